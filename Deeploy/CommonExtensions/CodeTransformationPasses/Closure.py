@@ -127,7 +127,7 @@ class ClosureGeneration(CodeTransformationPass, IntrospectiveCodeTransformationM
     def _generateClosureCtxt(self, ctxt: NetworkContext, nodeName: str) -> NetworkContext:
 
         ret = ctxt.hoistStruct(self.closureStructArgs, self.closureName + "_args", self.closureStructArgType)
-        ctxt.lookup(ret)._users.append(nodeName)
+        ctxt.lookup(ret)._users += [nodeName]
 
         allArgs = {
             "closureName": self.closureName,
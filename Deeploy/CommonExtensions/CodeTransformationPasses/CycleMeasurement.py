@@ -2,7 +2,7 @@
 #
 # File: CycleMeasurement.py
 #
-# Last edited: 13.11.2023
+# Last edited: 19.10.2026
 #
 # Copyright (C) 2023, ETH Zurich and University of Bologna.
 #
@@ -23,21 +23,82 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Tuple
+from typing import List, Tuple
 
-from Deeploy.DeeployTypes import CodeTransformationPass, ExecutionBlock, NetworkContext, NodeTemplate
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, \
+    NodeTemplate, _NoVerbosity
 
 
 class ProfilingCodeGeneration(CodeTransformationPass):
 
-    def apply(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
-              name: str) -> Tuple[NetworkContext, ExecutionBlock]:
-        executionBlock.addLeft(NodeTemplate("""
-        uint32_t ${op}_cycles = getCycles();
-        """), {"op": name})
-        executionBlock.addRight(
-            NodeTemplate("""
-        uint32_t ${op}_endCycles = getCycles();
-        printf("${op} took %u cycles \\n", ${op}_endCycles - ${op}_cycles);
-        """), {"op": name})
+    _startTemplate = NodeTemplate("""
+    uint32_t ${op}_cycles = getCycles();
+    """)
+
+    _endTemplate = NodeTemplate("""
+    uint32_t ${op}_endCycles = getCycles();
+    printf("${op} took %u cycles \\n", ${op}_endCycles - ${op}_cycles);
+    """)
+
+    def _operatorRepresentation(self, ctxt: NetworkContext, name: str) -> dict:
+        return {"op": name}
+
+    def apply(self,
+              ctxt: NetworkContext,
+              executionBlock: ExecutionBlock,
+              name: str,
+              verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
+        operatorRepresentation = self._operatorRepresentation(ctxt, name)
+        executionBlock.addLeft(self._startTemplate, operatorRepresentation)
+        executionBlock.addRight(self._endTemplate, operatorRepresentation)
         return ctxt, executionBlock
+
+
+class LayerProfilingCodeGeneration(ProfilingCodeGeneration):
+    """Accumulate the cycles of every layer into a global array instead of printing them
+
+    Every call to `apply` assigns the next index of the network's
+    `layerCycles` array to the layer, `layerNames` lists the profiled
+    layers in this order. Differences of `getCycles` are wrap-around
+    safe for layers shorter than 2^32 cycles.
+
+    """
+
+    _startTemplate = NodeTemplate("""
+    uint32_t ${op}_cycles = getCycles();
+    """)
+
+    _endTemplate = NodeTemplate("""
+    ${layerCycles}[${layerIdx}] += (uint32_t)(getCycles() - ${op}_cycles);
+    """)
+
+    def __init__(self):
+        self.layerNames: List[str] = []
+
+    def _operatorRepresentation(self, ctxt: NetworkContext, name: str) -> dict:
+        self.layerNames.append(name)
+        return {"op": name, "layerCycles": ctxt._mangle("layerCycles"), "layerIdx": len(self.layerNames) - 1}
+
+    def hoistProfilingBuffers(self, ctxt: NetworkContext) -> NetworkContext:
+        """Define the cycle counters and names of all profiled layers"""
+        numLayers = max(len(self.layerNames), 1)
+        names = ", ".join(f'"{name}"' for name in self.layerNames) if self.layerNames != [] else '""'
+
+        ctxt.hoistGlobalDefinition(
+            ctxt._mangle("layerProfiling"), f"""
+        unsigned int getCycles(void);
+        const uint32_t {ctxt._mangle("num_layers")} = {len(self.layerNames)};
+        const char *const {ctxt._mangle("layerNames")}[{numLayers}] = {{{names}}};
+        uint64_t {ctxt._mangle("layerCycles")}[{numLayers}];
+        """)
+        return ctxt
+
+    @staticmethod
+    def generateProfilingDeclarations(ctxt: NetworkContext) -> str:
+        """Declare the profiling buffers in the network's header"""
+        return f"""
+        #define DEEPLOY_LAYER_PROFILING
+        extern const uint32_t {ctxt._mangle("num_layers")};
+        extern const char *const {ctxt._mangle("layerNames")}[];
+        extern uint64_t {ctxt._mangle("layerCycles")}[];
+        """
@@ -25,11 +25,11 @@
 
 import copy
 import types
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import mako.codegen as codegen
 from mako.lexer import Lexer
-from mako.parsetree import Expression, TemplateNode
+from mako.parsetree import Code, Comment, ControlLine, Expression, Node, TemplateNode, Text
 
 from Deeploy.AbstractDataTypes import Pointer, Struct
 from Deeploy.DeeployTypes import ExecutionBlock, NetworkContext, NodeTemplate, OperatorRepresentation
@@ -39,11 +39,45 @@ _NULL: str = "NULL"
 
 class IntrospectiveCodeTransformationMixIn():
 
-    parseTreeDict: Dict[int, TemplateNode] = {}
+    # Process-wide caches, keyed by template source, shared by all code transformations. Cached parse trees must not be
+    # modified; copy them first.
+    parseTreeDict: Dict[str, TemplateNode] = {}
+    expressionDict: Dict[str, List[str]] = {}
+    compiledCodeDict: Dict[Tuple, Tuple[types.CodeType, types.ModuleType]] = {}
 
     @staticmethod
     def _generateParseTree(template: NodeTemplate) -> TemplateNode:
-        return Lexer(template.template._source).parse()
+        source = template.template._source
+        parseTree = IntrospectiveCodeTransformationMixIn.parseTreeDict.get(source, None)
+        if parseTree is None:
+            parseTree = Lexer(source).parse()
+            IntrospectiveCodeTransformationMixIn.parseTreeDict[source] = parseTree
+        return parseTree
+
+    @staticmethod
+    def _extractExpressions(template: NodeTemplate) -> List[str]:
+        source = template.template._source
+        expressions = IntrospectiveCodeTransformationMixIn.expressionDict.get(source, None)
+        if expressions is None:
+            parseTree = IntrospectiveCodeTransformationMixIn._generateParseTree(template)
+            expressions = [node.text for node in parseTree.nodes if type(node) == Expression]
+            IntrospectiveCodeTransformationMixIn.expressionDict[source] = expressions
+        return expressions
+
+    @staticmethod
+    def _nodeSignature(node: Node) -> Optional[Tuple]:
+        # Everything but the node positions that goes into the compiled code; None if unknown
+        if type(node) == Text:
+            return ("Text", node.content)
+        if type(node) == Expression:
+            return ("Expression", node.text, node.escapes)
+        if type(node) == ControlLine:
+            return ("ControlLine", node.keyword, node.isend, node.text)
+        if type(node) == Code:
+            return ("Code", node.text, node.ismodule)
+        if type(node) == Comment:
+            return ("Comment", node.text)
+        return None
 
     @staticmethod
     def _reconstructCode(template: NodeTemplate, node: TemplateNode):
@@ -75,27 +109,40 @@ class IntrospectiveCodeTransformationMixIn():
 
             return parseTree
 
-        node = fixupParseTree(node)
-
         temp = template.template
-        lexer = Lexer(temp._source)
-        source = codegen.compile(
-            node,
-            temp.uri,
-            None,
-            default_filters = temp.default_filters,
-            buffer_filters = temp.buffer_filters,
-            imports = temp.imports,
-            future_imports = temp.future_imports,
-            source_encoding = lexer.encoding,
-            generate_magic_comment = True,
-            strict_undefined = temp.strict_undefined,
-            enable_loop = temp.enable_loop,
-            reserved_names = temp.reserved_names,
-        )
-        module = types.ModuleType(temp.module_id)
-        code = compile(source, temp.module_id, "exec")
-        exec(code, module.__dict__, module.__dict__)
+
+        signatures = [IntrospectiveCodeTransformationMixIn._nodeSignature(child) for child in node.nodes]
+        key = None
+        if all(signature is not None for signature in signatures):
+            templateConfig = (temp.default_filters, temp.buffer_filters, temp.imports, temp.future_imports)
+            key = (tuple(signatures), repr(templateConfig), temp.strict_undefined, temp.enable_loop)
+
+        if key in IntrospectiveCodeTransformationMixIn.compiledCodeDict:
+            code, module = IntrospectiveCodeTransformationMixIn.compiledCodeDict[key]
+        else:
+            node = fixupParseTree(node)
+
+            lexer = Lexer(temp._source)
+            source = codegen.compile(
+                node,
+                temp.uri,
+                None,
+                default_filters = temp.default_filters,
+                buffer_filters = temp.buffer_filters,
+                imports = temp.imports,
+                future_imports = temp.future_imports,
+                source_encoding = lexer.encoding,
+                generate_magic_comment = True,
+                strict_undefined = temp.strict_undefined,
+                enable_loop = temp.enable_loop,
+                reserved_names = temp.reserved_names,
+            )
+            module = types.ModuleType(temp.module_id)
+            code = compile(source, temp.module_id, "exec")
+            exec(code, module.__dict__, module.__dict__)
+
+            if key is not None:
+                IntrospectiveCodeTransformationMixIn.compiledCodeDict[key] = (code, module)
 
         temp._code = code
         temp.module = module
@@ -133,17 +180,8 @@ class IntrospectiveCodeTransformationMixIn():
                                    template: NodeTemplate,
                                    unrollStructs = False):
 
-        codeHash = hash(template.template._source)
-
-        if codeHash in self.parseTreeDict.keys():
-            makoParseTree = self.parseTreeDict[codeHash]
-        else:
-            # Parse the user-provided template
-            makoParseTree = IntrospectiveCodeTransformationMixIn._generateParseTree(template)
-            self.parseTreeDict[codeHash] = makoParseTree
-
         # Filter parsing tree for expressions
-        makoExpressions = [node.text for node in makoParseTree.nodes if type(node) == Expression]
+        makoExpressions = IntrospectiveCodeTransformationMixIn._extractExpressions(template)
 
         # Filter expressions for variables contained in operatorRepresentation
         makoReferences = [
@@ -44,6 +44,8 @@ _stackAllocateTemplate = partial(
     _ArgStructAllocateTemplate,
     templateStr = "${structDict.typeName} ${name} = (${structDict.typeName}) ${str(structDict)};")
 
+_inPlaceAllocateTemplate = NodeTemplate("${name} = (${type.typeName}) ${alias};\n")
+
 
 class ArgumentStructGeneration(CodeTransformationPass, IntrospectiveCodeTransformationMixIn):
 
@@ -149,19 +151,32 @@ class MemoryManagementGeneration(CodeTransformationPass, IntrospectiveCodeTransf
         inputNames = self._getFinalInputNames(ctxt, executionBlock, name)
         transientBuffers = self._extractTransientBuffers(ctxt, name)
 
+        # Outputs aliasing a dying input take over its storage instead of being allocated
+        inPlaceInputs = {}
+        for buffer in outputNames:
+            nb = ctxt.lookup(buffer)
+            if hasattr(nb, "_alias") and nb._alias in inputNames:
+                inPlaceInputs[nb.name] = nb._alias
+
         # We have to allocate the output buffers, unless they are global
 
         for buffer in list(reversed(outputNames)) + transientBuffers:
             nb = ctxt.lookup(buffer)
             assert ctxt.localObjects[nb.name]._live == False, f"Tried to allocate already live buffer {nb.name}"
             ctxt.localObjects[nb.name]._live = True
-            executionBlock.addLeft(nb.allocTemplate, nb._bufferRepresentation())
+            if nb.name in inPlaceInputs:
+                executionBlock.addLeft(_inPlaceAllocateTemplate, {
+                    **nb._bufferRepresentation(), "alias": inPlaceInputs[nb.name]
+                })
+            else:
+                executionBlock.addLeft(nb.allocTemplate, nb._bufferRepresentation())
 
         for buffer in inputNames + transientBuffers:
             nb = ctxt.lookup(buffer)
             assert ctxt.localObjects[nb.name]._live == True, f"Tried to deallocate already dead buffer {nb.name}"
             ctxt.localObjects[nb.name]._live = False
-            executionBlock.addRight(nb.deallocTemplate, nb._bufferRepresentation())
+            if nb.name not in inPlaceInputs.values():
+                executionBlock.addRight(nb.deallocTemplate, nb._bufferRepresentation())
 
         return ctxt, executionBlock
 
@@ -0,0 +1,50 @@
+# ----------------------------------------------------------------------
+#
+# File: ConstantSharingDeployer.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+from Deeploy.CommonExtensions.NetworkDeployers.NetworkDeployerWrapper import NetworkDeployerWrapper
+from Deeploy.CommonExtensions.OptimizationPasses.BindingsOptimizationPasses.ConstantSharing import ConstantSharingPass
+from Deeploy.DeeployTypes import NetworkDeployer
+
+
+class ConstantSharingDeployerWrapper(NetworkDeployerWrapper):
+    """Deploy duplicated constants only once after binding
+
+    Wrap the deployer inside of a TilerDeployerWrapper, so that the
+    tiler only sees the shared constants.
+
+    """
+
+    def __init__(self, deployer: NetworkDeployer, constantSharingPass: Optional[ConstantSharingPass] = None):
+        super().__init__(deployer)
+        self.constantSharingPass = constantSharingPass if constantSharingPass is not None else ConstantSharingPass()
+
+    def bind(self):
+        ret = super().bind()
+        if not ret:
+            return False
+
+        self.ctxt, self.layerBinding = self.constantSharingPass.apply(self.ctxt, self.graph, self.layerBinding)
+
+        return ret
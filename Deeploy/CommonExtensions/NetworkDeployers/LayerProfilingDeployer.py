@@ -0,0 +1,61 @@
+# ----------------------------------------------------------------------
+#
+# File: LayerProfilingDeployer.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+from Deeploy.CommonExtensions.CodeTransformationPasses.CycleMeasurement import LayerProfilingCodeGeneration
+from Deeploy.CommonExtensions.NetworkDeployers.NetworkDeployerWrapper import NetworkDeployerWrapper
+from Deeploy.DeeployTypes import CodeGenVerbosity, NetworkDeployer, _NoVerbosity
+
+
+class LayerProfilingDeployerWrapper(NetworkDeployerWrapper):
+    """Measure the cycles spent in every layer of the network
+
+    The measurement wraps each layer's fully transformed execution
+    block, so it includes the allocation and deallocation of the
+    layer's buffers. The target has to provide `getCycles`.
+
+    """
+
+    def __init__(self, deployer: NetworkDeployer, layerProfilingPass: Optional[LayerProfilingCodeGeneration] = None):
+        super().__init__(deployer)
+        if layerProfilingPass is None:
+            layerProfilingPass = LayerProfilingCodeGeneration()
+        self.layerProfilingPass = layerProfilingPass
+
+    def codeTransform(self, verbose: CodeGenVerbosity = _NoVerbosity):
+        if self.transformed:
+            return
+
+        ret = super().codeTransform(verbose)
+
+        # The execution blocks are extended in place
+        for name, layer in self.layerBinding.items():
+            self.ctxt, _ = self.layerProfilingPass.apply(self.ctxt, layer.mapper.binder.executionBlock, name, verbose)
+
+        self.ctxt = self.layerProfilingPass.hoistProfilingBuffers(self.ctxt)
+
+        return ret
+
+    def generateLayerProfilingDeclarations(self) -> str:
+        return self.layerProfilingPass.generateProfilingDeclarations(self.ctxt)
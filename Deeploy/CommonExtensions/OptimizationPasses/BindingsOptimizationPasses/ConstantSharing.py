@@ -0,0 +1,113 @@
+# ----------------------------------------------------------------------
+#
+# File: ConstantSharing.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, Tuple
+
+import onnx_graphsurgeon as gs
+
+from Deeploy.CommonExtensions.OptimizationPasses.BindingsOptimizationPasses.BindingsOptimization import \
+    BindingOptimizationPass
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, ONNXLayer
+
+
+class ConstantSharingPass(BindingOptimizationPass):
+    """Deploy constants with identical contents only once
+
+    The frontend gives every consumer of a shared initializer its own
+    copy of the constant. After binding, all deployed constants with
+    the same values, type, shape and memory level are folded onto the
+    first of them: their consumers are rewritten to reference the
+    shared buffer, and the duplicates are kept in the context as
+    non-deployed aliases. Constants which were transformed for a
+    specific consumer during parsing or binding differ in their values
+    and keep their own copy.
+
+    """
+
+    def __init__(self):
+        # Duplicate constant name -> name of the shared constant, for the last call to apply
+        self.sharedConstants: Dict[str, str] = {}
+        self.savedBytes: int = 0
+
+    @staticmethod
+    def _sharingKey(_buffer: ConstantBuffer) -> Tuple:
+        # Identical values share the same interned array, see ConstantBuffer._compactValues
+        return (type(_buffer), id(_buffer.compactValues), tuple(_buffer.shape), _buffer._type,
+                getattr(_buffer, "_memoryLevel", None), getattr(_buffer, "_signed",
+                                                                None), getattr(_buffer, "nLevels", None))
+
+    @staticmethod
+    def _renameReferences(operatorRepresentation: Dict[str, Any], oldName: str, newName: str):
+        for key, value in operatorRepresentation.items():
+            if isinstance(value, str) and value == oldName:
+                operatorRepresentation[key] = newName
+            elif isinstance(value, (list, tuple)) and oldName in value:
+                operatorRepresentation[key] = type(value)(newName if item == oldName else item for item in value)
+
+    def apply(self, ctxt: NetworkContext, graph: gs.Graph,
+              layerBinding: Dict[str, ONNXLayer]) -> Tuple[NetworkContext, Dict[str, ONNXLayer]]:
+
+        self.sharedConstants = {}
+        self.savedBytes = 0
+
+        tensors = {tensor.name: tensor for node in graph.nodes for tensor in node.inputs}
+        sharedBuffers: Dict[Tuple, ConstantBuffer] = {}
+
+        for name, _buffer in list(ctxt.globalObjects.items()):
+            if not isinstance(_buffer, ConstantBuffer) or not _buffer._deploy or not hasattr(_buffer, "_type"):
+                continue
+
+            if name not in tensors or any(user not in layerBinding for user in _buffer._users):
+                continue
+
+            key = self._sharingKey(_buffer)
+            sharedBuffer = sharedBuffers.setdefault(key, _buffer)
+            if sharedBuffer is _buffer:
+                continue
+
+            # Nodes reading both copies would see two aliasing inputs
+            users = [layerBinding[user] for user in _buffer._users]
+            if any(sharedBuffer.name in [tensor.name for tensor in layer.node.inputs] for layer in users):
+                continue
+
+            for layer in users:
+                layer.node.inputs = [
+                    tensors[sharedBuffer.name] if tensor.name == name else tensor for tensor in layer.node.inputs
+                ]
+                self._renameReferences(layer.mapper.parser.operatorRepresentation, name, sharedBuffer.name)
+                for codeSnippet in layer.mapper.binder.executionBlock.codeSnippets:
+                    self._renameReferences(codeSnippet.operatorRepresentation, name, sharedBuffer.name)
+
+            for localBuffer in ctxt.localObjects.values():
+                if getattr(localBuffer, "_alias", None) == name:
+                    localBuffer._alias = sharedBuffer.name
+
+            sharedBuffer._users += [user for user in _buffer._users if user not in sharedBuffer._users]
+            _buffer._users = []
+            _buffer._deploy = False
+            _buffer._alias = sharedBuffer.name
+
+            self.sharedConstants[name] = sharedBuffer.name
+            self.savedBytes += _buffer.binarySize
+
+        return ctxt, layerBinding
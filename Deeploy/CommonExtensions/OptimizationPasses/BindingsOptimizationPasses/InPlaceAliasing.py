@@ -0,0 +1,180 @@
+# ----------------------------------------------------------------------
+#
+# File: InPlaceAliasing.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import onnx_graphsurgeon as gs
+
+from Deeploy.CommonExtensions.OptimizationPasses.BindingsOptimizationPasses.BindingsOptimization import \
+    BindingOptimizationPass
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, ONNXLayer, StructBuffer, TransientBuffer, \
+    VariableBuffer, _ReferenceBuffer
+from Deeploy.FutureExtension.Future import Future
+
+# Operators whose kernels read every input element before writing the output element at the same index
+_elementwiseOpTypes = ("Add", "RequantizedAdd", "RequantShift", "iGELU", "iHardswish", "RequantizediHardswish", "Mul")
+
+
+class InPlaceAliasingPass(BindingOptimizationPass):
+    """Let the output of an element-wise operator reuse the storage of one of its inputs
+
+    The output of a node is aliased to an input if the input holds
+    as many elements of the same width, lives in the same memory level
+    and neither the input nor any other alias of its storage is used
+    by a later node. Slices are aliased to their input if they select
+    a contiguous prefix of it. Aliases are recorded in the output's
+    `_alias` attribute, so that memory schedulers and allocators
+    place the output on top of its input.
+
+    """
+
+    def __init__(self, opTypes: Sequence[str] = _elementwiseOpTypes, aliasSlices: bool = True):
+        self.opTypes = opTypes
+        self.aliasSlices = aliasSlices
+        # (output, input) pairs aliased by the last call to apply
+        self.aliasedBuffers: List[Tuple[str, str]] = []
+
+    @staticmethod
+    def _isActivation(ctxt: NetworkContext, name: str) -> bool:
+        if not ctxt.is_local(name):
+            return False
+
+        _buffer = ctxt.lookup(name)
+
+        if not isinstance(_buffer, VariableBuffer) or isinstance(
+                _buffer, (ConstantBuffer, TransientBuffer, StructBuffer, _ReferenceBuffer)):
+            return False
+
+        # Asynchronous buffers are still being written when the consuming kernel starts
+        return hasattr(_buffer, "_type") and not issubclass(_buffer._type, Future)
+
+    @staticmethod
+    def _sliceValues(ctxt: NetworkContext, value) -> Optional[np.ndarray]:
+        if isinstance(value, str):
+            _buffer = ctxt.lookup(value)
+            if not isinstance(_buffer, ConstantBuffer):
+                return None
+            value = _buffer.values
+        return np.asarray(value).reshape(-1)
+
+    def _isPrefixSlice(self, ctxt: NetworkContext, layer: ONNXLayer, inBuffer: VariableBuffer,
+                       outBuffer: VariableBuffer) -> bool:
+        operatorRepresentation = layer.mapper.parser.operatorRepresentation
+
+        if inBuffer.name != operatorRepresentation.get('data_in'):
+            return False
+
+        starts = self._sliceValues(ctxt, operatorRepresentation['starts'])
+        steps = self._sliceValues(ctxt, operatorRepresentation['steps'])
+        if starts is None or steps is None or np.any(starts != 0) or np.any(steps != 1):
+            return False
+
+        inShape = list(inBuffer.shape)
+        outShape = list(outBuffer.shape)
+        if len(inShape) != len(outShape):
+            return False
+
+        # The output is a contiguous prefix of the input if it only cuts the outermost non-unit axis
+        changedAxes = [axis for axis, (inDim, outDim) in enumerate(zip(inShape, outShape)) if inDim != outDim]
+        if changedAxes == []:
+            return True
+
+        firstAxis = changedAxes[0]
+        return changedAxes == [firstAxis] and all(dim == 1 for dim in outShape[:firstAxis])
+
+    def _fits(self, ctxt: NetworkContext, layer: ONNXLayer, inBuffer: VariableBuffer,
+              outBuffer: VariableBuffer) -> bool:
+
+        if getattr(inBuffer, "_memoryLevel", None) != getattr(outBuffer, "_memoryLevel", None):
+            return False
+
+        if inBuffer._type.referencedType.typeWidth != outBuffer._type.referencedType.typeWidth:
+            return False
+
+        if layer.node.op == "Slice":
+            return self._isPrefixSlice(ctxt, layer, inBuffer, outBuffer)
+
+        # Element-wise outputs hold as many elements as an input only if this input is not broadcast
+        return np.prod(inBuffer.shape) == np.prod(outBuffer.shape)
+
+    @staticmethod
+    def _isDeadAfter(ctxt: NetworkContext, name: str, schedule: Dict[str, int], nodeIdx: int) -> bool:
+        # All buffers sharing the storage of the input have to be dead after this node
+        root = ctxt.dealiasBuffer(name)
+        if not ctxt.is_local(root):
+            return False
+
+        for key, _buffer in ctxt.localObjects.items():
+            if not isinstance(_buffer, VariableBuffer) or ctxt.dealiasBuffer(key) != root:
+                continue
+
+            for user in _buffer._users:
+                if user not in schedule or schedule[user] > nodeIdx:
+                    return False
+
+        return True
+
+    def apply(self, ctxt: NetworkContext, graph: gs.Graph,
+              layerBinding: Dict[str, ONNXLayer]) -> Tuple[NetworkContext, Dict[str, ONNXLayer]]:
+
+        self.aliasedBuffers = []
+        schedule = {name: idx for idx, name in enumerate(layerBinding.keys())}
+
+        for nodeIdx, (name, layer) in enumerate(layerBinding.items()):
+            node = layer.node
+
+            if node.op == "Slice":
+                if not self.aliasSlices:
+                    continue
+            elif node.op not in self.opTypes:
+                continue
+
+            # Bypassed nodes and nodes with permuted inputs do not access their inputs element by element
+            if len(node.outputs) != 1 or any(key == "bypass" or key.endswith("_perm") for key in node.attrs.keys()):
+                continue
+
+            outName = node.outputs[0].name
+            if not self._isActivation(ctxt, outName) or hasattr(ctxt.lookup(outName), "_alias"):
+                continue
+
+            outBuffer = ctxt.lookup(outName)
+
+            for tensor in node.inputs:
+                if not self._isActivation(ctxt, tensor.name):
+                    continue
+
+                inBuffer = ctxt.lookup(tensor.name)
+
+                if not self._fits(ctxt, layer, inBuffer, outBuffer):
+                    continue
+
+                if not self._isDeadAfter(ctxt, inBuffer.name, schedule, nodeIdx):
+                    continue
+
+                outBuffer._alias = inBuffer.name
+                outBuffer._inPlace = True
+                self.aliasedBuffers.append((outBuffer.name, inBuffer.name))
+                break
+
+        return ctxt, layerBinding
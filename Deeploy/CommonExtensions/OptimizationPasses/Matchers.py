@@ -24,7 +24,8 @@
 # limitations under the License.
 
 import re
-from typing import Dict, Literal, NamedTuple, Optional
+from bisect import bisect_left
+from typing import Dict, List, Literal, NamedTuple, Optional
 
 import onnx_graphsurgeon as gs
 
@@ -34,6 +35,60 @@ class Match(NamedTuple):
     nodes_map: Dict[str, gs.Node]
 
 
+class OpTypeIndex:
+    # Index of a graph's nodes by op type, in graph order. The index is attached to the graph, so it is shared by all
+    # passes running on that graph; update only re-indexes the nodes behind the first position where the graph changed.
+
+    def __init__(self):
+        self._nodes: List[gs.Node] = []
+        self._ops: List[str] = []
+        self._positions: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def fromGraph(graph: gs.Graph) -> "OpTypeIndex":
+        # gs.Graph logs an error on every failed attribute lookup, so don't use getattr
+        index = vars(graph).get("_opTypeIndex", None)
+        if index is None:
+            index = OpTypeIndex()
+            graph._opTypeIndex = index
+        index.update(graph)
+        return index
+
+    def update(self, graph: gs.Graph) -> None:
+        nodes = graph.nodes
+
+        first = 0
+        common = min(len(nodes), len(self._nodes))
+        while first < common and nodes[first] is self._nodes[first] and nodes[first].op == self._ops[first]:
+            first += 1
+
+        if first == len(nodes) and first == len(self._nodes):
+            return
+
+        for op in list(self._positions.keys()):
+            positions = self._positions[op]
+            del positions[bisect_left(positions, first):]
+            if len(positions) == 0:
+                del self._positions[op]
+
+        del self._nodes[first:]
+        del self._ops[first:]
+
+        for position in range(first, len(nodes)):
+            node = nodes[position]
+            self._nodes.append(node)
+            self._ops.append(node.op)
+            self._positions.setdefault(node.op, []).append(position)
+
+    def nodes(self, op: str, regex_op: bool = False) -> List[gs.Node]:
+        if regex_op:
+            positions = sorted(position for key, keyPositions in self._positions.items()
+                               if re.fullmatch(op, key) is not None for position in keyPositions)
+        else:
+            positions = self._positions.get(op, [])
+        return [self._nodes[position] for position in positions]
+
+
 class SubgraphMatcher:
 
     def __init__(self, regex_op: bool = False):
@@ -54,6 +109,11 @@ class SubgraphMatcher:
     def _nodes_map_from_anchor(self, anchor: gs.Node, pattern: gs.Graph) -> Optional[Dict[str, gs.Node]]:
         _, _ = anchor, pattern
 
+    # Override this if the anchor is not the first pattern node
+    def _anchor_candidates(self, graph: gs.Graph, pattern: gs.Graph) -> List[gs.Node]:
+        pattern_anchor = next(iter(pattern.nodes))
+        return OpTypeIndex.fromGraph(graph).nodes(pattern_anchor.op, self.regex_op)
+
     def _match_from_anchor(self, anchor: gs.Node, pattern: gs.Graph) -> Optional[Match]:
         nodes_map = self._nodes_map_from_anchor(anchor, pattern)
 
@@ -77,7 +137,7 @@ class SubgraphMatcher:
         def is_overlap(match: Match):
             return not matched_node_names.isdisjoint(node_names(match))
 
-        for node in graph.nodes:
+        for node in self._anchor_candidates(graph, pattern):
             match = self._match_from_anchor(node, pattern)
             if match is not None and not is_overlap(match):
                 matches.append(match)
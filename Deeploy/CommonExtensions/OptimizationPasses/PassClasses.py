@@ -25,6 +25,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import contextmanager
 from typing import List, Optional
 
 import onnx_graphsurgeon as gs
@@ -85,6 +86,22 @@ class _MemoReach():
         return reachingSet
 
 
+def _isCleanupDeferred(graph: gs.Graph) -> bool:
+    # gs.Graph logs an error on every failed attribute lookup, so don't use getattr
+    return vars(graph).get("_deferCleanup", False)
+
+
+@contextmanager
+def _deferCleanup(graph: gs.Graph, defer: bool = True):
+    # Skip the cleanup and toposort of every single rewrite; the caller has to clean up the graph afterwards
+    previous = _isCleanupDeferred(graph)
+    graph._deferCleanup = defer or previous
+    try:
+        yield graph
+    finally:
+        graph._deferCleanup = previous
+
+
 @gs.Graph.register()
 def deleteNode(self, node: gs.Node):
     # LMACAN: Assume only one input and only one output tensor
@@ -105,13 +122,15 @@ def deleteNode(self, node: gs.Node):
         node.inputs.clear()
         node.outputs.clear()
 
-    self.cleanup()
+    if not _isCleanupDeferred(self):
+        self.cleanup()
 
 
 def _reachableNodes(graph: gs.Graph, inputTensors: List[gs.Tensor], outputTensors: List[gs.Tensor]) -> List[gs.Node]:
 
-    _inputTensors = [tensor for tensor in inputTensors.copy() if tensor.name in graph.tensors().keys()]
-    _outputTensors = [tensor for tensor in outputTensors.copy() if tensor.name in graph.tensors().keys()]
+    tensors = graph.tensors()
+    _inputTensors = [tensor for tensor in inputTensors.copy() if tensor.name in tensors.keys()]
+    _outputTensors = [tensor for tensor in outputTensors.copy() if tensor.name in tensors.keys()]
 
     retList = _MemoReach(graph, _inputTensors, _outputTensors).reachingSet()
 
@@ -127,7 +146,8 @@ def replaceInsertNode(self, inputs, outputs, newNode):
     for node in reachableSet:
         node.outputs = []
 
-    self.toposort().cleanup()
+    if not _isCleanupDeferred(self):
+        self.toposort().cleanup()
 
 
 class Pass():
@@ -265,8 +285,11 @@ class ContextAwareReplaceSequentialPatternPassMixIn(ContextAwareSequentialPassMi
         for k in self.named_subpasses().keys():
             self.remove_subpass(k)
         self.matches = self.matcher.match(graph, self.pattern)
-        for i, m in enumerate(self.matches):
-            ctxt, graph = self.replacement_fn(ctxt, graph, m, f"{self.name}_{i}", **self.kwargs)
+        if len(self.matches) == 0:
+            return ctxt, graph
+        with _deferCleanup(graph, self.batched):
+            for i, m in enumerate(self.matches):
+                ctxt, graph = self.replacement_fn(ctxt, graph, m, f"{self.name}_{i}", **self.kwargs)
         graph.cleanup().toposort()
         return ctxt, graph
 
@@ -278,8 +301,11 @@ class ContextAgnosticReplaceSequentialPatternPassMixIn(ContextAgnosticSequential
         for k in self.named_subpasses().keys():
             self.remove_subpass(k)
         self.matches = self.matcher.match(graph, self.pattern)
-        for i, m in enumerate(self.matches):
-            graph = self.replacement_fn(graph, m, f"{self.name}_{i}", **self.kwargs)
+        if len(self.matches) == 0:
+            return graph
+        with _deferCleanup(graph, self.batched):
+            for i, m in enumerate(self.matches):
+                graph = self.replacement_fn(graph, m, f"{self.name}_{i}", **self.kwargs)
         graph.cleanup().toposort()
         return graph
 
@@ -288,11 +314,14 @@ class ReplaceSequentialPatternPass(SequentialPass):
     # finds all instances of pattern in the graph, calls the replacement_fn on
     # the matches and replaces the matched nodes with the module returned by
     # replacement_fn.
+    # If batched, all matches are rewritten before the graph is cleaned up and
+    # sorted once, instead of after every single rewrite.
     def __init__(self,
                  pattern: gs.Graph,
                  replacement_fn: callable,
                  name: str,
                  matcher: Optional[SubgraphMatcher] = None,
+                 batched: bool = True,
                  **kwargs):
         super().__init__(name_prefix = name)
         self.pattern = pattern
@@ -301,6 +330,7 @@ class ReplaceSequentialPatternPass(SequentialPass):
             self.matcher = NonBranchingMatcher()
         self.replacement_fn = replacement_fn
         self.name = name
+        self.batched = batched
         self.kwargs = kwargs
 
 
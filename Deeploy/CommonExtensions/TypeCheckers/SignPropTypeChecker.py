@@ -46,10 +46,10 @@ class SignPropTypeChecker(NodeTypeChecker):
         for inputNode, _type in zip(node.inputs, self.input_types):
             if isinstance(ctxt.lookup(inputNode.name), ConstantBuffer):
                 reference = ctxt.lookup(inputNode.name)
-                if not _type.referencedType.checkPromotion(reference.values):
+                if not _type.referencedType.checkPromotion(reference.compactValues):
                     raise Exception(f"Can't cast {reference} to {_type}!")
 
-                reference.nLevels = reference.values.max() - reference.values.min()
+                reference.nLevels = int(reference.compactValues.max()) - int(reference.compactValues.min())
                 reference._signed = _type.referencedType.typeMin < 0
 
         return ctxt
@@ -0,0 +1,331 @@
+# ----------------------------------------------------------------------
+#
+# File: CompilerProfiling.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compile-time profiling of the Deeploy pipeline.
+
+Sections are only recorded while a `CompilerProfiler` is active, e.g.
+
+>>> with CompilerProfiler() as profiler:
+...     deployer.generateFunction()
+>>> profiler.exportChromeTrace("trace.json")
+>>> print(profiler.summary())
+
+Without an active profiler, `profileSection` and `profiled` fall through to the profiled code directly.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+_Function = TypeVar("_Function", bound = Callable[..., Any])
+
+_activeProfiler: Optional[CompilerProfiler] = None
+
+
+def peakRSS() -> int:
+    """Return the peak resident set size of the current process in bytes, or 0 if it cannot be queried
+    """
+    if resource is None:
+        return 0
+
+    maxRSS = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes everywhere else
+    if sys.platform == "darwin":
+        return maxRSS
+    return maxRSS * 1024
+
+
+@dataclass
+class ProfilingEvent:
+    """A single completed profiling section
+    """
+
+    name: str  #: str: Name of the section, e.g. the name of a pass
+    category: str  #: str: Pipeline stage the section belongs to
+    start: float  #: float: Start time in seconds, relative to the creation of the profiler
+    duration: float  #: float: Wall time of the section in seconds, including nested sections
+    selfDuration: float  #: float: Wall time of the section in seconds, excluding nested sections
+    peakRSS: int  #: int: Peak resident set size of the process in bytes at the end of the section
+    threadId: int  #: int: Identifier of the thread that ran the section
+    args: Dict[str, Any] = field(default_factory = dict)  #: Dict[str, Any]: Additional annotations of the section
+
+
+@dataclass
+class ProfilingStatistics:
+    """Aggregated statistics of all sections sharing the same category and name
+    """
+
+    category: str
+    name: str
+    calls: int = 0
+    totalTime: float = 0.
+    selfTime: float = 0.
+    maxTime: float = 0.
+    peakRSS: int = 0
+
+    @property
+    def meanTime(self) -> float:
+        return self.totalTime / self.calls if self.calls > 0 else 0.
+
+
+class CompilerProfiler():
+    """Records wall time, call counts, and peak memory of the Deeploy compilation pipeline
+
+    Use it as a context manager to activate it for all profiling hooks, or call `section` directly.
+
+    """
+
+    def __init__(self):
+        self.events: List[ProfilingEvent] = []
+        self._origin = time.perf_counter()
+        self._childTimes: List[float] = []
+        self._previousProfiler: Optional[CompilerProfiler] = None
+
+    def __enter__(self) -> CompilerProfiler:
+        global _activeProfiler
+        self._previousProfiler = _activeProfiler
+        _activeProfiler = self
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        global _activeProfiler
+        _activeProfiler = self._previousProfiler
+        self._previousProfiler = None
+
+    @contextmanager
+    def section(self, name: str, category: str = "Deeploy", **args) -> Iterator[None]:
+        """Record the execution of the enclosed block as one section
+
+        Parameters
+        ----------
+        name : str
+            Name of the section
+        category : str
+            Pipeline stage the section belongs to
+        **args
+            Additional annotations stored with the event
+
+        """
+        self._childTimes.append(0.)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            childTime = self._childTimes.pop()
+            if len(self._childTimes) > 0:
+                self._childTimes[-1] += duration
+
+            self.events.append(
+                ProfilingEvent(name = name,
+                               category = category,
+                               start = start - self._origin,
+                               duration = duration,
+                               selfDuration = duration - childTime,
+                               peakRSS = peakRSS(),
+                               threadId = threading.get_ident(),
+                               args = args))
+
+    def statistics(self) -> List[ProfilingStatistics]:
+        """Aggregate all recorded events by category and name
+
+        Returns
+        -------
+        List[ProfilingStatistics]
+            Statistics of every section, sorted by descending total time
+
+        """
+        statistics: Dict[Tuple[str, str], ProfilingStatistics] = {}
+        for event in self.events:
+            key = (event.category, event.name)
+            if key not in statistics:
+                statistics[key] = ProfilingStatistics(event.category, event.name)
+
+            entry = statistics[key]
+            entry.calls += 1
+            entry.totalTime += event.duration
+            entry.selfTime += event.selfDuration
+            entry.maxTime = max(entry.maxTime, event.duration)
+            entry.peakRSS = max(entry.peakRSS, event.peakRSS)
+
+        return sorted(statistics.values(), key = lambda entry: entry.totalTime, reverse = True)
+
+    def summary(self, maxEntries: Optional[int] = None) -> str:
+        """Format the aggregated statistics as a table
+
+        Parameters
+        ----------
+        maxEntries : Optional[int]
+            Only list the given number of most expensive sections
+
+        Returns
+        -------
+        str
+            Summary table with one row per section
+
+        """
+        statistics = self.statistics()[:maxEntries]
+
+        header = ("Category", "Name", "Calls", "Total [ms]", "Self [ms]", "Mean [ms]", "Max [ms]", "Peak RSS [MiB]")
+        rows = [(entry.category, entry.name, str(entry.calls), f"{entry.totalTime * 1e3:.2f}",
+                 f"{entry.selfTime * 1e3:.2f}", f"{entry.meanTime * 1e3:.3f}", f"{entry.maxTime * 1e3:.2f}",
+                 f"{entry.peakRSS / 2**20:.1f}") for entry in statistics]
+
+        widths = [max(len(row[idx]) for row in [header, *rows]) for idx in range(len(header))]
+
+        lines = []
+        for row in [header, *rows]:
+            # Left-align the names, right-align the numbers
+            cells = [row[idx].ljust(widths[idx]) if idx < 2 else row[idx].rjust(widths[idx]) for idx in range(len(row))]
+            lines.append("  ".join(cells))
+        lines.insert(1, "-" * len(lines[0]))
+
+        return "\n".join(lines)
+
+    def chromeTrace(self) -> Dict[str, Any]:
+        """Convert the recorded events to the Chrome trace event format
+
+        Returns
+        -------
+        Dict[str, Any]
+            Trace that can be loaded in chrome://tracing or Perfetto
+
+        """
+        pid = os.getpid()
+        traceEvents = []
+        lastRSS = 0
+        for event in sorted(self.events, key = lambda event: event.start):
+            traceEvents.append({
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": event.start * 1e6,
+                "dur": event.duration * 1e6,
+                "pid": pid,
+                "tid": event.threadId,
+                "args": event.args
+            })
+
+        # Peak RSS only ever grows, so a counter sample is only needed when it changes
+        for event in sorted(self.events, key = lambda event: event.start + event.duration):
+            if event.peakRSS > lastRSS:
+                lastRSS = event.peakRSS
+                traceEvents.append({
+                    "name": "Peak RSS",
+                    "ph": "C",
+                    "ts": (event.start + event.duration) * 1e6,
+                    "pid": pid,
+                    "args": {
+                        "MiB": lastRSS / 2**20
+                    }
+                })
+
+        return {"traceEvents": traceEvents, "displayTimeUnit": "ms"}
+
+    def exportChromeTrace(self, path: str):
+        """Write the recorded events as Chrome trace JSON file
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file
+
+        """
+        dirname = os.path.dirname(path)
+        if dirname != "":
+            os.makedirs(dirname, exist_ok = True)
+
+        with open(path, "w") as f:
+            json.dump(self.chromeTrace(), f, default = str)
+
+
+def activeProfiler() -> Optional[CompilerProfiler]:
+    """Return the currently active profiler, if any
+    """
+    return _activeProfiler
+
+
+def profileSection(name: str, category: str = "Deeploy", **args) -> ContextManager:
+    """Context manager recording the enclosed block in the active profiler
+
+    Parameters
+    ----------
+    name : str
+        Name of the section
+    category : str
+        Pipeline stage the section belongs to
+    **args
+        Additional annotations stored with the event
+
+    """
+    if _activeProfiler is None:
+        return nullcontext()
+    return _activeProfiler.section(name, category, **args)
+
+
+def profiled(category: str = "Deeploy",
+             name: Optional[Union[str, Callable[..., str]]] = None,
+             args: Optional[Callable[..., Dict[str, Any]]] = None) -> Callable[[_Function], _Function]:
+    """Decorator recording every call of the decorated function in the active profiler
+
+    Parameters
+    ----------
+    category : str
+        Pipeline stage the function belongs to
+    name : Optional[Union[str, Callable[..., str]]]
+        Name of the section, or a function of the call arguments returning it. Defaults to the qualified name of the
+        decorated function.
+    args : Optional[Callable[..., Dict[str, Any]]]
+        Function of the call arguments returning additional annotations of the section
+
+    """
+
+    def decorator(function: _Function) -> _Function:
+        sectionName = function.__qualname__ if name is None else name
+
+        @functools.wraps(function)
+        def wrapper(*fargs, **fkwargs):
+            profiler = _activeProfiler
+            if profiler is None:
+                return function(*fargs, **fkwargs)
+
+            _name = sectionName(*fargs, **fkwargs) if callable(sectionName) else sectionName
+            _args = args(*fargs, **fkwargs) if args is not None else {}
+            with profiler.section(_name, category, **_args):
+                return function(*fargs, **fkwargs)
+
+        return wrapper
+
+    return decorator
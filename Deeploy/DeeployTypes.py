@@ -28,24 +28,30 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import io
+import itertools
 import os
 import pickle
 import re
+import weakref
 from abc import abstractmethod
 from collections import OrderedDict, deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 from functools import reduce
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, TypeVar, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Set, TextIO, Tuple, Type, TypeVar, Union
 
 import mako
 import numpy as np
 import onnx
 import onnx_graphsurgeon as gs
 from mako.template import Template
-from onnx.external_data_helper import convert_model_to_external_data
+from onnx.external_data_helper import set_external_data
 from ortools.constraint_solver.pywrapcp import IntVar
 
 from .AbstractDataTypes import BaseType, FloatImmediate, IntegerImmediate, Pointer, PointerClass, Struct, VoidType
+from .CompilerProfiling import profiled, profileSection
 
 Shape = TypeVar("Shape", bound = Any)
 SubGraph = List[gs.Node]
@@ -74,6 +80,36 @@ class CodeGenVerbosity:
 
 _NoVerbosity = CodeGenVerbosity(None)
 
+
+class DeeployStateExportLevel(IntEnum):
+    """Controls which intermediate deeployStates a NetworkDeployer exports
+    """
+
+    NONE = 0  #: Never export deeployStates
+    FINAL = 1  #: Only export the state after code generation, or the state at which deployment failed
+    ALL = 2  #: Export the state after every deployment stage
+
+
+@dataclass
+class NetworkContextSnapshot:
+    """A dataclass to hold the buffer versions of an exported NetworkContext; used to export later contexts incrementally"""
+    folderPath: str  #: str: Absolute path of the directory the context was exported to
+    fileName: str  #: str: Name of the exported context file
+    versions: Dict[Tuple[str, str], int] = field(
+        default_factory = dict
+    )  #: Dict[Tuple[str, str], int]: Version of every exported buffer, keyed by scope and name
+
+
+# Every attribute assignment of a buffer draws a new version from this counter, so buffers that were reassigned since
+# the last export can be detected without serializing them
+_bufferVersions = itertools.count()
+
+
+def _setVersionedAttr(obj, name: str, value: Any):
+    object.__setattr__(obj, name, value)
+    object.__setattr__(obj, '_version', next(_bufferVersions))
+
+
 _middlewarePreLoweringFilename = 'middleware_pre_lowering'
 _middlewarePostLoweringFilename = 'middleware_post_lowering'
 _backendPostParsingFilename = 'backend_post_parsing'
@@ -82,15 +118,126 @@ _backendPostBindingFilename = 'backend_post_binding'
 _ctxtExtension = '.pkl'
 _graphExtension = '.onnx'
 _dataExtension = '.data'
+_binaryExtension = '.bin'
+
+_weightStoreDirname = 'weights'
+_weightStoreThreshold = 1024
+
+_arrayValuesPerLine = 16
+_arrayChunkSize = 1 << 16
+
+
+def _formatIntegerChunk(values: np.ndarray, separators: np.ndarray) -> str:
+    # Lay out every value as a fixed-width row of [sign, digits..., ',', separator] and mask out unused characters
+    values = values.astype(np.int64)
+    magnitude = np.abs(values).astype(np.uint64)
+    numDigits = len(str(int(magnitude.max())))
+
+    chars = np.empty((len(values), numDigits + 3), dtype = np.uint8)
+    chars[:, 0] = ord('-')
+    chars[:, -2] = ord(',')
+    chars[:, -1] = separators
+
+    lengths = np.ones(len(values), dtype = np.int64)
+    remainder = magnitude.copy()
+    for digit in range(numDigits):
+        chars[:, numDigits - digit] = remainder % 10 + ord('0')
+        remainder //= 10
+        if digit > 0:
+            lengths += (magnitude >= 10**digit)
+
+    mask = np.ones(chars.shape, dtype = bool)
+    mask[:, 0] = values < 0
+    mask[:, 1:numDigits + 1] = np.arange(numDigits)[np.newaxis, :] >= (numDigits - lengths)[:, np.newaxis]
+
+    return chars[mask].tobytes().decode('ascii')
+
+
+def _formatChunk(values: np.ndarray, separators: np.ndarray) -> str:
+    return ''.join(f"{value},{chr(separator)}" for value, separator in zip(values, separators))
+
+
+def writeArrayValues(fileHandle: TextIO, values: np.ndarray):
+    """Write the values of an array as the body of a C initializer list
+
+    Values are formatted in vectorized chunks and written directly to
+    the file handle, with a line break every `_arrayValuesPerLine`
+    values. Integer arrays are formatted without any per-value Python
+    string conversion.
+
+    Parameters
+    ----------
+    fileHandle : TextIO
+        Text stream to write the formatted values to
+    values : np.ndarray
+        Values to format; arrays are flattened in row-major order
+
+    """
+    values = np.asarray(values).reshape(-1)
+    isInteger = np.issubdtype(values.dtype, np.integer)
+
+    for start in range(0, len(values), _arrayChunkSize):
+        chunk = values[start:start + _arrayChunkSize]
+
+        separators = np.full(len(chunk), ord(' '), dtype = np.uint8)
+        separators[(np.arange(start, start + len(chunk)) + 1) % _arrayValuesPerLine == 0] = ord('\n')
+
+        if isInteger:
+            chunkString = _formatIntegerChunk(chunk, separators)
+        else:
+            chunkString = _formatChunk(chunk, separators)
+
+        # Drop the trailing separator after the last value
+        if start + _arrayChunkSize >= len(values):
+            chunkString = chunkString[:-2]
+
+        fileHandle.write(chunkString)
+
+
+def formatArrayValues(values: np.ndarray) -> str:
+    """Return the values of an array as the body of a C initializer list
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to format; arrays are flattened in row-major order
+
+    Returns
+    -------
+    str
+        Comma-separated values
+
+    """
+    stream = io.StringIO()
+    writeArrayValues(stream, values)
+    return stream.getvalue()
 
 
 # SCHEREMO: mako.Templates are not copiable, since they can use shared context.
 # In Deeploy we only use them by direct call (no shared context), so we can override deepcopy and workaround the issue
 class _Template(Template):
     """
-    This class wraps the Mako.Template class in a way that enables deep-copying
+    This class wraps the Mako.Template class in a way that enables deep-copying.
+    Templates with the same source share their compiled module, which is only
+    compiled once per process.
     """
 
+    _compiledTemplates: Dict[Tuple[str, bool], Template] = {}
+
+    def __init__(self, text: str, strict_undefined: bool = False, **kwargs):
+        key = (text, strict_undefined)
+        compiledTemplate = _Template._compiledTemplates.get(key, None)
+
+        if kwargs or compiledTemplate is None:
+            super().__init__(text, strict_undefined = strict_undefined, **kwargs)
+            if not kwargs:
+                # Store a copy, since code transformations may replace the module of this instance
+                _Template._compiledTemplates[key] = copy.copy(self)
+            return
+
+        # Templates are only rendered by direct call, so sharing the compiled module is safe
+        self.__dict__.update(compiledTemplate.__dict__)
+
     def __deepcopy__(self, memo):
         _copy = type(self)("", strict_undefined = self.strict_undefined)
         _copy._source = self._source
@@ -245,6 +392,58 @@ class NodeTemplate():
         return callStack
 
 
+# Defines a global symbol holding the raw contents of a binary file, used in place of a C initializer list
+_incbinConstantTemplate = NodeTemplate("""
+__asm__(".pushsection ${section}, \\"aw\\"\\n.balign ${alignment}\\n.global ${name}\\n${name}:\\n.incbin \\"${fileName}\\"\\n.popsection\\n");
+extern ${type.referencedType.typeName} ${name}[${size}];
+""")
+
+# Includes the weights blob once and defines every constant as a symbol at its offset within the blob
+_weightsBlobIncbinTemplate = NodeTemplate("""
+__asm__(".pushsection ${section}, \\"aw\\"\\n.balign ${alignment}\\n.global ${name}\\n${name}:\\n.incbin \\"${fileName}\\"\\n.popsection\\n");
+% for bufferName, typeName, bufferSize, offset in table:
+__asm__(".global ${bufferName}\\n.set ${bufferName}, ${name} + ${offset}\\n");
+extern ${typeName} ${bufferName}[${bufferSize}];
+% endfor
+""")
+
+# Maps the weights blob into memory before main and points every constant to its offset within the blob
+_weightsBlobMmapTemplate = NodeTemplate("""
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+static char *${name};
+% for bufferName, typeName, bufferSize, offset in table:
+static ${typeName} *${bufferName};
+% endfor
+
+__attribute__((constructor)) static void ${name}_map(void) {
+  const char *path = getenv("DEEPLOY_WEIGHTS_BLOB");
+  if (path == NULL) {
+    path = "${fileName}";
+  }
+  int fd = open(path, O_RDONLY);
+  struct stat fileStat;
+  if (fd < 0 || fstat(fd, &fileStat) != 0 || fileStat.st_size < ${size}) {
+    printf("Cannot map weights blob %s!\\n", path);
+    exit(-1);
+  }
+  // Private mapping: pages are shared with the page cache until a kernel writes to them
+  ${name} = (char *)mmap(NULL, ${size}, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+  close(fd);
+  if (${name} == MAP_FAILED) {
+    printf("Cannot map weights blob %s!\\n", path);
+    exit(-1);
+  }
+% for bufferName, typeName, bufferSize, offset in table:
+  ${bufferName} = (${typeName} *)(${name} + ${offset});
+% endfor
+}
+""")
+
+
 class VariableBuffer():
     """This class represents memory locations containing variable tensor data that is not transient, i.e. intermediate results or input- and output buffers.
 
@@ -270,6 +469,9 @@ class VariableBuffer():
         self._signed = None
         self.nLevels = None
 
+    def __setattr__(self, name: str, value: Any):
+        _setVersionedAttr(self, name, value)
+
     def _bufferRepresentation(self) -> Dict:
         return {"type": self._instance, "name": self.name, "size": int(np.prod(self.shape))}
 
@@ -329,8 +531,23 @@ class VariableBuffer():
             del d['deallocTemplate']
         if 'initTemplate' in d.keys():
             del d['initTemplate']
+        d.pop('_version', None)
         return d
 
+    def _snapshot(self) -> VariableBuffer:
+        """Return a copy of this buffer that shares its tensor payloads
+
+        Returns
+        -------
+        VariableBuffer
+            Shallow copy of this buffer with its own list of users
+
+        """
+        _copy = object.__new__(type(self))
+        _copy.__dict__.update(self.__dict__)
+        _copy._users = list(self._users)
+        return _copy
+
     @classmethod
     def fromNode(cls, node: gs.Node):
         return (cls(name = node.name, shape = node.shape if not isinstance(node, gs.Constant) else node.values.shape))
@@ -380,27 +597,100 @@ class TransientBuffer(VariableBuffer):
 class ConstantBuffer(VariableBuffer):
     """Class to represent compile-time constant tensors (weights, biases, other parameters) within Deeploy.
 
+    The values are stored read-only in the smallest NumPy integer type
+    that holds them, and buffers with identical values share their
+    storage.
+
     """
 
+    # Storage of all live ConstantBuffers, keyed by the dtype, shape and digest of their values
+    _sharedValues: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
     def __init__(self, name: str = '', shape = [1], values = [0]):
         super().__init__(name, shape)
-        values = np.asarray(values)
-        intArray = values.astype(int)
-        assert (np.abs(values - intArray)).max() < 0.001, "Constant value {name} is NOT an integer!"
-        self.values = intArray  #: np.array: Stores the underlying weights in Ptyhon-type representation
+        self.values = values
 
         # Do not override - ConstantBuffers are assumed to be always live!
         self._live = True
 
+    @staticmethod
+    def _compactValues(name: str, values) -> np.ndarray:
+        values = np.asarray(values)
+
+        if not np.issubdtype(values.dtype, np.integer):
+            # Check in chunks to avoid full-size temporaries for large floating-point initializers
+            flatValues = values.reshape(-1)
+            for start in range(0, flatValues.size, _arrayChunkSize):
+                chunk = flatValues[start:start + _arrayChunkSize]
+                assert np.all(np.abs(chunk - np.trunc(chunk)) < 0.001), f"Constant value {name} is NOT an integer!"
+
+        if values.size == 0:
+            dtype = np.dtype(np.int8)
+        else:
+            dtype = np.result_type(np.min_scalar_type(int(np.trunc(values.min()))),
+                                   np.min_scalar_type(int(np.trunc(values.max()))))
+
+        compactValues = np.ascontiguousarray(values.astype(dtype))
+        key = (compactValues.dtype.str, compactValues.shape, hashlib.sha1(compactValues.data).hexdigest())
+
+        sharedValues = ConstantBuffer._sharedValues.get(key)
+        if sharedValues is not None:
+            return sharedValues
+
+        compactValues.setflags(write = False)
+        ConstantBuffer._sharedValues[key] = compactValues
+        return compactValues
+
+    @property
+    def values(self) -> np.ndarray:
+        """np.ndarray: Writable copy of the underlying weights in Python-type (int) representation"""
+        return self._values.astype(int)
+
+    @values.setter
+    def values(self, values):
+        self._values = self._compactValues(self.name, values)
+
+    @property
+    def compactValues(self) -> np.ndarray:
+        """np.ndarray: Read-only underlying weights in the smallest integer type that holds them"""
+        return self._values
+
+    def __deepcopy__(self, memo):
+        # The read-only values are shared with the copy
+        memo[id(self._values)] = self._values
+        _copy = object.__new__(type(self))
+        memo[id(self)] = _copy
+        _copy.__dict__.update(copy.deepcopy(self.__getstate__(), memo))
+        return _copy
+
     def __eq__(self, other):
-        ret = all([super().__eq__(other), np.array_equal(self.values, other.values)])
+        ret = all([super().__eq__(other), np.array_equal(self._values, other._values)])
         return ret
 
     def _valueString(self) -> str:
-        values = list(self.values.reshape(-1))
-        strValues = [str(value) for value in values]
-        valueString = ', '.join(strValues)
-        return valueString
+        return formatArrayValues(self._values)
+
+    def _binaryDataType(self) -> np.dtype:
+        referencedType = self._type.referencedType
+        if issubclass(referencedType, FloatImmediate):
+            return np.dtype(f"float{referencedType.typeWidth}")
+        signed = (referencedType.typeMin < 0)
+        return np.dtype(f"{'' if signed else 'u'}int{referencedType.typeWidth}")
+
+    def dumpValues(self, fileName: Union[str, BinaryIO]):
+        """Write the values of this buffer to a raw binary file using the memory layout of its C type
+
+        Parameters
+        ----------
+        fileName : Union[str, BinaryIO]
+            Path of the binary file to write, or an open binary file to append to
+
+        """
+        values = self._values.reshape(-1).astype(self._binaryDataType().newbyteorder('<'))
+        if isinstance(fileName, str):
+            values.tofile(fileName)
+        else:
+            fileName.write(values.tobytes())
 
     def __str__(self) -> str:
         return f'ConstantBuffer: name: {self.name}, type: {self._type}'
@@ -411,6 +701,11 @@ class ConstantBuffer(VariableBuffer):
     def _bufferRepresentation(self) -> Dict:
         return {"type": self._type, "name": self.name, "size": int(np.prod(self.shape)), "values": self._valueString()}
 
+    @property
+    def binarySize(self) -> int:
+        """Size of the values of this buffer in the memory layout of its C type, in bytes"""
+        return int(np.prod(self.shape)) * self._binaryDataType().itemsize
+
     @classmethod
     def fromVariableBuffer(cls, buffer: VariableBuffer, values):
         ret = cls(name = buffer.name, shape = buffer.shape, values = values)
@@ -450,6 +745,14 @@ class GlobalDefinition():
         self.name = name
         self.definition = definition
 
+    def __setattr__(self, name: str, value: Any):
+        _setVersionedAttr(self, name, value)
+
+    def __getstate__(self):
+        d = dict(self.__dict__)
+        d.pop('_version', None)
+        return d
+
     def alloc(self) -> str:
         """Return this GlobalDefintion's C code
         """
@@ -538,9 +841,18 @@ class NetworkContext():
 
         return alias
 
-    def exportNetworkContext(self, folderPath: str, fileName: str):
+    def exportNetworkContext(self,
+                             folderPath: str,
+                             fileName: str,
+                             parentSnapshot: Optional[NetworkContextSnapshot] = None) -> NetworkContextSnapshot:
         """Exports the NetworkContext as a pickled dictionary
 
+        If a snapshot of a previously exported context in the same
+        folder is passed, only the buffers that were added or had an
+        attribute reassigned since are written; the remaining buffers
+        are referenced from the previous context file. Buffers must
+        therefore not be modified in-place, see `snapshot`.
+
         Parameters
         ----------
         folderPath : str
@@ -548,6 +860,15 @@ class NetworkContext():
             saved
         fileName : str
             Name of the pickled context file
+        parentSnapshot : Optional[NetworkContextSnapshot]
+            Snapshot returned by a previous export; if None, the
+            context is exported in full
+
+        Returns
+        -------
+        NetworkContextSnapshot
+            Snapshot of the exported context, to be passed to the next
+            export
 
         Raises
         ------
@@ -561,8 +882,37 @@ class NetworkContext():
         if not os.path.isabs(absolutePath):
             raise OSError(f"Error exporting the context to: {absolutePath}")
 
+        absoluteFolderPath = os.path.dirname(absolutePath)
+        if parentSnapshot is not None and (parentSnapshot.folderPath != absoluteFolderPath
+                                           or parentSnapshot.fileName == fileName):
+            parentSnapshot = None
+
+        snapshot = NetworkContextSnapshot(absoluteFolderPath, fileName)
+        changedObjects: Dict[Tuple[str, str], Any] = {}
+
+        for scope, objects in (('global', self.globalObjects), ('local', self.localObjects)):
+            for name, obj in objects.items():
+                version = getattr(obj, '_version', None)
+                snapshot.versions[(scope, name)] = version
+                if version is None or parentSnapshot is None or parentSnapshot.versions.get((scope, name)) != version:
+                    changedObjects[(scope, name)] = obj
+
+        # Changed buffers are pickled together to preserve the references they share; only the buffer names are kept
+        # in the context itself to preserve their order
+        ctxt = copy.copy(self)
+        ctxt.globalObjects = OrderedDict.fromkeys(self.globalObjects.keys())
+        ctxt.localObjects = OrderedDict.fromkeys(self.localObjects.keys())
+
+        state = {
+            "parent": parentSnapshot.fileName if parentSnapshot is not None else None,
+            "context": ctxt,
+            "objects": changedObjects
+        }
+
         with open(absolutePath, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(state, f)
+
+        return snapshot
 
     @staticmethod
     def importNetworkContext(folderPath, fileName):
@@ -590,7 +940,26 @@ class NetworkContext():
             raise OSError(f"File or path does not exist: {absolutePath}")
 
         with open(absolutePath, 'rb') as f:
-            return pickle.load(f)
+            state = pickle.load(f)
+
+        # Contexts pickled as a whole by earlier versions
+        if isinstance(state, NetworkContext):
+            return state
+
+        parent = None
+        if state["parent"] is not None:
+            parent = NetworkContext.importNetworkContext(folderPath, state["parent"])
+
+        def _importObject(scope: str, name: str):
+            if (scope, name) in state["objects"]:
+                return state["objects"][(scope, name)]
+            assert parent is not None, f"Buffer {name} of {absolutePath} is missing in its parent context!"
+            return getattr(parent, scope + "Objects")[name]
+
+        ctxt = state["context"]
+        ctxt.globalObjects = OrderedDict((name, _importObject('global', name)) for name in ctxt.globalObjects.keys())
+        ctxt.localObjects = OrderedDict((name, _importObject('local', name)) for name in ctxt.localObjects.keys())
+        return ctxt
 
     def __repr__(self):
         globalObjects = []
@@ -921,7 +1290,7 @@ class NetworkContext():
 
         _buffer = self.lookup(name)
         if node.name not in _buffer._users:
-            _buffer._users.append(node.name)
+            _buffer._users += [node.name]
         if self.is_local(_buffer.name):
             self.localObjects[_buffer.name] = _buffer
         else:
@@ -949,6 +1318,34 @@ class NetworkContext():
         """
         return copy.copy(self)
 
+    def snapshot(self) -> NetworkContext:
+        """Return a copy-on-write snapshot of this NetworkContext, used to save backtracking points during parsing
+
+        In contrast to `copy.deepcopy`, only the buffer objects
+        themselves are copied; their payloads, most notably the
+        values of ConstantBuffers, are shared with the snapshot. This
+        is safe as long as payloads are only ever reassigned and never
+        modified in-place, which holds for all parsers and type
+        checkers.
+
+        Returns
+        -------
+        NetworkContext
+            Snapshot of this NetworkContext which is not affected by
+            any later modification of this NetworkContext
+
+        """
+
+        def _snapshotObject(obj: Union[VariableBuffer, GlobalDefinition]):
+            if isinstance(obj, VariableBuffer):
+                return obj._snapshot()
+            return copy.copy(obj)
+
+        _copy = copy.copy(self)
+        _copy.globalObjects = OrderedDict((name, _snapshotObject(obj)) for name, obj in self.globalObjects.items())
+        _copy.localObjects = OrderedDict((name, _snapshotObject(obj)) for name, obj in self.localObjects.items())
+        return _copy
+
 
 class NodeParser():
     """Deeploy's core Parser class. Analyzes network nodes and evaluates whether they can be mapped by it.
@@ -1213,8 +1610,8 @@ class NodeTypeChecker():
             if not isinstance(reference, VariableBuffer):
                 return False
 
-            if hasattr(reference, "values"):
-                retCheck &= _type.referencedType.checkPromotion(reference.values)
+            if isinstance(reference, ConstantBuffer):
+                retCheck &= _type.referencedType.checkPromotion(reference.compactValues)
             else:
                 if ctxt.is_global(inputNode.name):
                     retCheck &= _type.referencedType.partialOrderUpcast(reference._type.referencedType)
@@ -1230,7 +1627,7 @@ class NodeTypeChecker():
         for inputNode, _type in zip(node.inputs, self.input_types):
             if isinstance(ctxt.lookup(inputNode.name), ConstantBuffer):
                 reference = ctxt.lookup(inputNode.name)
-                if not _type.referencedType.checkPromotion(reference.values):
+                if not _type.referencedType.checkPromotion(reference.compactValues):
                     raise Exception(f"Can't cast {reference} to {_type}!")
 
                 ctxt.annotateType(inputNode.name, _type)
@@ -1524,7 +1921,7 @@ class NodeBinding():
         newCtxt, buffers = self.executionBlock.hoisting(newCtxt, **self.typeChecker.typeDict)
 
         for _buffer in buffers:
-            newCtxt.lookup(_buffer)._users.append(self._nodeName)
+            newCtxt.lookup(_buffer)._users += [self._nodeName]
 
         return newCtxt, [], True
 
@@ -1707,6 +2104,13 @@ class NodeMapper():
         return self.binder.generate(ctxt)
 
 
+def _profiledLayer(stage: str) -> Callable[[Callable], Callable]:
+    # Group the sections of all layers by operator type and keep the node name as annotation
+    return profiled("ONNXLayer",
+                    name = lambda layer, *args, **kwargs: f"{layer.node.op}.{stage}",
+                    args = lambda layer, *args, **kwargs: {"node": layer.node.name})
+
+
 class ONNXLayer():
     """Deeploy abstraction to represent one operator in an ONNX graph
     """
@@ -1842,6 +2246,7 @@ class ONNXLayer():
             mapper.resetDiscardedBindings()
         self.discardedMappers = set()
 
+    @_profiledLayer("parse")
     def parse(self, ctxt: NetworkContext, default_channels_first: bool) -> Tuple[NetworkContext, bool]:
         """Iterate through all possible mappers and elect the first one that work
 
@@ -1916,6 +2321,7 @@ class ONNXLayer():
 
         return None
 
+    @_profiledLayer("typeCheck")
     def typeCheck(self, ctxt: NetworkContext) -> Tuple[NetworkContext, bool]:
         """Invokes the mapper's typeCheck method
 
@@ -1940,6 +2346,7 @@ class ONNXLayer():
 
         return ctxt, ret
 
+    @_profiledLayer("bind")
     def bind(self, ctxt: NetworkContext) -> Tuple[NetworkContext, bool]:
         """Attempt to bind the mapper; discard mapper if binding does not work
 
@@ -1986,6 +2393,7 @@ class ONNXLayer():
         self.discardedMappers.append(self.mapper)
         return ctxt, False
 
+    @_profiledLayer("codeTransform")
     def codeTransform(self, ctxt: NetworkContext, verbose: CodeGenVerbosity = _NoVerbosity) -> NetworkContext:
         """Apply CodeTransformations to associated mapper's binder
 
@@ -2074,8 +2482,9 @@ class TopologyOptimizer():
 
         """
         for _pass in self.passes:
-            graph = _pass.apply(graph)
-            graph.cleanup().toposort()
+            with profileSection(type(_pass).__name__, "TopologyOptimizationPass"):
+                graph = _pass.apply(graph)
+                graph.cleanup().toposort()
         return graph
 
 
@@ -2123,8 +2532,9 @@ class NetworkOptimizer(TopologyOptimizer):
 
         """
         for _pass in self.passes:
-            ctxt, graph = _pass.apply(ctxt, graph)  # type: ignore
-            graph.cleanup().toposort()
+            with profileSection(type(_pass).__name__, "NetworkOptimizationPass"):
+                ctxt, graph = _pass.apply(ctxt, graph)  # type: ignore
+                graph.cleanup().toposort()
         return ctxt, graph
 
 
@@ -2195,7 +2605,8 @@ class CodeTransformation():
 
         """
         for _pass in self.passes:
-            ctxt, executionBlock = _pass.apply(ctxt, executionBlock, name, verbose)
+            with profileSection(type(_pass).__name__, "CodeTransformationPass", node = name):
+                ctxt, executionBlock = _pass.apply(ctxt, executionBlock, name, verbose)
         return ctxt, executionBlock
 
 
@@ -2293,7 +2704,8 @@ class NetworkContainer():
                  inputTypes: Dict[str, Type[Pointer]],
                  scheduler: Callable[[gs.Graph], Schedule] = lambda graph: list(graph.nodes),
                  name: str = 'DeeployNetwork',
-                 deeployStateDir: str = "DeeployState"):
+                 deeployStateDir: str = "DeeployState",
+                 deeployStateExportLevel: DeeployStateExportLevel = DeeployStateExportLevel.ALL):
         """Initializes a new NetworkContainer and its NetworkContext
 
         Parameters
@@ -2311,6 +2723,8 @@ class NetworkContainer():
             Prefix to use in deployment to uniquify tensor names
         deeployStateDir : str
             Path to a directory to dump intermediate outputs
+        deeployStateExportLevel : DeeployStateExportLevel
+            Which intermediate outputs to dump
 
 
         """
@@ -2331,6 +2745,8 @@ class NetworkContainer():
                                    transientBuffer = self.Platform.TransientBuffer)
 
         self.deeployStateDir = deeployStateDir
+        self.deeployStateExportLevel = deeployStateExportLevel
+        self._deeployStateSnapshot: Optional[NetworkContextSnapshot] = None
 
         self.bound = False
         self.transformed = False
@@ -2401,6 +2817,7 @@ class NetworkContainer():
             outputs += [value]
         return outputs
 
+    @profiled("NetworkDeployer")
     def codeTransform(self, verbose: CodeGenVerbosity = _NoVerbosity):
         """Apply code transformations on every layer's execution block
 
@@ -2465,6 +2882,7 @@ class NetworkContainer():
         return newCtxt, True
 
     # Don't override this
+    @profiled("NetworkDeployer")
     def parse(self, default_channels_first: bool = True) -> bool:
         """Parses the full network by iteratively exploring mapping and binding options with backtracking
 
@@ -2507,7 +2925,7 @@ class NetworkContainer():
         while (idx < len(scheduledLayerList)):
             currentLayer = scheduledLayerList[idx]
 
-            stCtxt = copy.deepcopy(ctxt)
+            stCtxt = ctxt.snapshot()
 
             newCtxt, parseSuccess = self._parseNode(currentLayer, ctxt, default_channels_first)
 
@@ -2548,6 +2966,7 @@ class NetworkContainer():
         self.parsed = True
         return True
 
+    @profiled("NetworkDeployer")
     def bind(self) -> bool:
         """Bind the entire network layer-by-layer
 
@@ -2584,6 +3003,7 @@ class NetworkContainer():
         return True
 
     # Don't override this
+    @profiled("NetworkDeployer")
     def generateInferenceCode(self) -> str:
         """Generate the actual inference function for the entire network
 
@@ -2735,9 +3155,45 @@ class NetworkContainer():
         raise NotImplementedError("Worst case buffer size is not known or not implemented!")
 
     # Don't override this
-    def generateBufferInitializationCode(self) -> str:
+    def generateBufferInitializationCode(self,
+                                         binaryConstantDir: Optional[str] = None,
+                                         binaryConstantSection: str = ".data",
+                                         weightsBlob: Optional[str] = None,
+                                         weightsBlobLoading: str = "incbin",
+                                         weightsBlobAlignment: int = 16) -> str:
         """Generates code for all forward-declaration of buffers used during inference
 
+        Parameters
+        ----------
+        binaryConstantDir : Optional[str]
+            If set, the values of deployed ConstantBuffers are dumped
+            as raw binary files into this directory and included with
+            the assembler's `.incbin` directive instead of being
+            emitted as C initializer lists. Platform-specific
+            placement of the buffers is not preserved. The files are
+            referenced relative to the parent of this directory,
+            which has to be on the include path of the assembler.
+        binaryConstantSection : str
+            Linker section of ConstantBuffers included from binary
+            files
+        weightsBlob : Optional[str]
+            If set, the values of all deployed ConstantBuffers are
+            packed into this single binary file instead of being
+            emitted as C initializer lists, and the generated code
+            refers to them by their offset within the file.
+            Platform-specific placement of the buffers is not
+            preserved.
+        weightsBlobLoading : str
+            How the generated code loads the weights blob: "incbin"
+            includes it with the assembler's `.incbin` directive in
+            `binaryConstantSection`, "mmap" maps it into memory at
+            program start on POSIX hosts. The path of the mapped file
+            can be overridden with the `DEEPLOY_WEIGHTS_BLOB`
+            environment variable.
+        weightsBlobAlignment : int
+            Alignment of every ConstantBuffer within the weights blob,
+            in bytes
+
         Returns
         -------
         str
@@ -2757,14 +3213,38 @@ class NetworkContainer():
         inputs = self.inputs()
         outputs = self.outputs()
 
+        assert binaryConstantDir is None or weightsBlob is None, \
+            "Constants are either dumped to one binary file each or to a weights blob!"
+        assert weightsBlobLoading in ("incbin", "mmap"), f"Unknown weights blob loading {weightsBlobLoading}!"
+
+        if binaryConstantDir is not None:
+            os.makedirs(binaryConstantDir, exist_ok = True)
+
         callStack = ''
+        if weightsBlob is not None:
+            callStack += self._generateWeightsBlobCode(ctxt, weightsBlob, weightsBlobLoading, weightsBlobAlignment,
+                                                       binaryConstantSection)
+
         for node in ctxt.globalObjects.values():
             if isinstance(node, VariableBuffer) and not isinstance(node, StructBuffer):
                 assert issubclass(node._type, Pointer), f"Global VariableBuffer {node.name} is not a Pointer!"
                 if node._deploy:
+                    if weightsBlob is not None and isinstance(node, ConstantBuffer):
+                        continue
                     name = node.name
                     node.name = ctxt._mangle(node.name)
-                    callStack += node.init()
+                    if binaryConstantDir is not None and isinstance(node, ConstantBuffer):
+                        fileName = os.path.join(binaryConstantDir, node.name + _binaryExtension)
+                        node.dumpValues(fileName)
+                        callStack += _incbinConstantTemplate.generate(
+                            name = node.name,
+                            type = node._type,
+                            size = int(np.prod(node.shape)),
+                            fileName = os.path.relpath(fileName, os.path.dirname(os.path.abspath(binaryConstantDir))),
+                            alignment = max(4, node._type.referencedType.typeWidth // 8),
+                            section = binaryConstantSection)
+                    else:
+                        callStack += node.init()
                     node.name = name
 
         for node in ctxt.globalObjects.values():
@@ -2779,6 +3259,40 @@ class NetworkContainer():
 
         return callStack
 
+    def _generateWeightsBlobCode(self, ctxt: NetworkContext, fileName: str, loading: str, alignment: int,
+                                 section: str) -> str:
+        # Pack all deployed constants into one file, each one aligned, and generate the table of their offsets
+        fileName = os.path.abspath(fileName)
+        os.makedirs(os.path.dirname(fileName), exist_ok = True)
+
+        table = []
+        offset = 0
+        with open(fileName, "wb") as blob:
+            for node in ctxt.globalObjects.values():
+                if not (isinstance(node, ConstantBuffer) and node._deploy):
+                    continue
+                padding = -offset % alignment
+                blob.write(bytes(padding))
+                offset += padding
+                node.dumpValues(blob)
+                table.append(
+                    (ctxt._mangle(node.name), node._type.referencedType.typeName, int(np.prod(node.shape)), offset))
+                offset += node.binarySize
+            padding = -offset % alignment
+            blob.write(bytes(padding))
+            offset += padding
+
+        if len(table) == 0:
+            return ""
+
+        template = _weightsBlobIncbinTemplate if loading == "incbin" else _weightsBlobMmapTemplate
+        return template.generate(name = ctxt._mangle("weights_blob"),
+                                 fileName = fileName,
+                                 size = offset,
+                                 alignment = alignment,
+                                 section = section,
+                                 table = table)
+
     def generateBufferAllocationCode(self) -> str:
         """Generates code to allocate space for the global input and output buffer of the network
 
@@ -2962,13 +3476,34 @@ class NetworkContainer():
         return totalSum
 
         # Don't override this
+    @staticmethod
+    def _storeWeights(model: onnx.ModelProto, folderPath: str):
+        # Initializers are stored content-addressed, so that every snapshot in folderPath references the same files
+        weightStorePath = os.path.join(folderPath, _weightStoreDirname)
+        os.makedirs(weightStorePath, exist_ok = True)
+
+        for tensor in model.graph.initializer:
+            if not tensor.HasField("raw_data") or len(tensor.raw_data) < _weightStoreThreshold:
+                continue
+
+            digest = hashlib.sha256(tensor.raw_data).hexdigest()
+            location = os.path.join(_weightStoreDirname, digest + _binaryExtension)
+            absoluteLocation = os.path.join(folderPath, location)
+
+            if not os.path.exists(absoluteLocation):
+                with open(absoluteLocation + ".tmp", 'wb') as f:
+                    f.write(tensor.raw_data)
+                os.replace(absoluteLocation + ".tmp", absoluteLocation)
+
+            set_external_data(tensor, location, offset = 0, length = len(tensor.raw_data))
+            tensor.ClearField("raw_data")
+
+    # Don't override this
     def _exportGraph(self, folderPath, fileName):
-        relativeDataPath = os.path.join(folderPath, fileName + _dataExtension)
-        absoluteDataPath = os.path.abspath(relativeDataPath)
         relativeOnnxPath = os.path.join(folderPath, fileName + _graphExtension)
         absoluteOnnxPath = os.path.abspath(relativeOnnxPath)
 
-        if not os.path.isabs(absoluteOnnxPath) or not os.path.isabs(absoluteDataPath):
+        if not os.path.isabs(absoluteOnnxPath):
             raise OSError(f"Error exporting the context to: {absoluteOnnxPath}")
 
         model = gs.export_onnx(self.graph)
@@ -2995,12 +3530,17 @@ class NetworkContainer():
                     if hasattr(gObject._type, "referencedType"):
                         tensor.doc_string += f"Reference Type: {gObject._type.referencedType.typeName}"
 
-        convert_model_to_external_data(model, location = fileName + _dataExtension)
+        self._storeWeights(model, os.path.dirname(absoluteOnnxPath))
         onnx.save(model, absoluteOnnxPath)
 
+    @profiled("NetworkDeployer")
     def exportDeeployState(self, folderPath: str, fileName: str):
         """Export compressed network context and neural network graph
 
+        Initializers are written to a content-addressed weight store
+        shared by all states in folderPath. The context is exported
+        incrementally with respect to the previously exported state.
+
         Parameters
         ----------
         folderPath : str
@@ -3012,7 +3552,15 @@ class NetworkContainer():
 
         os.makedirs(os.path.abspath(folderPath), exist_ok = True)
         self._exportGraph(folderPath, fileName)
-        self.ctxt.exportNetworkContext(folderPath, fileName)
+        self._deeployStateSnapshot = self.ctxt.exportNetworkContext(folderPath, fileName, self._deeployStateSnapshot)
+
+    def _exportDeeployStage(self, fileName: str, final: bool = False):
+        # Exports the deeployState of a deployment stage if requested by deeployStateExportLevel
+        if self.deeployStateExportLevel == DeeployStateExportLevel.NONE:
+            return
+        if self.deeployStateExportLevel == DeeployStateExportLevel.FINAL and not final:
+            return
+        self.exportDeeployState(self.deeployStateDir, fileName)
 
     @staticmethod
     def _importONNXGraph(folderPath: str, fileName: str) -> gs.Graph:
@@ -3037,7 +3585,7 @@ class NetworkContainer():
 
         """
         self.graph = NetworkDeployer._importONNXGraph(folderPath, f"{fileName}")
-        self.ctxt = NetworkContext.importNetworkCtxt(folderPath, f"{fileName}")
+        self.ctxt = NetworkContext.importNetworkContext(folderPath, f"{fileName}")
 
 
 class NetworkDeployer(NetworkContainer):
@@ -3052,7 +3600,9 @@ class NetworkDeployer(NetworkContainer):
                  scheduler: Callable[[gs.Graph], Schedule] = lambda graph: list(graph.nodes),
                  name: str = 'DeeployNetwork',
                  default_channels_first: bool = True,
-                 deeployStateDir: str = "DeeployState"):
+                 deeployStateDir: str = "DeeployState",
+                 deeployStateExportLevel: DeeployStateExportLevel = DeeployStateExportLevel.ALL,
+                 batchSize: int = 1):
         """Initialize a new NetworkDeployer
 
         Parameters
@@ -3078,17 +3628,31 @@ class NetworkDeployer(NetworkContainer):
             HxWxC, i.e. channels are last
         deeployStateDir : str
             Directory where intermediate states are saved
+        deeployStateExportLevel : DeeployStateExportLevel
+            Which intermediate states are saved
+        batchSize : int
+            Number of samples processed by one inference; the leading
+            dimension of all activations of the graph is scaled from 1
+            to batchSize in the front end
 
 
         """
-        super().__init__(graph, deploymentPlatform, inputTypes, scheduler, name, deeployStateDir = deeployStateDir)
+        super().__init__(graph,
+                         deploymentPlatform,
+                         inputTypes,
+                         scheduler,
+                         name,
+                         deeployStateDir = deeployStateDir,
+                         deeployStateExportLevel = deeployStateExportLevel)
 
         self.loweringOptimizer = loweringOptimizer
         self.default_channels_first = default_channels_first
+        self.batchSize = batchSize
 
         self.prepared = False
 
     # Don't override this
+    @profiled("NetworkDeployer")
     def lower(self, graph: gs.Graph) -> gs.Graph:
         """Apply the lowering optimize
 
@@ -3126,6 +3690,36 @@ class NetworkDeployer(NetworkContainer):
             if np.prod(inp.shape) == 0:
                 self.graph.inputs.remove(inp)
 
+    # Don't override this
+    # Scale the batch dimension of all activations
+    def _rebatchGraph(self, graph: gs.Graph):
+        if self.batchSize == 1:
+            return
+
+        assert self.batchSize > 1, f"Invalid batch size {self.batchSize}!"
+
+        for node in graph.nodes:
+            if node.op == "Transpose" and node.attrs['perm'][0] != 0:
+                raise RuntimeError(f"Cannot batch the network, {node.name} transposes the batch dimension!")
+            if node.op == "Gather" and node.attrs.get('axis', 0) == 0:
+                raise RuntimeError(f"Cannot batch the network, {node.name} gathers along the batch dimension!")
+
+            # Constants are not shared between nodes anymore
+            if node.op == "Reshape" and isinstance(node.inputs[1], gs.Constant) and node.inputs[1].values[0] == 1:
+                newShape = node.inputs[1].values.copy()
+                newShape[0] = self.batchSize
+                node.inputs[1].values = newShape
+
+        for tensor in graph.tensors().values():
+            if not isinstance(tensor, gs.Variable) or tensor.shape is None:
+                continue
+            if len(tensor.shape) == 0 or tensor.shape[0] != 1:
+                raise RuntimeError(
+                    f"Cannot batch the network, {tensor.name} of shape {tensor.shape} has no batch dimension of size 1!"
+                )
+            tensor.shape = [self.batchSize] + list(tensor.shape[1:])
+
+    @profiled("NetworkDeployer")
     def frontEnd(self):
         """API hook to prepare the graph to be deployed and build the initial NetworkContext
 
@@ -3140,20 +3734,23 @@ class NetworkDeployer(NetworkContainer):
 
         self._duplicateConstants(self.graph)
 
-        self.exportDeeployState(self.deeployStateDir, _middlewarePreLoweringFilename)
+        self._rebatchGraph(self.graph)
+
+        self._exportDeeployStage(_middlewarePreLoweringFilename)
 
         self.graph = self.lower(self.graph)  # This lowers the graph to a deployable format
 
-        self.exportDeeployState(self.deeployStateDir, _middlewarePostLoweringFilename)
+        self._exportDeeployStage(_middlewarePostLoweringFilename)
 
         try:
             self.parse(self.default_channels_first)  # This reparses the lowered graph
         except Exception as e:
             print("Error during parsing! Exporting deeploy state!")
-            self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+            self._exportDeeployStage(_backendPostBindingFilename, final = True)
             raise e
 
     # Don't Override this
+    @profiled("NetworkDeployer")
     def midEnd(self):
         """API hook to be used after finalizing kernel selection; hoist transient buffers, and perform low-level code optimizations (e.g. tiling and static memory allocation)
         """
@@ -3161,10 +3758,11 @@ class NetworkDeployer(NetworkContainer):
             self.bind()
         except Exception as e:
             print("Error during binding! Exporting deeploy state!")
-            self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+            self._exportDeeployStage(_backendPostBindingFilename, final = True)
             raise e
 
     # Don't override this unless you know what you are doin
+    @profiled("NetworkDeployer")
     def backEnd(self, verbose: CodeGenVerbosity = _NoVerbosity):
         """API hook to generate code once kernel implementations are picked and tiling, memory allocation, and other low-level optimizations have been done.
 
@@ -3175,11 +3773,11 @@ class NetworkDeployer(NetworkContainer):
 
         """
 
-        self.exportDeeployState(self.deeployStateDir, _backendPostParsingFilename)
+        self._exportDeeployStage(_backendPostParsingFilename)
 
         self.codeTransform(verbose)
 
-        self.exportDeeployState(self.deeployStateDir, _backendPostBindingFilename)
+        self._exportDeeployStage(_backendPostBindingFilename, final = True)
 
     # Don't override this
     def prepare(self, verbose: CodeGenVerbosity = _NoVerbosity):
@@ -69,7 +69,7 @@ class FutureGeneration(CodeTransformationPass, IntrospectiveCodeTransformationMi
                     **reference._instance._bufferRepresentation()
                 })
                 if name not in ctxt.lookup(stateReference)._users:
-                    ctxt.lookup(stateReference)._users.append(name)
+                    ctxt.lookup(stateReference)._users += [name]
 
             # SCHEREMO: Early resolve if we are the first user - otherwise it has been resolved already (in a static scheduler)!
             elif name == reference._users[0]:
@@ -78,7 +78,7 @@ class FutureGeneration(CodeTransformationPass, IntrospectiveCodeTransformationMi
                     **reference._instance._bufferRepresentation()
                 })
                 if name not in ctxt.lookup(stateReference)._users:
-                    ctxt.lookup(stateReference)._users.append(name)
+                    ctxt.lookup(stateReference)._users += [name]
         return ctxt, executionBlock
 
     def _dispatchFutures(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
@@ -93,5 +93,5 @@ class FutureGeneration(CodeTransformationPass, IntrospectiveCodeTransformationMi
                     **reference._instance._bufferRepresentation()
                 })
                 if name not in ctxt.lookup(stateReference)._users:
-                    ctxt.lookup(stateReference)._users.append(name)
+                    ctxt.lookup(stateReference)._users += [name]
         return ctxt, executionBlock
@@ -80,9 +80,17 @@ BasicDWConv1DBinding = NodeBinding(ConvChecker([PointerClass(int8_t), PointerCla
 BasicConv2DBinding = NodeBinding(ConvChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
                                  ConvTemplate.reference2DTemplate, BasicTransformer)
 
+BasicConv2DParallelBinding = NodeBinding(
+    ConvChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
+    ConvTemplate.reference2DParallelTemplate, BasicTransformer)
+
 BasicDWConv2DBinding = NodeBinding(ConvChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
                                    DWConvTemplate.reference2DTemplate, BasicTransformer)
 
+BasicDWConv2DParallelBinding = NodeBinding(
+    ConvChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
+    DWConvTemplate.reference2DParallelTemplate, BasicTransformer)
+
 BasicDebugPrintBindings = [
     NodeBinding(DebugPrintChecker([PointerClass(type)], [PointerClass(type)]), DebugPrintTemplate.referenceTemplate,
                 ReshapeSkipTransformer) for type in SignedIntegerDataTypes
@@ -101,6 +109,11 @@ BasicGEMMBinding = NodeBinding(
         [PointerClass(int8_t), PointerClass(int8_t), PointerClass(int32_t)], [PointerClass(int32_t)]),
     GemmTemplate.referenceTemplate, BasicTransformer)
 
+BasicGEMMParallelBinding = NodeBinding(
+    GEMMChecker(
+        [PointerClass(int8_t), PointerClass(int8_t), PointerClass(int32_t)], [PointerClass(int32_t)]),
+    GemmTemplate.referenceParallelTemplate, BasicTransformer)
+
 BasicIntegerDivBinding = NodeBinding(
     IntegerDivChecker([PointerClass(int32_t), PointerClass(int32_t)], [PointerClass(int32_t)]),
     IntegerDivTemplate.referenceTemplate, BasicTransformer)
@@ -119,6 +132,10 @@ BasicLayerNormBinding = NodeBinding(
 BasicMatMulBinding = NodeBinding(MatMulChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
                                  MatMulTemplate.referenceTemplate, BasicTransformer)
 
+BasicMatMulParallelBinding = NodeBinding(
+    MatMulChecker([PointerClass(int8_t), PointerClass(int8_t)], [PointerClass(int32_t)]),
+    MatMulTemplate.referenceParallelTemplate, BasicTransformer)
+
 BasicMaxPool2DBinding = NodeBinding(MaxPoolChecker([PointerClass(int8_t)], [PointerClass(int8_t)]),
                                     MaxPoolTemplate.referenceTemplate, BasicTransformer)
 
@@ -159,6 +176,13 @@ BasicRQSBindings = [
         BasicTransformer) for type in SignedIntegerDataTypes
 ]
 
+BasicRQSParallelBindings = [
+    NodeBinding(
+        RequantShiftChecker([PointerClass(type), PointerClass(int32_t),
+                             PointerClass(int32_t)], [PointerClass(int8_t)]),
+        RequantShiftTemplate.referenceParallelTemplate, BasicTransformer) for type in SignedIntegerDataTypes
+]
+
 BasicRQSGELUBinding = NodeBinding(
     GELUChecker([PointerClass(int8_t),
                  PointerClass(int32_t),
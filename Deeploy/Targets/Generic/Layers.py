@@ -197,6 +197,9 @@ class GEMMLayer(ONNXLayer):
                       channels_first) -> Tuple[Shape, Shape]:
         if operatorRepresentation['transA']:
             M = inputShapes[0][-1]
+        elif operatorRepresentation.get('fuseBatch', False) and np.prod(inputShapes[1][:-2]) == 1:
+            # The batch dimensions of A are folded into M
+            M = int(np.prod(inputShapes[0][:-1]))
         else:
             M = inputShapes[0][-2]
 
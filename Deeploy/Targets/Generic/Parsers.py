@@ -820,10 +820,14 @@ class GatherParser(NodeParser):
             self.operatorRepresentation[outputs[idx]] = ctxt.lookup(outputNode.name).name
 
         axis = self.operatorRepresentation['axis']
+        shape = ctxt.lookup(node.inputs[0].name).shape
         self.operatorRepresentation['numIndices'] = int(
             np.prod(ctxt.lookup(self.operatorRepresentation['indices']).values.shape))
-        self.operatorRepresentation['offset'] = np.prod(ctxt.lookup(node.inputs[0].name).shape[axis + 1:])
-        self.operatorRepresentation['size'] = np.prod(ctxt.lookup(node.inputs[0].name).shape)
+        self.operatorRepresentation['offset'] = np.prod(shape[axis + 1:])
+        self.operatorRepresentation['size'] = np.prod(shape)
+        # Slices in front of the gathered axis are gathered one after the other
+        self.operatorRepresentation['batch'] = int(np.prod(shape[:axis]))
+        self.operatorRepresentation['axisLength'] = shape[axis]
 
         return ctxt, True
 
@@ -954,7 +958,8 @@ class RequantShiftParser(NodeParser, RQSParserInterface):
         self.operatorRepresentation['channel_width'] = int(self.operatorRepresentation['size'] /
                                                            self.operatorRepresentation['channels'])
 
-        if len(data_in.shape) == 4:
+        # mul and add are broadcast along the batch dimension
+        if len(data_in.shape) >= 2:
             self.operatorRepresentation['batch'] = data_in.shape[0]
             self.operatorRepresentation['channel_width'] = int(self.operatorRepresentation['channel_width'] /
                                                                self.operatorRepresentation['batch'])
@@ -1461,9 +1466,11 @@ class iLayerNormParser(NodeParser):
 
 class MatMulParser(NodeParser):
 
-    def __init__(self, noBiasHoisting = True):
+    def __init__(self, noBiasHoisting = True, fuseBatch = False):
         super().__init__()
         self.noBiasHoisting = noBiasHoisting
+        # Fold the batch dimensions of A into M if all batches share B
+        self.fuseBatch = fuseBatch
 
     def parseNode(self, node: gs.Node) -> (bool):
 
@@ -1475,6 +1482,7 @@ class MatMulParser(NodeParser):
             self.operatorRepresentation['beta'] = 1
             self.operatorRepresentation['transB'] = 0
             self.operatorRepresentation['transA'] = 0
+            self.operatorRepresentation['fuseBatch'] = self.fuseBatch
 
         return ret
 
@@ -1520,6 +1528,14 @@ class MatMulParser(NodeParser):
 
         # SCHEREMO: Assert that batch is the same on both matrices
         W_batched = (self.operatorRepresentation['batch'] == np.prod(ctxt.lookup(node.inputs[1].name).shape[:-2]))
+
+        # Multiply all rows of A with the shared B in a single call
+        if self.fuseBatch and not W_batched and not self.operatorRepresentation['transA'] and np.prod(
+                ctxt.lookup(node.inputs[1].name).shape[:-2]) == 1:
+            self.operatorRepresentation['M'] = self.operatorRepresentation['batch'] * self.operatorRepresentation['M']
+            self.operatorRepresentation['batch'] = 1
+            W_batched = True
+
         self.operatorRepresentation['W_batched'] = W_batched
 
         return ctxt, ret
@@ -1566,9 +1582,9 @@ class RQMatMulParser(MatMulParser, RQSParserInterface):
 # This parser combines Matmul nodes and GEMM nodes to the more general GEMM nodes
 class GEMMParser(MatMulParser):
 
-    def __init__(self, noBiasHoisting = True):
+    def __init__(self, noBiasHoisting = True, fuseBatch = False):
         self.noBiasHoisting = noBiasHoisting
-        super().__init__()
+        super().__init__(fuseBatch = fuseBatch)
 
     def parseNode(self, node: gs.Node) -> (bool):
 
@@ -1600,6 +1616,8 @@ class GEMMParser(MatMulParser):
             else:
                 self.operatorRepresentation['transB'] = 0
 
+            self.operatorRepresentation['fuseBatch'] = self.fuseBatch
+
             return True
         # This might be a matmul node -> Cast up
         else:
@@ -2037,8 +2055,8 @@ class GenericDWConv2DParser(Conv2DParser):
 
 class GenericGEMMParser(GEMMParser):
 
-    def __init__(self, noBiasHoisting = True):
-        super().__init__(noBiasHoisting)
+    def __init__(self, noBiasHoisting = True, fuseBatch = False):
+        super().__init__(noBiasHoisting, fuseBatch)
 
     def parseNode(self, node: gs.Node) -> (bool):
 
@@ -28,12 +28,13 @@
 from Deeploy.DeeployTypes import ConstantBuffer, DeploymentEngine, DeploymentPlatform, NodeMapper, NodeTemplate, \
     StructBuffer, TopologyOptimizer, TransientBuffer, VariableBuffer
 from Deeploy.Targets.Generic.Bindings import BasicAddBindings, BasicConv1DBinding, BasicConv2DBinding, \
-    BasicDebugPrintBindings, BasicDWConv1DBinding, BasicDWConv2DBinding, BasicGatherBindings, BasicGELUBinding, \
-    BasicGEMMBinding, BasicIntegerDivBinding, BasicITAPartialSoftmaxBinding, BasicITASoftmaxBinding, \
-    BasicLayerNormBinding, BasicMatMulBinding, BasicMaxPool2DBinding, BasicMulBindings, BasicPad1DBindings, \
+    BasicConv2DParallelBinding, BasicDebugPrintBindings, BasicDWConv1DBinding, BasicDWConv2DBinding, \
+    BasicDWConv2DParallelBinding, BasicGatherBindings, BasicGELUBinding, BasicGEMMBinding, BasicGEMMParallelBinding, \
+    BasicIntegerDivBinding, BasicITAPartialSoftmaxBinding, BasicITASoftmaxBinding, BasicLayerNormBinding, \
+    BasicMatMulBinding, BasicMatMulParallelBinding, BasicMaxPool2DBinding, BasicMulBindings, BasicPad1DBindings, \
     BasicPad2DBindings, BasicReduceMeanBindings, BasicReduceSumBindings, BasicReshapeBindings, \
-    BasicRQIntegerDivBinding, BasicRQSBindings, BasicRQSGELUBinding, BasicSliceBindings, BasicSoftmaxBinding, \
-    BasicTransposeBindings, DummyBinding
+    BasicRQIntegerDivBinding, BasicRQSBindings, BasicRQSGELUBinding, BasicRQSParallelBindings, BasicSliceBindings, \
+    BasicSoftmaxBinding, BasicTransposeBindings, DummyBinding
 from Deeploy.Targets.Generic.Layers import AddLayer, ConvLayer, DebugPrintLayer, GatherLayer, GEMMLayer, \
     IntegerDivLayer, ITAMaxLayer, MatMulLayer, MaxPoolLayer, MulLayer, PadLayer, ReduceMeanLayer, ReduceSumLayer, \
     RequantShiftLayer, ReshapeLayer, RQIntegerDivLayer, RQSiGELULayer, SliceLayer, TransposeLayer, iGELULayer, \
@@ -56,12 +57,12 @@ DWConv2DMapper = NodeMapper(GenericDWConv2DParser(), [BasicDWConv2DBinding])
 FlattenMapper = NodeMapper(FlattenParser(), BasicReshapeBindings)
 GatherMapper = NodeMapper(GatherParser(), BasicGatherBindings)
 GELUMapper = NodeMapper(iGELUParser(), [BasicGELUBinding])
-GEMMMapper = NodeMapper(GenericGEMMParser(), [BasicGEMMBinding])
+GEMMMapper = NodeMapper(GenericGEMMParser(fuseBatch = True), [BasicGEMMBinding])
 iLayerNormMapper = NodeMapper(iLayerNormParser(), [BasicLayerNormBinding])
 IntegerDivMapper = NodeMapper(IntegerDivParser(), [BasicIntegerDivBinding])
 ITAMaxMapper = NodeMapper(ITAMaxParser(), [BasicITASoftmaxBinding])
 ITAPartialMaxMapper = NodeMapper(ITAPartialMaxParser(), [BasicITAPartialSoftmaxBinding])
-MatMulMapper = NodeMapper(MatMulParser(), [BasicMatMulBinding])
+MatMulMapper = NodeMapper(MatMulParser(fuseBatch = True), [BasicMatMulBinding])
 MaxPoolMapper = NodeMapper(GenericMaxPool2DParser(), [BasicMaxPool2DBinding])
 MulMapper = NodeMapper(MulParser(), BasicMulBindings)
 Pad1DMapper = NodeMapper(Pad1DParser(), BasicPad1DBindings)
@@ -117,6 +118,22 @@ GenericMapping = {
     # 'GlobalAveragePool': ConvLayer([DummyMapper]),
 }
 
+Conv2DParallelMapper = NodeMapper(GenericConv2DParser(), [BasicConv2DParallelBinding])
+DWConv2DParallelMapper = NodeMapper(GenericDWConv2DParser(), [BasicDWConv2DParallelBinding])
+GEMMParallelMapper = NodeMapper(GenericGEMMParser(fuseBatch = True), [BasicGEMMParallelBinding])
+MatMulParallelMapper = NodeMapper(MatMulParser(fuseBatch = True), [BasicMatMulParallelBinding])
+RequantShiftParallelMapper = NodeMapper(RequantShiftParser(), BasicRQSParallelBindings)
+
+# Splits the heavy kernels among the numThreads threads passed to RunNetwork
+GenericParallelMapping = {
+    **GenericMapping,
+    'Conv': ConvLayer([Conv2DParallelMapper, DWConv2DParallelMapper, Conv1DMapper, DWConv1DMapper]),
+    'Gemm': GEMMLayer([GEMMParallelMapper]),
+    'MatMul': GEMMLayer([MatMulParallelMapper]),
+    'MatMulInteger': MatMulLayer([MatMulParallelMapper]),
+    'RequantShift': RequantShiftLayer([RequantShiftParallelMapper]),
+}
+
 
 class GenericVariableBuffer(VariableBuffer):
 
@@ -28,8 +28,10 @@ from Deeploy.DeeployTypes import NodeTemplate
 referenceTemplate = NodeTemplate("""
 // Gather (Name: ${nodeName}, Op: ${nodeOp})
 BEGIN_SINGLE_CORE
-for (uint32_t i=0; i<${numIndices}; ++i) {
-    memcpy(${data_out}, ${data_in} + ${indices}[i] * ${offset}, ${offset});
+for (uint32_t b=0; b<${batch}; ++b) {
+    for (uint32_t i=0; i<${numIndices}; ++i) {
+        memcpy(${data_out} + (b * ${numIndices} + i) * ${offset}, ${data_in} + (b * ${axisLength} + ${indices}[i]) * ${offset}, ${offset} * sizeof(${data_out_type.referencedType.typeName}));
+    }
 }
 END_SINGLE_CORE
 """)
@@ -92,3 +92,40 @@ BEGIN_SINGLE_CORE
     }
 END_SINGLE_CORE
 """)
+
+referenceParallelTemplate = _GemmTemplate("""
+// GEMM Parallel (Name: ${nodeName}, Op: ${nodeOp})
+BEGIN_PARALLEL
+    ${A_type.typeName} ref_${data_out}_${A} = ${A};
+    ${B_type.typeName} ref_${data_out}_${B} = ${B};
+    ${C_type.typeName} ref_${data_out}_${C} = ${C};
+    ${data_out_type.typeName} ref_${data_out}_${data_out} = ${data_out};
+
+    for(uint32_t i=0;i<${batch};i++){
+        Gemm_parallel_s${A_type.referencedType.typeWidth}_s${B_type.referencedType.typeWidth}_s${C_type.referencedType.typeWidth}_s${data_out_type.referencedType.typeWidth}(
+            ref_${data_out}_${A},
+            ref_${data_out}_${B},
+            ref_${data_out}_${C},
+            ref_${data_out}_${data_out},
+            ${M},
+            ${N},
+            ${O},
+            ${alpha},
+            ${beta},
+            ${transA},
+            ${transB},
+            ${A_offset},
+            ${B_offset},
+            ${C_offset},
+            ${Y_offset},
+            thread_id,
+            thread_count
+        );
+
+        ref_${data_out}_${A} += ${M} * ${N};
+        ref_${data_out}_${B} += ${N} * ${O};
+        ref_${data_out}_${C} += ${M} * ${O};
+        ref_${data_out}_${data_out} += ${M} * ${O};
+    }
+END_PARALLEL
+""")
@@ -76,3 +76,30 @@ BEGIN_SINGLE_CORE
     }
 END_SINGLE_CORE
 """)
+
+referenceParallelTemplate = _MatMulTemplate("""
+// MatMul Parallel (Name: ${nodeName}, Op: ${nodeOp})
+BEGIN_PARALLEL
+    ${A_type.typeName} ref_${data_out}_${A} = ${A};
+    ${B_type.typeName} ref_${data_out}_${B} = ${B};
+    ${data_out_type.typeName} ref_${data_out}_${data_out} = ${data_out};
+
+    for(uint32_t i=0;i<${batch};i++){
+        MatMul_parallel_s${A_type.referencedType.typeWidth}_s${B_type.referencedType.typeWidth}_s${data_out_type.referencedType.typeWidth}(
+            ref_${data_out}_${A},
+            ref_${data_out}_${B},
+            ref_${data_out}_${data_out},
+            ${M},
+            ${N},
+            ${O},
+            ${A_offset}, ${B_offset}, ${C_offset},
+            thread_id,
+            thread_count
+        );
+
+        ref_${data_out}_${A} += ${M} * ${N};
+        ref_${data_out}_${B} += ${N} * ${O};
+        ref_${data_out}_${data_out} += ${M} * ${O};
+    }
+END_PARALLEL
+""")
@@ -69,3 +69,21 @@ BEGIN_SINGLE_CORE
     %endif
 END_SINGLE_CORE
 """)
+
+referenceParallelTemplate = _RequantShiftTemplate("""
+<%
+if isinstance(log2D, int):
+    log2Dstring = log2D
+else:
+    log2Dstring = "*"+log2D
+%>
+
+// RequantShift Parallel (Name: ${nodeName}, Op: ${nodeOp})
+BEGIN_PARALLEL
+    % if channels_first:
+    RequantShift_parallel_s${data_in_type.referencedType.typeWidth}_s${data_out_type.referencedType.typeWidth}_NCHW(${data_in}, ${size}, ${mul}, ${add}, ${data_out}, ${log2Dstring}, ${channel_width}, ${input_offset}, ${output_offset}, ${output_min}, ${output_max}, 1, thread_id, thread_count);
+    % else:
+    RequantShift_parallel_s${data_in_type.referencedType.typeWidth}_s${data_out_type.referencedType.typeWidth}_NHWC(${data_in}, ${size}, ${mul}, ${add}, ${data_out}, ${log2Dstring}, ${channels}, ${input_offset}, ${output_offset}, ${output_min}, ${output_max}, 1, thread_id, thread_count);
+    %endif
+END_PARALLEL
+""")
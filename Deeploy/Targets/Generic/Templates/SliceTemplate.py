@@ -98,7 +98,7 @@ ${data_out}_offset_0 =  ${dimSteps[axis]} * i_${axis};
 ${data_out}_offset_${axis} =  ${data_out}_offset_${axis-1} + ${dimSteps[axis]} * i_${axis};
 % endif
 % endfor
-memcpy(ref_${data_out}, ${data_in} + ${data_out}_offset_${axis}, ${transferSize* data_out_type.referencedType.typeWidth//8});
+memmove(ref_${data_out}, ${data_in} + ${data_out}_offset_${axis}, ${transferSize* data_out_type.referencedType.typeWidth//8});
 ref_${data_out} += ${transferSize};
 % for axis in range(axes[-1]+1):
 }
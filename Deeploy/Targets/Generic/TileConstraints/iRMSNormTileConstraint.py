@@ -23,7 +23,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 from typing import Dict, List, Tuple
 
 import numpy as np
@@ -34,7 +33,8 @@ from Deeploy.DeeployTypes import NetworkContext, OperatorRepresentation
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TileConstraint import TileConstraint
 from Deeploy.TilingExtension.TilerModel import TilerModel
-from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, TilingSchedule, VariableReplacementScheme
+from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangle, TilingSchedule, \
+    VariableReplacementScheme
 
 
 class iRMSNormTileConstraint(TileConstraint):
@@ -88,8 +88,7 @@ class iRMSNormTileConstraint(TileConstraint):
 
         for cube in outputCubes:
 
-            weightCube = copy.deepcopy(cube)
-            weightCube.dims = (cube.dims[-1],)
+            weightCube = HyperRectangle((cube.offset[-1],), (cube.dims[-1],))
             inputLoadSchedule.append({"data_in": cube, "weight": weightCube})
 
         for out in outputCubes:
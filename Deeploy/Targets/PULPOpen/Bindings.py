@@ -40,7 +40,8 @@ from Deeploy.Targets.Generic.Templates import ConcatTemplate, RQSiGELUTemplate,
 from Deeploy.Targets.Generic.TypeCheckers import ConcatChecker, GELUChecker, HardswishChecker, MatMulChecker, \
     MulChecker, ReduceMeanChecker, RQHardswishChecker, SliceChecker, SoftmaxChecker, TransposeChecker, \
     iLayerNormChecker
-from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterSynch import PULPSynchCoresPass
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterSynch import PULPSynchCoresPass, \
+    PULPSynchFusedKernelsPass
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterTiling import PULPClusterTiling
 from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPL3Tiling import PULPL3Tiling
 from Deeploy.Targets.PULPOpen.DataTypes import PULPDMAFuture
@@ -105,6 +106,7 @@ MemoryAwareForkTransformer = CodeTransformation([
 
 ForkTransformer = CodeTransformation([
     TilingVariableReplacement("L1"),
+    PULPSynchFusedKernelsPass(),
     TilingCallClosure(writeback = False),
     PULPSynchCoresPass(),
     ForkClosure(writeback = False, generateStruct = True),
@@ -196,6 +198,15 @@ PULPRQSGEMM_8_Binding = [
         ForkTransformer) for type1, type2 in zip([int8_t, uint8_t, int8_t, uint8_t], [int8_t, uint8_t, uint8_t, int8_t])
 ]
 
+PULPRQSGEMMReduction_8_Binding = [
+    NodeBinding(
+        PULPLinearChecker([PointerClass(type1),
+                           PointerClass(int8_t),
+                           PointerClass(int32_t),
+                           PointerClass(int32_t)], [PointerClass(type2)]), GEMMTemplate.PULPGEMMReduction_8_Template,
+        ForkTransformer) for type1, type2 in zip([int8_t, uint8_t, int8_t, uint8_t], [int8_t, uint8_t, uint8_t, int8_t])
+]
+
 PULPRQSMatrixVecBindings = [
     NodeBinding(
         PULPLinearChecker([PointerClass(type1),
@@ -216,6 +227,8 @@ PULPRQSTallGEMMBindings = [
 
 PULPRQSGEMMBindings = PULPRQSGEMM_8_Binding
 
+PULPRQSGEMMReductionBindings = PULPRQSGEMMReduction_8_Binding
+
 PULPMaxPool2DBindings = [
     NodeBinding(PULPMaxPoolChecker([PointerClass(type)], [PointerClass(type)]),
                 MaxPool2DTemplate.PULPMaxPool2D_8_Template, ForkTransformer) for type in [int8_t, uint8_t]
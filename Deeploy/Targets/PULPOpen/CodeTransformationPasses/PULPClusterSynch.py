@@ -25,8 +25,9 @@
 
 from typing import Tuple
 
-from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, \
-    NodeTemplate, _NoVerbosity
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
+    NetworkContext, NodeTemplate, _NoVerbosity
+from Deeploy.TilingExtension.LayerFusion import tileConstraintNodes
 
 _synchTemplate = NodeTemplate("""
         pi_cl_team_barrier();
@@ -42,3 +43,24 @@ class PULPSynchCoresPass(CodeTransformationPass):
               verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
         executionBlock.addRight(_synchTemplate, {})
         return ctxt, executionBlock
+
+
+class PULPSynchFusedKernelsPass(CodeTransformationPass):
+    """Synchronize the cores between the kernels of a fused pattern
+
+    Every kernel of a fused pattern reads the intermediate tile its
+    predecessor wrote, so all cores have to finish a kernel before the
+    next one starts.
+    """
+
+    def apply(self,
+              ctxt: NetworkContext,
+              executionBlock: ExecutionBlock,
+              name: str,
+              verbose: CodeGenVerbosity = _NoVerbosity) -> Tuple[NetworkContext, ExecutionBlock]:
+
+        for templateNode in tileConstraintNodes(executionBlock)[1:]:
+            idx = executionBlock.codeSnippets.index(templateNode)
+            executionBlock.codeSnippets.insert(idx, CodeSnippet(_synchTemplate, {}))
+
+        return ctxt, executionBlock
@@ -27,7 +27,8 @@ import copy
 from typing import Dict, List, Tuple
 
 from Deeploy.DeeployTypes import CodeSnippet, ExecutionBlock, NetworkContext, NodeTemplate, OperatorRepresentation
-from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterTilingSB import PULPClusterTilingSB, _DMAUpdate
+from Deeploy.Targets.PULPOpen.CodeTransformationPasses.PULPClusterTilingSB import PULPClusterTilingSB, _DMAUpdate, \
+    _tileValueTemplate
 from Deeploy.Targets.PULPOpen.DataTypes import PULPStructDataTypes
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingCodeGeneration import TilingCodeGeneration
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import DoubleBufferingTilingMixIn, \
@@ -74,38 +75,30 @@ dory_dma_barrier(&${stateReference});
 dory_dma_barrier(&${_stateReference});
 """)
 
-_updateDMATransferStructTemplate = NodeTemplate("""
+
+def _dmaStructTemplate(stateReference: str) -> str:
+    return (_tileValueTemplate(f"{stateReference}.ext", "extOffsetPtr", "(((char*)${extPtr}) + ", ")") +
+            _tileValueTemplate(f"{stateReference}.mchan_cmd", "mchanCmdPtr") +
+            _tileValueTemplate(f"{stateReference}.length_1d_copy", "length1dPtr") +
+            _tileValueTemplate(f"{stateReference}.number_of_1d_copies", "number1dPtr") +
+            _tileValueTemplate(f"{stateReference}.number_of_2d_copies", "number2dPtr") +
+            _tileValueTemplate(f"{stateReference}.loc", "locOffsetPtr", "(((char*)${baseLocPtr}) + ", ")"))
+
+
+_updateDMATransferStructTemplate = NodeTemplate(
+    """
 
 // UPDATE DMA STRUCT ${stateReference}, ${_stateReference}
-${stateReference}.ext = (((char*)${extPtr}) + ${extOffsetPtr}[${tileNum}]);
-${stateReference}.mchan_cmd = ${mchanCmdPtr}[${tileNum}];
-${stateReference}.length_1d_copy = ${length1dPtr}[${tileNum}];
-${stateReference}.number_of_1d_copies = ${number1dPtr}[${tileNum}];
-${stateReference}.number_of_2d_copies = ${number2dPtr}[${tileNum}];
-${stateReference}.loc = (((char*)${baseLocPtr}) + ${locOffsetPtr}[${tileNum}]);
-${locPtr} = (((char*)${baseLocPtr}) + ${locOffsetPtr}[${tileNum}-1]);
-""")
+""" + _dmaStructTemplate("${stateReference}") +
+    _tileValueTemplate("${locPtr}", "locOffsetPtr", "(((char*)${baseLocPtr}) + ", ")", index = "str(tileNum) + '-1'"))
 
 _outUpdateDMATransferStructTemplate = NodeTemplate("""
 
 if ((${tileNum}) % 2 == 0){
 // UPDATE DMA STRUCT ${stateReference}
-${stateReference}.ext = ((char*)${extPtr} + ${extOffsetPtr}[${tileNum}]);
-${stateReference}.mchan_cmd = ${mchanCmdPtr}[${tileNum}];
-${stateReference}.length_1d_copy = ${length1dPtr}[${tileNum}];
-${stateReference}.number_of_1d_copies = ${number1dPtr}[${tileNum}];
-${stateReference}.number_of_2d_copies = ${number2dPtr}[${tileNum}];
-${stateReference}.loc = (((char*)${baseLocPtr}) + ${locOffsetPtr}[${tileNum}]);
-} else {
-${_stateReference}.ext = ((char*)${extPtr} + ${extOffsetPtr}[${tileNum}]);
-${_stateReference}.mchan_cmd = ${mchanCmdPtr}[${tileNum}];
-${_stateReference}.length_1d_copy = ${length1dPtr}[${tileNum}];
-${_stateReference}.number_of_1d_copies = ${number1dPtr}[${tileNum}];
-${_stateReference}.number_of_2d_copies = ${number2dPtr}[${tileNum}];
-${_stateReference}.loc = (((char*)${baseLocPtr}) + ${locOffsetPtr}[${tileNum}]);
-}
-${locPtr} = (((char*)${baseLocPtr}) + ${locOffsetPtr}[${tileNum}]);
-
+""" + _dmaStructTemplate("${stateReference}") + """} else {
+""" + _dmaStructTemplate("${_stateReference}") + """}
+""" + _tileValueTemplate("${locPtr}", "locOffsetPtr", "(((char*)${baseLocPtr}) + ", ")") + """
 """)
 
 
@@ -140,10 +133,8 @@ class PULPClusterTilingDB(PULPClusterTilingSB):
         for update in updateList:
             locOffsetList.append(int(update.locOffset) - locBaseOffset)
 
-        name = namePrefix + "_locOffset"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], locOffsetList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(ctxt, cb, operatorRepresentation, nodeName,
-                                                                       'locOffsetPtr')
+        ctxt, operatorRepresentation = self._hoistTileValues(ctxt, locOffsetList, operatorRepresentation, nodeName,
+                                                             'locOffsetPtr', namePrefix + "_locOffset_ref")
 
         return ctxt, operatorRepresentation
 
@@ -250,6 +241,9 @@ class PULPClusterTilingDB(PULPClusterTilingSB):
             _operatorRepresentation = transaction.operatorRepresentation
             _operatorRepresentation["tileNum"] = "TILING_I"
 
+        egressDMATransferCalls = self._guardWriteBack(egressDMATransferCalls,
+                                                      operatorRepresentation.get("writeBackMask"))
+
         for transaction in egressDMAWaitStatements:
             _operatorRepresentation = transaction.operatorRepresentation
             _operatorRepresentation['tileNum'] = "TILING_I"
@@ -346,6 +340,10 @@ class PULPClusterTilingDB(PULPClusterTilingSB):
         operatorRepresentation["numTiles"] = self._hoistNumTiles(ctxt, operatorRepresentation['nodeName'],
                                                                  tilingSchedules)
 
+        writeBackMask = self._hoistWriteBackMask(ctxt, operatorRepresentation['nodeName'], tilingSchedules)
+        if writeBackMask is not None:
+            operatorRepresentation["writeBackMask"] = writeBackMask
+
         return self._tilingLoop(ctxt, executionBlock, nodeMemoryConstraint, flatTilingSchedule, variableReplacement,
                                 operatorRepresentation)
 
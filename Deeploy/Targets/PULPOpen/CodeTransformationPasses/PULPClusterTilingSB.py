@@ -24,6 +24,7 @@
 # limitations under the License.
 
 import copy
+import hashlib
 from collections import namedtuple
 from typing import Dict, List, Literal, Optional, Tuple, Type
 
@@ -42,7 +43,19 @@ from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import Pr
     SingleBufferingTilingMixIn, TilingMetaInfo
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, TilingSchedule, VariableReplacementScheme, \
-    calculateRectangleOffset, minimizeRectangleDims
+    calculateRectangleArrayOffsets, calculateRectangleOffset, compressTileValues, minimizeRectangleArrayDims, \
+    minimizeRectangleDims, tileTableStatistics
+
+
+def _tileValueTemplate(lhs: str, key: str, prefix: str = "", suffix: str = "", index: str = "tileNum") -> str:
+    # Assigns the value of tile ${index} to lhs, either from the table named by ${key} or computed by the
+    # TileValueSequence ${key}. Table names have to stay standalone expressions to be found as references.
+    return (f"% if isinstance({key}, str):\n"
+            f"{lhs} = {prefix}${{{key}}}[${{{index}}}]{suffix};\n"
+            f"% else:\n"
+            f"{lhs} = {prefix}${{{key}.expression({index})}}{suffix};\n"
+            f"% endif\n")
+
 
 _openTileLoopTemplate = NodeTemplate("""
 
@@ -126,25 +139,22 @@ dory_dma_barrier(&${stateReference});
 
 """)
 
-_updateDMATransferStructTemplate = NodeTemplate("""
+_updateDMATransferStructTemplate = NodeTemplate(
+    """
 
 // UPDATE DMA STRUCT ${stateReference}
-${stateReference}.ext = ((char*)${extPtr}) + ${extOffsetPtr}[${tileNum}];
-${stateReference}.length_1d_copy = ${length1dPtr}[${tileNum}];
-${stateReference}.number_of_1d_copies = ${number1dPtr}[${tileNum}];
-${stateReference}.number_of_2d_copies = ${number2dPtr}[${tileNum}];
-
-${stateReference}.stride_1d = ${stride1dPtr}[${tileNum}];
-${stateReference}.stride_2d = ${stride2dPtr}[${tileNum}];
-
-${stateReference}.mchan_cmd = ${mchanCmdPtr}[${tileNum}];
-""")
+""" + _tileValueTemplate("${stateReference}.ext", "extOffsetPtr", "((char*)${extPtr}) + ") +
+    _tileValueTemplate("${stateReference}.length_1d_copy", "length1dPtr") +
+    _tileValueTemplate("${stateReference}.number_of_1d_copies", "number1dPtr") +
+    _tileValueTemplate("${stateReference}.number_of_2d_copies", "number2dPtr") + """
+""" + _tileValueTemplate("${stateReference}.stride_1d", "stride1dPtr") +
+    _tileValueTemplate("${stateReference}.stride_2d", "stride2dPtr") + """
+""" + _tileValueTemplate("${stateReference}.mchan_cmd", "mchanCmdPtr"))
 
 _updateReferenceTemplate = NodeTemplate("""
 
 // UPDATE VARIABLE ${reference}
-*${reference} = ${baseReference}[${tileNum}];
-""")
+""" + _tileValueTemplate("*${reference}", "baseReference"))
 
 _initDMATemplate = NodeTemplate("""
 int32_t ${channelName} = dory_dma_allocate();
@@ -201,6 +211,10 @@ class PULPClusterTilingSB(TilingCodeGeneration):
         updateDict = {}
         deltaOffsets = {}
 
+        loadArrays = {**tilingSchedule.inputLoadArrays, **tilingSchedule.outputLoadArrays}
+        minimalRects = {}
+        accOffsets = {}
+
         for idx, loadStep in enumerate(loadSchedule):
             for stepIdx, (key, rect) in enumerate(loadStep.items()):
 
@@ -238,9 +252,14 @@ class PULPClusterTilingSB(TilingCodeGeneration):
                     accOffset = calculateRectangleOffset(_rect, _referenceBuffer)
 
                 else:
-                    struct = cls._rectToDMAStruct(ctxt, rect, direction, l1Buffer.name, l1Buffer._referenceName,
-                                                  finalMemoryLevel)
-                    accOffset = calculateRectangleOffset(rect, referenceBuffer)
+                    if key not in minimalRects.keys():
+                        minimalRects[key] = minimizeRectangleArrayDims(loadArrays[key], referenceBuffer)
+                        accOffsets[key] = calculateRectangleArrayOffsets(loadArrays[key], referenceBuffer).tolist()
+
+                    minimalRect, referenceRect = minimalRects[key][0][idx], minimalRects[key][1][idx]
+                    struct = cls._minimalRectToDMAStruct(ctxt, minimalRect, referenceRect, direction, l1Buffer.name,
+                                                         l1Buffer._referenceName, finalMemoryLevel)
+                    accOffset = accOffsets[key][idx]
 
                 length_1d_copy = struct.value['length_1d_copy'].value
                 number_of_1d_copies = struct.value['number_of_1d_copies'].value
@@ -266,6 +285,16 @@ class PULPClusterTilingSB(TilingCodeGeneration):
         referenceBuffer = ctxt.lookup(L2Name)
 
         rect, referenceRect = minimizeRectangleDims(rectangle, referenceBuffer)
+
+        return cls._minimalRectToDMAStruct(ctxt, rect, referenceRect, direction, L1Name, L2Name, finalMemoryLevel)
+
+    @classmethod
+    def _minimalRectToDMAStruct(cls, ctxt: NetworkContext, rect: HyperRectangle, referenceRect: HyperRectangle,
+                                direction: Literal["ToL1", "FromL1"], L1Name: str, L2Name: str,
+                                finalMemoryLevel: bool) -> PULPStructDataTypes.DMA_copy:
+
+        referenceBuffer = ctxt.lookup(L2Name)
+
         assert len(rect.dims) <= 3, "PULP: Only 2D transfers are supported!"
 
         if direction == "ToL1":
@@ -344,6 +373,54 @@ class PULPClusterTilingSB(TilingCodeGeneration):
 
         return ctxt, operatorRepresentation
 
+    def _hoistTileValues(self,
+                         ctxt: NetworkContext,
+                         values: List[int],
+                         operatorRepresentation: OperatorRepresentation,
+                         nodeName: str,
+                         operatorRepresentationName: str,
+                         refName: str,
+                         immediateType: Optional[Type[Immediate]] = None) -> Tuple[NetworkContext, Dict]:
+        # Per tile values that follow a simple pattern are computed from the tile index; all others are
+        # stored in a table which is shared by all nodes with the same values
+        if immediateType is None:
+            immediateType = BasicDataTypes.int32_t
+
+        tableSize = len(values) * (immediateType.typeWidth // 8)
+
+        sequence = compressTileValues(values)
+        if sequence is not None:
+            operatorRepresentation[operatorRepresentationName] = sequence
+            tileTableStatistics.compressedTables += 1
+            tileTableStatistics.compressedBytes += tableSize
+            return ctxt, operatorRepresentation
+
+        digest = hashlib.sha1(np.asarray(values, dtype = np.int64).tobytes()).hexdigest()[:16]
+        name = self.prefix + f"table_{immediateType.typeName}_{len(values)}_{digest}"
+
+        if ctxt.is_global(name):
+            constBuf = ctxt.lookup(name)
+            assert np.array_equal(constBuf.values, values), f"Tile table {name} does not match its values!"
+            constBuf._users += [nodeName]
+            tileTableStatistics.sharedTables += 1
+            tileTableStatistics.sharedBytes += tableSize
+        else:
+            constBuf = ctxt.ConstantBuffer(name, [len(values)], values)
+            ctxt.add(constBuf, "global")
+            constBuf._type = PointerClass(immediateType)
+            constBuf._instance = constBuf._type(name, ctxt)
+            constBuf._users = [nodeName]
+            constBuf._memoryLevel = self.targetMemLevel
+            tileTableStatistics.emittedTables += 1
+            tileTableStatistics.emittedBytes += tableSize
+
+        reference = ctxt.hoistReference(name, refName)
+        ctxt.lookup(reference)._memoryLevel = self.targetMemLevel
+
+        operatorRepresentation[operatorRepresentationName] = refName
+
+        return ctxt, operatorRepresentation
+
     def _hoistDMAUpdates(self, ctxt: NetworkContext, tensorName: str, updateList: List[_DMAUpdate],
                          operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, Dict]:
 
@@ -374,46 +451,32 @@ class PULPClusterTilingSB(TilingCodeGeneration):
 
         namePrefix = self.prefix + f"{nodeName}_{tensorName}"
 
-        name = namePrefix + "_offset"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], offsetList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(ctxt, cb, operatorRepresentation, nodeName,
-                                                                       'extOffsetPtr')
-
-        name = namePrefix + "_mchan_cmd"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], mchanCmdList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'mchanCmdPtr',
-            PULPStructDataTypes.DMA_copy.structTypeDict['mchan_cmd'])
-
-        name = namePrefix + "_length_1d_copy"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], len1dList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'length1dPtr',
+        ctxt, operatorRepresentation = self._hoistTileValues(ctxt, offsetList, operatorRepresentation, nodeName,
+                                                             'extOffsetPtr', namePrefix + "_offset_ref")
+
+        ctxt, operatorRepresentation = self._hoistTileValues(ctxt, mchanCmdList, operatorRepresentation, nodeName,
+                                                             'mchanCmdPtr', namePrefix + "_mchan_cmd_ref",
+                                                             PULPStructDataTypes.DMA_copy.structTypeDict['mchan_cmd'])
+
+        ctxt, operatorRepresentation = self._hoistTileValues(
+            ctxt, len1dList, operatorRepresentation, nodeName, 'length1dPtr', namePrefix + "_length_1d_copy_ref",
             PULPStructDataTypes.DMA_copy.structTypeDict['length_1d_copy'])
 
-        name = namePrefix + "_number_of_1d_copies"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], num1dList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'number1dPtr',
+        ctxt, operatorRepresentation = self._hoistTileValues(
+            ctxt, num1dList, operatorRepresentation, nodeName, 'number1dPtr', namePrefix + "_number_of_1d_copies_ref",
             PULPStructDataTypes.DMA_copy.structTypeDict['number_of_1d_copies'])
 
-        name = namePrefix + "_number_of_2d_copies"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], num2dList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'number2dPtr',
+        ctxt, operatorRepresentation = self._hoistTileValues(
+            ctxt, num2dList, operatorRepresentation, nodeName, 'number2dPtr', namePrefix + "_number_of_2d_copies_ref",
             PULPStructDataTypes.DMA_copy.structTypeDict['number_of_2d_copies'])
 
-        name = namePrefix + "_stride_1d"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], stride1dList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'stride1dPtr',
-            PULPStructDataTypes.DMA_copy.structTypeDict['stride_1d'])
+        ctxt, operatorRepresentation = self._hoistTileValues(ctxt, stride1dList, operatorRepresentation, nodeName,
+                                                             'stride1dPtr', namePrefix + "_stride_1d_ref",
+                                                             PULPStructDataTypes.DMA_copy.structTypeDict['stride_1d'])
 
-        name = namePrefix + "_stride_2d"
-        cb = ctxt.ConstantBuffer(name, [len(updateList)], stride2dList)
-        ctxt, operatorRepresentation = self._hoistConstantAndReference(
-            ctxt, cb, operatorRepresentation, nodeName, 'stride2dPtr',
-            PULPStructDataTypes.DMA_copy.structTypeDict['stride_2d'])
+        ctxt, operatorRepresentation = self._hoistTileValues(ctxt, stride2dList, operatorRepresentation, nodeName,
+                                                             'stride2dPtr', namePrefix + "_stride_2d_ref",
+                                                             PULPStructDataTypes.DMA_copy.structTypeDict['stride_2d'])
 
         return ctxt, operatorRepresentation
 
@@ -461,12 +524,24 @@ class PULPClusterTilingSB(TilingCodeGeneration):
 
             buf = ctxt.lookup(operatorRepresentation[key])
             reference = str(buf._instance)
+            baseReference = buf._referenceName
+
+            # The table of a compressible replacement only keeps the storage of the current value
+            baseBuf = ctxt.lookup(baseReference)
+            sequence = compressTileValues(baseBuf.values)
+            if sequence is not None:
+                tileTableStatistics.compressedTables += 1
+                tileTableStatistics.compressedBytes += (len(baseBuf.values) -
+                                                        1) * (baseBuf._type.referencedType.typeWidth // 8)
+                baseBuf.values = baseBuf.values[:1]
+                baseBuf.shape = [1]
+                baseReference = sequence
 
             updates.append(
                 CodeSnippet(self._updateReferenceTemplate, {
                     "reference": reference,
                     "tileNum": "TILING_I",
-                    "baseReference": buf._referenceName
+                    "baseReference": baseReference
                 }))
 
         return updates
@@ -587,6 +662,8 @@ class PULPClusterTilingSB(TilingCodeGeneration):
 
         egressDMATransferCalls, egressDMAWaitStatements = self._generateEgressDMACode(
             tilingSchedule, nodeMemoryConstraint, ctxt, operatorRepresentation)
+        egressDMATransferCalls = self._guardWriteBack(egressDMATransferCalls,
+                                                      operatorRepresentation.get("writeBackMask"))
 
         ctxt, ingressDMAUpdates = self._generateIngressPointerUpdates(nodeMemoryConstraint, tilingSchedule, ctxt,
                                                                       operatorRepresentation)
@@ -658,6 +735,10 @@ class PULPClusterTilingSB(TilingCodeGeneration):
         operatorRepresentation["numTiles"] = self._hoistNumTiles(ctxt, operatorRepresentation['nodeName'],
                                                                  tilingSchedules)
 
+        writeBackMask = self._hoistWriteBackMask(ctxt, operatorRepresentation['nodeName'], tilingSchedules)
+        if writeBackMask is not None:
+            operatorRepresentation["writeBackMask"] = writeBackMask
+
         return self._tilingLoop(ctxt, executionBlock, nodeMemoryConstraint, flatTilingSchedule, variableReplacement,
                                 operatorRepresentation)
 
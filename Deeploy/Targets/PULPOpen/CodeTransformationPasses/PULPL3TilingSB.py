@@ -38,7 +38,7 @@ from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import Pr
     SingleBufferingTilingMixIn, TilingMetaInfo
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, TilingSchedule, VariableReplacementScheme, \
-    calculateRectangleOffset, minimizeRectangleDims
+    calculateRectangleArrayOffsets, minimizeRectangleArrayDims, minimizeRectangleDims
 
 _openTileLoopTemplate = NodeTemplate("""
 
@@ -134,6 +134,10 @@ class PULPL3TilingSB(TilingCodeGeneration):
         updateDict = {}
         deltaOffsets = {}
 
+        loadArrays = {**tilingSchedule.inputLoadArrays, **tilingSchedule.outputLoadArrays}
+        minimalRects = {}
+        accOffsets = {}
+
         for idx, loadStep in enumerate(loadSchedule):
             for stepIdx, (key, rect) in enumerate(loadStep.items()):
 
@@ -152,8 +156,14 @@ class PULPL3TilingSB(TilingCodeGeneration):
                 referenceBuffer = ctxt.lookup(ctxt.lookup(operatorRepresentation[key])._referenceName)
                 l1Buffer = ctxt.lookup(operatorRepresentation[key])
 
-                struct = cls._rectToDMAStruct(ctxt, rect, direction, l1Buffer.name, l1Buffer._referenceName)
-                accOffset = calculateRectangleOffset(rect, referenceBuffer)
+                if key not in minimalRects.keys():
+                    minimalRects[key] = minimizeRectangleArrayDims(loadArrays[key], referenceBuffer)
+                    accOffsets[key] = calculateRectangleArrayOffsets(loadArrays[key], referenceBuffer).tolist()
+
+                minimalRect, referenceRect = minimalRects[key][0][idx], minimalRects[key][1][idx]
+                struct = cls._minimalRectToDMAStruct(ctxt, minimalRect, referenceRect, direction, l1Buffer.name,
+                                                     l1Buffer._referenceName)
+                accOffset = accOffsets[key][idx]
 
                 length_1d_copy = struct.value['size'].value
                 number_of_1d_copies = struct.value['length'].value
@@ -174,6 +184,16 @@ class PULPL3TilingSB(TilingCodeGeneration):
         referenceBuffer = ctxt.lookup(L2Name)
 
         rect, referenceRect = minimizeRectangleDims(rectangle, referenceBuffer)
+
+        return cls._minimalRectToDMAStruct(ctxt, rect, referenceRect, direction, L1Name, L2Name)
+
+    @classmethod
+    def _minimalRectToDMAStruct(cls, ctxt: NetworkContext, rect: HyperRectangle, referenceRect: HyperRectangle,
+                                direction: Literal["ToL2", "FromL2"], L1Name: str,
+                                L2Name: str) -> PULPStructDataTypes.pi_cl_ram_req_t:
+
+        referenceBuffer = ctxt.lookup(L2Name)
+
         assert len(rect.dims) <= 2, "PULP: Only 2D transfers are supported!"
 
         if direction == "ToL2":
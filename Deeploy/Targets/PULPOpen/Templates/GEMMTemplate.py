@@ -23,7 +23,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+
+from ortools.constraint_solver.pywrapcp import IntVar
 
 from Deeploy.DeeployTypes import NetworkContext, NodeTemplate, OperatorRepresentation
 
@@ -46,8 +48,7 @@ class PULPGEMMTemplate(NodeTemplate):
         return ctxt, operatorRepresentation, []
 
 
-PULPGEMM_8_Template = PULPGEMMTemplate("""
-<%
+_signatureTemplateStr = """<%
 signatureString = ''
 if input_signed:
     signatureString += '_i8'
@@ -62,7 +63,9 @@ if weight_signed:
 else:
     signatureString += '_u8'
 %>
-// PULP NN GEMM
+"""
+
+_pulpNNLinearTemplateStr = """// PULP NN GEMM
 int8_t* ref_${data_out}_${A} = ${A};
 int8_t* ref_${data_out}_${B} = ${B};
 int8_t* ref_${data_out}_${data_out} = ${data_out};
@@ -84,6 +87,62 @@ ref_${data_out}_${data_out} += ${O};
 ref_${data_out}_${B} += ${N} * ${O};
 % endif
 }
+"""
+
+PULPGEMM_8_Template = PULPGEMMTemplate("\n" + _signatureTemplateStr + _pulpNNLinearTemplateStr)
+
+
+class PULPGEMMReductionTemplate(PULPGEMMTemplate):
+
+    @staticmethod
+    def computeTransientBuffersSize(
+            ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> List[Tuple[str, Union[int, IntVar]]]:
+
+        # The int32 partial sums of an output tile are only kept if the reduction dimension is tiled, otherwise a
+        # single word is reserved as memory blocks can't be empty
+        reductionTiling = operatorRepresentation['reductionTiling']
+        accumulatorElements = operatorRepresentation['batch'] * operatorRepresentation['M'] * operatorRepresentation['O']
+        accumulatorSize = 4 * (accumulatorElements * reductionTiling + 1 - reductionTiling)
+        accumulatorName = operatorRepresentation['nodeName'] + "_accumulator"
+        return [(accumulatorName, accumulatorSize)]
+
+    def hoistTransientBuffers(self, ctxt: NetworkContext,
+                              operatorRepresentation: OperatorRepresentation) -> Tuple[NetworkContext, Dict, List[str]]:
+
+        # Without tiling, the full reduction is computed in a single kernel call
+        operatorRepresentation['reductionTiling'] = 0
+        operatorRepresentation['accumulate'] = 0
+        operatorRepresentation['writeOutput'] = 1
+
+        accumulatorName, accumulatorSize = PULPGEMMReductionTemplate.computeTransientBuffersSize(
+            ctxt, operatorRepresentation)[0]
+        ctxt.hoistTransientBuffer(accumulatorName, accumulatorSize)
+
+        operatorRepresentation['accumulator'] = accumulatorName
+        return ctxt, operatorRepresentation, [accumulatorName]
+
+
+PULPGEMMReduction_8_Template = PULPGEMMReductionTemplate("\n" + _signatureTemplateStr + """% if reductionTiling:
+// PULP GEMM with tiled reduction dimension
+int8_t* ref_${data_out}_${A} = ${A};
+int8_t* ref_${data_out}_${B} = ${B};
+int8_t* ref_${data_out}_${data_out} = ${data_out};
+int32_t* ref_${data_out}_${accumulator} = (int32_t*) ${accumulator};
+for(int i=0;i<${batch};i++){
+Gemm_Accumulate_${'i8' if input_signed else 'u8'}_${'i8' if weight_signed else 'u8'}_i32(ref_${data_out}_${A}, ref_${data_out}_${B}, ref_${data_out}_${accumulator}, ${M}, ${N}, ${O}, ${accumulate});
+if (${writeOutput}) {
+Gemm_Requant_i32_${'i8' if output_signed else 'u8'}(ref_${data_out}_${accumulator}, ref_${data_out}_${data_out}, ${mul}, ${C}, ${log2D}, ${M}, ${O});
+}
+ref_${data_out}_${A} += ${M} * ${N};
+ref_${data_out}_${data_out} += ${M} * ${O};
+ref_${data_out}_${accumulator} += ${M} * ${O};
+% if W_batched:
+ref_${data_out}_${B} += ${N} * ${O};
+% endif
+}
+% else:
+""" + _pulpNNLinearTemplateStr + """% endif
 """)
 
 
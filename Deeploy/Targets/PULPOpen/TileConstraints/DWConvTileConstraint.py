@@ -26,7 +26,8 @@
 
 from typing import Dict, List, Tuple, Union
 
-from ortools.constraint_solver.pywrapcp import IntVar
+import numpy as np
+from ortools.constraint_solver.pywrapcp import IntExpr, IntVar
 
 from Deeploy.AbstractDataTypes import PointerClass
 from Deeploy.CommonExtensions.DataTypes import uint8_t, uint16_t
@@ -37,6 +38,7 @@ from Deeploy.TilingExtension.TileConstraint import TileConstraint
 from Deeploy.TilingExtension.TilerModel import PerformanceHint, TilerModel
 from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangle, TilingSchedule, \
     VariableReplacementScheme
+from Deeploy.TilingExtension.TilingCostModel import TilingCostModel
 
 
 class DWConv2DTileConstraint(TileConstraint):
@@ -145,6 +147,23 @@ class DWConv2DTileConstraint(TileConstraint):
 
         return tilerModel
 
+    @staticmethod
+    def estimateTileCycles(tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext, ops: int,
+                           costModel: TilingCostModel) -> Union[int, IntExpr]:
+
+        outputBuffer = ctxt.lookup(name = parseDict['data_out'])
+        opsPerElement = -(-ops // int(np.prod(outputBuffer.shape)))
+
+        # The kernels split the channels of a tile among the cores, idle cores still take a full share
+        tileElements = 1
+        for dimIdx in range(len(outputBuffer.shape)):
+            dimVar = tilerModel.getTensorDimVar(tensorName = outputBuffer.name, dimIdx = dimIdx)
+            if dimIdx == 3:
+                dimVar = (dimVar + costModel.numCores - 1) // costModel.numCores * costModel.numCores
+            tileElements = tileElements * dimVar
+
+        return costModel.computeCycles(tileElements * opsPerElement)
+
     @staticmethod
     def constructSymbolicNodeRep(tilerModel: TilerModel, parseDict: Dict,
                                  ctxt: NetworkContext) -> Dict[str, Union[int, IntVar]]:
@@ -24,7 +24,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+
+from ortools.constraint_solver.pywrapcp import IntVar
 
 from Deeploy.AbstractDataTypes import PointerClass
 from Deeploy.CommonExtensions.DataTypes import uint8_t, uint16_t
@@ -216,3 +218,148 @@ class TallGEMMTileConstraint(GEMMTileConstraint):
         tm = GEMMTileConstraint.addPolicyConstraint(tilerModel, parseDict, ctxt)
 
         return tm
+
+
+class GEMMReductionTileConstraint(GEMMTileConstraint):
+    """GEMM tile constraint that may also tile the reduction dimension N
+
+    Every output tile is computed in consecutive steps over chunks of
+    N. The int32 partial sums are kept in an accumulator transient
+    buffer and only the last step requantizes them into the output.
+    """
+
+    @staticmethod
+    def addPolicyConstraint(tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext) -> TilerModel:
+
+        bufferA = ctxt.lookup(name = parseDict['A'])
+        bufferB = ctxt.lookup(name = parseDict['B'])
+
+        dimOffsetA = len(bufferA.shape) - 2
+        dimOffsetB = len(bufferB.shape) - 2
+
+        ASecondDimVar = tilerModel.getTensorDimVar(tensorName = bufferA.name,
+                                                   dimIdx = dimOffsetA + 1 - parseDict['transA'])
+        BSecondDimVar = tilerModel.getTensorDimVar(tensorName = bufferB.name,
+                                                   dimIdx = dimOffsetB + 1 - parseDict['transB'])
+
+        # Tiles have the same shape in all memory levels, so partial sums would also have to be accumulated across
+        # the outer tiling loop. Only tile the reduction dimension if all operands are tiled from L2.
+        tensorNames = [parseDict[key] for key in ['A', 'B', 'C', 'mul', 'data_out']]
+        if any("L3" in ctxt.lookup(name)._memoryLevel for name in tensorNames):
+            tilerModel.addConstraint(ASecondDimVar == parseDict['N'])
+
+        if (parseDict["O"] >= 16):
+            tilerModel.addTileSizeDivisibleConstraint(parseDict, 'O', BSecondDimVar, 16, prefix = "16_")
+
+        return tilerModel
+
+    @staticmethod
+    def constructSymbolicNodeRep(tilerModel: TilerModel, parseDict: Dict,
+                                 ctxt: NetworkContext) -> Dict[str, Union[int, IntVar]]:
+
+        bufferA = ctxt.lookup(name = parseDict['A'])
+        outputBuffer = ctxt.lookup(name = parseDict['data_out'])
+
+        dimOffsetA = len(bufferA.shape) - 2
+        dimOffsetOut = len(outputBuffer.shape) - 2
+
+        ASecondDimVar = tilerModel.getTensorDimVar(tensorName = bufferA.name,
+                                                   dimIdx = dimOffsetA + 1 - parseDict['transA'])
+
+        batchVar = 1
+        for dimIdx in range(dimOffsetOut):
+            batchVar = batchVar * tilerModel.getTensorDimVar(tensorName = outputBuffer.name, dimIdx = dimIdx)
+
+        symbolicParseDict = parseDict.copy()
+        symbolicParseDict['batch'] = batchVar
+        symbolicParseDict['M'] = tilerModel.getTensorDimVar(tensorName = outputBuffer.name, dimIdx = dimOffsetOut)
+        symbolicParseDict['O'] = tilerModel.getTensorDimVar(tensorName = outputBuffer.name, dimIdx = dimOffsetOut + 1)
+        symbolicParseDict['reductionTiling'] = (ASecondDimVar < parseDict['N']).Var()
+
+        return symbolicParseDict
+
+    @classmethod
+    def serializeTilingSolution(
+            cls, tilingSolution: NodeMemoryConstraint, absoluteOutputCubes: List[AbsoluteHyperRectangle],
+            targetMemLevel: str, ctxt: NetworkContext,
+            operatorRepresentation: OperatorRepresentation) -> Tuple[VariableReplacementScheme, TilingSchedule]:
+
+        varA = operatorRepresentation['A']
+
+        N = ctxt.lookup(varA).shape[-1]
+        NTile = tilingSolution.tensorMemoryConstraints[varA].memoryConstraints[targetMemLevel].shape[-1]
+
+        if NTile == N:
+            return super().serializeTilingSolution(tilingSolution, absoluteOutputCubes, targetMemLevel, ctxt,
+                                                   operatorRepresentation)
+
+        outputCubes = [cube.rectangle for cube in absoluteOutputCubes]
+
+        addrNames = ['A', 'B', 'mul', 'C', 'data_out']
+        inputBaseOffsets, outputBaseOffsets = cls.extractBaseAddr(tilingSolution, targetMemLevel,
+                                                                  operatorRepresentation, addrNames)
+
+        inputLoadSchedule = []
+        outputLoadSchedule = []
+
+        replacements = {
+            "M": [],
+            "N": [],
+            "O": [],
+            "batch": [],
+            "reductionTiling": [],
+            "accumulate": [],
+            "writeOutput": []
+        }
+
+        # Every output tile is accumulated over all chunks of the reduction dimension before it is written back
+        for cube in outputCubes:
+
+            BSize = 1
+            BOffset = 0
+            BatchSize = 1
+            BatchOffset = 0
+
+            if len(cube.offset) == 2:
+                (MOffset, OOffset) = cube.offset
+                (MSize, OSize) = cube.dims
+            elif len(cube.offset) == 3:
+                (BatchOffset, MOffset, OOffset) = cube.offset
+                (BatchSize, MSize, OSize) = cube.dims
+            else:
+                (BatchOffset, BOffset, MOffset, OOffset) = cube.offset
+                (BatchSize, BSize, MSize, OSize) = cube.dims
+
+            RequantCube = HyperRectangle((OOffset,), (OSize,))
+
+            NOffsets = list(range(0, N, NTile))
+            for NOffset in NOffsets:
+                NSize = min(NTile, N - NOffset)
+
+                ACube = HyperRectangle((BatchOffset, BOffset, MOffset, NOffset), (BatchSize, BSize, MSize, NSize))
+                BCube = HyperRectangle((BatchOffset, BOffset, OOffset, NOffset), (BatchSize, BSize, OSize, NSize))
+
+                inputLoadSchedule.append({"A": ACube, "B": BCube, "C": RequantCube, "mul": RequantCube})
+                outputLoadSchedule.append({"data_out": cube})
+
+                replacements["M"].append(MSize)
+                replacements["N"].append(NSize)
+                replacements["O"].append(OSize)
+                replacements["batch"].append(BSize)
+                replacements["reductionTiling"].append(1)
+                replacements["accumulate"].append(int(NOffset != NOffsets[0]))
+                replacements["writeOutput"].append(int(NOffset == NOffsets[-1]))
+
+        replacementTypes = {
+            "M": PointerClass(uint16_t),
+            "N": PointerClass(uint16_t),
+            "O": PointerClass(uint16_t),
+            "batch": PointerClass(uint8_t),
+            "reductionTiling": PointerClass(uint8_t),
+            "accumulate": PointerClass(uint8_t),
+            "writeOutput": PointerClass(uint8_t)
+        }
+
+        schedule = TilingSchedule(inputBaseOffsets, outputBaseOffsets, inputLoadSchedule, outputLoadSchedule)
+
+        return VariableReplacementScheme(replacements, replacementTypes), schedule
@@ -0,0 +1,36 @@
+# ----------------------------------------------------------------------
+#
+# File: TilingCostModel.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from Deeploy.TilingExtension.TilingCostModel import MemoryTransferCost, TilingCostModel
+
+# Rough estimates for Siracusa: the cluster DMA moves 8 bytes per cycle between L2 and L1, while transfers from L3 go
+# through the much slower uDMA. The 8 cluster cores reach about 16 int8 operations per cycle together.
+SiracusaTransferCosts = {
+    ("L2", "L1"): MemoryTransferCost(bandwidth = 8, setupCycles = 30, chunkCycles = 2),
+    ("L3", "L2"): MemoryTransferCost(bandwidth = 2, setupCycles = 400, chunkCycles = 20)
+}
+
+SiracusaTilingCostModel = TilingCostModel(transferCosts = SiracusaTransferCosts,
+                                          opsPerCycle = 16,
+                                          numCores = 8,
+                                          tileOverheadCycles = 200)
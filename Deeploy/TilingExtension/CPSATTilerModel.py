@@ -0,0 +1,751 @@
+# ----------------------------------------------------------------------
+#
+# File: CPSATTilerModel.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pprint import pformat
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from Deeploy.CompilerProfiling import profiled
+from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryLevel
+from Deeploy.TilingExtension.TilerModel import _SOLVERTIMEOUT, SolveStatistics, TilerModel
+
+# Bounds of intermediate expressions are clipped to keep CP-SAT's overflow checks happy
+_MAXBOUND = 2**48
+_MAXOBJECTIVE = 2**62
+
+_NEGATEDOPERATORS = {"==": "!=", "!=": "==", "<=": ">", ">=": "<", "<": ">=", ">": "<="}
+
+
+def _clip(value: int) -> int:
+    return int(max(-_MAXBOUND, min(_MAXBOUND, value)))
+
+
+def _truncDiv(numerator: int, denominator: int) -> int:
+    quotient = abs(numerator) // abs(denominator)
+    return quotient if (numerator >= 0) == (denominator > 0) else -quotient
+
+
+def _addTerms(termsA: Dict[int, int], termsB: Dict[int, int], scale: int = 1) -> Dict[int, int]:
+    terms = dict(termsA)
+    for idx, coeff in termsB.items():
+        coeff = terms.get(idx, 0) + scale * coeff
+        if coeff == 0:
+            terms.pop(idx, None)
+        else:
+            terms[idx] = coeff
+    return terms
+
+
+def _restrictDomain(cpModel: cp_model.CpModel, idx: int, coeff: int, lowerBound: int, upperBound: int) -> bool:
+    # Restricts the domain of a variable to `lowerBound <= coeff * variable <= upperBound`
+    if coeff < 0:
+        coeff, lowerBound, upperBound = -coeff, -upperBound, -lowerBound
+
+    domain = cpModel.Proto().variables[idx].domain
+    if len(domain) != 2:
+        return False
+
+    lowerBound = max(-(-lowerBound // coeff), domain[0])
+    upperBound = min(upperBound // coeff, domain[1])
+
+    # Empty domains make the model invalid instead of infeasible, post the constraint instead
+    if lowerBound > upperBound:
+        return False
+
+    domain[:] = [lowerBound, upperBound]
+    return True
+
+
+class CPSATExpression():
+    """Integer expression of a CPSATModel
+
+    Mirrors the subset of the pywrapcp expression API used by tile
+    constraints, cost models and memory schedulers, so that they can be
+    used with both backends. Linear expressions are kept as maps from
+    variable indices to coefficients, which are written to the model
+    proto directly, non-linear operations are decomposed into auxiliary
+    variables.
+    """
+
+    # Let numpy integers defer to the reflected operators
+    __array_ufunc__ = None
+
+    def __init__(self, model: 'CPSATModel', terms: Dict[int, int], constant: int, lowerBound: int, upperBound: int):
+        self._model = model
+        self.terms = terms
+        self.constant = constant
+        self.lowerBound = _clip(lowerBound)
+        self.upperBound = _clip(upperBound)
+        self._var: Optional[CPSATVariable] = None
+
+    @property
+    def expr(self) -> cp_model.LinearExprT:
+        if self.terms == {}:
+            return self.constant
+        cpModel = self._model.cpModel
+        variables = [cpModel.GetIntVarFromProtoIndex(idx) for idx in self.terms.keys()]
+        return cp_model.LinearExpr.WeightedSum(variables, list(self.terms.values())) + self.constant
+
+    def isConstant(self) -> bool:
+        return self.terms == {}
+
+    def Min(self) -> int:
+        return self.lowerBound
+
+    def Max(self) -> int:
+        return self.upperBound
+
+    def Name(self) -> str:
+        return ""
+
+    def Var(self) -> 'CPSATVariable':
+        if self._var is None:
+            self._var = self._model.IntVar(self.lowerBound, self.upperBound)
+            self._model.Add(self._var == self)
+        return self._var
+
+    def _wrap(self, other) -> 'CPSATExpression':
+        if isinstance(other, CPSATExpression):
+            return other
+        if isinstance(other, CPSATConstraint):
+            return other.Var()
+        if isinstance(other, (bool, np.bool_, int, np.integer)):
+            return CPSATExpression(self._model, {}, int(other), int(other), int(other))
+        return NotImplemented
+
+    def __add__(self, other) -> 'CPSATExpression':
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+        return CPSATExpression(self._model, _addTerms(self.terms, other.terms), self.constant + other.constant,
+                               self.lowerBound + other.lowerBound, self.upperBound + other.upperBound)
+
+    def __radd__(self, other) -> 'CPSATExpression':
+        return self.__add__(other)
+
+    def __neg__(self) -> 'CPSATExpression':
+        return self._scale(-1)
+
+    def __sub__(self, other) -> 'CPSATExpression':
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+        return CPSATExpression(self._model, _addTerms(self.terms, other.terms, -1), self.constant - other.constant,
+                               self.lowerBound - other.upperBound, self.upperBound - other.lowerBound)
+
+    def __rsub__(self, other) -> 'CPSATExpression':
+        return (-self).__add__(other)
+
+    def _scale(self, factor: int) -> 'CPSATExpression':
+        if factor == 0:
+            return self._wrap(0)
+        terms = {idx: coeff * factor for idx, coeff in self.terms.items()}
+        bounds = sorted([self.lowerBound * factor, self.upperBound * factor])
+        return CPSATExpression(self._model, terms, self.constant * factor, *bounds)
+
+    def __mul__(self, other) -> 'CPSATExpression':
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+
+        if other.isConstant():
+            return self._scale(other.constant)
+        if self.isConstant():
+            return other._scale(self.constant)
+
+        corners = [a * b for a in (self.lowerBound, self.upperBound) for b in (other.lowerBound, other.upperBound)]
+        product = self._model.IntVar(min(corners), max(corners))
+        self._model.cpModel.AddMultiplicationEquality(product.expr, [self.Var().expr, other.Var().expr])
+        return product
+
+    def __rmul__(self, other) -> 'CPSATExpression':
+        return self.__mul__(other)
+
+    def __floordiv__(self, other) -> 'CPSATExpression':
+        # Like pywrapcp, integer division rounds towards zero
+        assert isinstance(other, (int, np.integer)) and other > 0, f"Can only divide {self} by positive integers"
+        quotient = self._model.IntVar(_truncDiv(self.lowerBound, int(other)), _truncDiv(self.upperBound, int(other)))
+        self._model.cpModel.AddDivisionEquality(quotient.expr, self.Var().expr, int(other))
+        return quotient
+
+    def __mod__(self, other) -> 'CPSATExpression':
+        assert isinstance(other, (int, np.integer)) and other > 0, f"Can only take {self} modulo positive integers"
+        lowerBound = 0 if self.lowerBound >= 0 else -(int(other) - 1)
+        upperBound = min(max(self.upperBound, 0), int(other) - 1)
+        remainder = self - (self // other) * int(other)
+        return CPSATExpression(self._model, remainder.terms, remainder.constant, lowerBound, upperBound)
+
+    def _compare(self, other, operator: str) -> 'CPSATConstraint':
+        other = self._wrap(other)
+        if other is NotImplemented:
+            return other
+        return CPSATConstraint(self, other, operator)
+
+    def __eq__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, "==")
+
+    def __ne__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, "!=")
+
+    def __le__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, "<=")
+
+    def __ge__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, ">=")
+
+    def __lt__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, "<")
+
+    def __gt__(self, other) -> 'CPSATConstraint':
+        return self._compare(other, ">")
+
+    __hash__ = object.__hash__
+
+    def __str__(self) -> str:
+        return str(self.expr)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CPSATVariable(CPSATExpression):
+    """Integer variable of a CPSATModel"""
+
+    def __init__(self, model: 'CPSATModel', var: cp_model.IntVar, lowerBound: int, upperBound: int):
+        super().__init__(model, {var.Index(): 1}, 0, lowerBound, upperBound)
+        self._intVar = var
+        self._var = self
+
+    @property
+    def expr(self) -> cp_model.IntVar:
+        return self._intVar
+
+    def Name(self) -> str:
+        return self.expr.Name()
+
+
+class CPSATConstraint():
+    """Linear (in)equality between two CPSATExpressions
+
+    Like pywrapcp constraints, it can be used as a boolean expression,
+    which is 1 if the constraint holds.
+    """
+
+    __array_ufunc__ = None
+
+    def __init__(self, lhs: CPSATExpression, rhs: CPSATExpression, operator: str):
+        self.lhs = lhs
+        self.rhs = rhs
+        self.operator = operator
+        self._var: Optional[CPSATVariable] = None
+
+    def post(self, cpModel: cp_model.CpModel, enforcement: Sequence[cp_model.IntVar] = (), negate: bool = False):
+        operator = _NEGATEDOPERATORS[self.operator] if negate else self.operator
+        terms = _addTerms(self.lhs.terms, self.rhs.terms, -1)
+        offset = self.rhs.constant - self.lhs.constant
+        domain = {
+            "==": [offset, offset],
+            "!=": [cp_model.INT_MIN, offset - 1, offset + 1, cp_model.INT_MAX],
+            "<=": [cp_model.INT_MIN, offset],
+            ">=": [offset, cp_model.INT_MAX],
+            "<": [cp_model.INT_MIN, offset - 1],
+            ">": [offset + 1, cp_model.INT_MAX]
+        }[operator]
+
+        # Most tile constraints bound a single variable, which is cheaper to presolve as its domain
+        if len(enforcement) == 0 and len(terms) == 1 and len(domain) == 2:
+            (idx, coeff), = terms.items()
+            if _restrictDomain(cpModel, idx, coeff, *domain):
+                return
+
+        # Building the constraint proto directly is much faster than parsing cp_model expressions
+        constraint = cpModel.Proto().constraints.add()
+        constraint.enforcement_literal.extend(literal.Index() for literal in enforcement)
+        constraint.linear.vars.extend(terms.keys())
+        constraint.linear.coeffs.extend(terms.values())
+        constraint.linear.domain.extend(domain)
+
+    def Var(self) -> CPSATVariable:
+        if self._var is None:
+            model = self.lhs._model
+            self._var = model.IntVar(0, 1)
+            self.post(model.cpModel, [self._var.expr])
+            self.post(model.cpModel, [self._var.expr.Not()], negate = True)
+        return self._var
+
+    def __add__(self, other) -> CPSATExpression:
+        return self.Var() + other
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> CPSATExpression:
+        return self.Var() - other
+
+    def __rsub__(self, other) -> CPSATExpression:
+        return other - self.Var()
+
+    def __mul__(self, other) -> CPSATExpression:
+        return self.Var() * other
+
+    __rmul__ = __mul__
+
+    def __str__(self) -> str:
+        return f"{self.lhs} {self.operator} {self.rhs}"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CPSATMaxEquality():
+    """Global constraint `target == max(expressions)`, which can't be enforced conditionally"""
+
+    def __init__(self, expressions: List[CPSATExpression], target: CPSATExpression):
+        self.expressions = expressions
+        self.target = target
+
+    def post(self, cpModel: cp_model.CpModel, enforcement: Sequence[cp_model.IntVar] = ()):
+        assert len(enforcement) == 0, "Max constraints can't be enforced conditionally"
+        cpModel.AddMaxEquality(self.target.expr, [expression.expr for expression in self.expressions])
+
+    def __str__(self) -> str:
+        return f"{self.target} == max({', '.join(str(expression) for expression in self.expressions)})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+_Operand = Union[CPSATExpression, CPSATConstraint, int]
+
+
+def _postConstraint(cpModel: cp_model.CpModel,
+                    constraint: Union[CPSATConstraint, CPSATMaxEquality, bool],
+                    enforcement: Sequence[cp_model.IntVar] = ()):
+    # Comparisons of constants are evaluated by Python directly
+    if isinstance(constraint, (bool, np.bool_)):
+        if not constraint:
+            cpModel.AddBoolOr([literal.Not() for literal in enforcement])
+        return
+    constraint.post(cpModel, enforcement)
+
+
+class CPSATModel():
+    """Builder of CP-SAT models with the subset of the pywrapcp `Solver` API used on `TilerModel._model`"""
+
+    def __init__(self):
+        self.cpModel = cp_model.CpModel()
+
+    def _wrap(self, value: _Operand) -> CPSATExpression:
+        return CPSATExpression(self, {}, 0, 0, 0)._wrap(value)
+
+    def IntVar(self, lowerBound: int, upperBound: int, name: str = "") -> CPSATVariable:
+        lowerBound, upperBound = _clip(lowerBound), _clip(upperBound)
+        return CPSATVariable(self, self.cpModel.NewIntVar(lowerBound, upperBound, name), lowerBound, upperBound)
+
+    def Add(self, constraint: Union[CPSATConstraint, CPSATMaxEquality, bool]):
+        _postConstraint(self.cpModel, constraint)
+
+    def Sum(self, expressions: List[_Operand]) -> CPSATExpression:
+        terms: Dict[int, int] = {}
+        constant, lowerBound, upperBound = 0, 0, 0
+        for expression in map(self._wrap, expressions):
+            terms = _addTerms(terms, expression.terms)
+            constant += expression.constant
+            lowerBound += expression.lowerBound
+            upperBound += expression.upperBound
+        return CPSATExpression(self, terms, constant, lowerBound, upperBound)
+
+    def Max(self, expressionA: _Operand, expressionB: _Operand) -> CPSATExpression:
+        expressions = [self._wrap(expressionA), self._wrap(expressionB)]
+        maximum = self.IntVar(max(expression.lowerBound for expression in expressions),
+                              max(expression.upperBound for expression in expressions))
+        self.cpModel.AddMaxEquality(maximum.expr, [expression.expr for expression in expressions])
+        return maximum
+
+    def SumEquality(self, expressions: List[_Operand], target: _Operand) -> CPSATConstraint:
+        return CPSATConstraint(self.Sum(expressions), self._wrap(target), "==")
+
+    def MaxEquality(self, expressions: List[_Operand], target: _Operand) -> CPSATMaxEquality:
+        return CPSATMaxEquality([self._wrap(expression) for expression in expressions], self._wrap(target))
+
+
+class CPSATTilerModel(TilerModel):
+    """TilerModel solved with the CP-SAT solver of OR-tools
+
+    The model is built with the same API as the `TilerModel`, but solved
+    by CP-SAT. Performance hints and fixed solution hints are soft
+    constraints: the first objective is optimized among the solutions
+    that satisfy the most hints, where hints of a higher priority
+    outweigh all hints of lower priorities, and the satisfied hints are
+    fixed for the following objectives. Hinted values of `addHint` are
+    passed to CP-SAT as solution hints.
+
+    A deterministic model is solved with a single-worker fixed search
+    which, like the default backend, prefers large values of early
+    variables among the optimal solutions. Otherwise, the model is
+    solved by a portfolio of parallel search workers, which may return
+    any optimal solution, and different ones from run to run.
+
+    Parameters
+    ----------
+    copyIdxSuffix : Optional[str]
+        Suffix of the copy index in variable names
+    numSearchWorkers : int
+        Number of parallel search workers of non-deterministic models
+    timeLimit : int
+        Time limit of every solve in milliseconds
+    relativeGap : float
+        Relative gap between objective and bound at which the
+        optimization is stopped
+    deterministic : bool
+        Whether to solve with a fixed search instead of parallel workers
+
+    """
+
+    def __init__(self,
+                 copyIdxSuffix: Optional[str] = None,
+                 numSearchWorkers: int = 8,
+                 timeLimit: int = _SOLVERTIMEOUT,
+                 relativeGap: float = 0.0,
+                 deterministic: bool = True):
+        super().__init__(copyIdxSuffix)
+
+        self._model: CPSATModel = CPSATModel()
+        self.numSearchWorkers = numSearchWorkers
+        self.timeLimit = timeLimit
+        self.relativeGap = relativeGap
+        self.deterministic = deterministic
+
+        self._baseModel: Optional[cp_model.CpModel] = None
+        self._solver: Optional[cp_model.CpSolver] = None
+        self._solved: bool = False
+
+    def _resolveVariable(self, var) -> int:
+        if isinstance(var, (int, np.integer)):
+            return int(var)
+
+        if self._solver is None:
+            return 0
+
+        return self._solver.Value(var.expr)
+
+    def _newSolver(self, numSearchWorkers: Optional[int] = None) -> cp_model.CpSolver:
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = numSearchWorkers if numSearchWorkers is not None else self.numSearchWorkers
+        solver.parameters.max_time_in_seconds = self.timeLimit / 1000
+        solver.parameters.relative_gap_limit = self.relativeGap
+        return solver
+
+    def _newModelSolver(self, solType: Union[Literal['min'], Literal['max']]) -> cp_model.CpSolver:
+        if not self.deterministic:
+            return self._newSolver()
+
+        # Like the default backend, search the variables in order of creation, preferring large or small values
+        cpModel = self._model.cpModel
+        selectValue = cp_model.SELECT_MAX_VALUE if solType == 'max' else cp_model.SELECT_MIN_VALUE
+        del cpModel.Proto().search_strategy[:]
+        cpModel.AddDecisionStrategy([var.expr for var in self._variables.values()], cp_model.CHOOSE_FIRST, selectValue)
+
+        solver = self._newSolver(numSearchWorkers = 1)
+        solver.parameters.search_branching = cp_model.FIXED_SEARCH
+        # Presolve substitutes equal variables, which takes them out of the decision strategy
+        solver.parameters.cp_model_presolve = False
+        # Propagation prunes the depth-first search well enough, the linear relaxation only adds setup time
+        solver.parameters.linearization_level = 0
+        return solver
+
+    def _solve(self, cpModel: cp_model.CpModel, solver: cp_model.CpSolver) -> bool:
+        status = solver.Solve(cpModel)
+
+        statistics = self.solveStatistics
+        self.solveStatistics = SolveStatistics(
+            status = solver.StatusName(status),
+            wallTime = solver.WallTime() + (statistics.wallTime if statistics is not None else 0),
+            conflicts = solver.NumConflicts() + (statistics.conflicts if statistics is not None else 0),
+            branches = solver.NumBranches() + (statistics.branches if statistics is not None else 0),
+            objectiveValue = statistics.objectiveValue if statistics is not None else None,
+            objectiveBound = statistics.objectiveBound if statistics is not None else None)
+
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return False
+
+        self._solver = solver
+        return True
+
+    def _softConstraints(self) -> List[Tuple[int, List[Union[CPSATConstraint, CPSATMaxEquality, bool]]]]:
+        softConstraints = [(priority, [constraint]) for priority, constraint in self._performanceConstraints]
+        softConstraints += [(priority, [constraint <= memLevel.size])
+                            for priority, (memLevel, constraint) in self._performanceMemoryConstraints]
+
+        # Fixed hints are all-or-nothing, and are tried before any performance hint
+        if self.fixHints and self._hints != []:
+            maxPriority = max([priority for priority, _ in softConstraints], default = 0)
+            softConstraints.append((maxPriority + 1, [var == value for var, value in self._hints]))
+
+        return softConstraints
+
+    def _trySetupConstraints(self,) -> bool:
+        cpModel = self._model.cpModel
+
+        # The unconstrained model is kept to pinpoint the constraints of infeasible models
+        self._baseModel = cp_model.CpModel()
+        self._baseModel.CopyFrom(cpModel)
+
+        for constraint in self._constraints:
+            _postConstraint(cpModel, constraint)
+
+        for memLevel, constraint in self._memoryConstraints:
+            _postConstraint(cpModel, constraint <= memLevel.size)
+
+        for var, value in self._hints:
+            if var.Min() <= value <= var.Max():
+                cpModel.AddHint(var.expr, int(value))
+
+        return True
+
+    def _postSoftConstraints(self) -> Tuple[List[cp_model.IntVar], cp_model.LinearExprT, int]:
+        # Returns a literal per soft constraint, their weighted sum, and the maximum of the sum
+        softConstraints = self._softConstraints()
+        cpModel = self._model.cpModel
+
+        literals: List[cp_model.IntVar] = []
+        for _, constraints in softConstraints:
+            literal = cpModel.NewBoolVar("")
+            for constraint in constraints:
+                _postConstraint(cpModel, constraint, [literal])
+            literals.append(literal)
+
+        # Any hint of a priority outweighs all hints of lower priorities
+        weights: Dict[int, int] = {}
+        totalWeight = 0
+        for priority in sorted(set(priority for priority, _ in softConstraints)):
+            weights[priority] = totalWeight + 1
+            totalWeight += weights[priority] * len([_ for _priority, _ in softConstraints if _priority == priority])
+
+        score = cp_model.LinearExpr.WeightedSum(literals, [weights[priority] for priority, _ in softConstraints])
+        return literals, score, totalWeight
+
+    def _fixSatisfiedLiterals(self, literals: Sequence[cp_model.IntVar]):
+        for literal in literals:
+            if self._solver.BooleanValue(literal):
+                self._model.cpModel.Add(literal == 1)
+
+    def _fixSoftConstraints(self, literals: List[cp_model.IntVar], score: cp_model.LinearExprT,
+                            solType: Union[Literal['min'], Literal['max']]) -> bool:
+        cpModel = self._model.cpModel
+
+        cpModel.Maximize(score)
+        solved = self._solve(cpModel, self._newModelSolver(solType))
+        cpModel.ClearObjective()
+
+        if not solved:
+            return False
+
+        self._fixSatisfiedLiterals(literals)
+        return True
+
+    def _optimizeObjective(self,
+                           objective: CPSATExpression,
+                           minimize: bool,
+                           solType: Union[Literal['min'], Literal['max']],
+                           literals: Sequence[cp_model.IntVar] = (),
+                           score: cp_model.LinearExprT = 0,
+                           scale: int = 0) -> bool:
+        cpModel = self._model.cpModel
+
+        # The soft constraints are maximized first if their score is scaled beyond the range of the objective
+        direction = -1 if minimize else 1
+        combined = objective.expr + direction * scale * score
+
+        if minimize:
+            cpModel.Minimize(combined)
+        else:
+            cpModel.Maximize(combined)
+
+        solver = self._newModelSolver(solType)
+        solved = self._solve(cpModel, solver)
+        cpModel.ClearObjective()
+
+        if not solved:
+            return False
+
+        self._fixSatisfiedLiterals(literals)
+
+        self.solveStatistics.objectiveValue = solver.Value(objective.expr)
+        self.solveStatistics.objectiveBound = int(solver.BestObjectiveBound()) - direction * scale * solver.Value(score)
+
+        # Fix the objective for the following solves, without excluding better solutions if the search was stopped
+        if self.solveStatistics.status == "OPTIMAL":
+            cpModel.Add(objective.expr == self.solveStatistics.objectiveValue)
+        elif minimize:
+            cpModel.Add(objective.expr <= self.solveStatistics.objectiveValue)
+        else:
+            cpModel.Add(objective.expr >= self.solveStatistics.objectiveValue)
+
+        return True
+
+    def debugConstraints(self) -> bool:
+        assert self._baseModel is not None, "Set up the constraints before debugging them!"
+
+        cpModel = cp_model.CpModel()
+        cpModel.CopyFrom(self._baseModel)
+
+        # Find a set of geometrical constraints that can't be satisfied together
+        literals: List[cp_model.IntVar] = []
+        assumedConstraints: Dict[int, Union[CPSATConstraint, bool]] = {}
+        for constraint in self._constraints:
+            if isinstance(constraint, CPSATMaxEquality):
+                _postConstraint(cpModel, constraint)
+                continue
+            literal = cpModel.NewBoolVar("")
+            _postConstraint(cpModel, constraint, [literal])
+            literals.append(literal)
+            assumedConstraints[literal.Index()] = constraint
+
+        cpModel.AddAssumptions(literals)
+
+        solver = self._newSolver(numSearchWorkers = 1)
+        if solver.Solve(cpModel) == cp_model.INFEASIBLE:
+            offendingGeometricalConstraints = [
+                assumedConstraints[idx]
+                for idx in solver.SufficientAssumptionsForInfeasibility()
+                if idx in assumedConstraints
+            ]
+
+            errorMsg = [""]
+            errorMsg += ["ERROR: Some geometrical constraints are infeasible. A minimal set is this one:"]
+            errorMsg += [pformat(offendingGeometricalConstraints, indent = 2)]
+            raise RuntimeError(("\n").join(errorMsg))
+
+        # Satisfy as many memory constraints as possible, with the smallest requirements for the other ones
+        memoryConstraints = [
+            (memLevel, self._model._wrap(constraint)) for memLevel, constraint in self._memoryConstraints
+        ]
+        memoryLiterals = []
+        for memLevel, constraint in memoryConstraints:
+            literal = cpModel.NewBoolVar("")
+            _postConstraint(cpModel, constraint <= memLevel.size, [literal])
+            memoryLiterals.append(literal)
+
+        cpModel.Maximize(sum(memoryLiterals))
+        if not solver.Solve(cpModel) in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            raise RuntimeError("ERROR: Tiling model is infeasible or could not be solved in time")
+
+        offendingMemoryConstraints: List[Tuple[MemoryLevel, CPSATExpression]] = [
+            (memLevel, constraint)
+            for (memLevel, constraint), literal in zip(memoryConstraints, memoryLiterals)
+            if not solver.BooleanValue(literal)
+        ]
+
+        cpModel.Add(sum(memoryLiterals) >= int(solver.ObjectiveValue()))
+        cpModel.Minimize(sum(constraint.expr for _, constraint in offendingMemoryConstraints))
+        solver.Solve(cpModel)
+
+        minimumRequirement: Dict[str, int] = {}
+        for memLevel, constraint in offendingMemoryConstraints:
+            value = solver.Value(constraint.expr)
+
+            if memLevel.name in minimumRequirement.keys():
+                minimumRequirement[memLevel.name] = max(minimumRequirement[memLevel.name], value)
+            else:
+                minimumRequirement[memLevel.name] = value
+
+        errorMsg = [""]
+
+        for key, val in minimumRequirement.items():
+            levelError = ""
+            levelError += f"ERROR: minimal memory requirement violated, please increase {key} to at least {val} or change constraints"
+            errorMsg.append(levelError)
+
+        errorMsg.append(f"Offending constraints were")
+        for memLevel, constr in offendingMemoryConstraints:
+            errorMsg.append(f"{memLevel.size} >= {str(constr)}")
+
+        if len(errorMsg) > 1:
+            raise RuntimeError(("\n").join(errorMsg))
+
+        return True
+
+    def isFeasible(self) -> bool:
+        """Check whether the model has any solution, without optimizing its objectives
+
+        Returns
+        -------
+        bool
+            True if a solution was found within the solver time limit
+
+        """
+        self._trySetupConstraints()
+        return self._solve(self._model.cpModel, self._newSolver())
+
+    @profiled("Tiler")
+    def trySolveModel(self):
+
+        self._trySetupConstraints()
+
+        return self._solveModel()
+
+    def _softScale(self, objective: CPSATExpression, totalWeight: int) -> int:
+        # Scaling the score beyond the range of the objective prefers any better score over any better objective
+        scale = objective.Max() - objective.Min() + 1
+        if (totalWeight + 1) * scale + max(abs(objective.Min()), abs(objective.Max())) >= _MAXOBJECTIVE:
+            return 0
+        return scale
+
+    def _solveModel(self, solType: Union[Literal['min'], Literal['max']] = 'max') -> cp_model.CpSolver:
+        # The model is solved once, later calls only read the solution again
+        if self._solved:
+            return self._solver
+
+        if self.separableObjectives:
+            objectives = self._objectives
+        else:
+            objectives = self._objectives[:1]
+
+        literals, score, totalWeight = self._postSoftConstraints()
+
+        # Soft constraints are optimized together with the first objective, a separate solve is only needed if
+        # there is no objective or the combined objective could overflow
+        scale = self._softScale(objectives[0][0], totalWeight) if literals != [] and objectives != [] else 0
+        if literals != [] and scale == 0:
+            if not self._fixSoftConstraints(literals, score, solType):
+                self.debugConstraints()
+            literals, score = [], 0
+
+        for objective, minimize in objectives:
+            if not self._optimizeObjective(objective, minimize, solType, literals, score, scale):
+                self.debugConstraints()
+            literals, score, scale = [], 0, 0
+
+        if self._solver is None:
+            self._solve(self._model.cpModel, self._newModelSolver(solType))
+
+        if self._solver is None:
+            self.debugConstraints()
+
+        assert self._solver is not None, "Error in Tiler: No solution found"
+
+        self._solved = True
+        self._collector = self._solver
+        return self._collector
@@ -24,7 +24,9 @@
 # limitations under the License.
 
 from abc import abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 import Deeploy.CommonExtensions.DataTypes as BasicDataTypes
 from Deeploy.AbstractDataTypes import PointerClass
@@ -32,12 +34,22 @@ from Deeploy.CommonExtensions.CodeTransformationPasses.Closure import ClosureExe
 from Deeploy.CommonExtensions.CodeTransformationPasses.IntrospectiveCodeTransformation import \
     IntrospectiveCodeTransformationMixIn
 from Deeploy.CommonExtensions.CodeTransformationPasses.MemoryAllocation import ArgumentStructGeneration
-from Deeploy.DeeployTypes import CodeGenVerbosity, CodeTransformationPass, ExecutionBlock, NetworkContext, \
-    NodeTemplate, OperatorRepresentation, VariableBuffer, _NoVerbosity
+from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
+    NetworkContext, NodeTemplate, OperatorRepresentation, VariableBuffer, _NoVerbosity
 from Deeploy.TilingExtension.CodeTransformationPasses.TilingPrototypes import PrototypeTilingMixIn
+from Deeploy.TilingExtension.LayerFusion import mergePatternTilingSchedules, tileConstraintNodes, \
+    transfersIntoMemoryLevel, unravelOperatorRepresentation, wrapPatternTilingSolution
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TilingCodegen import TilingSchedule, VariableReplacementScheme, minimizeVariableReplacement
 
+_openWriteBackConditionTemplate = NodeTemplate("""
+if (${writeBackMask}[${tileIdxVar}]) {
+""")
+
+_closeWriteBackConditionTemplate = NodeTemplate("""
+}
+""")
+
 
 class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformationMixIn, PrototypeTilingMixIn):
 
@@ -121,6 +133,41 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
 
         return newPtrName
 
+    def _hoistWriteBackMask(self,
+                            ctxt: NetworkContext,
+                            nodeName: str,
+                            tilingSchedules: List[TilingSchedule],
+                            sourceMemoryLevel: str = "L2") -> Optional[str]:
+
+        # The mask has to be computed per schedule, consecutive schedules may start with the last output tile
+        writeBackMask = np.concatenate([tilingSchedule.outputWriteBackMask() for tilingSchedule in tilingSchedules])
+
+        if np.all(writeBackMask):
+            return None
+
+        newPtrName = self.prefix + nodeName + "_writeBack"
+
+        cb = ctxt.ConstantBuffer(newPtrName, [len(writeBackMask)], values = writeBackMask.astype(np.uint8).tolist())
+        ctxt.add(cb, "global")
+
+        cb._type = PointerClass(BasicDataTypes.uint8_t)
+        cb._instance = cb._type(newPtrName, ctxt)
+        cb._memoryLevel = sourceMemoryLevel
+
+        return newPtrName
+
+    @staticmethod
+    def _guardWriteBack(egressDMATransferCalls: List[CodeSnippet],
+                        writeBackMask: Optional[str],
+                        tileIdxVar: str = "TILING_I") -> List[CodeSnippet]:
+
+        if writeBackMask is None:
+            return egressDMATransferCalls
+
+        operatorRepresentation = {"writeBackMask": writeBackMask, "tileIdxVar": tileIdxVar}
+        return [CodeSnippet(_openWriteBackConditionTemplate, operatorRepresentation)
+               ] + egressDMATransferCalls + [CodeSnippet(_closeWriteBackConditionTemplate, {})]
+
     def apply(self,
               ctxt: NetworkContext,
               executionBlock: ExecutionBlock,
@@ -153,11 +200,12 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
 
         nodeMemoryConstraint = patternMemoryConstraint.nodeConstraints[0]
 
-        possibleTemplateNodes = [
-            node for node in baseExecutionBlock.codeSnippets if hasattr(node.template, 'tileConstraint')
-        ]
+        possibleTemplateNodes = tileConstraintNodes(baseExecutionBlock)
+
+        if len(possibleTemplateNodes) > 1:
+            return self._applyFused(ctxt, executionBlock, name, nodeMemoryConstraint, possibleTemplateNodes)
 
-        assert len(possibleTemplateNodes) == 1, "More than one template node with TCF found"
+        assert len(possibleTemplateNodes) == 1, "No template node with TCF found"
 
         templateNode = possibleTemplateNodes[0]
 
@@ -188,3 +236,37 @@ class TilingCodeGeneration(CodeTransformationPass, IntrospectiveCodeTransformati
             ctxt, executionBlock = self.argStructGeneration.apply(ctxt, executionBlock, name)
 
         return ctxt, executionBlock
+
+    def _applyFused(self, ctxt: NetworkContext, executionBlock: ExecutionBlock, name: str,
+                    nodeMemoryConstraint: NodeMemoryConstraint,
+                    templateNodes: List[CodeSnippet]) -> Tuple[NetworkContext, ExecutionBlock]:
+
+        # Intermediate tensors of fused patterns only live in the innermost memory level
+        if not transfersIntoMemoryLevel(nodeMemoryConstraint, self.targetMemLevel):
+            return ctxt, executionBlock
+
+        unravelReps = [unravelOperatorRepresentation(ctxt, node.operatorRepresentation) for node in templateNodes]
+        solutions = wrapPatternTilingSolution(nodeMemoryConstraint, templateNodes, self.targetMemLevel, ctxt,
+                                              unravelReps)
+
+        minimalVariableReplacements = []
+        for templateNode, (_, variableReplacement, _) in zip(templateNodes, solutions):
+            minimalVariableReplacement, newNodeRep = minimizeVariableReplacement(variableReplacement,
+                                                                                 templateNode.operatorRepresentation)
+            for key, value in newNodeRep.items():
+                templateNode.operatorRepresentation[key] = value
+
+            minimalVariableReplacements.append(minimalVariableReplacement)
+
+        # All kernels of the pattern run in the same tiling loop, only the pattern inputs and outputs are transferred
+        tilingSchedule, variableReplacement, operatorRepresentation = mergePatternTilingSchedules(
+            nodeMemoryConstraint, [tilingSchedules[0] for _, _, tilingSchedules in solutions],
+            minimalVariableReplacements, [node.operatorRepresentation for node in templateNodes], unravelReps)
+
+        ctxt, executionBlock, applicable = self.generateTilingLoop(ctxt, executionBlock, nodeMemoryConstraint,
+                                                                   [tilingSchedule], variableReplacement,
+                                                                   operatorRepresentation)
+        if applicable:
+            ctxt, executionBlock = self.argStructGeneration.apply(ctxt, executionBlock, name)
+
+        return ctxt, executionBlock
@@ -34,6 +34,8 @@ from Deeploy.CommonExtensions.CodeTransformationPasses.IntrospectiveCodeTransfor
     IntrospectiveCodeTransformationMixIn
 from Deeploy.DeeployTypes import CodeGenVerbosity, CodeSnippet, CodeTransformationPass, ExecutionBlock, \
     NetworkContext, NodeTemplate, OperatorRepresentation, TransientBuffer, _NoVerbosity
+from Deeploy.TilingExtension.LayerFusion import tileConstraintNodes, transfersIntoMemoryLevel, \
+    unravelOperatorRepresentation, wrapPatternTilingSolution
 from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
 from Deeploy.TilingExtension.TilingCodegen import TilingSchedule, VariableReplacementScheme, minimizeVariableReplacement
 
@@ -225,11 +227,12 @@ class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransfo
 
         nodeMemoryConstraint = patternMemoryConstraint.nodeConstraints[0]
 
-        possibleTemplateNodes = [
-            node for node in baseExecutionBlock.codeSnippets if hasattr(node.template, 'tileConstraint')
-        ]
+        possibleTemplateNodes = tileConstraintNodes(baseExecutionBlock)
 
-        assert len(possibleTemplateNodes) == 1, "More than one template node with TCF found"
+        if len(possibleTemplateNodes) > 1:
+            return self._applyFused(ctxt, executionBlock, nodeMemoryConstraint, possibleTemplateNodes)
+
+        assert len(possibleTemplateNodes) == 1, "No template node with TCF found"
 
         templateNode = possibleTemplateNodes[0]
         operatorRepresentation = templateNode.operatorRepresentation
@@ -260,22 +263,62 @@ class TilingVariableReplacement(CodeTransformationPass, IntrospectiveCodeTransfo
         ctxt = self._replaceTiledExpressions(ctxt, templateNode, minimalVariableReplacement, flatTilingSchedule,
                                              nodeMemoryConstraint)
 
+        keyList = {}
+        for key in list(flatTilingSchedule.inputBaseOffsets.keys()) + list(flatTilingSchedule.outputBaseOffsets.keys()):
+            keyList[unravelRep[key]] = operatorRepresentation[key]
+
+        ctxt = self._replaceClosureStructArgs(ctxt, executionBlock, keyList)
+
+        return ctxt, executionBlock
+
+    def _replaceClosureStructArgs(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
+                                  keyList: Dict[str, str]) -> NetworkContext:
+
         for codeSnippet in executionBlock.codeSnippets:
 
-            template, nRep = codeSnippet.template, codeSnippet.operatorRepresentation
+            nRep = codeSnippet.operatorRepresentation
 
             if not "closureStructArgs" in nRep:
                 continue
 
-            keyList = {}
-
-            for key in list(flatTilingSchedule.inputBaseOffsets.keys()) + list(
-                    flatTilingSchedule.outputBaseOffsets.keys()):
-                keyList[unravelRep[key]] = operatorRepresentation[key]
-
             for key in copy.copy(nRep['closureStructArgs'].value).keys():
                 if nRep['closureStructArgs'].value[key].referenceName in keyList.keys():
                     nRep['closureStructArgs'].value[key] = type(nRep['closureStructArgs'].value[key])(
                         keyList[nRep['closureStructArgs'].value[key].referenceName], ctxt)
 
+        return ctxt
+
+    def _applyFused(self, ctxt: NetworkContext, executionBlock: ExecutionBlock,
+                    nodeMemoryConstraint: NodeMemoryConstraint,
+                    templateNodes: List[CodeSnippet]) -> Tuple[NetworkContext, ExecutionBlock]:
+
+        # Intermediate tensors of fused patterns only live in the innermost memory level
+        if not transfersIntoMemoryLevel(nodeMemoryConstraint, self.targetMemLevel):
+            return ctxt, executionBlock
+
+        unravelReps = [unravelOperatorRepresentation(ctxt, node.operatorRepresentation) for node in templateNodes]
+        solutions = wrapPatternTilingSolution(nodeMemoryConstraint, templateNodes, self.targetMemLevel, ctxt,
+                                              unravelReps)
+
+        keyList = {}
+        for templateNode, unravelRep, (nodeConstraint, variableReplacement,
+                                       tilingSchedules) in zip(templateNodes, unravelReps, solutions):
+
+            operatorRepresentation = templateNode.operatorRepresentation
+            self._name = operatorRepresentation['nodeName']
+
+            minimalVariableReplacement, newNodeRep = minimizeVariableReplacement(variableReplacement,
+                                                                                 operatorRepresentation)
+            for key, value in newNodeRep.items():
+                operatorRepresentation[key] = value
+
+            ctxt = self._replaceTiledExpressions(ctxt, templateNode, minimalVariableReplacement, tilingSchedules[0],
+                                                 nodeConstraint)
+
+            for key in list(tilingSchedules[0].inputBaseOffsets.keys()) + list(
+                    tilingSchedules[0].outputBaseOffsets.keys()):
+                keyList[unravelRep[key]] = operatorRepresentation[key]
+
+        ctxt = self._replaceClosureStructArgs(ctxt, executionBlock, keyList)
+
         return ctxt, executionBlock
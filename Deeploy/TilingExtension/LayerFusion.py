@@ -0,0 +1,563 @@
+# ----------------------------------------------------------------------
+#
+# File: LayerFusion.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import onnx_graphsurgeon as gs
+
+from Deeploy.DeeployTypes import CodeSnippet, CodeTransformation, ConstantBuffer, ExecutionBlock, NetworkContext, \
+    ONNXLayer, OperatorRepresentation, SubGraph, TransientBuffer
+from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy
+from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import TargetMemoryLevelMapping
+from Deeploy.TilingExtension.MemoryConstraints import NodeMemoryConstraint
+from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangleArray, TilingSchedule, \
+    VariableReplacementScheme
+
+
+@dataclass
+class LayerFusion():
+    """Groups chains of consecutive layers into depth-first tiled patterns
+
+    All layers of a fused pattern are computed tile by tile: the
+    output tiles of the last layer are propagated backwards through
+    the receptive fields of the layers in front of it, and the
+    intermediate tensors of the chain stay in the target memory level
+    instead of round-tripping through their home memory level.
+
+    A layer is appended to a chain if its input is only produced and
+    consumed within the chain, the estimated footprint of the fused
+    pattern fits into the target memory level, and the solved tiling
+    of the fused pattern transfers at least `minSavedTraffic` bytes
+    less to and from the home memory level than the solved tilings of
+    the chain and the layer on their own. The saving is the traffic
+    of the intermediate tensor minus the halos and constants that the
+    smaller tiles of the fused pattern fetch again.
+    """
+
+    maxPatternLength: int = 3  #: int: Maximum number of layers of a fused pattern
+    minSavedTraffic: int = 1  #: int: Minimum number of bytes of home memory traffic fusing a layer has to save
+    maxTiles: int = 16  #: int: Number of tiles activations are assumed to be split into to estimate the footprint
+
+    @staticmethod
+    def _tensorSize(ctxt: NetworkContext, tensorName: str) -> int:
+        _buffer = ctxt.lookup(tensorName)
+        return int(np.prod(_buffer.shape)) * (_buffer._type.referencedType.typeWidth // 8)
+
+    @staticmethod
+    def _isFusable(layer: ONNXLayer) -> bool:
+        binder = layer.mapper.binder
+        if not hasattr(binder.template, 'tileConstraint'):
+            return False
+
+        # Transposing DMA transfers are generated per layer
+        operatorRepresentation = binder.executionBlock.codeSnippets[0].operatorRepresentation
+        return not any(key.startswith("in") and key.endswith("_perm") for key in operatorRepresentation.keys())
+
+    @staticmethod
+    def _transformerSignature(layer: ONNXLayer) -> Tuple[type, ...]:
+        return tuple(type(_pass) for _pass in layer.mapper.binder.codeTransformer.passes)
+
+    def _targetMemoryLevel(self, ctxt: NetworkContext, pattern: SubGraph,
+                           targetMemoryLevelMapping: TargetMemoryLevelMapping,
+                           memoryHierarchy: MemoryHierarchy) -> Optional[str]:
+
+        targetMemoryLevels = set()
+        for node in pattern:
+            for tensor in node.inputs + node.outputs:
+                _buffer = ctxt.lookup(tensor.name)
+                if not _buffer._deploy:
+                    continue
+
+                targetMemoryLevel = targetMemoryLevelMapping.lookup(node.name, tensor.name)
+                # Fused patterns are only tiled across a single level of the memory hierarchy
+                if len(memoryHierarchy.bfs(_buffer._memoryLevel, targetMemoryLevel)) > 2:
+                    return None
+
+                targetMemoryLevels.add(targetMemoryLevel)
+
+        if len(targetMemoryLevels) != 1:
+            return None
+
+        return targetMemoryLevels.pop()
+
+    def estimateFootprint(self, ctxt: NetworkContext, pattern: SubGraph) -> int:
+        """Estimate the footprint of a pattern in its target memory level
+
+        Constant tensors are assumed to be fully resident, all other
+        tensors, including the intermediate tensors of the pattern,
+        are assumed to be split into `maxTiles` tiles.
+
+        Parameters
+        ----------
+        ctxt : NetworkContext
+            Current NetworkContext
+        pattern : SubGraph
+            Pattern of the tiling schedule
+
+        Returns
+        -------
+        int
+            Estimated footprint in bytes
+
+        """
+        tensorNames = list(dict.fromkeys(tensor.name for node in pattern for tensor in node.inputs + node.outputs))
+        tensorNames = [tensorName for tensorName in tensorNames if ctxt.lookup(tensorName)._deploy]
+
+        constantSize = sum(
+            self._tensorSize(ctxt, tensorName)
+            for tensorName in tensorNames
+            if isinstance(ctxt.lookup(tensorName), ConstantBuffer))
+        activationSize = sum(
+            self._tensorSize(ctxt, tensorName)
+            for tensorName in tensorNames
+            if not isinstance(ctxt.lookup(tensorName), ConstantBuffer))
+
+        return constantSize + -(-activationSize // self.maxTiles)
+
+    def canFuse(self, ctxt: NetworkContext, chain: SubGraph, node: gs.Node, layerBinding: 'OrderedDict[str, ONNXLayer]',
+                targetMemoryLevelMapping: TargetMemoryLevelMapping, memoryHierarchy: MemoryHierarchy) -> bool:
+        """Check whether a node can be appended to a chain of fused layers
+
+        Only the structure of the chain and the estimated footprint
+        are checked; whether fusing the node saves traffic depends on
+        the solved tilings, see `fuse`.
+
+        Parameters
+        ----------
+        ctxt : NetworkContext
+            Current NetworkContext
+        chain : SubGraph
+            Chain of already fused layers
+        node : gs.Node
+            Node directly following the chain in the schedule
+        layerBinding : OrderedDict[str, ONNXLayer]
+            The bound layers of the network
+        targetMemoryLevelMapping : TargetMemoryLevelMapping
+            Target memory level of every tensor of every node
+        memoryHierarchy : MemoryHierarchy
+            Memory hierarchy of the platform
+
+        Returns
+        -------
+        bool
+            True if the node can be fused into the chain
+
+        """
+        if len(chain) >= self.maxPatternLength:
+            return False
+
+        producer, producerLayer, consumerLayer = chain[-1], layerBinding[chain[-1].name], layerBinding[node.name]
+
+        if not (self._isFusable(producerLayer) and self._isFusable(consumerLayer)):
+            return False
+
+        if self._transformerSignature(producerLayer) != self._transformerSignature(consumerLayer):
+            return False
+
+        # The intermediate tensor must neither leave the chain nor be a network output
+        if len(producer.outputs) != 1:
+            return False
+
+        intermediate = producer.outputs[0]
+        if not ctxt.is_local(intermediate.name) or [consumer.name for consumer in intermediate.outputs] != [node.name]:
+            return False
+
+        pattern = chain + [node]
+        targetMemoryLevel = self._targetMemoryLevel(ctxt, pattern, targetMemoryLevelMapping, memoryHierarchy)
+        if targetMemoryLevel is None:
+            return False
+
+        return self.estimateFootprint(ctxt, pattern) <= memoryHierarchy.memoryLevels[targetMemoryLevel].size
+
+    def patternTraffic(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph,
+                       targetMemoryLevelMapping: TargetMemoryLevelMapping) -> int:
+        """Bytes a solved pattern transfers between the home and target memory levels of its tensors
+
+        Every tile of the pattern transfers one tile of each of its
+        inputs and outputs; tensors produced and consumed within the
+        pattern are not transferred. Overlapping input tiles and
+        constant tensors loaded for every tile hence count once per
+        tile.
+
+        Parameters
+        ----------
+        tilerModel : TilerModel
+            Solved tiling model of the pattern on its own
+        ctxt : NetworkContext
+            Current NetworkContext
+        pattern : SubGraph
+            Pattern of the tiling schedule
+        targetMemoryLevelMapping : TargetMemoryLevelMapping
+            Target memory level of every tensor of every node
+
+        Returns
+        -------
+        int
+            Transferred bytes
+
+        """
+        outputName = pattern[-1].outputs[0].name
+
+        numTiles = 1
+        for dimIdx, dim in enumerate(ctxt.lookup(outputName).shape):
+            tileDim = tilerModel._resolveVariable(tilerModel.getTensorDimVar(outputName, dimIdx, 0))
+            numTiles *= -(-int(dim) // tileDim)
+
+        producedNames = {tensor.name for node in pattern for tensor in node.outputs}
+        consumedNames = {tensor.name for node in pattern for tensor in node.inputs}
+        intermediateNames = producedNames & consumedNames
+
+        traffic = 0
+        transferredNames = set()
+        for node in pattern:
+            for tensor in node.inputs + node.outputs:
+                if tensor.name in intermediateNames or tensor.name in transferredNames:
+                    continue
+
+                _buffer = ctxt.lookup(tensor.name)
+                if not _buffer._deploy or not tilerModel.existsCopyIdx(tensor.name, 0):
+                    continue
+
+                if _buffer._memoryLevel == targetMemoryLevelMapping.lookup(node.name, tensor.name):
+                    continue
+
+                transferredNames.add(tensor.name)
+                tileElements = tilerModel._resolveVariable(tilerModel.getTensorNumberOfEltVar(tensor.name, 0))
+                traffic += numTiles * tileElements * (_buffer._type.referencedType.typeWidth // 8)
+
+        return traffic
+
+    def fuse(self, ctxt: NetworkContext, schedule: List[SubGraph], layerBinding: 'OrderedDict[str, ONNXLayer]',
+             targetMemoryLevelMapping: TargetMemoryLevelMapping, memoryHierarchy: MemoryHierarchy,
+             solvePattern: Callable[[List[SubGraph], int], Optional[TilerModel]]) -> List[SubGraph]:
+        """Group consecutive layers of a schedule into fused patterns
+
+        Parameters
+        ----------
+        ctxt : NetworkContext
+            Current NetworkContext
+        schedule : List[SubGraph]
+            Tiling schedule, only patterns of a single layer are fused
+        layerBinding : OrderedDict[str, ONNXLayer]
+            The bound layers of the network
+        targetMemoryLevelMapping : TargetMemoryLevelMapping
+            Target memory level of every tensor of every node
+        memoryHierarchy : MemoryHierarchy
+            Memory hierarchy of the platform
+        solvePattern : Callable[[List[SubGraph], int], Optional[TilerModel]]
+            Solves the tiling model of the pattern at the given index
+            of a schedule on its own, returns None if the pattern
+            can't be tiled
+
+        Returns
+        -------
+        List[SubGraph]
+            Tiling schedule with fused patterns
+
+        """
+
+        def solveTraffic(schedule: List[SubGraph], patternIdx: int) -> Optional[int]:
+            tilerModel = solvePattern(schedule, patternIdx)
+            if tilerModel is None:
+                return None
+            return self.patternTraffic(tilerModel, ctxt, schedule[patternIdx], targetMemoryLevelMapping)
+
+        fusedSchedule: List[SubGraph] = []
+        chainable = False
+        # Traffic of the last pattern of the fused schedule, solved lazily
+        chainTraffic: Optional[int] = None
+
+        for idx, pattern in enumerate(schedule):
+            if chainable and len(pattern) == 1 and self.canFuse(ctxt, fusedSchedule[-1], pattern[0], layerBinding,
+                                                                targetMemoryLevelMapping, memoryHierarchy):
+                separate = fusedSchedule + list(schedule[idx:])
+                if chainTraffic is None:
+                    chainTraffic = solveTraffic(separate, len(fusedSchedule) - 1)
+                nodeTraffic = solveTraffic(separate, len(fusedSchedule))
+
+                candidate = fusedSchedule[:-1] + [fusedSchedule[-1] + pattern] + list(schedule[idx + 1:])
+                candidateTraffic = solveTraffic(candidate, len(fusedSchedule) - 1)
+
+                # Patterns that can only be tiled when fused are always fused
+                if candidateTraffic is not None and (chainTraffic is None or nodeTraffic is None or chainTraffic +
+                                                     nodeTraffic - candidateTraffic >= self.minSavedTraffic):
+                    fusedSchedule[-1] = fusedSchedule[-1] + pattern
+                    chainTraffic = candidateTraffic
+                    continue
+
+                fusedSchedule.append(list(pattern))
+                chainable = True
+                chainTraffic = nodeTraffic
+                continue
+
+            fusedSchedule.append(list(pattern))
+            chainable = len(pattern) == 1
+            chainTraffic = None
+
+        return fusedSchedule
+
+
+def fuseLayers(ctxt: NetworkContext, layerBinding: 'OrderedDict[str, ONNXLayer]', pattern: List[str]) -> NetworkContext:
+    """Merge the execution blocks of a fused pattern into the block of its last layer
+
+    The kernels of all layers are generated by the last layer of the
+    pattern, the other layers don't generate any code anymore.
+
+    Parameters
+    ----------
+    ctxt : NetworkContext
+        Current NetworkContext
+    layerBinding : OrderedDict[str, ONNXLayer]
+        The bound layers of the network
+    pattern : List[str]
+        Names of the layers of the pattern in execution order
+
+    Returns
+    -------
+    NetworkContext
+        Updated NetworkContext
+
+    """
+    if len(pattern) <= 1:
+        return ctxt
+
+    fusedName = pattern[-1]
+    fusedBinder = layerBinding[fusedName].mapper.binder
+
+    for name in reversed(pattern[:-1]):
+        binder = layerBinding[name].mapper.binder
+        fusedBinder.executionBlock.codeSnippets.extendleft(reversed(binder.executionBlock.codeSnippets))
+
+        binder._executionBlock = ExecutionBlock()
+        binder.codeTransformer = CodeTransformation([])
+
+    # Buffers of the absorbed layers are allocated and freed by the fused layer
+    for _buffer in list(ctxt.localObjects.values()) + list(ctxt.globalObjects.values()):
+        if not hasattr(_buffer, "_users"):
+            continue
+        _buffer._users = list(dict.fromkeys(fusedName if user in pattern else user for user in _buffer._users))
+
+    return ctxt
+
+
+def unravelOperatorRepresentation(ctxt: NetworkContext,
+                                  operatorRepresentation: OperatorRepresentation) -> OperatorRepresentation:
+    """Resolve all references of an operator representation to the referenced tensors
+    """
+
+    def unravelReference(name: str) -> str:
+        if name not in ctxt.localObjects.keys() and name not in ctxt.globalObjects.keys():
+            return name
+
+        refBuffer = ctxt.lookup(name)
+        if not hasattr(refBuffer, "_referenceName"):
+            return name
+
+        return unravelReference(refBuffer._referenceName)
+
+    return {
+        key: unravelReference(value) if isinstance(value, str) else value
+        for key, value in operatorRepresentation.items()
+    }
+
+
+def tileConstraintNodes(executionBlock: ExecutionBlock) -> List[CodeSnippet]:
+    """Return the kernels of an execution block that carry a tile constraint, in execution order
+    """
+    return [node for node in executionBlock.codeSnippets if hasattr(node.template, 'tileConstraint')]
+
+
+def transfersIntoMemoryLevel(nodeMemoryConstraint: NodeMemoryConstraint, targetMemLevel: str) -> bool:
+    """Return whether any tensor of a tiling solution is transferred into the given memory level
+    """
+    return any(targetMemLevel in list(tensorConstraint.memoryConstraints.keys())[1:]
+               for tensorConstraint in nodeMemoryConstraint.tensorMemoryConstraints.values())
+
+
+def _splitPatternMemoryConstraint(ctxt: NetworkContext, nodeMemoryConstraint: NodeMemoryConstraint,
+                                  unravelReps: List[OperatorRepresentation]) -> List[NodeMemoryConstraint]:
+
+    nodeTensorNames = [{value for value in rep.values() if isinstance(value, str)} for rep in unravelReps]
+
+    nodeConstraints = []
+    for idx, tensorNames in enumerate(nodeTensorNames):
+        nodeConstraint = NodeMemoryConstraint()
+        for tensorName, tensorConstraint in nodeMemoryConstraint.tensorMemoryConstraints.items():
+            if tensorName not in tensorNames:
+                continue
+
+            ioDir = nodeMemoryConstraint.getIO(tensorName)
+            # Intermediate tensors of the chain are outputs of their producer and inputs of their consumer
+            if ioDir == "intermediate" and not isinstance(ctxt.lookup(tensorName), TransientBuffer):
+                producesTensor = any(tensorName in names for names in nodeTensorNames[idx + 1:])
+                ioDir = "output" if producesTensor else "input"
+
+            nodeConstraint.addTensorConstraint(tensorConstraint, ioDir)
+        nodeConstraints.append(nodeConstraint)
+
+    return nodeConstraints
+
+
+def wrapPatternTilingSolution(
+    nodeMemoryConstraint: NodeMemoryConstraint, templateNodes: List[CodeSnippet], targetMemLevel: str,
+    ctxt: NetworkContext, unravelReps: List[OperatorRepresentation]
+) -> List[Tuple[NodeMemoryConstraint, VariableReplacementScheme, List[TilingSchedule]]]:
+    """Serialize the tiling solution of a fused pattern for every one of its kernels
+
+    The tiles of the last kernel follow from its tiling solution, the
+    output tiles of every other kernel are the input tiles its
+    consumer requires, including the halo of its receptive field.
+
+    Parameters
+    ----------
+    nodeMemoryConstraint : NodeMemoryConstraint
+        The tiling solution of the whole pattern
+    templateNodes : List[CodeSnippet]
+        The kernels of the pattern in execution order
+    targetMemLevel : str
+        The memory level tiles are transferred into
+    ctxt : NetworkContext
+        Current NetworkContext
+    unravelReps : List[OperatorRepresentation]
+        The operator representations of the kernels, with all
+        references resolved to the referenced tensors
+
+    Returns
+    -------
+    List[Tuple[NodeMemoryConstraint, VariableReplacementScheme, List[TilingSchedule]]]
+        The tiling solution, variable replacements, and tiling
+        schedules of every kernel
+
+    """
+    nodeConstraints = _splitPatternMemoryConstraint(ctxt, nodeMemoryConstraint, unravelReps)
+
+    lastConstraint, lastNode, lastRep = nodeConstraints[-1], templateNodes[-1], unravelReps[-1]
+    variableReplacement, tilingSchedules = lastNode.template.tileConstraint.wrapTilingSolution(
+        lastConstraint, targetMemLevel, ctxt, lastRep)
+
+    assert len(tilingSchedules) == 1, "Fused patterns have to be tiled across a single memory level!"
+
+    solutions = [(lastConstraint, variableReplacement, tilingSchedules)]
+
+    for nodeConstraint, templateNode, rep in zip(reversed(nodeConstraints[:-1]), reversed(templateNodes[:-1]),
+                                                 reversed(unravelReps[:-1])):
+        consumerRep = unravelReps[len(unravelReps) - len(solutions)]
+        consumerSchedule = solutions[0][2][0]
+
+        outputName = list(nodeConstraint.outputTensorMemoryConstraints.keys())[0]
+        consumerKeys = [key for key in consumerSchedule.inputLoadArrays.keys() if consumerRep[key] == outputName]
+
+        assert len(consumerKeys) == 1, f"Expected exactly one input tile of {outputName} per step!"
+
+        outputCubes = [
+            AbsoluteHyperRectangle(rectangle = cube, absoluteOffset = cube.offset)
+            for cube in consumerSchedule.inputLoadArrays[consumerKeys[0]]
+        ]
+
+        tileConstraint = templateNode.template.tileConstraint
+        variableReplacement, tilingSchedule = tileConstraint.serializeTilingSolution(
+            nodeConstraint, outputCubes, targetMemLevel, ctxt, rep)
+        tilingSchedule = tileConstraint.sanitizeTilingSchedule(tilingSchedule)
+
+        # Producers accumulating an output tile over several steps can't hand over one tile per step
+        assert tilingSchedule.numOutputSteps == len(outputCubes), \
+            f"{rep['nodeName']} has to compute every output tile in a single step to be fused!"
+
+        solutions.insert(0, (nodeConstraint, variableReplacement, [tilingSchedule]))
+
+    return solutions
+
+
+def mergePatternTilingSchedules(
+    nodeMemoryConstraint: NodeMemoryConstraint, tilingSchedules: List[TilingSchedule],
+    variableReplacements: List[VariableReplacementScheme], operatorRepresentations: List[OperatorRepresentation],
+    unravelReps: List[OperatorRepresentation]
+) -> Tuple[TilingSchedule, VariableReplacementScheme, OperatorRepresentation]:
+    """Merge the tiling schedules of the kernels of a fused pattern into one
+
+    Keys of every kernel are prefixed with its position in the
+    pattern. Intermediate tensors of the pattern are never transferred
+    and therefore dropped from the merged schedule.
+
+    Parameters
+    ----------
+    nodeMemoryConstraint : NodeMemoryConstraint
+        The tiling solution of the whole pattern
+    tilingSchedules : List[TilingSchedule]
+        Flat tiling schedule of every kernel
+    variableReplacements : List[VariableReplacementScheme]
+        Variable replacements of every kernel
+    operatorRepresentations : List[OperatorRepresentation]
+        Operator representations of every kernel
+    unravelReps : List[OperatorRepresentation]
+        The operator representations of the kernels, with all
+        references resolved to the referenced tensors
+
+    Returns
+    -------
+    Tuple[TilingSchedule, VariableReplacementScheme, OperatorRepresentation]
+        Merged tiling schedule, variable replacements, and operator
+        representation of the pattern
+
+    """
+    intermediateNames = nodeMemoryConstraint.intermediateTensorMemoryConstraints.keys()
+
+    inputBaseOffsets: Dict[str, List[int]] = {}
+    outputBaseOffsets: Dict[str, List[int]] = {}
+    inputLoadArrays: Dict[str, HyperRectangleArray] = {}
+    outputLoadArrays: Dict[str, HyperRectangleArray] = {}
+    perTileReplacements: Dict[str, List] = {}
+    replacementTypes = {}
+
+    operatorRepresentation: OperatorRepresentation = {
+        "nodeName": operatorRepresentations[-1]['nodeName'],
+        "nodeOps": sum(rep.get('nodeOps', 0) for rep in operatorRepresentations)
+    }
+
+    for idx, (tilingSchedule, variableReplacement, rep,
+              unravelRep) in enumerate(zip(tilingSchedules, variableReplacements, operatorRepresentations,
+                                           unravelReps)):
+
+        operatorRepresentation.update({f"{idx}_{key}": value for key, value in rep.items()})
+
+        for key, offsets in tilingSchedule.inputBaseOffsets.items():
+            if unravelRep[key] not in intermediateNames:
+                inputBaseOffsets[f"{idx}_{key}"] = offsets
+                inputLoadArrays[f"{idx}_{key}"] = tilingSchedule.inputLoadArrays[key]
+
+        for key, offsets in tilingSchedule.outputBaseOffsets.items():
+            if unravelRep[key] not in intermediateNames:
+                outputBaseOffsets[f"{idx}_{key}"] = offsets
+                outputLoadArrays[f"{idx}_{key}"] = tilingSchedule.outputLoadArrays[key]
+
+        for key, values in variableReplacement.perTileReplacements.items():
+            perTileReplacements[f"{idx}_{key}"] = values
+            replacementTypes[f"{idx}_{key}"] = variableReplacement.replacementTypes[key]
+
+    tilingSchedule = TilingSchedule(inputBaseOffsets, outputBaseOffsets, inputLoadArrays, outputLoadArrays)
+
+    return tilingSchedule, VariableReplacementScheme(perTileReplacements, replacementTypes), operatorRepresentation
@@ -0,0 +1,260 @@
+# ----------------------------------------------------------------------
+#
+# File: MemoryAwareScheduler.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import onnx_graphsurgeon as gs
+
+from Deeploy.DeeployTypes import NetworkContext, SubGraph
+
+
+class _SchedulingProblem():
+    """Dependencies and tensor lifetimes of a graph, with nodes and executed node sets encoded as bitmasks
+
+    Only intermediate tensors are considered, as graph inputs,
+    outputs and constants are globals which are not part of the
+    memory arena. Like in the MemoryScheduler, a tensor is live from
+    the step of its producer up to and including the step of its last
+    consumer. Tensor sizes are counted in bytes.
+    """
+
+    def __init__(self, graph: gs.Graph, ctxt: Optional[NetworkContext] = None):
+        self.nodes: List[gs.Node] = list(graph.nodes)
+
+        nodeIdx = {id(node): idx for idx, node in enumerate(self.nodes)}
+        globalNames = {tensor.name for tensor in graph.inputs + graph.outputs}
+
+        self.tensorSizes: Dict[str, int] = {}
+        self.consumerMasks: Dict[str, int] = {}
+        self.predecessorMasks: List[int] = [0] * len(self.nodes)
+        self.successors: List[List[int]] = [[] for _ in self.nodes]
+        self.nodeInputs: List[List[str]] = [[] for _ in self.nodes]
+        self.nodeOutputs: List[List[str]] = [[] for _ in self.nodes]
+
+        for idx, node in enumerate(self.nodes):
+            for tensor in node.outputs:
+                if tensor.name in globalNames:
+                    continue
+                self.nodeOutputs[idx].append(tensor.name)
+                self.tensorSizes[tensor.name] = self.tensorSize(tensor, ctxt)
+                self.consumerMasks[tensor.name] = 0
+
+        for idx, node in enumerate(self.nodes):
+            for tensor in node.inputs:
+                for producer in tensor.inputs:
+                    if id(producer) in nodeIdx and idx not in self.successors[nodeIdx[id(producer)]]:
+                        self.predecessorMasks[idx] |= 1 << nodeIdx[id(producer)]
+                        self.successors[nodeIdx[id(producer)]].append(idx)
+
+                if tensor.name in self.consumerMasks and tensor.name not in self.nodeInputs[idx]:
+                    self.nodeInputs[idx].append(tensor.name)
+                    self.consumerMasks[tensor.name] |= 1 << idx
+
+        self.fullMask = (1 << len(self.nodes)) - 1
+
+    @staticmethod
+    def tensorSize(tensor: gs.Variable, ctxt: Optional[NetworkContext] = None) -> int:
+        if tensor.shape is None or not all(isinstance(dim, (int, np.integer)) for dim in tensor.shape):
+            return 0
+
+        # Deeploy's data types are only inferred after binding, fall back to the data type of the graph otherwise
+        if ctxt is not None and (ctxt.is_local(tensor.name) or ctxt.is_global(tensor.name)) and hasattr(
+                ctxt.lookup(tensor.name), "_type"):
+            typeWidth = ctxt.lookup(tensor.name)._type.referencedType.typeWidth // 8
+        elif tensor.dtype is not None:
+            typeWidth = np.dtype(tensor.dtype).itemsize
+        else:
+            typeWidth = 1
+
+        return int(np.prod(tensor.shape)) * typeWidth
+
+    def initialReady(self) -> Tuple[int, ...]:
+        return tuple(idx for idx in range(len(self.nodes)) if self.predecessorMasks[idx] == 0)
+
+    def nextReady(self, ready: Tuple[int, ...], executed: int, idx: int) -> Tuple[int, ...]:
+        executed |= 1 << idx
+        newlyReady = [succ for succ in self.successors[idx] if self.predecessorMasks[succ] & ~executed == 0]
+        return tuple(sorted([readyIdx for readyIdx in ready if readyIdx != idx] + newlyReady))
+
+    def step(self, executed: int, liveSize: int, idx: int) -> Tuple[int, int]:
+        """Executes a node
+
+        Returns the live size while the node executes and the live
+        size after its dead inputs and outputs have been freed.
+        """
+
+        stepSize = liveSize + sum(self.tensorSizes[name] for name in self.nodeOutputs[idx])
+
+        executed |= 1 << idx
+        freed = sum(self.tensorSizes[name] for name in self.nodeOutputs[idx] if self.consumerMasks[name] == 0)
+        freed += sum(
+            self.tensorSizes[name] for name in self.nodeInputs[idx] if self.consumerMasks[name] & ~executed == 0)
+
+        return stepSize, stepSize - freed
+
+    def peakSize(self, order: List[int]) -> int:
+        executed, liveSize, peakSize = 0, 0, 0
+        for idx in order:
+            stepSize, liveSize = self.step(executed, liveSize, idx)
+            executed |= 1 << idx
+            peakSize = max(peakSize, stepSize)
+        return peakSize
+
+
+class MemoryAwareScheduler():
+    """Scheduler searching the topological order of a graph with the smallest peak of live intermediate tensors
+
+    For branching graphs, e.g. residual blocks, the execution order
+    decides how many intermediate tensors have to be kept alive at the
+    same time, and thereby the size of the memory arena. Small graphs
+    are scheduled optimally with a dynamic program over the sets of
+    executed nodes; if more than `maxStates` of such sets would have to
+    be explored, a greedy search with a lookahead of `lookahead` nodes is used
+    instead. The default order is kept unless the search finds a
+    strictly better one.
+
+    Instances can be passed as `scheduler` to any NetworkDeployer.
+    Tensor sizes are weighted with the width of their data types.
+    Deployers schedule the graph before they infer the data types, so
+    the data types of the ONNX graph are used unless a context with
+    the inferred types, e.g. of a previous deployment, is passed.
+
+    """
+
+    def __init__(self,
+                 maxStates: int = 1 << 12,
+                 lookahead: int = 2,
+                 verbose: bool = True,
+                 ctxt: Optional[NetworkContext] = None):
+        self.maxStates = maxStates
+        self.lookahead = lookahead
+        self.verbose = verbose
+        self.ctxt = ctxt
+
+        # Deployers call their scheduler once for binding and once for tiling
+        self._scheduleCache: Dict[Tuple[str, ...], List[str]] = {}
+
+    def __call__(self, graph: gs.Graph) -> List[SubGraph]:
+        nodes = {node.name: node for node in graph.nodes}
+        signature = tuple(nodes.keys())
+
+        if signature not in self._scheduleCache:
+            problem = _SchedulingProblem(graph, self.ctxt)
+            order = self._schedule(problem)
+            self._scheduleCache[signature] = [problem.nodes[idx].name for idx in order]
+
+        return [[nodes[name]] for name in self._scheduleCache[signature]]
+
+    def _schedule(self, problem: _SchedulingProblem) -> List[int]:
+        defaultOrder = list(range(len(problem.nodes)))
+        defaultPeakSize = problem.peakSize(defaultOrder)
+
+        order = self._exactSchedule(problem)
+        if order is None:
+            order = self._greedySchedule(problem)
+
+        peakSize = problem.peakSize(order)
+        if peakSize >= defaultPeakSize:
+            order, peakSize = defaultOrder, defaultPeakSize
+
+        if self.verbose:
+            reduction = 100 * (1 - peakSize / defaultPeakSize) if defaultPeakSize > 0 else 0
+            print(f"Memory-aware scheduling: peak live intermediate size of {peakSize} bytes "
+                  f"({defaultPeakSize} in default order, {reduction:.1f}% reduction)")
+
+        return order
+
+    def _exactSchedule(self, problem: _SchedulingProblem) -> Optional[List[int]]:
+        # The live size only depends on the set of executed nodes, not on their order
+        frontier: Dict[int, Tuple[int, int, Tuple[int, ...]]] = {0: (0, 0, problem.initialReady())}
+        backPointers: List[Dict[int, Tuple[int, int]]] = []
+        numStates = 1
+
+        for _ in range(len(problem.nodes)):
+            nextFrontier: Dict[int, Tuple[int, int, Tuple[int, ...]]] = {}
+            predecessors: Dict[int, Tuple[int, int]] = {}
+
+            for executed, (peakSize, liveSize, ready) in frontier.items():
+                for idx in ready:
+                    stepSize, nextLiveSize = problem.step(executed, liveSize, idx)
+                    nextPeakSize = max(peakSize, stepSize)
+
+                    # On ties, keep the order found first, which prefers nodes early in the default order
+                    nextExecuted = executed | (1 << idx)
+                    if nextExecuted not in nextFrontier or nextPeakSize < nextFrontier[nextExecuted][0]:
+                        nextFrontier[nextExecuted] = (nextPeakSize, nextLiveSize,
+                                                      problem.nextReady(ready, executed, idx))
+                        predecessors[nextExecuted] = (executed, idx)
+
+            numStates += len(nextFrontier)
+            if numStates > self.maxStates:
+                return None
+
+            frontier = nextFrontier
+            backPointers.append(predecessors)
+
+        order = []
+        executed = problem.fullMask
+        for predecessors in reversed(backPointers):
+            executed, idx = predecessors[executed]
+            order.append(idx)
+
+        return order[::-1]
+
+    def _lookaheadPeakSize(self, problem: _SchedulingProblem, executed: int, liveSize: int, ready: Tuple[int, ...],
+                           depth: int) -> int:
+        if depth == 0 or executed == problem.fullMask:
+            return liveSize
+
+        peakSizes = []
+        for idx in ready:
+            stepSize, nextLiveSize = problem.step(executed, liveSize, idx)
+            peakSizes.append(
+                max(
+                    stepSize,
+                    self._lookaheadPeakSize(problem, executed | (1 << idx), nextLiveSize,
+                                            problem.nextReady(ready, executed, idx), depth - 1)))
+
+        return min(peakSizes)
+
+    def _greedySchedule(self, problem: _SchedulingProblem) -> List[int]:
+        executed, liveSize, ready, order = 0, 0, problem.initialReady(), []
+
+        while executed != problem.fullMask:
+
+            def score(idx: int) -> Tuple[int, int, int]:
+                stepSize, nextLiveSize = problem.step(executed, liveSize, idx)
+                peakSize = max(
+                    stepSize,
+                    self._lookaheadPeakSize(problem, executed | (1 << idx), nextLiveSize,
+                                            problem.nextReady(ready, executed, idx), self.lookahead - 1))
+                return peakSize, nextLiveSize, idx
+
+            idx = min(ready, key = score)
+            _, liveSize = problem.step(executed, liveSize, idx)
+            ready = problem.nextReady(ready, executed, idx)
+            executed |= 1 << idx
+            order.append(idx)
+
+        return order
@@ -230,7 +230,8 @@ def convertFlowState2NodeMemoryConstraint(tilerModel: TilerModel,
 
     memoryOccupyingSet = flowState.liveSet | flowState.genSet
     _inputs = [item.tensorName for item in flowState.liveSet]
-    _outputs = [item.tensorName for item in flowState.genSet]
+    # Tensors generated and killed within the same step never leave it
+    _outputs = [item.tensorName for item in flowState.genSet - flowState.killSet]
 
     for tensorName, memoryLevel in memoryOccupyingSet:
 
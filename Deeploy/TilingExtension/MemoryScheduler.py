@@ -28,7 +28,7 @@ from __future__ import annotations
 import random
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 from ortools.constraint_solver.pywrapcp import IntVar
@@ -372,7 +372,7 @@ class MemoryScheduler():
                     cost = wordCost * c.multiBufferCoefficient
 
                     # SCHEREMO: In-place operator outputs are "costless" whenever their input is in the same pattern
-                    if hasattr(ctxt.lookup(node), "_alias") and ctxt.lookup(node)._alias in neighbors:
+                    if self._getAlias(ctxt, node) in neighbors:
                         cost = 0
 
             costVector.append(cost)
@@ -404,6 +404,19 @@ class MemoryScheduler():
 
         return newAdjacencyMatrix, newCostVector, permutationMatrix
 
+    def _getAlias(self, ctxt: NetworkContext, name: str) -> Optional[str]:
+        _buffer = ctxt.lookup(name)
+
+        if not hasattr(_buffer, "_alias"):
+            return None
+
+        # In-place outputs only share their input's storage in the home level; multi-buffered tile transfers
+        # may still move the previous input tile while the current output tile is written
+        if self.tileScheduler and getattr(_buffer, "_inPlace", False):
+            return None
+
+        return _buffer._alias
+
     # SCHEREMO: Set the end of the lifetime of in-place operator inputs to the lifetime of their outputs
     def _dealiasLifetimeMap(self, ctxt: NetworkContext,
                             tensorLifetimeMap: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int]]:
@@ -468,30 +481,38 @@ class MemoryScheduler():
 
             self.memoryMap[memoryLevel].append(blockList)
 
-            # SCHEREMO: Build permutation matrix
-            if optimizeSchedule:
-                if numVars > 1:
+            cost = self._schedulePatternBlocks(tilerModel, ctxt, blockList, adjacencyMatrix, costVector, memoryLevel,
+                                               patternIdx, optimizeSchedule)
+            constr = cost < memoryHierarchy.memoryLevels[memoryLevel].size
+            tilerModel.addConstraint(constr)
+
+        return
 
-                    permutationMatrix = self._addPermutationMatrix(tilerModel, numVars, patternIdx)
-                    permAdj, permCost = self._permuteMatrices(tilerModel, permutationMatrix, adjacencyMatrix,
-                                                              costVector, patternIdx)
+    def _schedulePatternBlocks(self, tilerModel: TilerModel, ctxt: NetworkContext, blockList: List[MemoryBlock],
+                               adjacencyMatrix: np.ndarray, costVector: List[Union[int, IntVar]], memoryLevel: str,
+                               patternIdx: int, optimizeSchedule: bool) -> IntVar:
 
-                else:
-                    permutationMatrix = np.ones((1,))
-                    permAdj, permCost = adjacencyMatrix, costVector
+        numVars = len(blockList)
+
+        # SCHEREMO: Build permutation matrix
+        if optimizeSchedule:
+            if numVars > 1:
+
+                permutationMatrix = self._addPermutationMatrix(tilerModel, numVars, patternIdx)
+                permAdj, permCost = self._permuteMatrices(tilerModel, permutationMatrix, adjacencyMatrix, costVector,
+                                                          patternIdx)
 
             else:
-                permutationList = self.heuristicPermutation(adjacencyMatrix, costVector)
-                permAdj, permCost, permutationMatrix = self._stablePermutation(adjacencyMatrix, costVector,
-                                                                               permutationList)
+                permutationMatrix = np.ones((1,))
+                permAdj, permCost = adjacencyMatrix, costVector
 
-            self._permutationState[memoryLevel + f"_{patternIdx}"] = permutationMatrix
+        else:
+            permutationList = self.heuristicPermutation(adjacencyMatrix, costVector)
+            permAdj, permCost, permutationMatrix = self._stablePermutation(adjacencyMatrix, costVector, permutationList)
 
-            cost = self._generateCost(tilerModel, permAdj, permCost, patternIdx)
-            constr = cost < memoryHierarchy.memoryLevels[memoryLevel].size
-            tilerModel.addConstraint(constr)
+        self._permutationState[memoryLevel + f"_{patternIdx}"] = permutationMatrix
 
-        return
+        return self._generateCost(tilerModel, permAdj, permCost, patternIdx)
 
     def scheduleMemoryConstraints(self,
                                   tilerModel: TilerModel,
@@ -566,6 +587,13 @@ class MemoryScheduler():
 
     def annotateSolution(self, ctxt: NetworkContext, tilerModel: TilerModel):
 
+        for memoryLevel, patternList in self.memoryMap.items():
+            for patternIdx, pattern in enumerate(patternList):
+                self._annotatePattern(ctxt, tilerModel, memoryLevel, patternIdx, pattern)
+
+    def _annotatePattern(self, ctxt: NetworkContext, tilerModel: TilerModel, memoryLevel: str, patternIdx: int,
+                         pattern: List[MemoryBlock]):
+
         def permMatrix2permList(permMatrix: np.ndarray) -> List[int]:
 
             _permMatrix = []
@@ -582,59 +610,210 @@ class MemoryScheduler():
 
             return [row.index(1) for row in _permMatrix]
 
+        permutationMatrix = self._permutationState[memoryLevel + f"_{patternIdx}"]
+
+        if not isinstance(permutationMatrix, np.ndarray):
+            _permutationMatrix = self.getPMatrix(tilerModel, patternIdx, memoryLevel)
+        else:
+            _permutationMatrix = permutationMatrix
+
+        permList = permMatrix2permList(_permutationMatrix)
+
+        if pattern != [] and len(pattern) > 1:
+            permPattern = _permuteList(pattern, permList)
+        else:
+            permPattern = pattern
+
+        aliasedBlocks = []
+
+        for blockIdx, memoryBlock in enumerate(permPattern):
+
+            blockNames = [block.name for block in permPattern]
+            _buffer = ctxt.lookup(memoryBlock.name)
+
+            alias = ctxt.dealiasBuffer(memoryBlock.name)
+
+            # SCHEREMO: If we're handling an active alias to a global buffer in their home memory level, we don't need to resolve addresses
+            if all([alias != memoryBlock.name, ctxt.is_global(alias), _buffer._memoryLevel == memoryLevel]):
+                continue
+
+            # SCHEREMO: Don't fully unroll aliases here - this is pattern-sensitive!
+            _alias = self._getAlias(ctxt, memoryBlock.name)
+            if _alias in blockNames:
+                aliasedBlocks.append((memoryBlock, _alias))
+                continue
+
+            upperIdx = blockIdx
+
+            upperEndVar = tilerModel.getVariable(
+                f"{self._COSTVARIABLENAME}_{upperIdx}{self._stringSuffix}_{memoryLevel}", patternIdx)
+            upperEnd = tilerModel._resolveVariable(upperEndVar)
+
+            maxAddr = 0
+            for idx, oldBlock in enumerate(permPattern):
+                if self.overlap(oldBlock.lifetime, memoryBlock.lifetime):
+                    if oldBlock.addrSpace is not None:
+                        maxAddr = max(maxAddr, oldBlock.addrSpace[1])
+
+            lowerEnd = maxAddr
+            memoryBlock.addrSpace = (lowerEnd, upperEnd)
+
+        self._annotateAliasedBlocks(permPattern, aliasedBlocks)
+
+    @staticmethod
+    def _annotateAliasedBlocks(pattern: List[MemoryBlock], aliasedBlocks: List[Tuple[MemoryBlock, str]]):
+        for block, alias in aliasedBlocks:
+            for refBlock in sorted(pattern, key = lambda x: x.lifetime[0]):
+                if refBlock.name == alias:
+                    block.addrSpace = refBlock.addrSpace
+                    break
+
+    def fragmentationReport(self) -> Dict[str, Tuple[int, int]]:
+        """Compare the allocated arena of every memory level with its lower bound
+
+        The lower bound of a pattern is its maximum live set, i.e. the
+        largest total size of buffers that are alive at the same time.
+        Both values are the maximum over all patterns of a memory level,
+        since all patterns of a level share the same arena.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            Arena size and lower bound in bytes for every memory level
+
+        """
+        report: Dict[str, Tuple[int, int]] = {}
+
         for memoryLevel, patternList in self.memoryMap.items():
-            for patternIdx, pattern in enumerate(patternList):
+            arenaSize = 0
+            lowerBound = 0
 
-                permutationMatrix = self._permutationState[memoryLevel + f"_{patternIdx}"]
+            for pattern in patternList:
+                # Aliased blocks share their address space, count every address range only once
+                allocatedBlocks = [block for block in pattern if block.addrSpace is not None]
+                if allocatedBlocks == []:
+                    continue
 
-                if not isinstance(permutationMatrix, np.ndarray):
-                    _permutationMatrix = self.getPMatrix(tilerModel, patternIdx, memoryLevel)
-                else:
-                    _permutationMatrix = permutationMatrix
+                arenaSize = max(arenaSize, max(block.addrSpace[1] for block in allocatedBlocks))
 
-                permList = permMatrix2permList(_permutationMatrix)
+                startTime = min(block.lifetime[0] for block in allocatedBlocks)
+                endTime = max(block.lifetime[1] for block in allocatedBlocks)
+                for timeStep in range(startTime, endTime + 1):
+                    liveAddrSpaces = {
+                        block.addrSpace
+                        for block in allocatedBlocks
+                        if block.lifetime[0] <= timeStep <= block.lifetime[1]
+                    }
+                    lowerBound = max(lowerBound, sum(upper - lower for lower, upper in liveAddrSpaces))
 
-                if pattern != [] and len(pattern) > 1:
-                    permPattern = _permuteList(pattern, permList)
-                else:
-                    permPattern = pattern
+            report[memoryLevel] = (arenaSize, lowerBound)
+
+        return report
+
+
+class GreedyMemoryScheduler(MemoryScheduler):
+    """MemoryScheduler that assigns buffer offsets with a best-fit heuristic
+
+    Patterns whose buffer sizes are all known while the model is set up
+    are allocated outside of the solver: buffers are placed in order of
+    decreasing size into the smallest free gap left by the interfering
+    buffers that are already placed. Only the resulting arena size enters
+    the TilerModel, instead of the O(n^2) permutation and cost variables.
+    Patterns with symbolic buffer sizes keep the cost model of
+    `MemoryScheduler`, but stack their buffers in order of decreasing
+    maximum size instead of a random order.
+
+    """
+
+    def __init__(self, stringSuffix: str, tileScheduler: bool, seed: int = 19960801):
+        super().__init__(stringSuffix, tileScheduler, seed)
+        self._staticPatterns: Set[str] = set()
+
+    @staticmethod
+    def _maxCost(cost: Union[int, IntVar]) -> int:
+        if isinstance(cost, int):
+            return cost
+        return cost.Max()
+
+    def heuristicPermutation(self, adjacencyMatrix, costVector) -> List[int]:
+        return sorted(range(len(costVector)), key = lambda idx: -self._maxCost(costVector[idx]))
+
+    @staticmethod
+    def _bestFitOffset(occupiedAddrSpaces: List[Tuple[int, int]], size: int) -> int:
+        bestOffset: Optional[int] = None
+        bestSlack: Optional[int] = None
+
+        offset = 0
+        for lower, upper in sorted(occupiedAddrSpaces):
+            slack = lower - offset - size
+            if slack >= 0 and (bestSlack is None or slack < bestSlack):
+                bestOffset = offset
+                bestSlack = slack
+            offset = max(offset, upper)
+
+        if bestOffset is None:
+            return offset
+
+        return bestOffset
+
+    def _allocateBlocks(self, ctxt: NetworkContext, blockList: List[MemoryBlock], costVector: List[int],
+                        memoryLevel: str) -> int:
 
-                aliasedBlocks = []
+        blockNames = [block.name for block in blockList]
+        aliasedBlocks = []
+        placedBlocks: List[MemoryBlock] = []
 
-                for blockIdx, memoryBlock in enumerate(permPattern):
+        allocationOrder = sorted(range(len(blockList)),
+                                 key = lambda idx: (-costVector[idx], blockList[idx].lifetime[0]))
 
-                    blockNames = [block.name for block in permPattern]
-                    _buffer = ctxt.lookup(memoryBlock.name)
+        for blockIdx in allocationOrder:
+            memoryBlock = blockList[blockIdx]
+            _buffer = ctxt.lookup(memoryBlock.name)
 
-                    alias = ctxt.dealiasBuffer(memoryBlock.name)
+            alias = ctxt.dealiasBuffer(memoryBlock.name)
 
-                    # SCHEREMO: If we're handling an active alias to a global buffer in their home memory level, we don't need to resolve addresses
-                    if all([alias != memoryBlock.name, ctxt.is_global(alias), _buffer._memoryLevel == memoryLevel]):
-                        continue
+            # Same alias handling as annotateSolution
+            if all([alias != memoryBlock.name, ctxt.is_global(alias), _buffer._memoryLevel == memoryLevel]):
+                continue
 
-                    # SCHEREMO: Don't fully unroll aliases here - this is pattern-sensitive!
-                    if hasattr(_buffer, "_alias") and _buffer._alias in blockNames:
-                        _alias = ctxt.lookup(memoryBlock.name)._alias
-                        aliasedBlocks.append((memoryBlock, _alias))
-                        continue
+            _alias = self._getAlias(ctxt, memoryBlock.name)
+            if _alias in blockNames:
+                aliasedBlocks.append((memoryBlock, _alias))
+                continue
 
-                    upperIdx = blockIdx
+            # Empty buffers still need a valid address range
+            size = max(costVector[blockIdx], type(self).byteAlignment)
 
-                    upperEndVar = tilerModel.getVariable(
-                        f"{self._COSTVARIABLENAME}_{upperIdx}{self._stringSuffix}_{memoryLevel}", patternIdx)
-                    upperEnd = tilerModel._resolveVariable(upperEndVar)
+            occupiedAddrSpaces = [
+                block.addrSpace for block in placedBlocks if self.overlap(block.lifetime, memoryBlock.lifetime)
+            ]
+            offset = self._bestFitOffset(occupiedAddrSpaces, size)
 
-                    maxAddr = 0
-                    for idx, oldBlock in enumerate(permPattern):
-                        if self.overlap(oldBlock.lifetime, memoryBlock.lifetime):
-                            if oldBlock.addrSpace is not None:
-                                maxAddr = max(maxAddr, oldBlock.addrSpace[1])
+            memoryBlock.addrSpace = (offset, offset + size)
+            placedBlocks.append(memoryBlock)
 
-                    lowerEnd = maxAddr
-                    memoryBlock.addrSpace = (lowerEnd, upperEnd)
+        self._annotateAliasedBlocks(blockList, aliasedBlocks)
+
+        return max([block.addrSpace[1] for block in placedBlocks], default = 0)
+
+    def _schedulePatternBlocks(self, tilerModel: TilerModel, ctxt: NetworkContext, blockList: List[MemoryBlock],
+                               adjacencyMatrix: np.ndarray, costVector: List[Union[int, IntVar]], memoryLevel: str,
+                               patternIdx: int, optimizeSchedule: bool) -> IntVar:
+
+        if not all(isinstance(cost, int) for cost in costVector):
+            return super()._schedulePatternBlocks(tilerModel, ctxt, blockList, adjacencyMatrix, costVector, memoryLevel,
+                                                  patternIdx, optimizeSchedule)
+
+        arenaSize = self._allocateBlocks(ctxt, blockList, costVector, memoryLevel)
+        self._staticPatterns.add(memoryLevel + f"_{patternIdx}")
+
+        return tilerModel.addVariable("cost" + self.stringSuffix, arenaSize, arenaSize, patternIdx)
+
+    def _annotatePattern(self, ctxt: NetworkContext, tilerModel: TilerModel, memoryLevel: str, patternIdx: int,
+                         pattern: List[MemoryBlock]):
+
+        # Statically allocated patterns are annotated while the model is set up
+        if memoryLevel + f"_{patternIdx}" in self._staticPatterns:
+            return
 
-                for block, alias in aliasedBlocks:
-                    for refBlock in sorted(permPattern, key = lambda x: x.lifetime[0]):
-                        if refBlock.name == alias:
-                            block.addrSpace = refBlock.addrSpace
-                            break
+        super()._annotatePattern(ctxt, tilerModel, memoryLevel, patternIdx, pattern)
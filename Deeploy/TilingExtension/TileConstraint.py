@@ -29,14 +29,15 @@ from abc import abstractmethod
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from ortools.constraint_solver.pywrapcp import IntVar
+from ortools.constraint_solver.pywrapcp import IntExpr, IntVar
 
 #from Deeploy import TilerModel
 from Deeploy.DeeployTypes import NetworkContext, OperatorRepresentation
 from Deeploy.TilingExtension.MemoryConstraints import MemoryConstraint, NodeMemoryConstraint, TensorMemoryConstraint
 from Deeploy.TilingExtension.TilerModel import TilerModel
 from Deeploy.TilingExtension.TilingCodegen import AbsoluteHyperRectangle, HyperRectangle, MemoryTransfer, \
-    TilingSchedule, VariableReplacementScheme, computeHyperRectangleList
+    TilingSchedule, VariableReplacementScheme, computeHyperRectangleArray
+from Deeploy.TilingExtension.TilingCostModel import TilingCostModel
 
 
 class TileConstraint():
@@ -58,6 +59,23 @@ class TileConstraint():
         '''
         return tilerModel
 
+    # Override this
+    @staticmethod
+    def estimateTileCycles(tilerModel: TilerModel, parseDict: Dict, ctxt: NetworkContext, ops: int,
+                           costModel: TilingCostModel) -> Union[int, IntExpr]:
+        '''
+        Override this function to estimate the kernel cycles of a single tile from its symbolic dimensions.
+        By default, the operations of the node are spread evenly over the elements of its output.
+        '''
+        if 'data_out' not in parseDict:
+            return costModel.computeCycles(ops)
+
+        outputBuffer = ctxt.lookup(parseDict['data_out'])
+        opsPerElement = -(-ops // int(np.prod(outputBuffer.shape)))
+
+        return costModel.computeCycles(
+            tilerModel.getTensorNumberOfEltVar(tensorName = outputBuffer.name) * opsPerElement)
+
     @staticmethod
     def constructSymbolicNodeRep(tilerModel: TilerModel, parseDict: Dict,
                                  ctxt: NetworkContext) -> Dict[str, Union[int, IntVar]]:
@@ -107,14 +125,12 @@ class TileConstraint():
 
         for baseOffsetName, baseOffsetValue in tilingSchedule.inputBaseOffsets.copy().items():
             if baseOffsetValue == [None]:
-                for step in tilingSchedule.inputLoadSchedule:
-                    del step[baseOffsetName]
+                tilingSchedule.inputLoadArrays.pop(baseOffsetName, None)
                 del tilingSchedule.inputBaseOffsets[baseOffsetName]
 
         for baseOffsetName, baseOffsetValue in tilingSchedule.outputBaseOffsets.copy().items():
             if baseOffsetValue == [None]:
-                for step in tilingSchedule.outputLoadSchedule:
-                    del step[baseOffsetName]
+                tilingSchedule.outputLoadArrays.pop(baseOffsetName, None)
                 del tilingSchedule.outputBaseOffsets[baseOffsetName]
 
         return _tilingSchedule
@@ -138,9 +154,6 @@ class TileConstraint():
 
             return MemoryTransfer(sourceConstraint, destConstraint)
 
-        def _offsetAdd(offsetA: Tuple[int, ...], offsetB: Tuple[int, ...]) -> Tuple[int, ...]:
-            return tuple(dimA + dimB for dimA, dimB in zip(offsetA, offsetB))
-
         def getCubeTransfers(tensorConstraint: TensorMemoryConstraint, sourceCubes: List[AbsoluteHyperRectangle],
                              sourceMemoryLevel: str,
                              targetMemoryLevel: str) -> Tuple[List[AbsoluteHyperRectangle], List[int]]:
@@ -151,11 +164,11 @@ class TileConstraint():
             for sourceCube in sourceCubes:
                 memTransfer = getMemoryTransfer(tensorConstraint, sourceCube.rectangle, sourceMemoryLevel,
                                                 targetMemoryLevel)
-                solutionCubes = computeHyperRectangleList(memTransfer)
+                solutionCubes = computeHyperRectangleArray(memTransfer)
+                absoluteOffsets = solutionCubes.offsets + np.asarray(sourceCube.absoluteOffset, dtype = np.int64)
                 solutionAbsoluteCubes = [
-                    AbsoluteHyperRectangle(rectangle = cube,
-                                           absoluteOffset = _offsetAdd(sourceCube.absoluteOffset, cube.offset))
-                    for cube in solutionCubes
+                    AbsoluteHyperRectangle(rectangle = cube, absoluteOffset = tuple(absoluteOffset))
+                    for cube, absoluteOffset in zip(solutionCubes, absoluteOffsets.tolist())
                 ]
                 solution += solutionAbsoluteCubes
                 solutionLengths.append(len(solutionAbsoluteCubes))
@@ -29,7 +29,12 @@
 # Like Template-T-Obj mapping, propagate cst, graph edition, etc
 
 import copy
-from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+import multiprocessing
+import traceback
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import onnx_graphsurgeon as gs
@@ -38,25 +43,42 @@ from ortools.constraint_solver.pywrapcp import IntVar, SolutionCollector
 import Deeploy.CommonExtensions.DataTypes as BasicDataTypes
 from Deeploy.AbstractDataTypes import Pointer, PointerClass
 from Deeploy.CommonExtensions.NetworkDeployers.NetworkDeployerWrapper import NetworkDeployerWrapper
+from Deeploy.CompilerProfiling import profiled
 from Deeploy.DeeployTypes import ConstantBuffer, GlobalDefinition, NetworkContext, NetworkOptimizationPass, \
     NodeBinding, NodeTemplate, ONNXLayer, Schedule, SubGraph, TopologyOptimizer, TransientBuffer
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy
 from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import MemoryDeployerWrapper, \
     MemoryLevelAwareDeployer, MemoryPlatform, MemoryPlatformWrapper, TargetMemoryLevelMapping
 from Deeploy.TilingExtension.GenericFlow import GenericFlowState
+from Deeploy.TilingExtension.LayerFusion import LayerFusion, fuseLayers
 from Deeploy.TilingExtension.MemoryConstraintFlows import GraphMemoryConstraintFlow, TensorMemLevelTuple, \
     convertFlowState2NodeMemoryConstraint
 from Deeploy.TilingExtension.MemoryConstraints import MemoryConstraint, NodeMemoryConstraint, \
     PatternMemoryConstraints, TensorMemoryConstraint
 from Deeploy.TilingExtension.MemoryScheduler import MemoryBlock, MemoryScheduler
 from Deeploy.TilingExtension.TileConstraint import TileConstraint
-from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilerModel import SolveStatistics, TilerModel
+from Deeploy.TilingExtension.TilingCostModel import SymbolicCycles, TilingCostModel
+from Deeploy.TilingExtension.TilingSolutionCache import PatternSolution, TilingSolutionCache, patternSignature, \
+    patternTensorNames
 
 TilingSolution = List[PatternMemoryConstraints]
+MemoryConstraintFlowStates = Tuple[List[GenericFlowState[TensorMemLevelTuple]],
+                                   List[List[GenericFlowState[TensorMemLevelTuple]]]]
 
 _deallocTemplate = NodeTemplate("")
 
 
+@dataclass
+class PatternTilingResult:
+    """Solution of a single pattern's sub-model in a decomposed tiling solve"""
+    tilingSolution: PatternMemoryConstraints
+    memoryBlocks: Dict[str, List[MemoryBlock]]
+    transientMemoryLevels: Dict[str, str]
+    tileShapes: Optional[PatternSolution] = None
+    solveStatistics: Optional[SolveStatistics] = None
+
+
 class Tiler():
 
     arenaName = "MEMORYARENA"
@@ -70,13 +92,40 @@ class Tiler():
         self.innerMemoryScheduler = self.memorySchedulerClass("_inner", tileScheduler = True)
         self.outerMemoryScheduler = self.memorySchedulerClass("_outer", tileScheduler = False)
         self.symbolicMemoryConstraints: Optional[List[PatternMemoryConstraints]] = None
+        self.solutionCache: Optional[TilingSolutionCache] = None
+        # None solves all patterns in one model, otherwise patterns are solved independently by numWorkers processes
+        self.numWorkers: Optional[int] = None
+        # None maximizes the memory footprint of the tiles, otherwise the estimated latency is minimized
+        self.costModel: Optional[TilingCostModel] = None
+        # None tiles every layer on its own, otherwise chains of layers are fused into depth-first tiled patterns
+        self.layerFusion: Optional[LayerFusion] = None
+        # Constructor of the models solved by the tiler, e.g. to use the CPSATTilerModel backend
+        self.tilerModelFactory: Callable[[], TilerModel] = TilerModel
+        # Statistics of the solved models, the outer model of a decomposed solve comes first
+        self.solveStatistics: List[Optional[SolveStatistics]] = []
 
         self._worstCaseBufferSize: Dict[str, int] = {}
+        self._patternSignatures: List[str] = []
+        self._schedule: List[SubGraph] = []
+        self._layerBinding: 'OrderedDict[str, ONNXLayer]' = OrderedDict()
+        self._targetMemoryLevelMapping: Optional[TargetMemoryLevelMapping] = None
+        self._memoryConstraintFlowStates: Optional[MemoryConstraintFlowStates] = None
+        self._globalBufferConstraints: Optional[NodeMemoryConstraint] = None
+        self._cachedSolutions: List[Optional[PatternSolution]] = []
 
     @property
     def worstCaseBufferSize(self):
         return self._worstCaseBufferSize
 
+    @property
+    def _decomposed(self) -> bool:
+        # Fixed cached solutions are only applied pattern by pattern, so that only changed patterns are optimized
+        return self.numWorkers is not None or (self.solutionCache is not None and self.solutionCache.fixSolutions)
+
+    def _isSolutionFixed(self, patternIdx: int) -> bool:
+        return self.solutionCache is not None and self.solutionCache.fixSolutions and self._cachedSolutions[
+            patternIdx] is not None
+
     def _convertCtxtToStaticSchedule(self, ctxt: NetworkContext,
                                      memoryMap: Dict[str, List[List[MemoryBlock]]]) -> NetworkContext:
 
@@ -91,7 +140,9 @@ class Tiler():
                     _buffer = ctxt.lookup(node.name)
                     # SCHEREMO: If alias buffers have zero cost, they don't contribute to the currentMax and their addrSpace is None
                     if hasattr(_buffer, "_alias") and (ctxt.is_global(_buffer._alias) or _buffer._alias in blockNames):
-                        continue
+                        # In-place outputs keep their own tiles below the home level
+                        if not getattr(_buffer, "_inPlace", False) or node.addrSpace is None:
+                            continue
 
                     currentMax = max(currentMax, node._addrSpace[1])
 
@@ -152,14 +203,41 @@ class Tiler():
 
         return ctxt
 
+    @profiled("Tiler")
     def computeTilingSchedule(self, ctxt: NetworkContext) -> TilingSolution:
 
-        assert self.tilerModel is not None and self.symbolicMemoryConstraints is not None, "Set up the model before trying to compute a schedule!"
+        if self._decomposed:
+            assert self._memoryConstraintFlowStates is not None, "Set up the model before trying to compute a schedule!"
+
+            patternResults = self._solveDecomposedModel(ctxt)
+            tilingSchedule = [result.tilingSolution for result in patternResults]
+            self.solveStatistics = [self.tilerModel.solveStatistics
+                                   ] + [result.solveStatistics for result in patternResults]
+
+            for result in patternResults:
+                for tensorName, memoryLevel in result.transientMemoryLevels.items():
+                    ctxt.lookup(tensorName)._memoryLevel = memoryLevel
+
+            self.innerMemoryScheduler.memoryMap = {
+                level: [result.memoryBlocks[level] for result in patternResults]
+                for level in self.memoryHierarchy.memoryLevels.keys()
+            }
+            patternSolutions = [result.tileShapes for result in patternResults]
+        else:
+            assert self.tilerModel is not None and self.symbolicMemoryConstraints is not None, "Set up the model before trying to compute a schedule!"
+
+            collector = self.tilerModel.trySolveModel()
+            tilingSchedule = self._getTilingSolution(self.tilerModel, ctxt, collector, self.symbolicMemoryConstraints)
+            self.solveStatistics = [self.tilerModel.solveStatistics]
 
-        collector = self.tilerModel.trySolveModel()
-        tilingSchedule = self._getTilingSolution(self.tilerModel, ctxt, collector, self.symbolicMemoryConstraints)
+            self.innerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
+
+            if self.solutionCache is not None:
+                patternSolutions = [
+                    self._patternSolution(self.tilerModel, ctxt, pattern, idx)
+                    for idx, pattern in enumerate(self._schedule)
+                ]
 
-        self.innerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
         self.outerMemoryScheduler.annotateSolution(ctxt, self.tilerModel)
 
         memoryMap = {}
@@ -191,8 +269,12 @@ class Tiler():
 
         self._convertCtxtToStaticSchedule(ctxt, memoryMap)
 
+        if self.solutionCache is not None:
+            self._storeCachedSolutions(patternSolutions)
+
         return tilingSchedule
 
+    @profiled("Tiler")
     def setupModel(self, ctxt: NetworkContext, schedule: Schedule, layerBinding: 'OrderedDict[str, ONNXLayer]',
                    targetMemoryLevelMapping: TargetMemoryLevelMapping) -> NetworkContext:
 
@@ -203,18 +285,397 @@ class Tiler():
             else:
                 wrapSchedule.append(entry)
 
-        tilerModel = TilerModel()
+        if self.layerFusion is not None:
+
+            def solvePattern(schedule: List[SubGraph], patternIdx: int) -> Optional[TilerModel]:
+                return self._solveStandalonePattern(ctxt, schedule, patternIdx, layerBinding, targetMemoryLevelMapping)
+
+            wrapSchedule = self.layerFusion.fuse(ctxt, wrapSchedule, layerBinding, targetMemoryLevelMapping,
+                                                 self.memoryHierarchy, solvePattern)
+
+        self._schedule = wrapSchedule
+
+        if self._decomposed:
+            # The sub-models of a decomposed solve are built by the workers
+            self._layerBinding = layerBinding
+            self._targetMemoryLevelMapping = targetMemoryLevelMapping
+            self._memoryConstraintFlowStates = self._computeMemoryConstraintFlow(ctxt, wrapSchedule, layerBinding,
+                                                                                 targetMemoryLevelMapping)
+            self._globalBufferConstraints = self._generateBufferConstraints(ctxt)
+
+            if self.solutionCache is not None:
+                self._cachedSolutions = self._lookupCachedSolutions(ctxt, wrapSchedule, layerBinding,
+                                                                    targetMemoryLevelMapping)
+            else:
+                self._cachedSolutions = [None] * len(wrapSchedule)
+
+            return ctxt
+
+        tilerModel = self.tilerModelFactory()
         tilerModel = self._setupGeometricConstraints(tilerModel, ctxt, wrapSchedule, layerBinding)
         tilerModel = self._setupTensorDimensionProducts(tilerModel, ctxt, wrapSchedule)
-        tilerModel = self._setupHeuristics(tilerModel, ctxt, wrapSchedule)
+        tilerModel = self._setupObjective(tilerModel, ctxt, wrapSchedule, layerBinding, targetMemoryLevelMapping)
         tilerModel, allSymbolicMemoryConstraints = self._setupMemoryConstraints(tilerModel, ctxt, wrapSchedule,
                                                                                 layerBinding, targetMemoryLevelMapping)
 
+        if self.solutionCache is not None:
+            tilerModel = self._setupCachedSolutions(tilerModel, ctxt, wrapSchedule, layerBinding,
+                                                    targetMemoryLevelMapping)
+
         self.tilerModel = tilerModel
         self.symbolicMemoryConstraints = allSymbolicMemoryConstraints
 
         return ctxt
 
+    def _solveStandalonePattern(self, ctxt: NetworkContext, schedule: List[SubGraph], patternIdx: int,
+                                layerBinding: 'OrderedDict[str, ONNXLayer]',
+                                targetMemoryLevelMapping: TargetMemoryLevelMapping) -> Optional[TilerModel]:
+
+        # Other patterns only occupy their home levels while the pattern runs, its tiles can use the whole hierarchy
+        graphFlowStates, patternFlowStates = self._computeMemoryConstraintFlow(ctxt, schedule, layerBinding,
+                                                                               targetMemoryLevelMapping)
+        flowStates = ([graphFlowStates[patternIdx]], [patternFlowStates[patternIdx]])
+        patternSchedule = [schedule[patternIdx]]
+
+        tilerModel = self.tilerModelFactory()
+        tilerModel = self._setupGeometricConstraints(tilerModel, ctxt, patternSchedule, layerBinding)
+        tilerModel = self._setupTensorDimensionProducts(tilerModel, ctxt, patternSchedule)
+        tilerModel = self._setupObjective(tilerModel, ctxt, patternSchedule, layerBinding, targetMemoryLevelMapping)
+        allMemoryConstraints = self._generateAllMemoryConstraints(tilerModel, ctxt, patternSchedule, layerBinding,
+                                                                  targetMemoryLevelMapping, flowStates,
+                                                                  self._generateBufferConstraints(ctxt))
+
+        innerMemoryScheduler = self.memorySchedulerClass("_inner", tileScheduler = True)
+        for level in self.memoryHierarchy.memoryLevels.keys():
+            innerMemoryScheduler.scheduleMemoryConstraints(tilerModel, ctxt, allMemoryConstraints, self.memoryHierarchy,
+                                                           level)
+
+        # Solve with the regular objective, so the solution reflects the tiling the pattern would get
+        try:
+            tilerModel.trySolveModel()
+        except (AssertionError, RuntimeError):
+            return None
+
+        return tilerModel
+
+    def _patternTensorDimVars(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph,
+                              patternIdx: int) -> List[Optional[List[IntVar]]]:
+        tensorDimVars: List[Optional[List[IntVar]]] = []
+        for tensorName in patternTensorNames(ctxt, pattern):
+            if not tilerModel.existsCopyIdx(tensorName, patternIdx):
+                tensorDimVars.append(None)
+                continue
+
+            tensorDimVars.append([
+                tilerModel.getTensorDimVar(tensorName, dimIdx, patternIdx)
+                for dimIdx in range(len(ctxt.lookup(tensorName).shape))
+            ])
+
+        return tensorDimVars
+
+    def _setupCachedSolutions(self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
+                              layerBinding: 'OrderedDict[str, ONNXLayer]',
+                              targetMemoryLevelMapping: TargetMemoryLevelMapping) -> TilerModel:
+
+        for idx, (pattern, solution) in enumerate(
+                zip(schedule, self._lookupCachedSolutions(ctxt, schedule, layerBinding, targetMemoryLevelMapping))):
+            if solution is not None:
+                tilerModel = self._addSolutionHints(tilerModel, ctxt, pattern, idx, solution)
+
+        return tilerModel
+
+    def _lookupCachedSolutions(self, ctxt: NetworkContext, schedule: List[SubGraph],
+                               layerBinding: 'OrderedDict[str, ONNXLayer]',
+                               targetMemoryLevelMapping: TargetMemoryLevelMapping) -> List[Optional[PatternSolution]]:
+
+        assert self.solutionCache is not None, "Can't look up cached solutions without a solution cache!"
+
+        strategy = f"{type(self).__module__}.{type(self).__qualname__}/{self.memorySchedulerClass.__qualname__}"
+        if self.costModel is not None:
+            strategy += f"/{self.costModel}"
+
+        self._schedule = schedule
+        self._patternSignatures = []
+
+        solutions: List[Optional[PatternSolution]] = []
+        for pattern in schedule:
+            signature = patternSignature(ctxt, pattern, layerBinding, targetMemoryLevelMapping, self.memoryHierarchy,
+                                         strategy)
+            self._patternSignatures.append(signature)
+            solutions.append(self.solutionCache.lookup(signature))
+
+        return solutions
+
+    def _addSolutionHints(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph, patternIdx: int,
+                          solution: PatternSolution) -> TilerModel:
+
+        assert self.solutionCache is not None, "Can't add solution hints without a solution cache!"
+
+        for dimVars, tileShape in zip(self._patternTensorDimVars(tilerModel, ctxt, pattern, patternIdx), solution):
+            if dimVars is None or tileShape is None:
+                continue
+
+            for dimVar, dimValue in zip(dimVars, tileShape):
+                tilerModel.addHint(dimVar, dimValue)
+
+        return tilerModel
+
+    def _fixSolution(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph, patternIdx: int,
+                     solution: PatternSolution) -> TilerModel:
+
+        for dimVars, tileShape in zip(self._patternTensorDimVars(tilerModel, ctxt, pattern, patternIdx), solution):
+            if dimVars is None or tileShape is None:
+                continue
+
+            for dimVar, dimValue in zip(dimVars, tileShape):
+                tilerModel.addConstraint(dimVar == dimValue)
+
+        return tilerModel
+
+    def _patternSolution(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph,
+                         patternIdx: int) -> PatternSolution:
+        solution: PatternSolution = []
+        for dimVars in self._patternTensorDimVars(tilerModel, ctxt, pattern, patternIdx):
+            if dimVars is None:
+                solution.append(None)
+            else:
+                solution.append([tilerModel._resolveVariable(dimVar) for dimVar in dimVars])
+
+        return solution
+
+    def _storeCachedSolutions(self, solutions: List[PatternSolution]):
+
+        assert self.solutionCache is not None, "Can't store solutions without a solution cache!"
+
+        for signature, solution in zip(self._patternSignatures, solutions):
+            self.solutionCache.store(signature, solution)
+
+    def _setupPatternModel(self,
+                           ctxt: NetworkContext,
+                           patternIdx: int,
+                           fixSolution: bool = True) -> Tuple[TilerModel, List[PatternMemoryConstraints]]:
+
+        assert self._memoryConstraintFlowStates is not None, "Can't set up a pattern model without memory constraint flow!"
+
+        # The memory constraint flow is computed over the whole schedule, a pattern only needs its own slice
+        graphFlowStates, patternFlowStates = self._memoryConstraintFlowStates
+        flowStates = ([graphFlowStates[patternIdx]], [patternFlowStates[patternIdx]])
+        schedule = [self._schedule[patternIdx]]
+
+        tilerModel = self.tilerModelFactory()
+        tilerModel = self._setupGeometricConstraints(tilerModel, ctxt, schedule, self._layerBinding)
+        tilerModel = self._setupTensorDimensionProducts(tilerModel, ctxt, schedule)
+        tilerModel = self._setupObjective(tilerModel, ctxt, schedule, self._layerBinding,
+                                          self._targetMemoryLevelMapping)
+        allMemoryConstraints = self._generateAllMemoryConstraints(tilerModel, ctxt, schedule, self._layerBinding,
+                                                                  self._targetMemoryLevelMapping, flowStates,
+                                                                  self._globalBufferConstraints)
+
+        cachedSolution = self._cachedSolutions[patternIdx]
+        if fixSolution and self._isSolutionFixed(patternIdx):
+            tilerModel = self._fixSolution(tilerModel, ctxt, schedule[0], 0, cachedSolution)
+        elif cachedSolution is not None:
+            tilerModel = self._addSolutionHints(tilerModel, ctxt, schedule[0], 0, cachedSolution)
+
+        return tilerModel, allMemoryConstraints
+
+    def _outerMemoryFootprint(self, ctxt: NetworkContext,
+                              patternConstraints: PatternMemoryConstraints) -> PatternMemoryConstraints:
+
+        # Tensors in their home level are reserved with their full size, which is independent of the tiling solution
+        footprint = PatternMemoryConstraints()
+        for stepConstraints in patternConstraints.nodeConstraints:
+            footprintStep = NodeMemoryConstraint()
+            for tensorName, tensorConstraint in stepConstraints.tensorMemoryConstraints.items():
+                _buffer = ctxt.lookup(tensorName)
+
+                if isinstance(_buffer, (TransientBuffer, ConstantBuffer)) or ctxt.is_global(tensorName):
+                    continue
+
+                if _buffer._memoryLevel not in tensorConstraint.memoryConstraints.keys():
+                    continue
+
+                homeConstraint = tensorConstraint.memoryConstraints[_buffer._memoryLevel]
+
+                size = homeConstraint.size
+                multiBufferCoefficient = homeConstraint.multiBufferCoefficient
+
+                memoryConstraint = MemoryConstraint(_buffer._memoryLevel, size if isinstance(size, int) else size.Max())
+                memoryConstraint.multiBufferCoefficient = multiBufferCoefficient if isinstance(
+                    multiBufferCoefficient, int) else multiBufferCoefficient.Max()
+
+                footprintStep.addTensorConstraint(
+                    TensorMemoryConstraint(tensorName, {memoryConstraint.memoryLevel: memoryConstraint}, ctxt),
+                    stepConstraints.getIO(tensorName))
+            footprint.addConstraint(footprintStep)
+
+        return footprint
+
+    def _solveOuterModel(self, ctxt: NetworkContext, footprints: List[PatternMemoryConstraints]) -> Dict[str, int]:
+
+        outerMemoryConstraints = PatternMemoryConstraints()
+        for footprint in footprints:
+            for nodeConstraint in footprint.nodeConstraints:
+                outerMemoryConstraints.addConstraint(nodeConstraint)
+
+        tilerModel = self.tilerModelFactory()
+        for level in self.memoryHierarchy.memoryLevels.keys():
+            self.outerMemoryScheduler.scheduleMemoryConstraints(tilerModel, ctxt, [outerMemoryConstraints],
+                                                                self.memoryHierarchy, level)
+            tilerModel.addObjective(tilerModel.getVariable(self.outerMemoryScheduler.getSymbolicCostName(0, level), 0),
+                                    'minimize')
+
+        tilerModel.trySolveModel()
+        self.tilerModel = tilerModel
+
+        outerCosts = {}
+        for level in self.memoryHierarchy.memoryLevels.keys():
+            costVariable = tilerModel.getVariable(self.outerMemoryScheduler.getSymbolicCostName(0, level), 0)
+            outerCosts[level] = tilerModel._resolveVariable(costVariable)
+
+        return outerCosts
+
+    def _solvePatternModel(self, ctxt: NetworkContext, patternIdx: int, tilerModel: TilerModel,
+                           allMemoryConstraints: List[PatternMemoryConstraints],
+                           outerCosts: Dict[str, int]) -> PatternTilingResult:
+
+        innerMemoryHierarchy = self._innerMemoryHierarchy(outerCosts)
+        innerMemoryScheduler = self.memorySchedulerClass("_inner", tileScheduler = True)
+
+        for level in innerMemoryHierarchy.memoryLevels.keys():
+            innerMemoryScheduler.scheduleMemoryConstraints(tilerModel, ctxt, allMemoryConstraints, innerMemoryHierarchy,
+                                                           level)
+
+        try:
+            collector = tilerModel.trySolveModel()
+        except (AssertionError, RuntimeError):
+            if not self._isSolutionFixed(patternIdx):
+                raise
+
+            # The cached solution does not fit into the memory left by the other patterns, solve the pattern again
+            tilerModel, allMemoryConstraints = self._setupPatternModel(ctxt, patternIdx, fixSolution = False)
+            innerMemoryScheduler = self.memorySchedulerClass("_inner", tileScheduler = True)
+            for level in innerMemoryHierarchy.memoryLevels.keys():
+                innerMemoryScheduler.scheduleMemoryConstraints(tilerModel, ctxt, allMemoryConstraints,
+                                                               innerMemoryHierarchy, level)
+            collector = tilerModel.trySolveModel()
+        tilingSolution = self._getTilingSolution(tilerModel, ctxt, collector, allMemoryConstraints)[0]
+        solveStatistics = tilerModel.solveStatistics
+
+        innerMemoryScheduler.annotateSolution(ctxt, tilerModel)
+
+        # Lifetimes of the sub-model are relative to the pattern, shift them to the network schedule
+        memoryBlocks: Dict[str, List[MemoryBlock]] = {}
+        for level, patternList in innerMemoryScheduler.memoryMap.items():
+            for block in patternList[0]:
+                block.lifetime = (block.lifetime[0] + patternIdx, block.lifetime[1] + patternIdx)
+            memoryBlocks[level] = patternList[0]
+
+        transientMemoryLevels = {
+            tensorName: ctxt.lookup(tensorName)._memoryLevel
+            for stepConstraints in allMemoryConstraints[0].nodeConstraints
+            for tensorName in stepConstraints.tensorMemoryConstraints.keys()
+            if isinstance(ctxt.lookup(tensorName), TransientBuffer)
+        }
+
+        tileShapes = None
+        if self.solutionCache is not None:
+            tileShapes = self._patternSolution(tilerModel, ctxt, self._schedule[patternIdx], 0)
+
+        return PatternTilingResult(tilingSolution, memoryBlocks, transientMemoryLevels, tileShapes, solveStatistics)
+
+    def _decomposedWorker(self, connection: Connection, ctxt: NetworkContext, patternIndices: List[int]):
+
+        try:
+            patternModels = {idx: self._setupPatternModel(ctxt, idx) for idx in patternIndices}
+            connection.send({
+                idx: self._outerMemoryFootprint(ctxt, allMemoryConstraints[0])
+                for idx, (_, allMemoryConstraints) in patternModels.items()
+            })
+
+            outerCosts = connection.recv()
+            connection.send({
+                idx: self._solvePatternModel(ctxt, idx, tilerModel, allMemoryConstraints, outerCosts)
+                for idx, (tilerModel, allMemoryConstraints) in patternModels.items()
+            })
+        except Exception:
+            connection.send(RuntimeError(f"Error in Tiler worker:\n{traceback.format_exc()}"))
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _receiveFromWorker(connection: Connection) -> Dict[int, Any]:
+        try:
+            message = connection.recv()
+        except EOFError:
+            raise RuntimeError("Error in Tiler: worker process terminated unexpectedly")
+
+        if isinstance(message, Exception):
+            raise message
+
+        return message
+
+    @profiled("Tiler")
+    def _solveDecomposedModel(self, ctxt: NetworkContext) -> List[PatternTilingResult]:
+
+        numWorkers = self.numWorkers if self.numWorkers is not None else 1
+        assert numWorkers >= 1, f"Invalid number of workers {numWorkers}!"
+
+        numPatterns = len(self._schedule)
+        numWorkers = min(numWorkers, numPatterns)
+
+        if numWorkers <= 1:
+            patternModels = [self._setupPatternModel(ctxt, idx) for idx in range(numPatterns)]
+            footprints = [
+                self._outerMemoryFootprint(ctxt, allMemoryConstraints[0]) for _, allMemoryConstraints in patternModels
+            ]
+            outerCosts = self._solveOuterModel(ctxt, footprints)
+
+            return [
+                self._solvePatternModel(ctxt, idx, tilerModel, allMemoryConstraints, outerCosts)
+                for idx, (tilerModel, allMemoryConstraints) in enumerate(patternModels)
+            ]
+
+        # Forked workers inherit the context and layer bindings, only footprints and solutions are pickled
+        processContext = multiprocessing.get_context("fork")
+        workers: List[Tuple[multiprocessing.Process, Connection]] = []
+
+        try:
+            for workerIdx in range(numWorkers):
+                parentConnection, childConnection = processContext.Pipe()
+                process = processContext.Process(target = self._decomposedWorker,
+                                                 args = (childConnection, ctxt,
+                                                         list(range(workerIdx, numPatterns, numWorkers))),
+                                                 daemon = True)
+                process.start()
+                childConnection.close()
+                workers.append((process, parentConnection))
+
+            footprints: Dict[int, PatternMemoryConstraints] = {}
+            for _, connection in workers:
+                footprints.update(self._receiveFromWorker(connection))
+
+            outerCosts = self._solveOuterModel(ctxt, [footprints[idx] for idx in range(numPatterns)])
+
+            for _, connection in workers:
+                connection.send(outerCosts)
+
+            patternResults: Dict[int, PatternTilingResult] = {}
+            for _, connection in workers:
+                patternResults.update(self._receiveFromWorker(connection))
+
+        except BaseException:
+            for process, _ in workers:
+                process.terminate()
+            raise
+
+        finally:
+            for process, connection in workers:
+                connection.close()
+                process.join()
+
+        return [patternResults[idx] for idx in range(numPatterns)]
+
     # SCHEREMO: Return a integer factor or IntVar variable for the multi Buffer coefficient given the tiling path, hop and tensorName.
     def multiBufferStrategy(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph, path: List[str],
                             hop: str, tensorName: str) -> Union[int, IntVar]:
@@ -260,16 +721,14 @@ class Tiler():
 
     def _resolveTensorMemoryConstraint(self, tilerModel: TilerModel, ctxt: NetworkContext, collector: SolutionCollector,
                                        tensorConstraint: TensorMemoryConstraint) -> TensorMemoryConstraint:
-        assert self.tilerModel is not None, "Can't resolve tensor memory constraints, tilerModel is None!"
-
         tensorName = tensorConstraint.tensorName
         solvedTensorConstraint = TensorMemoryConstraint(tensorName, {}, ctxt)
 
         for memoryLevel, memoryConstraint in tensorConstraint.memoryConstraints.items():
-            size = self.tilerModel._resolveVariable(memoryConstraint.size)
+            size = tilerModel._resolveVariable(memoryConstraint.size)
 
             newMemoryConstraint: MemoryConstraint = MemoryConstraint(memoryLevel, size)
-            multiBufferCoefficient = self.tilerModel._resolveVariable(memoryConstraint.multiBufferCoefficient)
+            multiBufferCoefficient = tilerModel._resolveVariable(memoryConstraint.multiBufferCoefficient)
             newMemoryConstraint.multiBufferCoefficient = multiBufferCoefficient
 
             if not isinstance(ctxt.lookup(tensorName), TransientBuffer):
@@ -282,8 +741,7 @@ class Tiler():
                 else:
                     _, copyIdx = tilerModel.getNameCopyIdx(memoryConstraint.size.Name())
                     for i in range(tensorShapeLen):
-                        newShape.append(
-                            self.tilerModel._resolveVariable(tilerModel.getTensorDimVar(tensorName, i, copyIdx)))
+                        newShape.append(tilerModel._resolveVariable(tilerModel.getTensorDimVar(tensorName, i, copyIdx)))
 
                 newMemoryConstraint.shape = tuple(newShape)
 
@@ -302,7 +760,9 @@ class Tiler():
                 return False
             if len(tensorConstraint.memoryConstraints.values()) <= 1 and not isinstance(
                     ctxt.lookup(tensorName), TransientBuffer):
-                return False
+                # Tensors produced and consumed within a fused pattern only live in the pattern's memory level
+                homeLevel = ctxt.lookup(tensorName)._memoryLevel
+                return any(level != homeLevel for level in tensorConstraint.memoryConstraints.keys())
             return True
 
         for patternConstraints in allConstraints:
@@ -362,6 +822,95 @@ class Tiler():
 
         return tilerModel
 
+    def _setupObjective(self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
+                        layerBinding: 'OrderedDict[str, ONNXLayer]',
+                        targetMemoryLevelMapping: TargetMemoryLevelMapping) -> TilerModel:
+
+        if self.costModel is None:
+            return self._setupHeuristics(tilerModel, ctxt, schedule)
+
+        return self._setupLatencyObjective(tilerModel, ctxt, schedule, layerBinding, targetMemoryLevelMapping)
+
+    def _setupLatencyObjective(self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
+                               layerBinding: 'OrderedDict[str, ONNXLayer]',
+                               targetMemoryLevelMapping: TargetMemoryLevelMapping) -> TilerModel:
+
+        # The patterns are independent, so minimizing the latency of each one minimizes the total latency
+        tilerModel.separableObjectives = True
+
+        for idx, pattern in enumerate(schedule):
+            tilerModel.copyIdx = idx
+
+            latency = self._patternLatency(tilerModel, ctxt, pattern, layerBinding, targetMemoryLevelMapping)
+
+            if isinstance(latency, int):
+                lowerBound, upperBound = latency, latency
+            else:
+                lowerBound, upperBound = latency.Min(), latency.Max()
+
+            patternVariable = tilerModel.addVariable(name = "DEEPLOY_PATTERN_LATENCY",
+                                                     lowerBound = lowerBound,
+                                                     upperBound = upperBound,
+                                                     copyIdx = idx)
+            tilerModel.addConstraint(patternVariable == latency)
+
+            tilerModel.addObjective(patternVariable, 'minimize')
+
+        return tilerModel
+
+    def _patternLatency(self, tilerModel: TilerModel, ctxt: NetworkContext, pattern: SubGraph,
+                        layerBinding: 'OrderedDict[str, ONNXLayer]',
+                        targetMemoryLevelMapping: TargetMemoryLevelMapping) -> SymbolicCycles:
+
+        assert self.costModel is not None, "Can't estimate the latency of a pattern without a cost model!"
+
+        patternNodeNames = [node.name for node in pattern]
+
+        computeCycles: SymbolicCycles = self.costModel.tileOverheadCycles
+        for node in pattern:
+            if node.name not in layerBinding.keys():
+                continue
+
+            operatorRepresentation = layerBinding[node.name].mapper.parser.operatorRepresentation
+            tileConstraint = layerBinding[node.name].mapper.binder.template.tileConstraint
+            computeCycles += tileConstraint.estimateTileCycles(tilerModel, operatorRepresentation, ctxt,
+                                                               operatorRepresentation.get('nodeOps', 0), self.costModel)
+
+        transferCycles: SymbolicCycles = 0
+        transfersHidden = True
+        seenTensorNames = []
+        for node in pattern:
+            for gsTensor in node.inputs + node.outputs:
+                if gsTensor.name in seenTensorNames or not ctxt.lookup(gsTensor.name)._deploy:
+                    continue
+                seenTensorNames.append(gsTensor.name)
+
+                # Tensors produced and consumed within the pattern stay in the target memory level
+                producers = [producer.name for producer in gsTensor.inputs]
+                consumers = [consumer.name for consumer in gsTensor.outputs]
+                if len(producers) > 0 and len(consumers) > 0 and all(
+                        name in patternNodeNames for name in producers + consumers):
+                    continue
+
+                targetMemoryLevel = targetMemoryLevelMapping.lookup(node.name, gsTensor.name)
+                path = self.memoryHierarchy.bfs(ctxt.lookup(gsTensor.name)._memoryLevel, targetMemoryLevel)
+                if len(path) < 2:
+                    continue
+
+                transferCycles += self.costModel.transferCycles(tilerModel, ctxt, gsTensor.name, path)
+
+                coefficient = self.multiBufferStrategy(tilerModel, ctxt, pattern, path, targetMemoryLevel,
+                                                       gsTensor.name)
+                transfersHidden &= isinstance(coefficient, int) and coefficient > 1
+
+        numTiles = self.costModel.numTiles(tilerModel, ctxt, pattern[-1].outputs[0].name)
+
+        if not transfersHidden:
+            return numTiles * (computeCycles + transferCycles)
+
+        # With multi-buffering, the transfers of a tile overlap with the kernel of its neighbour
+        return numTiles * self.costModel.overlap(tilerModel, computeCycles, transferCycles) + transferCycles
+
     def _setupHeuristics(self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph]) -> TilerModel:
 
         for idx, pattern in enumerate(schedule):
@@ -416,13 +965,10 @@ class Tiler():
                                                                 self.memoryHierarchy, level)
 
         # Update inner memoryHierarchy with outer constraints
-        innerMemoryHierarchy = MemoryHierarchy([])
-        for level, memLevel in self.memoryHierarchy.memoryLevels.items():
-            newMemLevel = copy.copy(memLevel)
-            outerConstraint = tilerModel.getVariable(self.outerMemoryScheduler.getSymbolicCostName(0, level), 0)
-
-            newMemLevel.size = newMemLevel.size - outerConstraint
-            innerMemoryHierarchy._add(newMemLevel)
+        innerMemoryHierarchy = self._innerMemoryHierarchy({
+            level: tilerModel.getVariable(self.outerMemoryScheduler.getSymbolicCostName(0, level), 0)
+            for level in self.memoryHierarchy.memoryLevels.keys()
+        })
 
         for level in innerMemoryHierarchy.memoryLevels.keys():
             self.innerMemoryScheduler.scheduleMemoryConstraints(tilerModel, ctxt, allMemoryConstraints,
@@ -430,13 +976,28 @@ class Tiler():
 
         return tilerModel, allMemoryConstraints
 
+    def _innerMemoryHierarchy(self, outerCosts: Dict[str, Union[int, IntVar]]) -> MemoryHierarchy:
+
+        innerMemoryHierarchy = MemoryHierarchy([])
+        for level, memLevel in self.memoryHierarchy.memoryLevels.items():
+            newMemLevel = copy.copy(memLevel)
+            newMemLevel.size = newMemLevel.size - outerCosts[level]
+            innerMemoryHierarchy._add(newMemLevel)
+
+        return innerMemoryHierarchy
+
     def _generateAllMemoryConstraints(
-            self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
+            self,
+            tilerModel: TilerModel,
+            ctxt: NetworkContext,
+            schedule: List[SubGraph],
             layerBinding: 'OrderedDict[str, ONNXLayer]',
-            targetMemoryLevelMapping: TargetMemoryLevelMapping) -> List[PatternMemoryConstraints]:
+            targetMemoryLevelMapping: TargetMemoryLevelMapping,
+            flowStates: Optional[MemoryConstraintFlowStates] = None,
+            globalBufferConstraints: Optional[NodeMemoryConstraint] = None) -> List[PatternMemoryConstraints]:
 
         dynamicTensorConstraints, constantTensorConstraints = self._generateMemoryConstraints(
-            tilerModel, ctxt, schedule, layerBinding, targetMemoryLevelMapping)
+            tilerModel, ctxt, schedule, layerBinding, targetMemoryLevelMapping, flowStates, globalBufferConstraints)
 
         allConstraints: List[PatternMemoryConstraints] = []
         # Initialize structures
@@ -451,18 +1012,27 @@ class Tiler():
         return allConstraints
 
     def _generateMemoryConstraints(
-        self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
-        layerBinding: 'OrderedDict[str, ONNXLayer]', targetMemoryLevelMapping: TargetMemoryLevelMapping
+        self,
+        tilerModel: TilerModel,
+        ctxt: NetworkContext,
+        schedule: List[SubGraph],
+        layerBinding: 'OrderedDict[str, ONNXLayer]',
+        targetMemoryLevelMapping: TargetMemoryLevelMapping,
+        flowStates: Optional[MemoryConstraintFlowStates] = None,
+        globalBufferConstraints: Optional[NodeMemoryConstraint] = None
     ) -> Tuple[List[PatternMemoryConstraints], NodeMemoryConstraint]:
 
         # SCHEREMO: Construct non-double-buffered constraints of local variable buffers
 
         outerVariableConstraints, innerVariableConstraints = self._generateVariableBufferConstraints(
-            tilerModel, ctxt, schedule, layerBinding, targetMemoryLevelMapping)
+            tilerModel, ctxt, schedule, layerBinding, targetMemoryLevelMapping, flowStates)
 
         # SCHEREMO: Construct global buffer constraints
 
-        globalVariableConstraint = self._generateBufferConstraints(ctxt)
+        if globalBufferConstraints is None:
+            globalVariableConstraint = self._generateBufferConstraints(ctxt)
+        else:
+            globalVariableConstraint = globalBufferConstraints
 
         # SCHEREMO: Construct first-level constraint set (all global buffers + tensors stored in higher level)
 
@@ -615,40 +1185,58 @@ class Tiler():
 
         return constantGlobalConstraint
 
+    def _computeMemoryConstraintFlow(self, ctxt: NetworkContext, schedule: List[SubGraph],
+                                     layerBinding: 'OrderedDict[str, ONNXLayer]',
+                                     targetMemoryLevelMapping: TargetMemoryLevelMapping) -> MemoryConstraintFlowStates:
+
+        initialLiveBuffers = {
+            value.name
+            for value in ctxt.globalObjects.values()
+            if (isinstance(value, ctxt.VariableBuffer) and value._users != [])
+        }
+
+        producedBuffers = {layer.node.outputs[0].name for layer in layerBinding.values()}
+        inputBufferNames = initialLiveBuffers - producedBuffers
+        inputBuffers = [ctxt.lookup(name) for name in inputBufferNames]
+
+        initialLiveTensors = {TensorMemLevelTuple(buf.name, buf._memoryLevel) for buf in inputBuffers}
+
+        constraintFlow = GraphMemoryConstraintFlow(ctxt, targetMemoryLevelMapping)
+        graphFlowStates = constraintFlow.flow(schedule, initialLiveTensors)
+
+        return graphFlowStates, constraintFlow._patternFlowStates
+
     def _generateVariableBufferConstraints(
-        self, tilerModel: TilerModel, ctxt: NetworkContext, schedule: List[SubGraph],
-        layerBinding: 'OrderedDict[str, ONNXLayer]', targetMemoryLevelMapping: TargetMemoryLevelMapping
+        self,
+        tilerModel: TilerModel,
+        ctxt: NetworkContext,
+        schedule: List[SubGraph],
+        layerBinding: 'OrderedDict[str, ONNXLayer]',
+        targetMemoryLevelMapping: TargetMemoryLevelMapping,
+        flowStates: Optional[MemoryConstraintFlowStates] = None
     ) -> Tuple[List[PatternMemoryConstraints], List[PatternMemoryConstraints]]:
 
         def deltaFlow(
                 patternFlow: List[GenericFlowState[TensorMemLevelTuple]]) -> GenericFlowState[TensorMemLevelTuple]:
 
             initialFlow = patternFlow[0]
-            endFlow = patternFlow[1]
+            endFlow = patternFlow[-1]
 
             # SCHEREMO: The genset and killset of the innerflow are correct; however, since we now pass the initialliveset of the pattern to the constraint flow. we need to remove bypassed tensors
             mergedLiveSet = initialFlow.liveSet - endFlow.liveSet
-            mergedGenSet = initialFlow.genSet
-            mergedKillSet = initialFlow.killSet
+
+            # Fused patterns execute as a single step; tensors generated and killed within it stay intermediate
+            mergedGenSet = set().union(*[flowState.genSet for flowState in patternFlow[:-1]])
+            mergedKillSet = set().union(*[flowState.killSet for flowState in patternFlow[:-1]])
 
             mergedFlow = GenericFlowState[TensorMemLevelTuple](mergedLiveSet, mergedKillSet, mergedGenSet)
 
             return mergedFlow
 
-        initialLiveBuffers = {
-            value.name
-            for value in ctxt.globalObjects.values()
-            if (isinstance(value, ctxt.VariableBuffer) and value._users != [])
-        }
-
-        producedBuffers = {layer.node.outputs[0].name for layer in layerBinding.values()}
-        inputBufferNames = initialLiveBuffers - producedBuffers
-        inputBuffers = [ctxt.lookup(name) for name in inputBufferNames]
+        if flowStates is None:
+            flowStates = self._computeMemoryConstraintFlow(ctxt, schedule, layerBinding, targetMemoryLevelMapping)
 
-        initialLiveTensors = {TensorMemLevelTuple(buf.name, buf._memoryLevel) for buf in inputBuffers}
-
-        constraintFlow = GraphMemoryConstraintFlow(ctxt, targetMemoryLevelMapping)
-        graphFlowStates = constraintFlow.flow(schedule, initialLiveTensors)
+        graphFlowStates, patternFlowStates = flowStates
 
         innerMemConstraints: List[PatternMemoryConstraints] = []
         outerMemConstraints: List[PatternMemoryConstraints] = []
@@ -661,7 +1249,7 @@ class Tiler():
             outerPatternMemoryConstraints = PatternMemoryConstraints()
 
             outerFlowState = graphFlowStates[idx]
-            patternFlow = constraintFlow._patternFlowStates[idx]
+            patternFlow = patternFlowStates[idx]
 
             dynamicOuterBufferConstraints = convertFlowState2NodeMemoryConstraint(tilerModel,
                                                                                   ctxt,
@@ -671,18 +1259,19 @@ class Tiler():
             outerPatternMemoryConstraints.addConstraint(dynamicOuterBufferConstraints)
             outerMemConstraints.append(outerPatternMemoryConstraints)
 
-            mergedFlow = [deltaFlow(patternFlow)]
+            mergedFlow = deltaFlow(patternFlow)
 
-            for step, innerFlowState in zip(pattern, mergedFlow):
-                transientBufferConstraints = self._generatePatternStepTransientBufferConstraints(
+            transientBufferConstraints = NodeMemoryConstraint()
+            for step in pattern:
+                transientBufferConstraints += self._generatePatternStepTransientBufferConstraints(
                     tilerModel, ctxt, layerBinding, step, targetMemoryLevelMapping)
 
-                dynamicInnerBufferConstraints = convertFlowState2NodeMemoryConstraint(tilerModel,
-                                                                                      ctxt,
-                                                                                      innerFlowState,
-                                                                                      useMax = False)
+            dynamicInnerBufferConstraints = convertFlowState2NodeMemoryConstraint(tilerModel,
+                                                                                  ctxt,
+                                                                                  mergedFlow,
+                                                                                  useMax = False)
 
-                innerPatternMemoryConstraints.addConstraint(transientBufferConstraints + dynamicInnerBufferConstraints)
+            innerPatternMemoryConstraints.addConstraint(transientBufferConstraints + dynamicInnerBufferConstraints)
 
             innerMemConstraints.append(innerPatternMemoryConstraints)
 
@@ -757,10 +1346,15 @@ class TilerAwareDeployer(MemoryLevelAwareDeployer):
                                   layerBinding = self.layerBinding,
                                   targetMemoryLevelMapping = self.getTargetMemoryLevelMapping())
             tilingSolution = self.tiler.computeTilingSchedule(self.ctxt)
+            patterns = [[node.name for node in pattern] for pattern in self.tiler._schedule]
+        else:
+            patterns = [[name] for name in self.layerBinding.keys()]
 
         # SCHEREMO: Annotate execution block with solution
-        for layer, pattern in zip(self.layerBinding.values(), tilingSolution):
-            layer.mapper.binder.executionBlock.patternMemoryConstraint = pattern
+        for pattern, patternMemoryConstraint in zip(patterns, tilingSolution):
+            self.ctxt = fuseLayers(self.ctxt, self.layerBinding, pattern)
+            executionBlock = self.layerBinding[pattern[-1]].mapper.binder.executionBlock
+            executionBlock.patternMemoryConstraint = patternMemoryConstraint
 
         # SCHEREMO: Code generation STUB
 
@@ -799,10 +1393,15 @@ class TilerDeployerWrapper(NetworkDeployerWrapper):
                                   layerBinding = self.layerBinding,
                                   targetMemoryLevelMapping = self.getTargetMemoryLevelMapping())
             tilingSolution = self.tiler.computeTilingSchedule(self.ctxt)
+            patterns = [[node.name for node in pattern] for pattern in self.tiler._schedule]
+        else:
+            patterns = [[name] for name in self.layerBinding.keys()]
 
         # SCHEREMO: Annotate execution block with solution
-        for layer, pattern in zip(self.layerBinding.values(), tilingSolution):
-            layer.mapper.binder.executionBlock.patternMemoryConstraint = pattern
+        for pattern, patternMemoryConstraint in zip(patterns, tilingSolution):
+            self.ctxt = fuseLayers(self.ctxt, self.layerBinding, pattern)
+            executionBlock = self.layerBinding[pattern[-1]].mapper.binder.executionBlock
+            executionBlock.patternMemoryConstraint = patternMemoryConstraint
 
         # SCHEREMO: Code generation STUB
 
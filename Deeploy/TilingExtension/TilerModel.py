@@ -31,6 +31,7 @@ from typing import Dict, List, Literal, Optional, Tuple, Union
 import numpy as np
 from ortools.constraint_solver.pywrapcp import IntExpr, IntVar, SolutionCollector, Solver
 
+from Deeploy.CompilerProfiling import profiled
 from Deeploy.DeeployTypes import NetworkContext, OperatorRepresentation
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryLevel
 
@@ -51,6 +52,17 @@ class PerformanceHint(AddConstraintStrategy):
     priority: int = 0
 
 
+@dataclass
+class SolveStatistics:
+    """Statistics of the last solve of a TilerModel"""
+    status: str  #: str: Final status of the search
+    wallTime: float  #: float: Time spent in the solver in seconds
+    conflicts: int  #: int: Number of failed search branches
+    branches: int  #: int: Number of search branches
+    objectiveValue: Optional[int] = None  #: Optional[int]: Best objective value found
+    objectiveBound: Optional[int] = None  #: Optional[int]: Best proven bound of the objective, if known
+
+
 class TilerModel():
 
     def __init__(self, copyIdxSuffix: Optional[str] = None):
@@ -62,8 +74,13 @@ class TilerModel():
         self._performanceConstraints: List[Tuple[int, IntExpr]] = []
         self._performanceMemoryConstraints: List[Tuple[int, Tuple[MemoryLevel, IntExpr]]] = []
         self._variables: Dict[str, IntVar] = {}
+        self._hints: List[Tuple[IntVar, int]] = []
 
         self.copyIdx: int = 0
+        self.fixHints: bool = False  #: bool: Add hints as constraints if they keep the model valid
+        self.separableObjectives: bool = False  #: bool: Optimize the objective of every pattern on its own
+        self.timeLimit: int = _SOLVERTIMEOUT  #: int: Time limit of every solve in milliseconds
+        self.solveStatistics: Optional[SolveStatistics] = None
         self._copyIdxSuffix: str = copyIdxSuffix if copyIdxSuffix is not None else _COPYIDXSUFFIX
         self._collector: Optional[SolutionCollector] = None
 
@@ -131,6 +148,10 @@ class TilerModel():
             else:
                 self._memoryConstraints.append((memoryLevel, constraintExpression))
 
+    def addHint(self, variable: IntVar, value: int):
+        """Suggest a value for a variable; the solver tries all hinted values first, see also `fixHints`"""
+        self._hints.append((variable, value))
+
     def addVariable(self, name: str, lowerBound: int, upperBound: int, copyIdx: Optional[int] = None) -> IntVar:
 
         varName = name + self._getSuffix(copyIdx)
@@ -327,6 +348,12 @@ class TilerModel():
             constrExpr = constraint <= memLevel.size
             self._model.Add(constrExpr)
 
+        # Check all hints at once, checking constraints one by one is prohibitively slow for large models
+        if self.fixHints and self._hints != []:
+            hintConstraint = self._model.Sum([(var == value).Var() for var, value in self._hints]) == len(self._hints)
+            if self._model.CheckConstraint(hintConstraint):
+                self._model.Add(hintConstraint)
+
         for _, performanceConstraint in sorted(self._performanceConstraints, reverse = True):
             if self._model.CheckConstraint(performanceConstraint):
                 self._model.Add(performanceConstraint)
@@ -359,6 +386,44 @@ class TilerModel():
 
         return objective
 
+    def _patternOptimizer(self, objective: IntVar, minimize: bool):
+        _, copyIdx = self.getNameCopyIdx(objective.Name())
+        suffix = self._getSuffix(copyIdx)
+
+        patternVariables = [var for varName, var in self._variables.items() if varName.endswith(suffix)]
+
+        solution = self._model.Assignment()
+        solution.Add(patternVariables)
+        solution.AddObjective(objective)
+
+        decisionBuilder = self._model.Phase(patternVariables, self._model.CHOOSE_FIRST_UNBOUND,
+                                            self._model.ASSIGN_MAX_VALUE)
+
+        return self._model.NestedOptimize(decisionBuilder, solution, not minimize, 1,
+                                          [self._model.TimeLimit(self.timeLimit)])
+
+    def isFeasible(self) -> bool:
+        """Check whether the model has any solution, without optimizing its objectives
+
+        Returns
+        -------
+        bool
+            True if a solution was found within the solver time limit
+
+        """
+        if not self._trySetupConstraints():
+            return False
+
+        variablesList = [var for varName, var in self._variables.items()]
+        decision_builder = self._model.Phase(variablesList, self._model.CHOOSE_FIRST_UNBOUND,
+                                             self._model.ASSIGN_MIN_VALUE)
+
+        collector = self._model.FirstSolutionCollector()
+        _ = self._model.Solve(decision_builder, [collector, self._model.TimeLimit(self.timeLimit)])
+
+        return collector.SolutionCount() > 0
+
+    @profiled("Tiler")
     def trySolveModel(self):
 
         solvable: bool = self._trySetupConstraints()
@@ -377,18 +442,43 @@ class TilerModel():
             decision_builder = self._model.Phase(variablesList, self._model.CHOOSE_FIRST_UNBOUND,
                                                  self._model.ASSIGN_MIN_VALUE)
 
+        if self._hints != []:
+            hintAssignment = self._model.Assignment()
+            for var, value in self._hints:
+                hintAssignment.Add(var)
+                hintAssignment.SetValue(var, value)
+            decision_builder = self._model.DecisionBuilderFromAssignment(hintAssignment, decision_builder,
+                                                                         [var for var, _ in self._hints])
+
         collector = self._model.LastSolutionCollector()
 
         for var in variablesList:
             collector.Add(var)
 
-        objective = self._setupObjective()
-
-        timelimit = self._model.TimeLimit(_SOLVERTIMEOUT)
+        timelimit = self._model.TimeLimit(self.timeLimit)
 
         log = self._model.SearchLog(1000000)
 
-        _ = self._model.Solve(decision_builder, [objective, collector, log, timelimit])
+        if self.separableObjectives:
+            # Fix the optimal variables of one pattern after the other instead of searching their joint space
+            patternBuilders = [self._patternOptimizer(objective, minimize) for objective, minimize in self._objectives]
+            decision_builder = self._model.Compose(patternBuilders + [decision_builder])
+            monitors = [collector, log, timelimit]
+        else:
+            monitors = [self._setupObjective(), collector, log, timelimit]
+
+        wallTime, failures, branches = self._model.WallTime(), self._model.Failures(), self._model.Branches()
+        _ = self._model.Solve(decision_builder, monitors)
+
+        objectiveValue = None
+        if collector.SolutionCount() > 0 and not self.separableObjectives and self._objectives != []:
+            objectiveValue = collector.Value(collector.SolutionCount() - 1, self._objectives[0][0])
+
+        self.solveStatistics = SolveStatistics(status = "FEASIBLE" if collector.SolutionCount() > 0 else "UNKNOWN",
+                                               wallTime = (self._model.WallTime() - wallTime) / 1000,
+                                               conflicts = self._model.Failures() - failures,
+                                               branches = self._model.Branches() - branches,
+                                               objectiveValue = objectiveValue)
 
         assert collector.SolutionCount() > 0, "Error in Tiler: No solution found"
 
@@ -25,8 +25,10 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 
@@ -69,6 +71,161 @@ class AbsoluteHyperRectangle:
         self.absoluteOffset = absoluteOffset
 
 
+class HyperRectangleArray():
+    """Sequence of HyperRectangles of equal rank backed by a structured NumPy array
+
+    Every row of the underlying array stores the ``offset`` and ``dims``
+    of one HyperRectangle. Integer indexing and iteration yield
+    HyperRectangles, such that the array can be used wherever a list
+    of HyperRectangles is expected.
+
+    """
+
+    def __init__(self, offsets: np.ndarray, dims: np.ndarray):
+        offsets = np.asarray(offsets, dtype = np.int64)
+        dims = np.asarray(dims, dtype = np.int64)
+
+        assert offsets.ndim == 2 and offsets.shape == dims.shape, \
+            f"HyperRectangleArray offsets and dims for mismatching shapes {offsets.shape} and {dims.shape}"
+
+        self.data = np.empty(offsets.shape[0], dtype = self._dtype(offsets.shape[1]))
+        self.data['offset'] = offsets
+        self.data['dims'] = dims
+
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def _dtype(rank: int) -> np.dtype:
+        return np.dtype([('offset', np.int64, (rank,)), ('dims', np.int64, (rank,))])
+
+    @classmethod
+    def _fromData(cls, data: np.ndarray) -> HyperRectangleArray:
+        new = cls.__new__(cls)
+        new.data = data
+        return new
+
+    @classmethod
+    def fromList(cls, hyperRectangles: Sequence[HyperRectangle], rank: int = 0) -> HyperRectangleArray:
+        if len(hyperRectangles) > 0:
+            rank = len(hyperRectangles[0].offset)
+
+        dtype = cls._dtype(rank)
+        if len(hyperRectangles) == 0 or rank == 0:
+            return cls._fromData(np.zeros(len(hyperRectangles), dtype = dtype))
+
+        rows = []
+        for rect in hyperRectangles:
+            assert len(rect.offset) == rank and len(rect.dims) == rank, \
+                f"HyperRectangle {rect} does not have rank {rank}!"
+            rows.append((*rect.offset, *rect.dims))
+
+        # The structured dtype is laid out as the offsets followed by the dims of each tile
+        flat = np.array(rows, dtype = np.int64)
+        return cls._fromData(flat.view(dtype).reshape(len(hyperRectangles)))
+
+    @classmethod
+    def concatenate(cls, hyperRectangleArrays: Sequence[HyperRectangleArray]) -> HyperRectangleArray:
+        ranks = set(array.rank for array in hyperRectangleArrays)
+        assert len(ranks) == 1, f"Cannot concatenate HyperRectangleArrays of ranks {ranks}!"
+
+        return cls._fromData(np.concatenate([array.data for array in hyperRectangleArrays]))
+
+    @property
+    def offsets(self) -> np.ndarray:
+        return self.data['offset']
+
+    @property
+    def dims(self) -> np.ndarray:
+        return self.data['dims']
+
+    @property
+    def rank(self) -> int:
+        return self.data.dtype['offset'].shape[0]
+
+    def toList(self) -> List[HyperRectangle]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[HyperRectangle, HyperRectangleArray]:
+        if isinstance(idx, slice):
+            return HyperRectangleArray._fromData(self.data[idx])
+
+        row = self.data[idx]
+        return HyperRectangle(tuple(row['offset'].tolist()), tuple(row['dims'].tolist()))
+
+    def __iter__(self) -> Iterator[HyperRectangle]:
+        for offset, dims in zip(self.offsets.tolist(), self.dims.tolist()):
+            yield HyperRectangle(tuple(offset), tuple(dims))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HyperRectangleArray):
+            return False
+        return self.data.dtype == other.data.dtype and np.array_equal(self.data, other.data)
+
+    def __repr__(self) -> str:
+        return f"HyperRectangleArray(offsets = {self.offsets.tolist()}, dims = {self.dims.tolist()})"
+
+
+class _LoadScheduleView(Sequence):
+    """Per-step view of a load schedule that is stored per tensor
+
+    Each step is materialized as a fresh ``Dict[str, HyperRectangle]``;
+    modifying a step does not modify the underlying TilingSchedule.
+
+    """
+
+    def __init__(self, loadArrays: Dict[str, HyperRectangleArray], numSteps: int):
+        self._loadArrays = loadArrays
+        self._numSteps = numSteps
+
+    def __len__(self) -> int:
+        return self._numSteps
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Dict[str, HyperRectangle], List[Dict[str, HyperRectangle]]]:
+        if isinstance(idx, slice):
+            return [self[_idx] for _idx in range(*idx.indices(self._numSteps))]
+
+        if idx < 0:
+            idx += self._numSteps
+        if not 0 <= idx < self._numSteps:
+            raise IndexError(f"Load schedule step {idx} out of range!")
+
+        return {key: array[idx] for key, array in self._loadArrays.items()}
+
+    def __iter__(self) -> Iterator[Dict[str, HyperRectangle]]:
+        keys = list(self._loadArrays.keys())
+        rectLists = [list(array) for array in self._loadArrays.values()]
+        for idx in range(self._numSteps):
+            yield {key: rects[idx] for key, rects in zip(keys, rectLists)}
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _loadScheduleToArrays(
+    loadSchedule: Union[Sequence[Dict[str, HyperRectangle]], Dict[str, HyperRectangleArray]]
+) -> Tuple[Dict[str, HyperRectangleArray], int]:
+
+    if isinstance(loadSchedule, dict):
+        lengths = set(len(array) for array in loadSchedule.values())
+        assert len(lengths) <= 1, f"All tensors of a load schedule need the same number of steps, got {lengths}!"
+        return dict(loadSchedule), lengths.pop() if len(lengths) == 1 else 0
+
+    if len(loadSchedule) == 0:
+        return {}, 0
+
+    keys = list(loadSchedule[0].keys())
+    for scheduleStep in loadSchedule:
+        assert scheduleStep.keys() == set(keys), f"Load schedule step {scheduleStep} does not load exactly {keys}!"
+
+    loadArrays = {
+        key: HyperRectangleArray.fromList([scheduleStep[key] for scheduleStep in loadSchedule]) for key in keys
+    }
+
+    return loadArrays, len(loadSchedule)
+
+
 @dataclass
 class TilingSchedule():
     # the places to store input tiles
@@ -79,33 +236,54 @@ class TilingSchedule():
     # Should have length numTiles
     outputBaseOffsets: Dict[str, List[int]]
 
-    # the hypercubes to load in each step
-    # Should have length numTiles
-    inputLoadSchedule: List[Dict[str, HyperRectangle]]
+    # the hypercubes to load in each step, one array per input tensor
+    # Should have length numInputSteps
+    inputLoadArrays: Dict[str, HyperRectangleArray]
 
-    # the hypercubes to store in each step
-    # Should have length numTiles
-    outputLoadSchedule: List[Dict[str, HyperRectangle]]
+    # the hypercubes to store in each step, one array per output tensor
+    # Should have length numOutputSteps
+    outputLoadArrays: Dict[str, HyperRectangleArray]
+
+    numInputSteps: int
+    numOutputSteps: int
 
     def __init__(self, inputBaseOffsets: Dict[str, List[int]], outputBaseOffsets: Dict[str, List[int]],
-                 inputLoadSchedule: List[Dict[str, HyperRectangle]], outputLoadSchedule: List[Dict[str,
-                                                                                                   HyperRectangle]]):
+                 inputLoadSchedule: Union[Sequence[Dict[str, HyperRectangle]], Dict[str, HyperRectangleArray]],
+                 outputLoadSchedule: Union[Sequence[Dict[str, HyperRectangle]], Dict[str, HyperRectangleArray]]):
 
         # assert len(inputLoadSchedule) == len(outputLoadSchedule), "Didn't get equal amount of input and output tiles!"
 
-        for scheduleStep in inputLoadSchedule:
-            for key in inputBaseOffsets:
-                assert key in scheduleStep.keys(), f"Key {key} is not in scheduleStep {scheduleStep}"
-
-        for scheduleStep in outputLoadSchedule:
-            for key in outputBaseOffsets:
-                assert key in scheduleStep.keys(), f"Key {key} is not in scheduleStep {scheduleStep}"
-
         self.inputBaseOffsets = inputBaseOffsets
         self.outputBaseOffsets = outputBaseOffsets
         self.inputLoadSchedule = inputLoadSchedule
         self.outputLoadSchedule = outputLoadSchedule
 
+        if self.numInputSteps > 0:
+            for key in inputBaseOffsets:
+                assert key in self.inputLoadArrays.keys(), f"Key {key} is not in inputLoadSchedule"
+
+        if self.numOutputSteps > 0:
+            for key in outputBaseOffsets:
+                assert key in self.outputLoadArrays.keys(), f"Key {key} is not in outputLoadSchedule"
+
+    @property
+    def inputLoadSchedule(self) -> Sequence[Dict[str, HyperRectangle]]:
+        return _LoadScheduleView(self.inputLoadArrays, self.numInputSteps)
+
+    @inputLoadSchedule.setter
+    def inputLoadSchedule(self, loadSchedule: Union[Sequence[Dict[str, HyperRectangle]], Dict[str,
+                                                                                              HyperRectangleArray]]):
+        self.inputLoadArrays, self.numInputSteps = _loadScheduleToArrays(loadSchedule)
+
+    @property
+    def outputLoadSchedule(self) -> Sequence[Dict[str, HyperRectangle]]:
+        return _LoadScheduleView(self.outputLoadArrays, self.numOutputSteps)
+
+    @outputLoadSchedule.setter
+    def outputLoadSchedule(self, loadSchedule: Union[Sequence[Dict[str, HyperRectangle]], Dict[str,
+                                                                                               HyperRectangleArray]]):
+        self.outputLoadArrays, self.numOutputSteps = _loadScheduleToArrays(loadSchedule)
+
     def __repr__(self) -> str:
         outStr = ""
         outStr += f"inputBaseOffsets: \n{str(self.inputBaseOffsets)} \n"
@@ -119,6 +297,31 @@ class TilingSchedule():
 
         return outStr
 
+    def outputWriteBackMask(self) -> np.ndarray:
+        """Return which output steps have to be transferred back
+
+        Consecutive steps producing the very same output tiles, e.g.
+        while partial sums are accumulated over the reduction
+        dimension, only write the tiles back after the last of them.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of length numOutputSteps
+
+        """
+        writeBackMask = np.ones(self.numOutputSteps, dtype = bool)
+        if self.numOutputSteps < 2 or len(self.outputLoadArrays) == 0:
+            return writeBackMask
+
+        repeatedSteps = np.ones(self.numOutputSteps - 1, dtype = bool)
+        for array in self.outputLoadArrays.values():
+            repeatedSteps &= np.all(array.offsets[:-1] == array.offsets[1:], axis = 1)
+            repeatedSteps &= np.all(array.dims[:-1] == array.dims[1:], axis = 1)
+
+        writeBackMask[:-1] = ~repeatedSteps
+        return writeBackMask
+
     def __add__(self, other: TilingSchedule) -> TilingSchedule:
 
         assert isinstance(other, TilingSchedule), f"Other {other} is not a TilingSchedule"
@@ -133,30 +336,59 @@ class TilingSchedule():
         for key in other.outputBaseOffsets.keys():
             assert key in self.outputBaseOffsets.keys(), f"Other {other} has no key {key}"
 
-        new = TilingSchedule(self.inputBaseOffsets.copy(), self.outputBaseOffsets.copy(), self.inputLoadSchedule.copy(),
-                             self.outputLoadSchedule.copy())
+        def _concatenate(loadArrays: Dict[str, HyperRectangleArray], numSteps: int,
+                         otherLoadArrays: Dict[str, HyperRectangleArray],
+                         otherNumSteps: int) -> Dict[str, HyperRectangleArray]:
+            if otherNumSteps == 0:
+                return loadArrays.copy()
+            if numSteps == 0:
+                return otherLoadArrays.copy()
 
-        new.inputLoadSchedule += other.inputLoadSchedule
-        new.outputLoadSchedule += other.outputLoadSchedule
+            assert loadArrays.keys() == otherLoadArrays.keys(), \
+                f"Cannot concatenate load schedules of {list(loadArrays.keys())} and {list(otherLoadArrays.keys())}"
+            return {
+                key: HyperRectangleArray.concatenate([array, otherLoadArrays[key]]) for key, array in loadArrays.items()
+            }
+
+        inputLoadArrays = _concatenate(self.inputLoadArrays, self.numInputSteps, other.inputLoadArrays,
+                                       other.numInputSteps)
+        outputLoadArrays = _concatenate(self.outputLoadArrays, self.numOutputSteps, other.outputLoadArrays,
+                                        other.numOutputSteps)
+
+        new = TilingSchedule(self.inputBaseOffsets.copy(), self.outputBaseOffsets.copy(), inputLoadArrays,
+                             outputLoadArrays)
+
+        # Steps without any transfers are not represented by the arrays
+        new.numInputSteps = self.numInputSteps + other.numInputSteps
+        new.numOutputSteps = self.numOutputSteps + other.numOutputSteps
 
         return new
 
 
 @dataclass
 class VariableReplacementScheme():
-    perTileReplacements: Dict[str, List]
+    # one entry per tile
+    perTileReplacements: Dict[str, np.ndarray]
     replacementTypes: Dict[str, Type[Pointer]]
 
-    def __init__(self, perTileReplacements: Dict[str, List], replacementTypes: Dict[str, Type[Pointer]]):
+    def __init__(self, perTileReplacements: Dict[str, Sequence], replacementTypes: Dict[str, Type[Pointer]]):
         assert len(perTileReplacements.keys()) == len(
             replacementTypes.keys()), "Exactly all replacements must have one type"
 
         for key in perTileReplacements.keys():
             assert key in replacementTypes.keys(), "Keys must match!"
 
-        self.perTileReplacements = perTileReplacements
+        self.perTileReplacements = {key: np.asarray(value) for key, value in perTileReplacements.items()}
         self.replacementTypes = replacementTypes
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VariableReplacementScheme):
+            return False
+        if self.perTileReplacements.keys() != other.perTileReplacements.keys():
+            return False
+        return self.replacementTypes == other.replacementTypes and all(
+            np.array_equal(value, other.perTileReplacements[key]) for key, value in self.perTileReplacements.items())
+
     def __add__(self, other: VariableReplacementScheme) -> VariableReplacementScheme:
 
         assert isinstance(other, VariableReplacementScheme), f"Other {other} is not a VariableReplacementScheme"
@@ -171,11 +403,12 @@ class VariableReplacementScheme():
         for key in other.replacementTypes.keys():
             assert key in self.replacementTypes.keys(), f"key {key} not in other {other}!"
 
-        new = VariableReplacementScheme(self.perTileReplacements.copy(), self.replacementTypes.copy())
-        for key in self.perTileReplacements.keys():
-            new.perTileReplacements[key] += other.perTileReplacements[key]
+        newPerTileRep = {
+            key: np.concatenate([value, other.perTileReplacements[key]])
+            for key, value in self.perTileReplacements.items()
+        }
 
-        return new
+        return VariableReplacementScheme(newPerTileRep, self.replacementTypes.copy())
 
 
 def minimizeVariableReplacement(
@@ -185,80 +418,286 @@ def minimizeVariableReplacement(
     newRepTypes = {}
 
     for key, value in scheme.perTileReplacements.items():
-        if len(set(value)) > 1:
+        if np.any(value != value[0]):
             newPerTileRep[key] = scheme.perTileReplacements[key]
             newRepTypes[key] = scheme.replacementTypes[key]
         else:
-            operatorRepresentation[key] = value[0]
+            operatorRepresentation[key] = value[:1].tolist()[0]
+            tileTableStatistics.compressedTables += 1
+            tileTableStatistics.compressedBytes += len(value) * (
+                scheme.replacementTypes[key].referencedType.typeWidth // 8)
 
     return VariableReplacementScheme(newPerTileRep, newRepTypes), operatorRepresentation
 
 
-def minimizeRectangleDims(hyperRectangle: HyperRectangle,
-                          referenceBuffer: VariableBuffer) -> Tuple[HyperRectangle, HyperRectangle]:
+@dataclass
+class TileTableStatistics():
+    """Number and size of the per tile tables of the tiling code
+
+    Compressed tables are replaced by immediates or arithmetic on the
+    tile index, shared tables reuse an identical table of another
+    node. Emitted tables are stored in memory.
+    """
+    compressedTables: int = 0
+    compressedBytes: int = 0
+    sharedTables: int = 0
+    sharedBytes: int = 0
+    emittedTables: int = 0
+    emittedBytes: int = 0
+
+    def reset(self):
+        self.compressedTables = self.compressedBytes = 0
+        self.sharedTables = self.sharedBytes = 0
+        self.emittedTables = self.emittedBytes = 0
+
+
+#: Statistics of all tile tables generated since the last ``reset()``
+tileTableStatistics = TileTableStatistics()
+
+
+@dataclass(frozen = True)
+class TileValueSequence():
+    """Per tile values computed from the tile index instead of being loaded from a table
+
+    The value of tile ``i`` is ``first + stride * i`` if not
+    ``alternating``, and ``first + stride * (i % 2)`` otherwise. If
+    ``lastIndex`` is set, the tile with this index takes ``lastValue``
+    instead, which covers the remainder tile of a tiling.
+    """
+    first: int
+    stride: int = 0
+    alternating: bool = False
+    lastIndex: Optional[int] = None
+    lastValue: Optional[int] = None
+
+    def expression(self, index: Union[int, str]) -> str:
+        """C expression of the value of tile ``index``
+
+        Parameters
+        ----------
+        index : Union[int, str]
+            C expression of the tile index
+
+        Returns
+        -------
+        str
+            C expression of the value
+
+        """
+        if self.stride == 0:
+            value = f"{self.first}"
+        else:
+            term = f"{abs(self.stride)} * " + (f"(({index}) & 1)" if self.alternating else f"({index})")
+            if self.first == 0:
+                value = term if self.stride > 0 else f"-{term}"
+            else:
+                value = f"{self.first} {'+' if self.stride > 0 else '-'} {term}"
+
+        if self.lastIndex is None:
+            return f"({value})"
+        return f"((({index}) == {self.lastIndex}) ? {self.lastValue} : {value})"
+
+
+def _fitTileValues(values: np.ndarray) -> Optional[TileValueSequence]:
+    if len(values) <= 1 or np.all(values == values[0]):
+        return TileValueSequence(int(values[0]) if len(values) > 0 else 0)
+
+    stride = int(values[1] - values[0])
+    if np.all(np.diff(values) == stride):
+        return TileValueSequence(int(values[0]), stride)
+
+    if np.all(values[0::2] == values[0]) and np.all(values[1::2] == values[1]):
+        return TileValueSequence(int(values[0]), stride, alternating = True)
+
+    return None
+
+
+def compressTileValues(values: Sequence[int]) -> Optional[TileValueSequence]:
+    """Express per tile values as arithmetic on the tile index, if possible
+
+    Constant, affine and alternating sequences are compressed, also if
+    only the last tile deviates from them.
+
+    Parameters
+    ----------
+    values : Sequence[int]
+        The value of every tile
+
+    Returns
+    -------
+    Optional[TileValueSequence]
+        The compressed sequence, or None if the values need a table
 
-    rectDims = hyperRectangle.dims
-    rectOffset = hyperRectangle.offset
-    shape = referenceBuffer.shape
-    newDims: List[int] = []
-    newOffset: List[int] = []
+    """
+    values = np.asarray(values, dtype = np.int64).reshape(-1)
+    assert len(values) > 0, "Cannot compress an empty sequence of tile values!"
 
-    newBaseline = []
+    sequence = _fitTileValues(values)
+    if sequence is not None or len(values) <= 2:
+        return sequence
 
-    reversedRectOffset = list(reversed(rectOffset))
+    sequence = _fitTileValues(values[:-1])
+    if sequence is None:
+        return None
+
+    return TileValueSequence(sequence.first,
+                             sequence.stride,
+                             sequence.alternating,
+                             lastIndex = len(values) - 1,
+                             lastValue = int(values[-1]))
+
+
+def _alignedRank(hyperRectangles: HyperRectangleArray, referenceBuffer: VariableBuffer) -> int:
+    # Rectangles and buffers are aligned on their innermost dimensions
+    return min(hyperRectangles.rank, len(referenceBuffer.shape))
+
+
+def _minimizationPlan(fullDims: Tuple[bool, ...], shape: Tuple[int, ...]) -> List[Tuple[Optional[int], int]]:
+    # Collapse dimensions right to left: every fully transferred dimension is merged into the next tiled dimension
+    # to its left. Each entry of the plan is the aligned source dimension and the factor it is scaled with.
+    plan: List[Tuple[Optional[int], int]] = []
 
-    # SCHEREMO: Collapse dimensions right to left
     acc = 0
-    for idx, (tileDim, bufDim) in enumerate(zip(reversed(rectDims), reversed(shape))):
-
-        if tileDim == bufDim:
-            assert reversedRectOffset[idx] == 0, "Can't not tile a dimension and have an offset, tf"
-
-        # SCHEREMO: Collapse if equal
-        if tileDim == bufDim and acc != 0:
-            acc *= tileDim
-        elif tileDim == bufDim and acc == 0:
-            acc = tileDim
-        elif tileDim != bufDim and acc != 0:
-            newDims.insert(0, acc * tileDim)
-            newBaseline.insert(0, acc * bufDim)
-            newOffset.insert(0, acc * reversedRectOffset[idx])
+    for idx in reversed(range(len(shape))):
+        if fullDims[idx] and acc != 0:
+            acc *= shape[idx]
+        elif fullDims[idx] and acc == 0:
+            acc = shape[idx]
+        elif acc != 0:
+            plan.insert(0, (idx, acc))
             acc = 0
         else:
-            newDims.insert(0, tileDim)
-            newBaseline.insert(0, bufDim)
-            newOffset.insert(0, reversedRectOffset[idx])
+            plan.insert(0, (idx, 1))
 
     if acc > 1:
-        newDims.insert(0, acc)
-        newBaseline.insert(0, acc)
-        newOffset.insert(0, acc * reversedRectOffset[idx])
+        plan.insert(0, (None, acc))
 
-    # JUNGVI: If the function collapsed all dimensions of the tensor, set it to dim 1 and offset 0
-    if len(newDims) == 0:
-        newDims = [1]
-        newBaseline = [1]
-        newOffset = [0]
+    return plan
 
-    newRect = HyperRectangle(tuple(newOffset), tuple(newDims))
-    newBaseline = HyperRectangle(tuple([0] * len(newOffset)), tuple(newBaseline))
 
-    return newRect, newBaseline
+def minimizeRectangleArrayDims(hyperRectangles: HyperRectangleArray,
+                               referenceBuffer: VariableBuffer) -> Tuple[List[HyperRectangle], List[HyperRectangle]]:
+    """Collapse the dimensions of all tiles into the minimal number of strided dimensions
 
+    Tiles which transfer the same set of full dimensions share one
+    collapsing plan, which is applied to all of them at once.
 
-def calculateRectangleOffset(hyperRectangle: HyperRectangle, referenceBuffer: VariableBuffer) -> int:
+    Parameters
+    ----------
+    hyperRectangles : HyperRectangleArray
+        The tiles to minimize
+    referenceBuffer : VariableBuffer
+        The buffer the tiles are cut from
+
+    Returns
+    -------
+    Tuple[List[HyperRectangle], List[HyperRectangle]]
+        The minimized tile and the minimized baseline rectangle of
+        the reference buffer for every tile
+
+    """
+
+    numTiles = len(hyperRectangles)
+    if numTiles == 0:
+        return [], []
+
+    rank = _alignedRank(hyperRectangles, referenceBuffer)
+    shape = tuple(referenceBuffer.shape[len(referenceBuffer.shape) - rank:])
+
+    offsets = hyperRectangles.offsets[:, hyperRectangles.rank - rank:]
+    dims = hyperRectangles.dims[:, hyperRectangles.rank - rank:]
+
+    fullDims = dims == np.asarray(shape, dtype = np.int64)
+    assert not np.any(offsets[fullDims]), "Can't not tile a dimension and have an offset, tf"
+
+    # Tiles transferring the same set of full dimensions share one plan
+    if (fullDims == fullDims[0]).all():
+        tileGroups = [np.arange(numTiles)]
+    else:
+        planKeys = fullDims.astype(np.int64) @ (np.int64(1) << np.arange(rank, dtype = np.int64))
+        tileGroups = [np.flatnonzero(planKeys == planKey) for planKey in np.unique(planKeys).tolist()]
+
+    newRects: List[Optional[HyperRectangle]] = [None] * numTiles
+    newBaselines: List[Optional[HyperRectangle]] = [None] * numTiles
+
+    for tileIdxs in tileGroups:
+        plan = _minimizationPlan(tuple(fullDims[tileIdxs[0]].tolist()), shape)
+
+        # If all dimensions collapsed, fall back to a single dimension of size 1 at offset 0
+        if len(plan) == 0:
+            plan = [(None, 1)]
+
+        # Every plan is a linear map from the original to the collapsed dimensions
+        projection = np.zeros((rank, len(plan)), dtype = np.int64)
+        dimsBias = np.zeros(len(plan), dtype = np.int64)
+        newBaselineDims = []
 
-    minimalRect, baselineRect = minimizeRectangleDims(hyperRectangle, referenceBuffer)
+        for newIdx, (idx, factor) in enumerate(plan):
+            if idx is None:
+                dimsBias[newIdx] = factor
+                newBaselineDims.append(factor)
+            else:
+                projection[idx, newIdx] = factor
+                newBaselineDims.append(factor * shape[idx])
+
+        newOffsets = offsets[tileIdxs] @ projection
+        newDims = dims[tileIdxs] @ projection + dimsBias
+
+        baseline = HyperRectangle(tuple([0] * len(plan)), tuple(newBaselineDims))
+        for tileIdx, newOffset, newDim in zip(tileIdxs.tolist(), newOffsets.tolist(), newDims.tolist()):
+            newRects[tileIdx] = HyperRectangle(tuple(newOffset), tuple(newDim))
+            newBaselines[tileIdx] = baseline
+
+    return newRects, newBaselines
+
+
+def minimizeRectangleDims(hyperRectangle: HyperRectangle,
+                          referenceBuffer: VariableBuffer) -> Tuple[HyperRectangle, HyperRectangle]:
+
+    newRects, newBaselines = minimizeRectangleArrayDims(HyperRectangleArray.fromList([hyperRectangle]), referenceBuffer)
 
-    offsetMult = [1]
-    for dim in reversed(baselineRect.dims[1:]):
-        offsetMult.insert(0, dim * np.prod(offsetMult))
+    return newRects[0], newBaselines[0]
 
-    accOffset = 0
-    for offsetIdx, mult in zip(minimalRect.offset, offsetMult):
-        accOffset += offsetIdx * mult
 
-    return int(accOffset * (referenceBuffer._type.referencedType.typeWidth // 8))
+def calculateRectangleArrayOffsets(hyperRectangles: HyperRectangleArray, referenceBuffer: VariableBuffer) -> np.ndarray:
+    """Compute the byte offset of every tile within its reference buffer
+
+    Parameters
+    ----------
+    hyperRectangles : HyperRectangleArray
+        The tiles to locate
+    referenceBuffer : VariableBuffer
+        The buffer the tiles are cut from
+
+    Returns
+    -------
+    np.ndarray
+        The offset in bytes of the first element of every tile
+
+    """
+
+    rank = _alignedRank(hyperRectangles, referenceBuffer)
+    shape = tuple(referenceBuffer.shape[len(referenceBuffer.shape) - rank:])
+
+    offsets = hyperRectangles.offsets[:, hyperRectangles.rank - rank:]
+    dims = hyperRectangles.dims[:, hyperRectangles.rank - rank:]
+
+    assert not np.any(offsets[dims == np.asarray(shape, dtype = np.int64)]), \
+        "Can't not tile a dimension and have an offset, tf"
+
+    # Collapsing untiled dimensions preserves the row-major element offset
+    strides = [1] * rank
+    for idx in reversed(range(rank - 1)):
+        strides[idx] = strides[idx + 1] * shape[idx + 1]
+
+    return (offsets @ np.asarray(strides, dtype = np.int64)) * (referenceBuffer._type.referencedType.typeWidth // 8)
+
+
+def calculateRectangleOffset(hyperRectangle: HyperRectangle, referenceBuffer: VariableBuffer) -> int:
+
+    accOffsets = calculateRectangleArrayOffsets(HyperRectangleArray.fromList([hyperRectangle]), referenceBuffer)
+
+    return int(accOffsets[0])
 
 
 def extractTilingTransfer(tilingSolution: NodeMemoryConstraint, targetMemLevel: str,
@@ -287,51 +726,22 @@ def extractTilingTransfer(tilingSolution: NodeMemoryConstraint, targetMemLevel:
     raise RuntimeError(f"{tensorName} not found in tilingSolution!")
 
 
-def computeHyperRectangleList(memTrans: MemoryTransfer) -> List[HyperRectangle]:
-
-    def nextElement(idxVec: List[int], targetVector: List[int]) -> Optional[List[int]]:
-        nextIdx = []
-
-        countUp = True
-        for vecIdx, maxIdx in zip(reversed(idxVec), reversed(targetVector)):
-            if countUp:
-                if vecIdx == maxIdx:
-                    nextIdx.append(1)
-                else:
-                    nextIdx.append(vecIdx + 1)
-                    countUp = False
-            else:
-                nextIdx.append(vecIdx)
-
-        nextIdx.reverse()
-
-        if countUp:
-            return None
+def computeHyperRectangleArray(memTrans: MemoryTransfer) -> HyperRectangleArray:
+    """Enumerate all tiles of a memory transfer in row-major order
 
-        return nextIdx
+    Parameters
+    ----------
+    memTrans : MemoryTransfer
+        The transfer from the larger source to the smaller destination
+        memory constraint
 
-    def calculateCost(idxVec: Iterable[int], smallShape: Tuple[int]) -> List[int]:
-        outVec = []
-        for idx, step in zip(idxVec, smallShape):
-            outVec.append((idx - 1) * step)
+    Returns
+    -------
+    HyperRectangleArray
+        One HyperRectangle for each tile, the last dimension varying
+        fastest
 
-        return outVec
-
-    def calculateDim(idxVec: List[int], numTiles: List[int], smallShape: Tuple[int],
-                     largeShape: Tuple[int]) -> List[int]:
-
-        dimVec = []
-
-        for idx, (vecIdx, maxIdx) in enumerate(zip(idxVec, numTiles)):
-            if vecIdx != maxIdx:
-                dimVec.append(smallShape[idx])
-                continue
-            if largeShape[idx] % smallShape[idx] == 0:
-                dimVec.append(smallShape[idx])
-                continue
-            dimVec.append(largeShape[idx] % smallShape[idx])
-
-        return dimVec
+    """
 
     src = memTrans.source
     dst = memTrans.destination
@@ -347,24 +757,22 @@ def computeHyperRectangleList(memTrans: MemoryTransfer) -> List[HyperRectangle]:
     for idx, (dim1, dim2) in enumerate(zip(smallShape, largeShape)):
         assert dim1 <= dim2, f"Large shape is smaller in dimension {idx}"
 
-    totNumTiles = 1
-    numTiles: List[int] = []
+    numTiles = tuple(-(-int(dim2) // int(dim1)) for dim1, dim2 in zip(smallShape, largeShape))
+    totNumTiles = math.prod(numTiles)
 
-    for (dim1, dim2) in zip(smallShape, largeShape):
-        totNumTiles *= np.ceil(dim2 / dim1)
-        numTiles.append(int(np.ceil(dim2 / dim1)))
+    _largeShape = np.asarray(largeShape, dtype = np.int64)
+    _smallShape = np.asarray(smallShape, dtype = np.int64)
 
-    cubeList: List[HyperRectangle] = []
-    idxVec = [1] * len(smallShape)
+    if totNumTiles == 1:
+        tileIdxs = np.zeros((1, len(numTiles)), dtype = np.int64)
+    else:
+        tileIdxs = np.indices(numTiles, dtype = np.int64).reshape(len(numTiles), totNumTiles).T
 
-    for i in range(int(totNumTiles)):
-        offsetVec = calculateCost(idxVec, smallShape)
-        dimVec = calculateDim(idxVec, numTiles, smallShape, largeShape)
-        cubeList.append(HyperRectangle(tuple(offsetVec), tuple(dimVec)))
+    offsets = tileIdxs * _smallShape
+    dims = np.minimum(_smallShape, _largeShape - offsets)
 
-        nextVec = nextElement(idxVec, numTiles)
-        if nextVec is None:
-            break
-        idxVec = nextVec
+    return HyperRectangleArray(offsets, dims)
 
-    return cubeList
+
+def computeHyperRectangleList(memTrans: MemoryTransfer) -> List[HyperRectangle]:
+    return computeHyperRectangleArray(memTrans).toList()
@@ -0,0 +1,151 @@
+# ----------------------------------------------------------------------
+#
+# File: TilingCostModel.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+from ortools.constraint_solver.pywrapcp import IntExpr
+
+from Deeploy.DeeployTypes import NetworkContext
+from Deeploy.TilingExtension.TilerModel import TilerModel
+
+SymbolicCycles = Union[int, IntExpr]
+
+
+@dataclass(frozen = True)
+class MemoryTransferCost:
+    """Analytic cost of DMA transfers along one edge of the memory hierarchy
+    """
+
+    bandwidth: int = 1  #: int: Sustained bandwidth in bytes per cycle
+    setupCycles: int = 0  #: int: Cycles to program and wait for one transfer
+    chunkCycles: int = 0  #: int: Additional cycles for every contiguous chunk of a transfer
+
+
+@dataclass
+class TilingCostModel:
+    """Analytic latency model used as tiling objective
+
+    The latency of a pattern is its number of tiles times the latency
+    of one tile. A tile takes the kernel cycles estimated by the
+    `TileConstraint` of every node and the DMA cycles to move all
+    pattern inputs and outputs between their home and target memory
+    levels. If the transfers are multi-buffered, they overlap with the
+    kernels of the neighbouring tiles and only the slower of both
+    counts.
+
+    All numbers are rough estimates in cycles; they only have to rank
+    tiling solutions correctly.
+    """
+
+    #: Dict[Tuple[str, str], MemoryTransferCost]: Transfer costs of memory hierarchy edges, in either direction
+    transferCosts: Dict[Tuple[str, str], MemoryTransferCost] = field(default_factory = dict)
+    #: MemoryTransferCost: Transfer cost of edges not listed in transferCosts
+    defaultTransferCost: MemoryTransferCost = MemoryTransferCost()
+    opsPerCycle: int = 1  #: int: Operations per cycle of all cores together
+    numCores: int = 1  #: int: Number of cores the kernels are parallelized on
+    tileOverheadCycles: int = 0  #: int: Fixed cycles per tile, e.g. for the kernel call and synchronization
+
+    def transferCost(self, source: str, destination: str) -> MemoryTransferCost:
+        if (source, destination) in self.transferCosts:
+            return self.transferCosts[source, destination]
+        return self.transferCosts.get((destination, source), self.defaultTransferCost)
+
+    def computeCycles(self, ops: SymbolicCycles) -> SymbolicCycles:
+        """Convert a number of operations into cycles
+        """
+        return (ops + self.opsPerCycle - 1) // self.opsPerCycle
+
+    def contiguousChunks(self, tilerModel: TilerModel, ctxt: NetworkContext, tensorName: str) -> SymbolicCycles:
+        """Number of contiguous memory chunks of a tile of the given tensor
+
+        Every dimension contributes its tile size as factor once any of
+        the dimensions after it is tiled; dimensions whose inner
+        dimensions are all untiled merge into one contiguous chunk.
+        """
+        shape = ctxt.lookup(tensorName).shape
+
+        chunks: SymbolicCycles = 1
+        innerTiled: Optional[IntExpr] = None
+        for dimIdx in reversed(range(len(shape))):
+            dimVar = tilerModel.getTensorDimVar(tensorName = tensorName, dimIdx = dimIdx)
+            if innerTiled is not None:
+                chunks = chunks * (1 + innerTiled * (dimVar - 1))
+
+            isTiled = (dimVar < shape[dimIdx]).Var()
+            innerTiled = isTiled if innerTiled is None else (innerTiled + isTiled >= 1).Var()
+
+        return chunks
+
+    def transferCycles(self, tilerModel: TilerModel, ctxt: NetworkContext, tensorName: str,
+                       path: List[str]) -> SymbolicCycles:
+        """Cycles to move one tile of the given tensor along a path of the memory hierarchy
+        """
+        _buffer = ctxt.lookup(tensorName)
+
+        typeWidth = _buffer._type.referencedType.typeWidth // 8
+        size = tilerModel.getTensorNumberOfEltVar(tensorName = tensorName) * typeWidth
+        chunks = self.contiguousChunks(tilerModel, ctxt, tensorName)
+
+        cycles: SymbolicCycles = 0
+        for source, destination in zip(path[:-1], path[1:]):
+            cost = self.transferCost(source, destination)
+            transferCycles = (size + cost.bandwidth - 1) // cost.bandwidth
+            cycles = cycles + cost.setupCycles + transferCycles + chunks * cost.chunkCycles
+
+        return cycles
+
+    def numTiles(self, tilerModel: TilerModel, ctxt: NetworkContext, tensorName: str) -> SymbolicCycles:
+        """Number of tiles needed to cover the given tensor
+
+        The tiles form a grid over the tensor, so every dimension
+        contributes ceil(dim / tileDim) tiles, including the remainder
+        tile, and the number of tiles is the product of these factors.
+        """
+        shape = ctxt.lookup(tensorName).shape
+
+        numTiles: SymbolicCycles = 1
+        for dimIdx, dim in enumerate(shape):
+            dimVar = tilerModel.getTensorDimVar(tensorName = tensorName, dimIdx = dimIdx)
+            if dimVar.Min() == dimVar.Max():
+                numTiles = numTiles * -(-int(dim) // dimVar.Min())
+                continue
+
+            dimTiles = tilerModel.addVariable(name = f"{tensorName}_dim_{dimIdx}_num_tiles",
+                                              lowerBound = 1,
+                                              upperBound = dim)
+            tilerModel.addConstraint(dimTiles * dimVar >= dim)
+            tilerModel.addConstraint((dimTiles - 1) * dimVar < dim)
+            numTiles = numTiles * dimTiles
+
+        return numTiles
+
+    @staticmethod
+    def overlap(tilerModel: TilerModel, cyclesA: SymbolicCycles, cyclesB: SymbolicCycles) -> SymbolicCycles:
+        """Latency of two activities running concurrently
+        """
+        if isinstance(cyclesA, int) and isinstance(cyclesB, int):
+            return max(cyclesA, cyclesB)
+        if isinstance(cyclesA, int):
+            cyclesA, cyclesB = cyclesB, cyclesA
+        return tilerModel._model.Max(cyclesA, cyclesB)
@@ -0,0 +1,262 @@
+# ----------------------------------------------------------------------
+#
+# File: TilingSolutionCache.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import onnx_graphsurgeon as gs
+
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, ONNXLayer, SubGraph, TransientBuffer
+from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy
+from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import TargetMemoryLevelMapping
+
+# Bump whenever the signature or the stored solution format changes
+_CACHEVERSION = 2
+
+PatternSolution = List[Optional[List[int]]]
+
+
+def _qualifiedName(obj: Any) -> str:
+    cls = obj if isinstance(obj, type) else type(obj)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _canonicalValue(value: Any, tensorIndices: Dict[str, int]) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_canonicalValue(item, tensorIndices) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _canonicalValue(item, tensorIndices) for key, item in value.items()}
+    if isinstance(value, gs.Tensor):
+        return {"tensor": tensorIndices.get(value.name)}
+    if isinstance(value, str):
+        # Tensor names differ between networks, refer to them by their position within the pattern
+        if value in tensorIndices:
+            return {"tensor": tensorIndices[value]}
+        return value
+    # Values of other types still have to distinguish patterns
+    return {"type": _qualifiedName(value), "repr": repr(value)}
+
+
+def patternTensorNames(ctxt: NetworkContext, pattern: SubGraph) -> List[str]:
+    """Return the names of all deployed tensors of a pattern in a canonical order
+
+    Parameters
+    ----------
+    ctxt : NetworkContext
+        Current NetworkContext
+    pattern : SubGraph
+        Pattern of the tiling schedule
+
+    Returns
+    -------
+    List[str]
+        Tensor names, ordered by their first use within the pattern
+
+    """
+    tensorNames: List[str] = []
+    for node in pattern:
+        for tensor in node.inputs + node.outputs:
+            if tensor.name not in tensorNames and ctxt.lookup(tensor.name)._deploy:
+                tensorNames.append(tensor.name)
+    return tensorNames
+
+
+def patternSignature(ctxt: NetworkContext, pattern: SubGraph, layerBinding: 'OrderedDict[str, ONNXLayer]',
+                     targetMemoryLevelMapping: TargetMemoryLevelMapping, memoryHierarchy: MemoryHierarchy,
+                     strategy: str) -> str:
+    """Compute a canonical signature of a pattern's tiling problem
+
+    The signature covers the operator types and attributes, tensor
+    shapes, data types and memory levels, the memory hierarchy, the
+    tiling strategy and the `TileConstraint` of every node. Tensor and
+    node names are not part of the signature, so identical layers of
+    different networks map to the same signature.
+
+    Parameters
+    ----------
+    ctxt : NetworkContext
+        Current NetworkContext
+    pattern : SubGraph
+        Pattern of the tiling schedule
+    layerBinding : OrderedDict[str, ONNXLayer]
+        Bound layers of the network
+    targetMemoryLevelMapping : TargetMemoryLevelMapping
+        Target memory levels of all node-tensor pairs
+    memoryHierarchy : MemoryHierarchy
+        Memory hierarchy the pattern is tiled for
+    strategy : str
+        Identifier of the tiling and buffering strategy
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the signature
+
+    """
+    tensorNames = patternTensorNames(ctxt, pattern)
+    tensorIndices = {name: idx for idx, name in enumerate(tensorNames)}
+
+    tensors = []
+    for name in tensorNames:
+        _buffer = ctxt.lookup(name)
+
+        if isinstance(_buffer, TransientBuffer):
+            kind = "transient"
+        elif isinstance(_buffer, ConstantBuffer):
+            kind = "constant"
+        else:
+            kind = "variable"
+
+        tensors.append({
+            "kind": kind,
+            "global": ctxt.is_global(name),
+            "shape": _canonicalValue(_buffer.shape, {}),
+            "type": _buffer._type.referencedType.typeName,
+            "memoryLevel": getattr(_buffer, "_memoryLevel", None)
+        })
+
+    nodes = []
+    for node in pattern:
+        attrs = {key: _canonicalValue(value, tensorIndices) for key, value in node.attrs.items()}
+        targetMemoryLevels = [
+            targetMemoryLevelMapping.lookup(node.name, tensor.name) for tensor in node.inputs + node.outputs
+        ]
+        nodeSignature = {
+            "op": node.op,
+            "attrs": attrs,
+            "inputs": [tensorIndices.get(tensor.name) for tensor in node.inputs],
+            "outputs": [tensorIndices.get(tensor.name) for tensor in node.outputs],
+            "targetMemoryLevels": targetMemoryLevels
+        }
+
+        if node.name in layerBinding.keys():
+            mapper = layerBinding[node.name].mapper
+            nodeSignature["tileConstraint"] = _qualifiedName(mapper.binder.template.tileConstraint)
+            nodeSignature["operatorRepresentation"] = {
+                key: _canonicalValue(value, tensorIndices)
+                for key, value in mapper.parser.operatorRepresentation.items()
+                if key not in ("nodeName", "nodeOp")
+            }
+
+        nodes.append(nodeSignature)
+
+    signature = {
+        "version": _CACHEVERSION,
+        "strategy": strategy,
+        "memoryLevels": sorted((level.name, level.size) for level in memoryHierarchy.memoryLevels.values()),
+        "tensors": tensors,
+        "nodes": nodes
+    }
+
+    return hashlib.sha256(json.dumps(signature, sort_keys = True, default = str).encode()).hexdigest()
+
+
+class TilingSolutionCache():
+    """Persistent on-disk cache of per-pattern tiling solutions
+
+    Solutions are stored as the tile shapes of all tensors of a
+    pattern, keyed by the pattern's canonical signature. The `Tiler`
+    feeds cached solutions back to the solver, either as a search hint
+    or as fixed tile shapes. Fixed patterns are solved one by one, and
+    only patterns without cached solution are optimized; a pattern
+    whose cached solution does not fit anymore is solved again.
+
+    """
+
+    def __init__(self, cacheDir: str, fixSolutions: bool = False):
+        """Initialize a TilingSolutionCache
+
+        Parameters
+        ----------
+        cacheDir : str
+            Directory holding one JSON file per cached pattern
+        fixSolutions : bool
+            If True, the tile shapes of cached patterns are fixed
+            instead of being used as search hints
+
+        """
+        self.cacheDir = cacheDir
+        self.fixSolutions = fixSolutions
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.cacheDir, exist_ok = True)
+
+    def _fileName(self, signature: str) -> str:
+        return os.path.join(self.cacheDir, f"{signature}.json")
+
+    def lookup(self, signature: str) -> Optional[PatternSolution]:
+        """Return the cached solution of a pattern if there is one
+
+        Parameters
+        ----------
+        signature : str
+            Signature of the pattern
+
+        Returns
+        -------
+        Optional[PatternSolution]
+            Tile shape of every tensor of the pattern, or None for
+            tensors without tile shape; None on a cache miss
+
+        """
+        try:
+            with open(self._fileName(signature), "r") as f:
+                solution = json.load(f)["tensorShapes"]
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return solution
+
+    def store(self, signature: str, solution: PatternSolution):
+        """Store the solution of a pattern
+
+        Parameters
+        ----------
+        signature : str
+            Signature of the pattern
+        solution : PatternSolution
+            Tile shape of every tensor of the pattern
+
+        """
+        # Write to a temporary file first, so concurrent runs never see partial entries
+        fd, tmpName = tempfile.mkstemp(dir = self.cacheDir, suffix = ".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"tensorShapes": solution}, f)
+        os.replace(tmpName, self._fileName(signature))
@@ -0,0 +1,47 @@
+/* =====================================================================
+ * Title:        CycleCounter.h
+ * Description:  Host timer, counts nanoseconds instead of cycles
+ *
+ * Date:         19.10.2026
+ *
+ * ===================================================================== */
+
+/*
+ * Copyright (C) 2026 ETH Zurich and University of Bologna.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the License); you may
+ * not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an AS IS BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#ifndef CYCLECOUNTER
+#define CYCLECOUNTER
+
+#include <stdint.h>
+
+// Resets the internal cycle counter to zero
+void ResetTimer(void);
+
+// Starts the internal cycle counter
+void StartTimer(void);
+
+// Stops the internal cycle counter
+void StopTimer(void);
+
+// Returns the current number of cycles according to the internal cycle counter,
+// one cycle is one nanosecond of the host's monotonic clock
+unsigned int getCycles(void);
+
+// Returns the time of the host's monotonic clock in nanoseconds
+uint64_t getNanoseconds(void);
+
+#endif
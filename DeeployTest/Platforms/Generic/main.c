@@ -27,26 +27,119 @@
  * limitations under the License.
  */
 
+#include <inttypes.h>
 #include <stdint.h>
+#include <stdlib.h>
 #include <string.h>
 
+#include "CycleCounter.h"
 #include "Network.h"
 #include "testinputs.h"
 #include "testoutputs.h"
 
-int main() {
+#ifndef NUM_THREADS
+#define NUM_THREADS 1
+#endif
 
-  printf("Initializing network...\r\n");
+// Timed inferences of the benchmark mode, 0 runs the network once
+#ifndef BENCHMARK_ITERATIONS
+#define BENCHMARK_ITERATIONS 0
+#endif
 
-  InitNetwork(0, 1);
+#ifndef BENCHMARK_WARMUP
+#define BENCHMARK_WARMUP 10
+#endif
 
+static void copyInputs(void) {
   for (uint32_t buf = 0; buf < DeeployNetwork_num_inputs; buf++) {
     memcpy(DeeployNetwork_inputs[buf], testInputVector[buf],
            DeeployNetwork_inputs_bytes[buf]);
   }
+}
+
+#if BENCHMARK_ITERATIONS > 0
+static uint64_t latencies[BENCHMARK_ITERATIONS];
+
+static int compareLatencies(const void *a, const void *b) {
+  uint64_t const lhs = *(const uint64_t *)a;
+  uint64_t const rhs = *(const uint64_t *)b;
+  return (lhs > rhs) - (lhs < rhs);
+}
+
+// Nearest-rank percentile of the sorted latencies
+static uint64_t percentile(uint32_t p) {
+  uint32_t rank = (p * BENCHMARK_ITERATIONS + 99) / 100;
+  return latencies[rank > 0 ? rank - 1 : 0];
+}
+
+// Prints the results as a single JSON line prefixed with "Benchmark: "
+static void benchmark(void) {
+
+  printf("Warming up with %d inferences...\r\n", BENCHMARK_WARMUP);
+  for (uint32_t i = 0; i < BENCHMARK_WARMUP; i++) {
+    copyInputs();
+    RunNetwork(0, NUM_THREADS);
+  }
+
+#ifdef DEEPLOY_LAYER_PROFILING
+  memset(DeeployNetwork_layerCycles, 0,
+         DeeployNetwork_num_layers * sizeof(DeeployNetwork_layerCycles[0]));
+#endif
+
+  printf("Timing %d inferences on %d threads...\r\n", BENCHMARK_ITERATIONS,
+         NUM_THREADS);
+
+  uint64_t total = 0;
+  for (uint32_t i = 0; i < BENCHMARK_ITERATIONS; i++) {
+    copyInputs();
+    uint64_t const start = getNanoseconds();
+    RunNetwork(0, NUM_THREADS);
+    latencies[i] = getNanoseconds() - start;
+    total += latencies[i];
+  }
+
+  qsort(latencies, BENCHMARK_ITERATIONS, sizeof(latencies[0]),
+        compareLatencies);
+
+  printf("Benchmark: {\"iterations\": %d, \"warmup\": %d, \"threads\": %d, ",
+         BENCHMARK_ITERATIONS, BENCHMARK_WARMUP, NUM_THREADS);
+  printf("\"latency_ns\": {\"mean\": %" PRIu64 ", \"min\": %" PRIu64
+         ", \"p50\": %" PRIu64 ", \"p90\": %" PRIu64 ", \"p99\": %" PRIu64
+         ", \"max\": %" PRIu64 "}, ",
+         total / BENCHMARK_ITERATIONS, latencies[0], percentile(50),
+         percentile(90), percentile(99), latencies[BENCHMARK_ITERATIONS - 1]);
+  printf("\"inferences_per_second\": %.3f, \"layers\": [",
+         total > 0 ? 1e9 * BENCHMARK_ITERATIONS / (double)total : 0.0);
+#ifdef DEEPLOY_LAYER_PROFILING
+  for (uint32_t layer = 0; layer < DeeployNetwork_num_layers; layer++) {
+    printf("%s{\"name\": \"%s\", \"mean_ns\": %" PRIu64 "}",
+           layer > 0 ? ", " : "", DeeployNetwork_layerNames[layer],
+           DeeployNetwork_layerCycles[layer] / BENCHMARK_ITERATIONS);
+  }
+#endif
+  printf("]}\r\n");
+}
+#endif
+
+int main() {
+
+  printf("Initializing network...\r\n");
+
+  InitNetwork(0, NUM_THREADS);
+
+  ResetTimer();
+  StartTimer();
+
+#if BENCHMARK_ITERATIONS > 0
+  // The outputs of the last timed inference are checked below
+  benchmark();
+#else
+  copyInputs();
 
-  printf("Running network...\r\n");
-  RunNetwork(0, 1);
+  printf("Running network on %d threads...\r\n", NUM_THREADS);
+  // Parallel layers fork NUM_THREADS workers and join them before returning
+  RunNetwork(0, NUM_THREADS);
+#endif
 
   int32_t tot_err = 0;
   uint32_t tot = 0;
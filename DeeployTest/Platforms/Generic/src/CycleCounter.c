@@ -0,0 +1,63 @@
+/* =====================================================================
+ * Title:        CycleCounter.c
+ * Description:  Host timer, counts nanoseconds instead of cycles
+ *
+ * Date:         19.10.2026
+ *
+ * ===================================================================== */
+
+/*
+ * Copyright (C) 2026 ETH Zurich and University of Bologna.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the License); you may
+ * not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an AS IS BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#define _POSIX_C_SOURCE 199309L
+
+#include <time.h>
+
+#include "CycleCounter.h"
+
+static uint64_t prev_val = 0;
+static int stopped = 0;
+
+uint64_t getNanoseconds(void) {
+  struct timespec now;
+  clock_gettime(CLOCK_MONOTONIC, &now);
+  return (uint64_t)now.tv_sec * 1000000000u + (uint64_t)now.tv_nsec;
+}
+
+void ResetTimer(void) {
+  stopped = 1;
+  prev_val = 0;
+}
+
+void StartTimer(void) {
+  prev_val = getNanoseconds();
+  stopped = 0;
+}
+
+void StopTimer(void) {
+  prev_val = getNanoseconds() - prev_val;
+  stopped = 1;
+}
+
+unsigned int getCycles(void) {
+  if (stopped) {
+    return (unsigned int)prev_val;
+  } else {
+    return (unsigned int)(getNanoseconds() - prev_val);
+  }
+}
@@ -0,0 +1,3033 @@
+#include "DeeployBasicMath.h"
+#include "bsp/ram.h"
+#include "dory_dma.h"
+#include "dory_mem.h"
+#include "pmsis.h"
+#include "pulp_nn_kernels.h"
+#include "stdint.h"
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "Network.h"
+
+uint8_t *DeeployNetwork_input_0;
+int8_t *DeeployNetwork_output_0;
+
+static PI_L2 int8_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight[864] = {
+    -24, 7,   1,   8,   22,  4,   22,  24,  -15, 0,   20,  -5,  17,  -24, 18,  23,  -19, 21,  24,  -2,  18,  -15, -13, 1,   11,  -1,  -2,  -7,  11,  -4,  -4,
+    -7,  2,   6,   -7,  -9,  -4,  -23, 18,  9,   -14, 10,  8,   18,  8,   -18, 18,  -5,  -8,  12,  24,  1,   5,   24,  -5,  -5,  -8,  11,  2,   -20, -5,  8,
+    -10, -14, 0,   19,  18,  12,  21,  -10, 2,   5,   22,  19,  -5,  -15, -6,  14,  19,  -10, 3,   -6,  -4,  15,  4,   -21, 5,   0,   10,  -12, 9,   5,   -11,
+    -12, 7,   11,  -24, -2,  2,   6,   23,  -11, 10,  24,  25,  -15, 20,  -15, 24,  12,  -6,  16,  -5,  -21, -6,  -23, 22,  4,   -19, -24, 20,  12,  10,  11,
+    9,   -3,  5,   -9,  24,  22,  10,  1,   -22, 11,  -3,  20,  12,  2,   4,   -17, 16,  -18, -12, 8,   -14, -24, -7,  1,   -18, 5,   23,  11,  -1,  -7,  -2,
+    18,  13,  3,   -22, 10,  -19, -5,  -2,  12,  8,   -8,  20,  -1,  -7,  -9,  19,  1,   1,   -3,  -2,  -23, -17, 14,  21,  -16, 21,  23,  -4,  5,   -4,  4,
+    -8,  -22, 19,  -13, 0,   -24, 12,  1,   3,   -22, 8,   2,   -9,  6,   16,  7,   9,   -6,  7,   6,   18,  -21, -6,  -6,  -1,  -5,  17,  -6,  -18, -16, 20,
+    5,   -15, -20, -15, 20,  10,  10,  11,  -14, 1,   3,   2,   16,  17,  1,   13,  -7,  23,  24,  15,  -16, -20, 14,  23,  -10, -16, 6,   20,  17,  -12, 11,
+    1,   3,   21,  21,  6,   17,  3,   23,  10,  11,  15,  22,  23,  0,   5,   -4,  -4,  0,   -5,  16,  21,  22,  -13, -14, -2,  -10, -20, 19,  -16, 14,  19,
+    -8,  14,  20,  -6,  4,   -17, -20, 21,  -8,  -12, -9,  -16, -19, 25,  16,  -10, 21,  -21, 7,   9,   4,   -10, -16, 16,  -1,  5,   -2,  18,  -4,  4,   -6,
+    -20, 6,   -24, -20, -7,  7,   -3,  5,   -15, -9,  14,  -14, -17, 4,   19,  -5,  -8,  -13, -21, -11, -15, 14,  3,   -16, -18, -8,  -16, -15, 23,  24,  -10,
+    -22, -4,  6,   1,   19,  -6,  -14, 13,  11,  13,  -21, 5,   -8,  20,  20,  -21, -7,  -21, -19, 9,   16,  -21, 17,  1,   24,  1,   -4,  -19, 22,  -9,  22,
+    -13, 9,   -9,  16,  -6,  3,   -17, 5,   11,  10,  -8,  -2,  0,   19,  11,  3,   22,  -17, 25,  -11, 18,  20,  12,  21,  -14, 17,  -11, 5,   -22, 20,  -17,
+    15,  15,  8,   0,   18,  25,  4,   9,   16,  19,  25,  13,  5,   -2,  21,  -17, -14, -20, -18, -3,  -23, -7,  16,  19,  16,  1,   18,  10,  -17, 10,  3,
+    -8,  3,   20,  -19, 18,  -17, -9,  -23, -4,  -7,  -20, -20, 24,  16,  14,  -22, 5,   10,  -11, 3,   1,   -17, -6,  7,   -23, -17, -17, -2,  19,  19,  -11,
+    -3,  -19, -17, -10, 21,  -12, 1,   -15, 23,  3,   3,   8,   2,   -4,  17,  0,   -12, -24, -7,  -17, 4,   8,   7,   9,   -7,  5,   -21, -18, -24, -10, -5,
+    20,  10,  12,  -18, -19, 15,  17,  3,   6,   13,  -3,  8,   -15, 4,   -3,  -16, 17,  -13, 11,  -3,  18,  -13, -21, -22, 23,  -8,  -7,  -3,  -22, 8,   -13,
+    21,  -15, -21, -10, 21,  -8,  -16, -2,  -19, 19,  -19, 15,  -17, -11, 10,  -22, 14,  6,   -22, 11,  16,  -21, -4,  -9,  -10, -22, -4,  14,  23,  8,   14,
+    14,  -1,  -7,  -13, 7,   16,  19,  -9,  22,  16,  -6,  -3,  -18, 13,  17,  14,  18,  23,  -19, -3,  -8,  -9,  -19, 23,  4,   14,  0,   7,   -13, 12,  -1,
+    16,  8,   20,  -21, 9,   4,   8,   11,  -9,  -6,  10,  -15, -11, -6,  -20, 22,  10,  -19, -7,  -18, 5,   12,  -19, -6,  -9,  -12, 25,  -23, -24, 4,   14,
+    -11, 13,  -5,  14,  20,  -8,  4,   6,   -12, -10, 0,   10,  8,   -24, 9,   -6,  -18, -18, -15, 11,  8,   7,   12,  21,  -15, -4,  -21, -15, -19, -15, 11,
+    -16, 15,  4,   -13, -2,  2,   20,  14,  10,  2,   -18, -7,  6,   9,   -18, 13,  -5,  12,  13,  -3,  11,  -11, -3,  3,   -21, 14,  -17, -21, 22,  19,  -4,
+    15,  17,  -7,  -14, 1,   15,  3,   19,  8,   -23, 8,   24,  -22, 23,  -22, -7,  6,   -13, -2,  10,  -5,  -15, 9,   12,  -16, 17,  -20, 7,   -1,  -17, -3,
+    9,   1,   12,  -20, 8,   -3,  2,   -19, 18,  5,   -24, 7,   18,  6,   -22, -22, 19,  8,   -16, -5,  -17, -11, -22, 8,   15,  -23, 2,   5,   -13, -3,  -4,
+    0,   12,  18,  24,  -9,  -2,  -17, -16, -14, 22,  15,  14,  23,  -20, 6,   -1,  24,  -12, 8,   -11, 11,  5,   -22, 16,  -19, -2,  -16, -22, -19, -23, 23,
+    -10, -2,  24,  14,  21,  7,   -24, -20, -14, -23, -7,  -7,  23,  -17, 0,   1,   2,   10,  5,   13,  10,  2,   -20, -1,  23,  6,   -2,  24,  25,  -14, -17,
+    -23, -18, 9,   -1,  12,  -21, -22, -13, -10, -16, 3,   16,  24,  -14, -2,  12,  -6,  14,  1,   -6,  -14, 0,   -16, -2,  -17, -14, 15,  -6,  -16, -9,  0,
+    -21, 15,  19,  -1,  -6,  -14, 12,  5,   21,  -19, -1,  0,   17,  0,   14,  -20, 24,  24,  8,   5,   -6,  17,  -14, -11, 13,  -12, 25};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul[32] = {257, 257, 257, 257, 257, 257, 257, 257, 257, 257, 257,
+                                                                                                   257, 257, 257, 257, 257, 257, 257, 257, 257, 257, 257,
+                                                                                                   257, 257, 257, 257, 257, 257, 257, 257, 257, 257};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add[32] = {
+    -1129900, -1315454, -65406,  652395,   -721527, 1460146, -920188, 1115766, -1081327, 1585562, -1316996, 581977, -539057,  1338585, -277945, 929955,
+    1128359,  -1528507, -455018, -1373536, 1113710, 15292,   -329088, -729751, 450907,   1006284, 755966,   313669, -1270736, 980327,  467612,  867504};
+
+static PI_L2 int8_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight[288] = {
+    -30, 27,  25,  3,  -38, 32,  20,  28,  35,  -29, -2,  19,  -23, -36, -2,  -18, -34, 10,  23,  26,  26,  9,   -33, -20, 4,   40,  -11, 37,  -24,
+    -34, -36, -13, 7,  29,  27,  -13, 29,  33,  -19, 37,  -22, -16, 17,  -16, 38,  20,  -12, -27, 26,  36,  3,   30,  -33, -39, 17,  0,   -40, -6,
+    -41, 25,  19,  -4, 24,  -20, 18,  41,  40,  -1,  -7,  -10, -6,  -22, 21,  -34, -25, 6,   41,  26,  31,  40,  10,  -17, -31, -18, -4,  37,  -31,
+    -17, -41, -38, -6, 7,   -15, -2,  40,  13,  3,   4,   37,  -22, -37, 25,  -18, 20,  -36, 9,   -29, 26,  13,  -13, -41, -23, 12,  -11, -40, 13,
+    -16, 34,  -10, 28, -29, -23, -22, 3,   -26, 22,  29,  -11, -34, -32, 42,  -30, -11, -2,  11,  29,  -10, 0,   42,  -39, -36, 13,  -22, -33, 16,
+    -12, 28,  -33, 33, -20, -2,  14,  22,  -27, 13,  -18, -29, 20,  -1,  9,   30,  -12, 41,  -17, -18, 37,  -2,  18,  -1,  -9,  -33, 4,   -42, 31,
+    -14, -38, 37,  -7, 7,   -18, -19, 23,  20,  -32, -14, -25, -28, 28,  -40, -29, -17, -35, 4,   -42, -19, -28, -29, 4,   34,  -23, -15, 18,  29,
+    -17, -31, -5,  30, 20,  10,  32,  25,  17,  21,  -38, 43,  -4,  8,   34,  -23, 1,   41,  35,  0,   1,   28,  10,  10,  -35, 2,   -22, 16,  -32,
+    -14, 25,  8,   40, 42,  -29, -14, 20,  31,  28,  21,  -33, 37,  -18, -17, -26, 26,  12,  -19, -5,  -35, -29, -22, 16,  25,  11,  23,  -2,  -25,
+    1,   12,  14,  23, 39,  0,   42,  -26, -25, -32, -29, -15, -37, -15, 39,  -4,  15,  0,   4,   -39, 29,  33,  -8,  31,  -5,  -18, 38};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul[32] = {514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+                                                                                                   514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+                                                                                                   514, 514, 514, 514, 514, 514, 514, 514, 514, 514};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add[32] = {
+    -1425450, -1751326, -2332146, -381002, 735406,   597140,   -649824, -26856,  409530, 1546498,  -2484290, 887550,  1853356,  -44332,  -1863378, 1436502,
+    -125544,  -2301306, 1709950,  310842,  -2573726, -1977486, 2815050, 1717146, 755966, -1732822, -1142750, 2123720, -1097004, 2319554, 1172306,  -1745672};
+
+static PI_L2 int8_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight[2048] = {
+    -21, -7,  13,  -10, 15,  -21, -11, 17,  20,  -6,  5,   14,  -8,  3,   8,   -14, 10,  21,  16,  -20, -14, -6,  -19, -20, 8,   -10, -15, 0,   -15, 10,  11,
+    -6,  6,   -7,  -16, -16, -21, 9,   1,   -1,  -8,  5,   -5,  8,   4,   -4,  -12, 17,  -2,  -5,  3,   -1,  -20, 2,   0,   -7,  5,   5,   -12, 1,   -19, -2,
+    20,  5,   -14, -7,  -11, -10, 4,   7,   -1,  -21, 20,  -15, 1,   -22, -6,  23,  17,  -2,  10,  20,  9,   15,  14,  17,  -20, 12,  -2,  -18, 3,   -3,  0,
+    22,  -20, -9,  0,   17,  11,  -4,  -17, -19, -19, -9,  17,  -9,  -6,  -9,  19,  -12, -14, 1,   -1,  -4,  0,   -9,  2,   3,   13,  -2,  -11, 0,   6,   23,
+    21,  -3,  -15, 7,   4,   -5,  -17, -9,  -2,  -13, -17, 19,  8,   18,  21,  4,   -3,  19,  22,  -3,  22,  -3,  -2,  21,  -7,  -18, -17, -4,  21,  -5,  -6,
+    1,   19,  -10, -19, -16, 9,   -8,  -16, 0,   -20, -8,  -17, 14,  -20, 13,  -4,  13,  -18, 2,   -18, 21,  14,  -8,  16,  20,  -18, 8,   -12, 11,  -13, 15,
+    3,   20,  5,   -9,  -10, 22,  0,   -7,  5,   -8,  12,  1,   13,  -8,  14,  5,   13,  14,  -16, 3,   -8,  8,   -13, 6,   -4,  -7,  -8,  23,  5,   -16, -3,
+    -8,  -8,  -6,  1,   0,   -13, 20,  -18, -11, 14,  15,  -20, -12, -5,  -17, 21,  21,  -7,  6,   -3,  -14, -18, 19,  -3,  4,   19,  -13, 6,   -8,  12,  23,
+    -15, -3,  -21, 19,  -9,  -17, -10, 4,   13,  -9,  -17, -4,  -12, -6,  -18, 1,   -9,  16,  5,   3,   -6,  4,   15,  14,  14,  5,   -9,  12,  12,  4,   6,
+    1,   12,  4,   1,   1,   16,  -15, -18, -16, 17,  0,   -14, -4,  5,   -2,  -3,  -8,  20,  10,  18,  4,   22,  -7,  -10, 7,   -9,  17,  -21, -19, -18, 3,
+    19,  -4,  -12, -2,  -1,  -12, 9,   7,   -10, -1,  -12, 19,  -7,  15,  -10, 9,   0,   1,   18,  23,  -1,  -20, 19,  -21, 13,  -2,  20,  -1,  -11, 20,  19,
+    5,   -22, -8,  13,  -18, 4,   19,  -12, 9,   3,   -15, -13, 13,  6,   -1,  13,  10,  3,   -6,  6,   -10, 7,   -19, -11, 11,  -4,  3,   -2,  -8,  23,  7,
+    -8,  -10, -5,  -18, -12, -18, 3,   9,   -14, 0,   -15, 5,   18,  10,  -17, 7,   2,   23,  -10, -6,  -22, 9,   -5,  14,  2,   -19, -11, 16,  9,   16,  -4,
+    4,   -17, -10, 16,  -21, 1,   -14, -16, 2,   -2,  16,  -21, -10, 14,  4,   -14, -15, 3,   -8,  -2,  -6,  -17, 12,  13,  -15, -8,  -12, -9,  -9,  20,  20,
+    21,  16,  10,  -20, 4,   16,  19,  19,  -12, 11,  18,  13,  8,   22,  -2,  17,  16,  0,   -12, -18, -8,  -12, -8,  2,   19,  13,  7,   16,  -3,  6,   9,
+    22,  6,   15,  1,   -17, 18,  -19, -16, -17, -18, -1,  7,   -5,  0,   6,   14,  1,   -17, -9,  -22, -16, 13,  -15, 2,   -2,  23,  -14, -11, -5,  0,   1,
+    -16, -6,  -7,  4,   22,  -11, -20, -12, 19,  13,  1,   13,  5,   -14, -5,  0,   19,  7,   7,   22,  -9,  16,  19,  7,   2,   -12, -3,  15,  -11, 10,  -21,
+    2,   18,  -7,  2,   -16, 18,  -1,  -5,  13,  -17, 9,   8,   1,   20,  16,  6,   -1,  -2,  21,  -2,  10,  18,  12,  1,   -9,  -17, 0,   2,   -9,  -10, -2,
+    13,  -1,  3,   20,  8,   -22, 10,  15,  -19, 12,  17,  17,  18,  21,  -5,  -18, 11,  -18, 12,  15,  19,  -1,  15,  18,  10,  -16, 10,  5,   -21, 22,  22,
+    15,  -5,  11,  -12, -15, -7,  -7,  -1,  -17, 0,   -6,  -3,  10,  -13, -16, 5,   -16, -9,  -15, -19, -4,  -6,  5,   -15, -22, -10, -9,  -19, 18,  -5,  0,
+    -8,  1,   -17, -14, -10, 0,   -14, -17, 19,  -6,  -9,  7,   -3,  22,  23,  12,  -17, -9,  15,  7,   -15, 11,  7,   -18, -21, -13, -4,  -2,  -2,  22,  -5,
+    -13, 20,  8,   11,  18,  -17, -12, -12, 10,  13,  5,   -8,  -22, 7,   -8,  14,  -7,  4,   4,   -11, 17,  13,  -21, 21,  22,  16,  -1,  20,  -15, -16, 11,
+    5,   -5,  7,   -19, -19, -9,  23,  -18, 23,  -9,  6,   -6,  -1,  -10, -17, 3,   15,  14,  -4,  21,  5,   23,  5,   -3,  20,  2,   -3,  -20, 1,   -20, -12,
+    14,  0,   -9,  -12, -10, -17, 21,  17,  6,   16,  10,  -22, 23,  4,   -17, 18,  6,   6,   -3,  -13, -21, 14,  13,  -12, -1,  1,   -6,  7,   -11, 8,   21,
+    15,  -6,  -18, 8,   21,  20,  16,  15,  -13, 16,  6,   3,   -16, 13,  -6,  15,  -13, 10,  7,   8,   8,   -14, 9,   8,   -7,  -2,  8,   14,  18,  6,   10,
+    -8,  6,   12,  23,  11,  -6,  -19, 10,  17,  -1,  -6,  -3,  22,  3,   9,   -19, 14,  9,   -13, -3,  2,   7,   -5,  15,  -1,  6,   19,  0,   -2,  -3,  -2,
+    16,  -8,  4,   -6,  17,  -19, 14,  11,  -3,  5,   19,  16,  -20, 5,   -1,  -17, 23,  -16, -12, 13,  8,   13,  10,  4,   -5,  9,   -19, 9,   -8,  19,  -14,
+    -10, 1,   0,   -1,  1,   -10, -17, 22,  -19, -4,  9,   -12, -21, -2,  -7,  14,  -16, 22,  -14, -18, 13,  -4,  10,  -3,  20,  21,  -13, 20,  8,   19,  9,
+    0,   -11, 7,   -14, -12, 16,  -12, 16,  -17, -2,  -8,  11,  3,   15,  -12, -17, 14,  1,   -22, -17, -4,  0,   19,  14,  -11, 4,   16,  -21, 22,  -5,  0,
+    -2,  10,  13,  -17, 8,   -20, 3,   -19, -4,  18,  -2,  14,  -13, 21,  17,  3,   17,  9,   18,  -14, -17, 2,   -22, 10,  6,   8,   -2,  -15, 9,   17,  7,
+    6,   -7,  -15, -20, 10,  1,   15,  -14, -19, -1,  -9,  1,   7,   3,   9,   1,   -21, -9,  -14, 8,   -6,  14,  -21, -9,  15,  11,  13,  -2,  20,  -16, 18,
+    -13, 8,   6,   20,  13,  12,  -11, -21, -4,  -13, 19,  10,  11,  -10, 23,  1,   20,  -8,  0,   15,  16,  -8,  7,   -11, -20, 13,  3,   16,  3,   23,  -18,
+    11,  -9,  -14, 4,   -11, 3,   11,  -22, 10,  8,   21,  0,   -19, 9,   -14, -4,  4,   -6,  6,   11,  -16, 19,  -20, -2,  -15, -10, -19, -8,  1,   -10, 6,
+    1,   -16, -16, -9,  -2,  -11, 16,  9,   17,  -17, 11,  17,  -4,  1,   1,   14,  -16, 5,   -5,  -14, 11,  11,  1,   -10, 11,  -2,  4,   -19, 17,  -13, 1,
+    23,  1,   -9,  12,  15,  6,   -10, 10,  7,   -10, -10, 2,   17,  -16, 9,   -18, -10, -11, -17, -4,  13,  17,  -20, 18,  -8,  17,  -21, 17,  13,  -6,  13,
+    20,  18,  0,   -12, -7,  19,  -2,  -12, 20,  2,   4,   8,   -3,  -21, -12, -15, 7,   8,   -20, 12,  21,  -3,  -2,  23,  17,  15,  21,  16,  -13, -7,  -1,
+    21,  -9,  7,   18,  3,   6,   13,  6,   12,  -11, -3,  -16, 10,  -11, 22,  19,  11,  15,  -14, 20,  -8,  8,   -16, -18, 9,   -16, -9,  10,  11,  1,   0,
+    11,  -18, -20, -6,  -12, -13, 12,  15,  20,  4,   22,  8,   -18, 3,   -14, 11,  -3,  -5,  -16, -11, 5,   -22, 5,   20,  -13, 23,  5,   1,   -9,  3,   -1,
+    13,  -19, 21,  23,  -15, -17, 16,  3,   18,  12,  -3,  -3,  -11, -17, -10, 12,  -15, 20,  17,  9,   -11, -15, -17, 8,   10,  8,   -17, -15, 15,  9,   13,
+    6,   -1,  -5,  -13, 0,   12,  7,   0,   11,  -11, 15,  18,  2,   -22, -15, -17, 20,  21,  -19, 16,  21,  -9,  -3,  -1,  -2,  -11, -3,  17,  13,  21,  7,
+    -2,  14,  18,  10,  -8,  6,   15,  -7,  -3,  12,  -12, -14, 0,   -17, -8,  -20, -17, 12,  5,   19,  21,  13,  -11, 15,  0,   19,  -10, 15,  -16, 11,  -10,
+    18,  12,  18,  9,   13,  5,   10,  -16, -19, 8,   -11, -9,  -2,  -4,  21,  15,  18,  14,  3,   16,  3,   -14, -8,  23,  -18, 3,   -9,  -6,  16,  6,   -1,
+    -21, 8,   8,   11,  -2,  2,   -17, -8,  -17, 3,   6,   -16, 2,   4,   7,   -12, 2,   10,  3,   -14, -19, 9,   22,  0,   2,   19,  19,  22,  22,  6,   19,
+    9,   0,   11,  -11, 13,  10,  3,   -9,  18,  -11, -8,  -4,  -17, -19, -22, 13,  -21, -18, -7,  3,   -13, 0,   -4,  7,   -16, -21, 21,  15,  4,   -20, 23,
+    -12, -18, 3,   3,   19,  8,   -16, 18,  12,  -20, 2,   -15, -10, -3,  -19, 13,  6,   -9,  -22, 7,   20,  -6,  -2,  17,  10,  -1,  13,  -17, 13,  8,   19,
+    -13, -7,  -4,  -3,  7,   -7,  15,  12,  -3,  -17, -5,  -19, -2,  18,  -6,  3,   -3,  22,  -17, -1,  -14, -8,  -6,  -7,  8,   16,  13,  17,  -5,  9,   -3,
+    -20, 20,  11,  0,   5,   -7,  20,  17,  10,  -18, -18, -8,  -8,  2,   -21, -17, -21, 9,   21,  8,   -1,  14,  12,  -7,  -13, -5,  14,  -18, -20, -2,  -18,
+    17,  3,   2,   -10, -4,  4,   -11, -1,  -11, 6,   9,   -13, -19, -21, 16,  -14, 12,  -19, -3,  -5,  1,   -9,  -21, 13,  -19, -19, -13, 5,   -17, 8,   -9,
+    -13, 22,  -16, 20,  11,  9,   -10, 18,  6,   -4,  -9,  23,  17,  23,  23,  -15, -1,  8,   -8,  -12, 3,   1,   18,  -11, 0,   20,  -9,  2,   4,   -1,  19,
+    12,  19,  -16, -1,  10,  -6,  -11, -21, -19, 20,  21,  8,   -6,  1,   5,   11,  1,   -21, 4,   -9,  22,  -13, 21,  -17, 6,   -3,  -21, 17,  -19, -3,  22,
+    0,   8,   12,  4,   -2,  -16, -6,  18,  -16, 5,   17,  15,  12,  -18, -5,  -3,  6,   13,  -13, -3,  -17, -9,  -19, 21,  -7,  -21, 21,  -18, -10, 21,  15,
+    23,  -10, -5,  -6,  13,  13,  -20, -6,  -18, -13, 16,  -6,  19,  2,   17,  11,  8,   9,   17,  3,   -9,  -16, 17,  14,  -10, 1,   10,  -6,  -14, -7,  -12,
+    12,  11,  2,   6,   -11, -20, 5,   -10, 21,  8,   -1,  -12, -11, 4,   -4,  -3,  -16, 20,  16,  5,   -9,  -5,  11,  -8,  4,   20,  -4,  9,   -15, -18, 5,
+    1,   -8,  17,  11,  -8,  21,  22,  -2,  -22, -18, 14,  9,   22,  -1,  9,   4,   10,  14,  -15, 11,  10,  19,  8,   10,  -17, -14, -3,  13,  22,  12,  -13,
+    -5,  5,   -5,  -19, 6,   2,   -1,  11,  -5,  11,  20,  14,  18,  -5,  12,  19,  -6,  -15, -2,  3,   10,  -20, 21,  -12, -11, 13,  14,  -4,  -15, 14,  13,
+    -10, 2,   1,   6,   -10, 6,   20,  -7,  16,  -1,  -3,  -9,  -17, -21, 6,   9,   -15, 4,   -1,  -20, -18, -14, 11,  0,   -11, 15,  -21, 2,   0,   -1,  -5,
+    23,  8,   1,   -1,  -1,  14,  -20, -19, 23,  10,  -5,  -13, -11, -7,  -10, -13, -7,  3,   -4,  0,   -20, -18, -5,  13,  1,   -8,  3,   6,   -16, -17, 0,
+    13,  -16, 20,  -9,  0,   21,  -8,  2,   10,  21,  -11, 19,  17,  -2,  19,  -6,  -6,  -7,  -10, 12,  17,  1,   17,  -19, 7,   -12, -20, 8,   7,   -21, 15,
+    8,   9,   -13, -1,  -12, -11, 9,   12,  -7,  -7,  19,  16,  15,  -12, -18, -20, -5,  22,  11,  21,  -20, 10,  -3,  11,  2,   18,  12,  -14, -15, -13, -14,
+    -16, -10, 3,   -6,  -15, 22,  13,  20,  -21, -11, -17, 4,   -1,  2,   4,   14,  2,   -9,  -2,  1,   -16, -17, 3,   -16, -1,  -10, -19, 1,   2,   4,   15,
+    -9,  13,  7,   -22, 5,   19,  5,   -2,  -18, -5,  16,  23,  12,  -11, -15, 15,  -4,  1,   20,  12,  -5,  -1,  -8,  14,  -20, -9,  -17, -14, 19,  -6,  -20,
+    -17, -7,  -11, 0,   3,   15,  0,   6,   7,   19,  -18, -8,  5,   10,  9,   13,  -21, 14,  -3,  9,   7,   -7,  22,  -22, -14, -21, 14,  -2,  -16, 7,   9,
+    13,  -7,  7,   -18, 16,  6,   -20, -8,  -16, 14,  -4,  -21, 7,   -9,  6,   17,  -1,  -15, -3,  -13, 2,   18,  -18, -4,  -18, -19, -10, 16,  18,  -3,  -16,
+    -10, 9,   -22, 10,  -18, -16, -13, 5,   -19, -6,  22,  8,   1,   4,   -15, -2,  -14, 0,   -19, 23,  -14, 0,   2,   21,  13,  -6,  -4,  4,   22,  19,  -4,
+    -9,  -7,  -10, -16, 21,  8,   23,  0,   15,  -21, 2,   3,   9,   10,  -19, -17, 0,   -10, -6,  12,  7,   8,   15,  -10, -22, 5,   0,   -16, 10,  -17, 2,
+    -2,  11,  12,  0,   11,  -18, -11, 0,   -19, -20, -11, 18,  21,  12,  18,  1,   20,  -13, -8,  -15, -6,  -11, 10,  -2,  9,   -18, 1,   -4,  -17, 18,  23,
+    -13, -1};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul[64] = {
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add[64] = {
+    1070020, 410044,   -902198, -923786,  745686,  123232,  -37136,   1056142, -246848,  415184,  -749026, 1347066, -74144,   1354262, 310328,   964136,
+    -335256, -834864,  189024,  -1284100, 1258144, 663960,  -1407460, 1187212, -1232186, 1365056, 1145578, -175402, 101130,   46132,   -1093406, 1346552,
+    -164608, 1415428,  305188,  -771128,  -978784, -892432, -482260,  -610760, -974672,  1065394, -628236, 322664,  556020,   1196464, -684776,  -1168450,
+    1093664, -1136068, 11694,   -583518,  -124516, -590714, 1350150,  -340910, 124774,   544198,  1181558, 106784,  -1426992, -233998, 728724,   453220};
+
+static PI_L2 int8_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight[576] = {
+    17,  2,   6,   40,  -28, 22,  -2,  -28, -35, 24,  39,  23,  -34, 36,  42,  12,  -14, 31,  -6,  -33, -15, -19, -7,  -22, -4,  -29, 1,   -23, -40, 27,  41,
+    -35, 24,  21,  -40, -24, 18,  -36, 9,   -1,  -2,  16,  -20, 20,  -39, 21,  -35, -40, -17, 19,  28,  23,  37,  -26, 1,   34,  8,   38,  12,  -31, 10,  28,
+    26,  43,  19,  18,  15,  -11, 5,   14,  14,  6,   -13, -1,  42,  20,  -12, -4,  18,  0,   -9,  -20, 14,  19,  27,  0,   8,   -2,  -12, -21, -29, 32,  9,
+    -34, 24,  -6,  2,   32,  -29, 18,  5,   -40, 37,  -19, -23, 10,  -33, 10,  -28, -9,  37,  -4,  -2,  39,  -18, 1,   39,  14,  40,  11,  8,   -3,  -27, -26,
+    23,  30,  23,  -17, -10, 36,  0,   33,  30,  31,  -32, 10,  39,  17,  29,  35,  34,  32,  19,  22,  36,  41,  -34, 2,   9,   -11, 29,  36,  28,  41,  -28,
+    26,  -14, -25, -1,  0,   37,  -21, 28,  -30, 3,   14,  6,   0,   -39, 3,   40,  -41, 42,  11,  -41, -28, 34,  -25, 21,  4,   -37, -14, -8,  11,  24,  2,
+    -38, 14,  -38, 37,  4,   -40, 2,   37,  31,  -30, -15, 19,  8,   23,  -30, 21,  14,  17,  14,  14,  -26, 36,  23,  0,   28,  -9,  24,  -14, -16, 20,  36,
+    22,  9,   -35, -40, -1,  -23, -37, -17, -17, -15, 21,  22,  -35, 1,   -21, 8,   -19, -39, 30,  -3,  -32, -22, -15, 39,  37,  -26, -4,  2,   -29, 15,  -35,
+    -13, 31,  33,  -27, -29, 14,  -22, 16,  -40, 32,  30,  -20, -40, 4,   -19, 26,  21,  0,   -24, 36,  -8,  -17, 16,  42,  41,  -2,  -15, -5,  -33, -7,  37,
+    -39, -39, -30, -22, -10, 28,  24,  -12, -27, 18,  0,   -15, -10, 5,   -5,  35,  -33, -26, 29,  -8,  32,  -15, -41, 38,  -21, -11, -1,  -1,  10,  38,  30,
+    -40, 0,   -42, 30,  -12, -25, 1,   21,  13,  40,  1,   -21, 10,  -3,  -32, -34, 3,   36,  23,  -16, 34,  -36, -32, -22, -13, -8,  41,  -37, 42,  32,  -11,
+    -28, 7,   23,  29,  28,  6,   16,  -20, 32,  -39, -24, -19, 7,   -32, -2,  -28, 20,  -30, 4,   41,  32,  3,   -7,  -8,  -28, 8,   -23, -30, -18, -16, -2,
+    23,  -6,  2,   -16, 33,  -9,  26,  23,  -1,  14,  -27, 1,   22,  41,  -8,  21,  14,  -4,  -9,  37,  -4,  12,  -14, 13,  30,  -20, 16,  -9,  15,  -28, 35,
+    -33, 25,  -26, 39,  -10, 42,  2,   6,   41,  -5,  -27, -21, -21, 24,  41,  20,  14,  24,  23,  -39, 33,  -25, 21,  32,  -37, -32, 25,  42,  33,  -1,  1,
+    -6,  25,  35,  -26, -23, 31,  37,  42,  30,  -19, 11,  -26, -28, -16, -28, -3,  -17, -9,  -21, -39, -2,  6,   7,   3,   30,  -36, 43,  -17, 10,  11,  13,
+    43,  -18, -42, -22, 22,  -22, 2,   -17, -32, -29, -25, 10,  -35, 29,  -26, -25, 30,  42,  33,  -22, 33,  15,  -42, 40,  -5,  -33, 15,  -26, -14, -19, 19,
+    -12, 36,  -27, -25, -24, -41, 29,  -28, 13,  12,  16,  38,  41,  -21, -23, -28, 9,   5,   -39, -32, 3,   5,   -33, -19, -9,  -3,  36,  -38, 8,   28,  23,
+    36,  30,  -23, -31, 12,  20,  31,  -20, 25,  -27, -22, 17,  -37, -35, -9,  -35, 9,   6,   -18, -9,  -25, -11, 4,   -4,  -12, -4,  19,  -32, 23,  0,   20,
+    -32, -4,  -31, -31, -38, 2,   -42, 18,  37,  -17, 39,  -7,  -3,  29,  16,  -2,  -25, 2};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul[64] = {
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514,
+    514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514, 514};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add[64] = {
+    -2473496, 311356,  -1594556, -838976,  -1586332, -44332,  -1392554, -62322,   1768546, -1962580, 468640,   -856966,  -2678068, 362756,  1150204,  -436000,
+    891148,   507704,  550880,   1405662,  -146618,  -981354, -229372,  -1313912, 672184,  -564500,  -2289484, 340140,   -2720216, -186196, 921988,   -28912,
+    -1676796, 1396410, 941006,   1986996,  -410300,  405932,  1390756,  962080,   -70032,  450650,   836664,   -1851042, -395394,  -987008, -1692216, -2580922,
+    1433418,  2801172, -2358360, -1172562, -1863378, -23772,  882924,   1568600,  -973644, -389740,  -1125274, 680922,   1102402,  -9894,   -1246578, 2539032};
+
+static PI_L2 int8_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight[2560] = {
+    -2, -2, 3,  1,  1,  2,  7,  -3, -6, 6,  -5, 3,  -4, 4,  8,  4,  5,  6,  8,  -3, -2, -4, 7,  2,  -6, -4, 8,  -6, -2, -3, -6, -5, 6,  6,  -1, -5, -4, 8,  5,
+    8,  -5, -7, -5, 8,  4,  2,  -5, 5,  2,  4,  -2, 3,  -1, -6, 5,  -4, -2, -7, 2,  8,  3,  1,  4,  -4, 8,  2,  7,  -7, 6,  3,  -2, -1, 4,  8,  7,  2,  3,  -2,
+    -2, 4,  3,  8,  -6, -2, -7, 0,  0,  1,  0,  5,  -1, 3,  4,  -1, 7,  -7, 0,  0,  2,  -5, 1,  -6, -2, 6,  3,  6,  -1, 0,  -6, -4, -4, 1,  3,  0,  4,  4,  6,
+    -7, 1,  -5, 2,  -4, -3, -3, 7,  1,  -6, 0,  4,  8,  -5, -3, -3, -3, -1, 2,  -2, -3, -1, -3, -6, -1, -7, 7,  -4, 7,  2,  -1, -2, -3, 6,  4,  8,  -7, 1,  -4,
+    -2, 8,  7,  -3, 4,  7,  -6, 5,  -2, -5, 8,  1,  6,  -4, -7, 8,  4,  -3, 8,  8,  -1, 0,  5,  -4, -7, 4,  8,  8,  -6, 7,  2,  2,  6,  7,  -3, 3,  7,  2,  8,
+    -5, 5,  6,  0,  -2, -4, 0,  0,  2,  -7, 2,  3,  0,  5,  -6, -1, 5,  1,  1,  5,  2,  -3, 4,  -2, -2, -2, 8,  0,  -7, 4,  -3, -1, -5, 2,  -5, -5, 5,  -5, 2,
+    7,  -6, -4, 8,  0,  -1, -2, -6, -4, 3,  5,  5,  1,  5,  3,  8,  -1, 3,  8,  -6, 1,  5,  2,  7,  1,  -7, -6, 2,  6,  5,  0,  0,  -4, 4,  2,  0,  -2, -4, 7,
+    -1, -6, 4,  -5, 3,  5,  4,  2,  6,  -5, 0,  -2, 3,  -2, 0,  -6, 8,  3,  7,  1,  -6, 2,  -7, -7, 3,  2,  -2, 1,  -5, -5, 1,  6,  5,  -7, 5,  3,  2,  1,  2,
+    -7, -4, 2,  7,  -1, 8,  -2, -7, 5,  5,  -1, -2, 5,  4,  1,  5,  7,  2,  5,  -1, 1,  -3, -6, 1,  7,  -2, -1, 8,  6,  -1, -7, -2, 5,  -7, 7,  -2, 5,  8,  -7,
+    3,  -3, 4,  -1, 4,  4,  -2, -2, 3,  6,  -6, -1, -4, -6, 3,  4,  -5, 0,  0,  6,  -1, -7, 0,  5,  6,  2,  3,  -1, 1,  3,  5,  2,  8,  3,  -2, 4,  6,  -2, 4,
+    6,  4,  5,  2,  3,  3,  -4, -5, -1, -4, 7,  6,  -1, 6,  7,  -3, -6, 6,  0,  -1, -4, -4, -4, 3,  1,  3,  4,  1,  -2, -2, 8,  6,  3,  -3, 2,  6,  1,  7,  -7,
+    8,  3,  -7, -1, 8,  8,  -6, 4,  -3, -5, 7,  7,  2,  2,  2,  8,  -7, 1,  0,  6,  7,  -3, 7,  -7, 8,  3,  -2, 8,  -4, -4, -2, -6, -4, -7, -3, 3,  -3, 6,  5,
+    -5, 6,  -5, 8,  0,  7,  -4, 0,  0,  3,  2,  -5, -2, -5, -1, -3, 2,  2,  -4, -4, 1,  6,  -6, -3, 7,  0,  8,  -6, -4, 7,  6,  -5, 7,  0,  -2, 2,  6,  -3, -7,
+    6,  5,  3,  8,  -2, 7,  -5, -7, 0,  -5, 7,  -5, 1,  1,  0,  3,  -1, 0,  -1, 3,  -5, 8,  7,  6,  5,  -4, 5,  -4, 0,  4,  7,  1,  5,  -2, 3,  -3, -5, -3, 8,
+    -2, 4,  -6, 1,  -4, 6,  2,  -1, 6,  2,  7,  8,  8,  -1, -6, 5,  -5, -1, 8,  -6, -7, -2, -1, -5, 6,  -2, -1, 5,  4,  6,  7,  -4, -7, -5, 3,  2,  1,  -5, -4,
+    1,  -3, 1,  -1, -4, 5,  -6, 2,  6,  -2, -5, 7,  7,  -3, -7, 3,  6,  -3, 3,  8,  -1, -4, -7, 2,  7,  5,  2,  2,  -2, -1, 6,  0,  5,  -7, -6, 1,  6,  -3, 4,
+    4,  2,  4,  7,  -7, 5,  6,  -2, -3, 4,  3,  -3, -7, -1, -5, -2, -3, 0,  -3, -2, -4, 7,  -2, -1, -1, -6, 2,  8,  0,  4,  6,  -1, -3, 1,  -7, 4,  -3, 1,  2,
+    -1, -4, 4,  -4, -3, 2,  1,  2,  0,  -6, -4, 8,  -3, -7, 1,  -7, 3,  -4, 6,  -7, -1, -1, 0,  -5, 4,  -4, 8,  -2, 0,  -4, 1,  -7, 6,  -3, -3, 4,  1,  -6, 1,
+    -7, -6, -3, -1, 3,  -4, -1, 6,  -3, -1, 1,  6,  0,  6,  -4, -5, 2,  -7, 2,  4,  1,  -6, 3,  6,  -4, 3,  2,  5,  6,  -4, 0,  -3, -5, -5, 1,  -5, -4, -5, 4,
+    -7, 6,  6,  8,  5,  5,  -2, 4,  8,  -4, 3,  7,  0,  3,  -6, -1, -7, -5, 7,  8,  -6, 2,  8,  5,  0,  5,  -1, 2,  -5, 3,  -6, -7, 3,  4,  0,  8,  -4, -5, 2,
+    1,  5,  7,  -5, 5,  8,  5,  7,  -5, 3,  3,  -5, 3,  -3, -5, 8,  -1, 4,  1,  4,  7,  -2, -3, -1, 4,  -4, 1,  -5, 1,  8,  6,  -1, 6,  -4, 7,  0,  -6, -7, -2,
+    7,  -4, 3,  5,  0,  0,  1,  -6, 4,  7,  -2, 8,  -4, 4,  2,  -7, 2,  0,  -5, -1, 2,  -3, 0,  -6, 5,  -7, -5, -3, 6,  -6, -5, 2,  -6, -2, 2,  -7, -7, 1,  8,
+    4,  5,  -3, 1,  3,  -7, 7,  4,  7,  -3, 3,  1,  7,  -6, 0,  -5, 0,  0,  6,  7,  -4, -5, 4,  -3, 5,  -4, 8,  7,  0,  0,  6,  0,  3,  3,  -4, 2,  0,  4,  4,
+    -4, 1,  1,  0,  3,  -5, 6,  1,  6,  5,  -7, -4, -3, 5,  2,  1,  -5, 8,  -6, 1,  -2, -4, 3,  7,  -7, 6,  2,  -7, -4, 0,  -1, 8,  4,  -5, -4, 0,  -5, 8,  5,
+    2,  -4, -7, 6,  -4, 5,  7,  -3, -3, 1,  1,  5,  -4, -4, 1,  5,  0,  8,  -5, 5,  7,  5,  8,  8,  -1, 8,  4,  -2, 4,  -5, 8,  -7, 2,  4,  8,  8,  8,  -4, -4,
+    3,  -4, -4, 1,  -2, 8,  -6, -1, 8,  5,  2,  3,  -2, 5,  6,  8,  8,  -3, 6,  -2, -1, 2,  -2, -3, 8,  -7, -3, -4, 8,  -1, -6, 4,  -6, -5, 0,  5,  4,  0,  3,
+    4,  3,  -6, -3, -3, 5,  7,  -7, 3,  3,  -7, -4, -5, 3,  0,  6,  -6, -5, -1, 2,  -2, 2,  -6, 7,  5,  1,  6,  7,  4,  -1, 7,  6,  5,  -4, -6, 8,  -5, 6,  4,
+    -1, 0,  8,  -3, 3,  -6, -1, -1, -6, 1,  -6, -4, 7,  -7, 5,  -6, -3, -1, -2, 8,  -7, 4,  1,  7,  -6, 3,  -7, 8,  -1, 6,  6,  0,  3,  -1, -3, 6,  -1, -2, -5,
+    8,  6,  -1, 5,  -7, 4,  4,  3,  8,  3,  5,  7,  -1, 1,  0,  -5, 6,  6,  1,  0,  7,  5,  -2, 6,  -5, 1,  -7, 8,  -2, 5,  -5, 2,  -1, 3,  3,  -4, 3,  0,  -5,
+    4,  7,  -2, 5,  0,  3,  -1, 1,  -3, -5, 5,  2,  -2, -5, 6,  -6, -6, 7,  -6, -3, 5,  -5, 8,  -2, 8,  4,  -2, 7,  -7, -3, 5,  7,  5,  5,  -5, -1, 3,  6,  6,
+    4,  2,  0,  -5, -4, 8,  0,  5,  4,  8,  -7, -5, 7,  -4, 7,  -3, 3,  -4, -5, 0,  3,  5,  -2, -3, -7, -6, 6,  -3, 8,  -7, -7, 2,  -5, -6, -5, 3,  1,  -5, -5,
+    5,  -3, 7,  -1, -3, 5,  2,  -4, -5, -3, 5,  1,  -2, 0,  1,  0,  7,  1,  8,  7,  -2, 1,  6,  7,  6,  7,  8,  0,  5,  -5, 0,  5,  0,  5,  -5, -6, 3,  0,  -3,
+    4,  6,  0,  -5, 6,  -6, -2, -4, -5, 8,  6,  1,  -2, 5,  7,  -7, 2,  6,  1,  -3, -6, -5, -4, -5, -3, -4, -7, 7,  -1, 2,  7,  4,  -3, -4, -7, 2,  1,  -5, -5,
+    4,  7,  -2, -1, -5, 6,  8,  3,  1,  -4, -2, 3,  -2, 6,  -6, -6, -4, -6, 2,  -4, 4,  5,  6,  -3, 7,  0,  -6, -3, -1, -4, -5, 7,  4,  4,  0,  -5, -2, 2,  8,
+    -7, 1,  4,  0,  2,  2,  5,  4,  8,  0,  2,  -7, -6, 1,  0,  2,  -5, 5,  1,  -6, 7,  6,  6,  -7, -2, 0,  -5, 5,  3,  6,  8,  -5, -6, 6,  -5, -7, 7,  -4, 0,
+    1,  2,  -6, 8,  -7, -2, 7,  0,  -7, 5,  -1, -2, -7, 4,  -6, -4, 6,  7,  -2, 6,  7,  -6, -5, 7,  5,  6,  2,  8,  4,  3,  -6, -7, -3, 8,  3,  -2, -4, -6, 3,
+    7,  1,  -3, -5, 5,  -2, 1,  -4, 1,  0,  7,  6,  2,  -4, -5, -4, 8,  -3, 2,  5,  -3, -2, -3, -7, 1,  -6, 4,  8,  5,  -1, -2, 5,  -3, 0,  1,  -3, 4,  4,  0,
+    8,  -7, 4,  -6, 0,  0,  -1, 7,  2,  -2, 4,  8,  -7, 7,  1,  -6, -3, 5,  6,  -6, 5,  -1, -6, 0,  -7, 7,  2,  -6, -5, -6, -3, 0,  1,  -4, 7,  7,  -2, 0,  1,
+    1,  -7, -1, -7, -2, -1, -2, -4, 6,  7,  8,  7,  8,  -3, -2, 5,  8,  -7, 4,  -1, 7,  6,  -2, 4,  8,  6,  -2, -5, -7, -2, -6, 2,  4,  3,  5,  8,  -5, 2,  -3,
+    1,  -4, -5, 5,  -7, 4,  7,  -5, 3,  6,  -2, 0,  -5, -4, 2,  6,  4,  -3, 3,  0,  8,  4,  -5, 3,  3,  2,  3,  -5, 2,  3,  -3, -6, -1, 7,  -5, -1, 1,  8,  5,
+    -1, -6, -2, -5, -3, 7,  -4, 7,  -3, 6,  7,  7,  0,  7,  -6, 8,  7,  -1, 3,  6,  -3, -4, -5, -1, 1,  -6, -4, 4,  4,  -5, -5, 7,  2,  7,  7,  -3, -7, -1, -6,
+    -7, 8,  -2, 2,  -1, 7,  -3, -7, -7, 5,  8,  1,  -2, 0,  -7, 8,  -7, 0,  -7, -1, -2, -3, -4, -1, -7, -1, 3,  8,  3,  -5, 3,  -1, 0,  -3, 4,  7,  -4, -1, 3,
+    8,  -2, -4, -2, -5, 6,  -5, -3, -2, 6,  1,  -4, 2,  0,  3,  -6, 4,  -4, 1,  4,  5,  -6, -6, -7, -1, -3, -4, -4, -7, -5, 8,  6,  4,  -3, 4,  -5, 6,  7,  -1,
+    5,  -2, -4, -7, 8,  -7, -7, -6, -4, 7,  8,  -5, 4,  -5, 6,  -6, 6,  -5, -7, 8,  8,  1,  8,  8,  1,  -6, 2,  -1, -1, 3,  -6, 0,  -4, 0,  6,  0,  5,  -5, 4,
+    8,  -4, 8,  -5, -7, -5, -3, -2, -2, 8,  8,  4,  -3, -1, 6,  -6, -2, -2, 4,  0,  -4, -2, -3, 3,  -7, 1,  -5, 2,  0,  3,  4,  7,  0,  4,  5,  1,  3,  -1, 6,
+    6,  -3, -1, 2,  7,  -4, -4, -2, 6,  -5, 5,  -3, -4, -2, 8,  -2, -3, -1, 6,  -2, 5,  0,  0,  1,  4,  -3, -5, -6, -5, 2,  4,  4,  -6, 5,  -1, -1, -7, -6, -3,
+    0,  -5, 1,  5,  -5, -4, -4, 5,  -1, 7,  -2, 0,  -4, 7,  3,  0,  -5, -6, -4, -3, -1, 2,  7,  8,  -3, 1,  -6, 5,  8,  2,  5,  -2, 5,  7,  -5, -1, 0,  -6, 1,
+    -7, 1,  -1, 6,  -5, -4, 8,  6,  2,  -4, 4,  -4, -1, -7, 3,  -2, -4, 3,  8,  6,  4,  -4, -7, 5,  0,  6,  -6, 5,  -1, -7, -4, 2,  -3, 8,  0,  3,  -6, 0,  -2,
+    1,  1,  -3, 2,  2,  -3, -1, 5,  -2, 7,  6,  0,  -7, 7,  -3, -2, -2, 6,  -3, -4, -2, 8,  7,  6,  -2, 0,  -7, 4,  -7, 5,  -5, -6, 1,  -1, 8,  6,  7,  8,  -6,
+    7,  8,  -1, 7,  4,  3,  5,  7,  3,  5,  -5, 8,  7,  8,  -4, 4,  -1, -4, 2,  -4, 6,  -3, -2, -5, 6,  -1, -6, 6,  -4, -5, 4,  4,  -6, 4,  8,  -1, 7,  1,  -7,
+    2,  0,  8,  1,  -1, 2,  -7, -4, 2,  3,  0,  3,  7,  2,  -1, -2, 5,  -5, 5,  -5, 1,  -4, 6,  4,  1,  -1, -2, -7, -7, -2, 2,  -4, -4, -3, -2, -4, -7, 6,  2,
+    -3, 1,  -1, -3, 4,  -7, 1,  -6, -4, 8,  -3, -3, 4,  -5, 3,  0,  4,  -5, -6, -1, 8,  3,  5,  5,  6,  5,  -1, 5,  8,  5,  -7, -2, -2, 8,  8,  -7, -5, -5, 2,
+    8,  5,  -2, 7,  7,  -3, -7, 0,  -1, 6,  1,  6,  7,  8,  5,  5,  -3, 5,  0,  1,  -2, 7,  -3, 7,  -3, 5,  -2, 1,  2,  7,  7,  8,  6,  0,  3,  8,  2,  7,  -2,
+    -1, 7,  8,  6,  3,  4,  0,  -1, 5,  -5, 8,  0,  4,  -7, -4, -6, -3, 2,  -5, -5, 3,  -5, -3, 1,  -3, 1,  2,  7,  -4, -5, 5,  -5, 0,  0,  -1, -2, -1, 1,  -3,
+    -4, -7, -2, -6, 2,  5,  0,  -7, 0,  -4, 3,  7,  4,  -7, -3, 7,  8,  -4, 2,  -6, -4, -2, 2,  -3, 1,  -6, 6,  7,  5,  0,  -5, -7, 5,  3,  -7, 7,  -4, 8,  -5,
+    8,  -3, -5, 4,  -5, 0,  7,  0,  -6, -5, 1,  5,  -5, -5, -4, -1, 0,  6,  4,  -2, -6, 0,  -4, 4,  6,  -7, -5, -2, -6, 6,  -2, 4,  5,  7,  1,  -2, 1,  5,  -2,
+    5,  8,  -2, 5,  6,  0,  2,  4,  7,  5,  8,  2,  -2, -4, -3, 2,  -3, -5, -5, -2, -1, -1, 3,  -2, -5, 1,  -2, -3, 8,  -5, 3,  8,  0,  -1, 4,  6,  -2, 0,  -2,
+    5,  7,  -4, -1, -2, -1, 6,  6,  -4, -4, 8,  -7, 2,  -6, -4, -3, 4,  7,  4,  0,  -1, -2, -3, 8,  2,  5,  6,  -7, -1, -6, -3, 6,  8,  4,  2,  6,  5,  7,  0,
+    -6, 1,  -5, 6,  1,  -6, 6,  -6, 7,  0,  2,  7,  8,  -1, 1,  -2, 7,  8,  -3, -1, 3,  6,  -7, 3,  2,  -3, 4,  -1, 3,  -3, 8,  5,  3,  -2, 7,  8,  -1, -7, 4,
+    5,  3,  3,  -3, -2, -4, 0,  8,  7,  6,  5,  0,  5,  7,  -1, 8,  1,  -2, -4, 7,  5,  -1, -2, -6, 7,  -2, -6, 0,  -7, 5,  -1, 4,  -7, 1,  6,  -4, -2, -7, 5,
+    5,  3,  0,  2,  6,  0,  -7, 6,  2,  8,  -4, 7,  5,  -5, -7, -5, -2, 7,  3,  0,  7,  8,  -7, 8,  -7, 6,  -2, -6, -2, 5,  4,  4,  4,  -5, 1,  -3, 2,  3,  3,
+    -3, 7,  5,  7,  -1, 1,  -4, 3,  6,  -3, 5,  4,  1,  -7, -1, 3,  6,  6,  5,  0,  -1, 4,  8,  -2, -3, 0,  -5, -3, -1, -5, 3,  -3, -7, 4,  4,  2,  4,  -1, -4,
+    -7, 7,  5,  2,  4,  -3, 8,  4,  -5, -1, -6, -2, -2, -6, 6,  1,  -4, -7, -7, -5, 1,  2,  -2, -1, -6, 3,  0,  1,  -6, 1,  6,  4,  -3, 3,  -1, 6,  -5, 0,  4,
+    0,  -2, 3,  -1, -3, 5,  5,  -3, -1, 6,  -6, 1,  -7, 2,  -3, 6,  7,  8,  -6, -5, -3, -2, 6,  -4, 2,  0,  -1, 3,  -1, -1, 0,  3,  -6, -3, 6,  0,  5,  -7, -6,
+    5,  0,  -1, -1, 3,  -2, 4,  -6, 2,  5,  -3, 1,  5,  2,  8,  -6, 5,  6,  -5, 0,  -3, -5, 5,  -5, 5,  -3, 4,  3,  8,  0,  2,  -7, 5,  -5, 0,  -1, -5, 3,  2,
+    4,  -6, 1,  -6, -6, 3,  2,  -1, 3,  -7, -2, 7,  2,  1,  -2, 7,  7,  0,  -2, 4,  -6, 8,  5,  1,  0};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias[10] = {-179000, 165894, 98046,  -310070, 263040,
+                                                                                             164352,  307244, -42276, -72602,  -268950};
+
+static PI_L2 int32_t DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul[10] = {514, 514, 514, 514, 514, 514, 514, 514, 514, 514};
+
+int8_t *DeeployNetwork_MEMORYARENA_L2;
+int8_t *DeeployNetwork_MEMORYARENA_L1;
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_numTiles[2] = {0, 1};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ch_im_out[1] = {24};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_numTiles[2] = {0, 2};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_numTiles[2] = {0, 1};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ch_im_out[1] = {10};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ch_im_in[1] = {10};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_numTiles[2] = {0, 4};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ch_im_out[1] = {17};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_numTiles[2] = {0, 4};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_dimLen_3[1] = {62};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_numTiles[2] = {0, 2};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ch_im_out[1] = {11};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ch_im_in[1] = {11};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_numTiles[2] = {0, 6};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_numTiles[2] = {0, 1};
+
+static PI_L1 uint16_t DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_O[1] = {6};
+
+static PI_L2 uint8_t DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_numTiles[2] = {0, 2};
+
+void *DeeployNetwork_inputs[1];
+void *DeeployNetwork_outputs[1];
+extern struct pi_device cluster_dev;
+typedef struct {
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // Transpose [1, 3, 8, 8] -> [1, 8, 8, 3] (Name: _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn, Op: Transpose)
+  BEGIN_SINGLE_CORE
+
+  const uint32_t coreId = pi_core_id();
+
+  uint16_t dimLen_0 = 1;
+
+  uint16_t dimLen_1 = 3;
+
+  uint16_t dimLen_2 = 8;
+
+  uint16_t dimLen_3 = 8;
+
+  for (uint32_t i_0 = 0; i_0 < dimLen_0; i_0++) {
+
+    const uint32_t baseChunk = dimLen_2 / NUM_CORES;
+    const uint32_t leftover = dimLen_2 - baseChunk * NUM_CORES;
+    const uint32_t offset = baseChunk * coreId + (coreId < leftover ? coreId : leftover);
+    const uint32_t chunk = coreId < leftover ? baseChunk + 1 : baseChunk;
+    for (uint32_t i_2 = offset; i_2 < offset + chunk; i_2++) {
+
+      for (uint32_t i_3 = 0; i_3 < dimLen_3; i_3++) {
+
+        for (uint32_t i_1 = 0; i_1 < dimLen_1; i_1++) {
+
+          ((uint8_t (*)[dimLen_2][dimLen_3][dimLen_1])
+               DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out)[i_0][i_2][i_3][i_1] =
+              ((uint8_t (*)[dimLen_1][dimLen_2][dimLen_3])
+                   DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in)[i_0][i_1][i_2][i_3];
+        }
+      }
+    }
+  }
+  END_SINGLE_CORE
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in;
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in =
+                                                                        DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in,
+                                                                    .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out =
+                                                                        DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint8_t *DeeployNetwork_input_0;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args;
+  uint8_t *DeeployNetwork_input_0 = args->DeeployNetwork_input_0;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in = (uint8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  uint8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out = (uint8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 192);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 192,
+                 .mchan_cmd = 1310912,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in =
+      (DMA_copy){.ext = DeeployNetwork_input_0,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 192,
+                 .mchan_cmd = 1441984,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_numTiles
+           [*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_numTiles
+                      [(*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.ext = ((char *)DeeployNetwork_input_0) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.length_1d_copy = (192);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in.mchan_cmd = (1441984);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in from DeeployNetwork_input_0
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in);
+
+    _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args =
+        (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in =
+                                                                        DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_in,
+                                                                    .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out =
+                                                                        DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork,
+                    &DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.length_1d_copy = (192);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out.mchan_cmd = (1310912);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out from
+    // DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint8_t *DeeployNetwork_input_0;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args;
+  uint8_t *DeeployNetwork_input_0 = args->DeeployNetwork_input_0;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args_t){.DeeployNetwork_input_0 = DeeployNetwork_input_0,
+                                                             .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In =
+                                                                 DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+                                                             .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr =
+                                                                 DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out;
+  uint8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_0_tiling_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_0_tiling_closure(void *_MERGE_CONVRQ_PASS_0_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_0_tiling_closure_args_t *args = (_MERGE_CONVRQ_PASS_0_tiling_closure_args_t *)_MERGE_CONVRQ_PASS_0_tiling_closure_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out;
+  uint8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // PULP NN CONV
+
+  pulp_nn_conv_u8_i8_i8(DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in, DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer, NULL,
+                        DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight,
+                        DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add, 1, 16,
+                        8, 8, 3, 4, 4, *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out, 3, 3, 1, 1, 1, 1, 2, 2, 1, 1);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out;
+  uint8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_0_cluster_fork_args_t;
+
+static void _MERGE_CONVRQ_PASS_0_cluster_fork(void *_MERGE_CONVRQ_PASS_0_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_0_cluster_fork_args_t *args = (_MERGE_CONVRQ_PASS_0_cluster_fork_args_t *)_MERGE_CONVRQ_PASS_0_cluster_fork_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out;
+  uint8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_0_tiling_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_0_tiling_closure_args = (_MERGE_CONVRQ_PASS_0_tiling_closure_args_t){
+      .DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out};
+
+  // _MERGE_CONVRQ_PASS_0_tiling_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_0_tiling_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_0_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_0_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_0_closure(void *_MERGE_CONVRQ_PASS_0_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_0_closure_args_t *args = (_MERGE_CONVRQ_PASS_0_closure_args_t *)_MERGE_CONVRQ_PASS_0_closure_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer = (void *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1320);
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ch_im_out;
+  uint8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in = (uint8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 744);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1752);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 648);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 936);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 32,
+                 .number_of_1d_copies = 16,
+                 .length_1d_copy = 24,
+                 .mchan_cmd = 1835392,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 96,
+                 .mchan_cmd = 1441888,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 96,
+                 .mchan_cmd = 1441888,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 648,
+                 .mchan_cmd = 1442440,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 192,
+                 .mchan_cmd = 1441984,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_numTiles[*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_numTiles[(*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.ext = ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.length_1d_copy = (192);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in.mchan_cmd = (1441984);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight) + (648 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.length_1d_copy = (648 - 432 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight.mchan_cmd = (1442440 - 432 * (TILING_I));
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add) + (96 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.length_1d_copy = (96 - 64 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add.mchan_cmd = (1441888 - 64 * (TILING_I));
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul) + (96 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.length_1d_copy = (96 - 64 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul.mchan_cmd = (1441888 - 64 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = (24 - 16 * (TILING_I));
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_weight);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_add);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_mul);
+
+    _MERGE_CONVRQ_PASS_0_cluster_fork_args_t DeeployNetwork__MERGE_CONVRQ_PASS_0_cluster_fork_args = (_MERGE_CONVRQ_PASS_0_cluster_fork_args_t){
+        .DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_ch_im_out,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_weight,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_mul,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_add,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_MERGE_CONVRQ_PASS_0_cluster_fork, &DeeployNetwork__MERGE_CONVRQ_PASS_0_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out) + (24 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.length_1d_copy = (24 - 16 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.number_of_1d_copies = (16);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.stride_1d = (32);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out.mchan_cmd = (1835392 - 256 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_0_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_0_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_0_closure_L3_args_t;
+
+static void _MERGE_CONVRQ_PASS_0_closure_L3(void *_MERGE_CONVRQ_PASS_0_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_0_closure_L3_args_t *args = (_MERGE_CONVRQ_PASS_0_closure_L3_args_t *)_MERGE_CONVRQ_PASS_0_closure_L3_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add;
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_0_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_0_closure_args = (_MERGE_CONVRQ_PASS_0_closure_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_0_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_0_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_0_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // Transpose [1, 4, 4, 32] -> [1, 32, 4, 4] (Name: _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut, Op: Transpose)
+  BEGIN_SINGLE_CORE
+
+  const uint32_t coreId = pi_core_id();
+
+  uint16_t dimLen_0 = 1;
+
+  uint16_t dimLen_1 = 4;
+
+  uint16_t dimLen_2 = 4;
+
+  uint16_t dimLen_3 = 32;
+
+  for (uint32_t i_0 = 0; i_0 < dimLen_0; i_0++) {
+
+    const uint32_t baseChunk = dimLen_3 / NUM_CORES;
+    const uint32_t leftover = dimLen_3 - baseChunk * NUM_CORES;
+    const uint32_t offset = baseChunk * coreId + (coreId < leftover ? coreId : leftover);
+    const uint32_t chunk = coreId < leftover ? baseChunk + 1 : baseChunk;
+    for (uint32_t i_3 = offset; i_3 < offset + chunk; i_3++) {
+
+      for (uint32_t i_1 = 0; i_1 < dimLen_1; i_1++) {
+
+        for (uint32_t i_2 = 0; i_2 < dimLen_2; i_2++) {
+
+          ((int8_t (*)[dimLen_3][dimLen_1][dimLen_2])
+               DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out)[i_0][i_3][i_1][i_2] =
+              ((int8_t (*)[dimLen_1][dimLen_2][dimLen_3])
+                   DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in)[i_0][i_1][i_2][i_3];
+        }
+      }
+    }
+  }
+  END_SINGLE_CORE
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_1;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_1 = args->DeeployNetwork_input_1;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 512);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out =
+      (DMA_copy){.ext = DeeployNetwork_input_1,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 512,
+                 .mchan_cmd = 1311232,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 512,
+                 .mchan_cmd = 1442304,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_numTiles
+           [*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_numTiles
+                      [(*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.length_1d_copy = (512);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in.mchan_cmd = (1442304);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in from
+    // DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in);
+
+    _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args =
+        (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork,
+                    &DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.ext = ((char *)DeeployNetwork_input_1) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.length_1d_copy = (512);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out.mchan_cmd = (1311232);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out from DeeployNetwork_input_1
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_1;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3(void *_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args_t *)_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_1 = args->DeeployNetwork_input_1;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out =
+                                                                  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+                                                              .DeeployNetwork_input_1 = DeeployNetwork_input_1,
+                                                              .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr =
+                                                                  DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_1_tiling_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_1_tiling_closure(void *_MERGE_CONVRQ_PASS_1_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_1_tiling_closure_args_t *args = (_MERGE_CONVRQ_PASS_1_tiling_closure_args_t *)_MERGE_CONVRQ_PASS_1_tiling_closure_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // PULP NN CONV
+
+  pulp_nn_depthwise_i8_i8_i8(DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in, DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer, NULL,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight, NULL,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add, 1,
+                             16, 4, 4, *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in, 4, 4,
+                             *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_1_cluster_fork_args_t;
+
+static void _MERGE_CONVRQ_PASS_1_cluster_fork(void *_MERGE_CONVRQ_PASS_1_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_1_cluster_fork_args_t *args = (_MERGE_CONVRQ_PASS_1_cluster_fork_args_t *)_MERGE_CONVRQ_PASS_1_cluster_fork_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_1_tiling_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_1_tiling_closure_args = (_MERGE_CONVRQ_PASS_1_tiling_closure_args_t){
+      .DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out};
+
+  // _MERGE_CONVRQ_PASS_1_tiling_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_1_tiling_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_1_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add;
+  int8_t *DeeployNetwork_input_1;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_1_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_1_closure(void *_MERGE_CONVRQ_PASS_1_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_1_closure_args_t *args = (_MERGE_CONVRQ_PASS_1_closure_args_t *)_MERGE_CONVRQ_PASS_1_closure_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add;
+  int8_t *DeeployNetwork_input_1 = args->DeeployNetwork_input_1;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer = (void *)((char *)DeeployNetwork_MEMORYARENA_L1 + 452);
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 132);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1892);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 92);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 292);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 32,
+                 .number_of_1d_copies = 16,
+                 .length_1d_copy = 10,
+                 .mchan_cmd = 1835168,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 40,
+                 .mchan_cmd = 1441832,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 40,
+                 .mchan_cmd = 1441832,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 90,
+                 .mchan_cmd = 1441882,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in =
+      (DMA_copy){.ext = DeeployNetwork_input_1,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 160,
+                 .mchan_cmd = 1441952,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_numTiles[*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_numTiles[(*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.ext = ((char *)DeeployNetwork_input_1) + (160 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.length_1d_copy = (((TILING_I) == 3) ? 32 : 160);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in.mchan_cmd = (((TILING_I) == 3) ? 1441824 : 1441952);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight) + (90 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.length_1d_copy = (((TILING_I) == 3) ? 18 : 90);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight.mchan_cmd = (((TILING_I) == 3) ? 1441810 : 1441882);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add) + (40 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.length_1d_copy = (((TILING_I) == 3) ? 8 : 40);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add.mchan_cmd = (((TILING_I) == 3) ? 1441800 : 1441832);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul) + (40 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.length_1d_copy = (((TILING_I) == 3) ? 8 : 40);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul.mchan_cmd = (((TILING_I) == 3) ? 1441800 : 1441832);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in from DeeployNetwork_input_1
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = (((TILING_I) == 3) ? 2 : 10);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = (((TILING_I) == 3) ? 2 : 10);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_weight);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_add);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_mul);
+
+    _MERGE_CONVRQ_PASS_1_cluster_fork_args_t DeeployNetwork__MERGE_CONVRQ_PASS_1_cluster_fork_args = (_MERGE_CONVRQ_PASS_1_cluster_fork_args_t){
+        .DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_out,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_ch_im_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_weight,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_mul,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_add,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_MERGE_CONVRQ_PASS_1_cluster_fork, &DeeployNetwork__MERGE_CONVRQ_PASS_1_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out) + (10 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.length_1d_copy = (((TILING_I) == 3) ? 2 : 10);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.number_of_1d_copies = (16);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.stride_1d = (32);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out.mchan_cmd = (((TILING_I) == 3) ? 1835040 : 1835168);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_1_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_1_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add;
+  int8_t *DeeployNetwork_input_1;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_1_closure_L3_args_t;
+
+static void _MERGE_CONVRQ_PASS_1_closure_L3(void *_MERGE_CONVRQ_PASS_1_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_1_closure_L3_args_t *args = (_MERGE_CONVRQ_PASS_1_closure_L3_args_t *)_MERGE_CONVRQ_PASS_1_closure_L3_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add;
+  int8_t *DeeployNetwork_input_1 = args->DeeployNetwork_input_1;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_1_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_1_closure_args = (_MERGE_CONVRQ_PASS_1_closure_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add,
+      .DeeployNetwork_input_1 = DeeployNetwork_input_1,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_1_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_1_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_1_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_2_tiling_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_2_tiling_closure(void *_MERGE_CONVRQ_PASS_2_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_2_tiling_closure_args_t *args = (_MERGE_CONVRQ_PASS_2_tiling_closure_args_t *)_MERGE_CONVRQ_PASS_2_tiling_closure_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // PULP NN CONV
+
+  pulp_nn_conv_i8_i8_i8(DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in, DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer, NULL,
+                        DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight,
+                        DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add, 1, 16,
+                        4, 4, 32, 4, 4, *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_2_cluster_fork_args_t;
+
+static void _MERGE_CONVRQ_PASS_2_cluster_fork(void *_MERGE_CONVRQ_PASS_2_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_2_cluster_fork_args_t *args = (_MERGE_CONVRQ_PASS_2_cluster_fork_args_t *)_MERGE_CONVRQ_PASS_2_cluster_fork_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_2_tiling_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_2_tiling_closure_args = (_MERGE_CONVRQ_PASS_2_tiling_closure_args_t){
+      .DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out};
+
+  // _MERGE_CONVRQ_PASS_2_tiling_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_2_tiling_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_2_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_2_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_2_closure(void *_MERGE_CONVRQ_PASS_2_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_2_closure_args_t *args = (_MERGE_CONVRQ_PASS_2_closure_args_t *)_MERGE_CONVRQ_PASS_2_closure_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer = (void *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1396);
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ch_im_out;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 612);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1908);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 544);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1124);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 64,
+                 .number_of_1d_copies = 16,
+                 .length_1d_copy = 17,
+                 .mchan_cmd = 1835280,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 68,
+                 .mchan_cmd = 1441860,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 68,
+                 .mchan_cmd = 1441860,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 544,
+                 .mchan_cmd = 1442336,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 512,
+                 .mchan_cmd = 1442304,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_numTiles[*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_numTiles[(*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.ext = ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.length_1d_copy = (512);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in.mchan_cmd = (1442304);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight) + (544 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.length_1d_copy = (((TILING_I) == 3) ? 416 : 544);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight.mchan_cmd = (((TILING_I) == 3) ? 1442208 : 1442336);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add) + (68 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.length_1d_copy = (((TILING_I) == 3) ? 52 : 68);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add.mchan_cmd = (((TILING_I) == 3) ? 1441844 : 1441860);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul) + (68 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.length_1d_copy = (((TILING_I) == 3) ? 52 : 68);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul.mchan_cmd = (((TILING_I) == 3) ? 1441844 : 1441860);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = (((TILING_I) == 3) ? 13 : 17);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_weight);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_add);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_mul);
+
+    _MERGE_CONVRQ_PASS_2_cluster_fork_args_t DeeployNetwork__MERGE_CONVRQ_PASS_2_cluster_fork_args = (_MERGE_CONVRQ_PASS_2_cluster_fork_args_t){
+        .DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_ch_im_out,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_weight,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_mul,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_add,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_MERGE_CONVRQ_PASS_2_cluster_fork, &DeeployNetwork__MERGE_CONVRQ_PASS_2_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out) + (17 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.length_1d_copy = (((TILING_I) == 3) ? 13 : 17);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.number_of_1d_copies = (16);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.stride_1d = (64);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out.mchan_cmd = (((TILING_I) == 3) ? 1835216 : 1835280);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_2_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_2_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_2_closure_L3_args_t;
+
+static void _MERGE_CONVRQ_PASS_2_closure_L3(void *_MERGE_CONVRQ_PASS_2_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_2_closure_L3_args_t *args = (_MERGE_CONVRQ_PASS_2_closure_L3_args_t *)_MERGE_CONVRQ_PASS_2_closure_L3_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_2_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_2_closure_args = (_MERGE_CONVRQ_PASS_2_closure_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_2_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_2_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_2_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint16_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure(void *_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args;
+  uint16_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // Transpose [1, 4, 4, 64] -> [1, 64, 4, 4] (Name: _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut, Op: Transpose)
+  BEGIN_SINGLE_CORE
+
+  const uint32_t coreId = pi_core_id();
+
+  uint16_t dimLen_0 = 1;
+
+  uint16_t dimLen_1 = 4;
+
+  uint16_t dimLen_2 = 4;
+
+  uint16_t dimLen_3 = *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3;
+
+  for (uint32_t i_0 = 0; i_0 < dimLen_0; i_0++) {
+
+    const uint32_t baseChunk = dimLen_3 / NUM_CORES;
+    const uint32_t leftover = dimLen_3 - baseChunk * NUM_CORES;
+    const uint32_t offset = baseChunk * coreId + (coreId < leftover ? coreId : leftover);
+    const uint32_t chunk = coreId < leftover ? baseChunk + 1 : baseChunk;
+    for (uint32_t i_3 = offset; i_3 < offset + chunk; i_3++) {
+
+      for (uint32_t i_1 = 0; i_1 < dimLen_1; i_1++) {
+
+        for (uint32_t i_2 = 0; i_2 < dimLen_2; i_2++) {
+
+          ((int8_t (*)[dimLen_3][dimLen_1][dimLen_2])
+               DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out)[i_0][i_3][i_1][i_2] =
+              ((int8_t (*)[dimLen_1][dimLen_2][dimLen_3])
+                   DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in)[i_0][i_1][i_2][i_3];
+        }
+      }
+    }
+  }
+  END_SINGLE_CORE
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint16_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork(void *_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args_t *)_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args;
+  uint16_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out};
+
+  // _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_8;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure(void *_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_8 = args->DeeployNetwork_input_8;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  uint16_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 =
+      (uint16_t *)DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_dimLen_3;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 992);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out =
+      (DMA_copy){.ext = DeeployNetwork_input_8,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 992,
+                 .mchan_cmd = 1311712,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 64,
+                 .number_of_1d_copies = 16,
+                 .length_1d_copy = 62,
+                 .mchan_cmd = 1967072,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_numTiles
+           [*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_numTiles
+                      [(*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out) + (62 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.length_1d_copy = (62 - 60 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.number_of_1d_copies = (16);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.stride_1d = (64);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in.mchan_cmd = (1967072 - 960 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in from
+    // DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3
+    *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 = (62 - 60 * (TILING_I));
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in);
+
+    _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args =
+        (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3 =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_dimLen_3,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork,
+                    &DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.ext = ((char *)DeeployNetwork_input_8) + (992 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.length_1d_copy = (992 - 960 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out.mchan_cmd = (1311712 - 960 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out from DeeployNetwork_input_8
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_8;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3(void *_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args_t *)_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_8 = args->DeeployNetwork_input_8;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out =
+                                                                  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+                                                              .DeeployNetwork_input_8 = DeeployNetwork_input_8,
+                                                              .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr =
+                                                                  DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_3_tiling_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_3_tiling_closure(void *_MERGE_CONVRQ_PASS_3_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_3_tiling_closure_args_t *args = (_MERGE_CONVRQ_PASS_3_tiling_closure_args_t *)_MERGE_CONVRQ_PASS_3_tiling_closure_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // PULP NN CONV
+
+  pulp_nn_depthwise_i8_i8_i8(DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in, DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer, NULL,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight, NULL,
+                             DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul, DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add, 1,
+                             16, 4, 4, *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in, 2, 2,
+                             *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out, 3, 3, 1, 1, 1, 1, 2, 2, 1, 1);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out;
+} _MERGE_CONVRQ_PASS_3_cluster_fork_args_t;
+
+static void _MERGE_CONVRQ_PASS_3_cluster_fork(void *_MERGE_CONVRQ_PASS_3_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_3_cluster_fork_args_t *args = (_MERGE_CONVRQ_PASS_3_cluster_fork_args_t *)_MERGE_CONVRQ_PASS_3_cluster_fork_args;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer = args->DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_3_tiling_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_3_tiling_closure_args = (_MERGE_CONVRQ_PASS_3_tiling_closure_args_t){
+      .DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add,
+      .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out};
+
+  // _MERGE_CONVRQ_PASS_3_tiling_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_3_tiling_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_3_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add;
+  int8_t *DeeployNetwork_input_8;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_3_closure_args_t;
+
+static void _MERGE_CONVRQ_PASS_3_closure(void *_MERGE_CONVRQ_PASS_3_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_3_closure_args_t *args = (_MERGE_CONVRQ_PASS_3_closure_args_t *)_MERGE_CONVRQ_PASS_3_closure_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add;
+  int8_t *DeeployNetwork_input_8 = args->DeeployNetwork_input_8;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer = (void *)((char *)DeeployNetwork_MEMORYARENA_L1 + 364);
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ch_im_out;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ch_im_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 144);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1948);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 100);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 320);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 64,
+                 .number_of_1d_copies = 4,
+                 .length_1d_copy = 11,
+                 .mchan_cmd = 1835052,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 44,
+                 .mchan_cmd = 1441836,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 44,
+                 .mchan_cmd = 1441836,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 99,
+                 .mchan_cmd = 1441891,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in =
+      (DMA_copy){.ext = DeeployNetwork_input_8,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 176,
+                 .mchan_cmd = 1441968,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_numTiles[*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_numTiles[(*DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.ext = ((char *)DeeployNetwork_input_8) + (176 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.length_1d_copy = (((TILING_I) == 5) ? 144 : 176);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in.mchan_cmd = (((TILING_I) == 5) ? 1441936 : 1441968);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight) + (99 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.length_1d_copy = (((TILING_I) == 5) ? 81 : 99);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight.mchan_cmd = (((TILING_I) == 5) ? 1441873 : 1441891);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add) + (44 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.length_1d_copy = (((TILING_I) == 5) ? 36 : 44);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add.mchan_cmd = (((TILING_I) == 5) ? 1441828 : 1441836);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul) + (44 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.length_1d_copy = (((TILING_I) == 5) ? 36 : 44);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul.mchan_cmd = (((TILING_I) == 5) ? 1441828 : 1441836);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in from DeeployNetwork_input_8
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = (((TILING_I) == 5) ? 9 : 11);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in
+    *DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = (((TILING_I) == 5) ? 9 : 11);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_weight);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_add);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_mul);
+
+    _MERGE_CONVRQ_PASS_3_cluster_fork_args_t DeeployNetwork__MERGE_CONVRQ_PASS_3_cluster_fork_args = (_MERGE_CONVRQ_PASS_3_cluster_fork_args_t){
+        .DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer = DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_out,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_ch_im_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_in,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_weight,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_mul,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_add,
+        .DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_MERGE_CONVRQ_PASS_3_cluster_fork, &DeeployNetwork__MERGE_CONVRQ_PASS_3_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out) + (11 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.length_1d_copy = (((TILING_I) == 5) ? 9 : 11);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.number_of_1d_copies = (4);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.stride_1d = (64);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out.mchan_cmd = (((TILING_I) == 5) ? 1835044 : 1835052);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out from DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_CONVRQ_PASS_3_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_CONVRQ_PASS_3_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add;
+  int8_t *DeeployNetwork_input_8;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr;
+} _MERGE_CONVRQ_PASS_3_closure_L3_args_t;
+
+static void _MERGE_CONVRQ_PASS_3_closure_L3(void *_MERGE_CONVRQ_PASS_3_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _MERGE_CONVRQ_PASS_3_closure_L3_args_t *args = (_MERGE_CONVRQ_PASS_3_closure_L3_args_t *)_MERGE_CONVRQ_PASS_3_closure_L3_args;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add =
+      args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add;
+  int8_t *DeeployNetwork_input_8 = args->DeeployNetwork_input_8;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_CONVRQ_PASS_3_closure_args_t DeeployNetwork__MERGE_CONVRQ_PASS_3_closure_args = (_MERGE_CONVRQ_PASS_3_closure_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add,
+      .DeeployNetwork_input_8 = DeeployNetwork_input_8,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_3_closure CLOSURE CALL
+  _MERGE_CONVRQ_PASS_3_closure(&DeeployNetwork__MERGE_CONVRQ_PASS_3_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure(void *_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // Transpose [1, 2, 2, 64] -> [1, 64, 2, 2] (Name: _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut, Op: Transpose)
+  BEGIN_SINGLE_CORE
+
+  const uint32_t coreId = pi_core_id();
+
+  uint16_t dimLen_0 = 1;
+
+  uint16_t dimLen_1 = 2;
+
+  uint16_t dimLen_2 = 2;
+
+  uint16_t dimLen_3 = 64;
+
+  for (uint32_t i_0 = 0; i_0 < dimLen_0; i_0++) {
+
+    const uint32_t baseChunk = dimLen_3 / NUM_CORES;
+    const uint32_t leftover = dimLen_3 - baseChunk * NUM_CORES;
+    const uint32_t offset = baseChunk * coreId + (coreId < leftover ? coreId : leftover);
+    const uint32_t chunk = coreId < leftover ? baseChunk + 1 : baseChunk;
+    for (uint32_t i_3 = offset; i_3 < offset + chunk; i_3++) {
+
+      for (uint32_t i_1 = 0; i_1 < dimLen_1; i_1++) {
+
+        for (uint32_t i_2 = 0; i_2 < dimLen_2; i_2++) {
+
+          ((int8_t (*)[dimLen_3][dimLen_1][dimLen_2])
+               DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out)[i_0][i_3][i_1][i_2] =
+              ((int8_t (*)[dimLen_1][dimLen_2][dimLen_3])
+                   DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in)[i_0][i_1][i_2][i_3];
+        }
+      }
+    }
+  }
+  END_SINGLE_CORE
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out;
+} _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork(void *_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args_t *)_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in;
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out =
+      args->DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out};
+
+  // _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  int8_t *DeeployNetwork_onnx__Flatten_24;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure(void *_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args_t *)_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  int8_t *DeeployNetwork_onnx__Flatten_24 = args->DeeployNetwork_onnx__Flatten_24;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int8_t *DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 256);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out =
+      (DMA_copy){.ext = DeeployNetwork_onnx__Flatten_24,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 256,
+                 .mchan_cmd = 1310976,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in =
+      (DMA_copy){.ext = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+                 .loc = DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 256,
+                 .mchan_cmd = 1442048,
+                 .dir = 1,
+                 .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_numTiles
+           [*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_numTiles
+                      [(*DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.ext =
+        ((char *)DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.length_1d_copy = (256);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in.mchan_cmd = (1442048);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in from
+    // DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in);
+
+    _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args =
+        (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args_t){.DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_in,
+                                                                     .DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out =
+                                                                         DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork,
+                    &DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.ext = ((char *)DeeployNetwork_onnx__Flatten_24) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.length_1d_copy = (256);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out.mchan_cmd = (1310976);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out from DeeployNetwork_onnx__Flatten_24
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_data_in);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  int8_t *DeeployNetwork_onnx__Flatten_24;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr;
+} _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args_t;
+
+static void _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3(void *_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args_t *args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args_t *)_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = args->DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  int8_t *DeeployNetwork_onnx__Flatten_24 = args->DeeployNetwork_onnx__Flatten_24;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr =
+      args->DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out =
+                                                                  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+                                                              .DeeployNetwork_onnx__Flatten_24 = DeeployNetwork_onnx__Flatten_24,
+                                                              .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr =
+                                                                  DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out;
+} _MERGE_GEMMRQ_PASS_0_tiling_closure_args_t;
+
+static void _MERGE_GEMMRQ_PASS_0_tiling_closure(void *_MERGE_GEMMRQ_PASS_0_tiling_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_GEMMRQ_PASS_0_tiling_closure_args_t *args = (_MERGE_GEMMRQ_PASS_0_tiling_closure_args_t *)_MERGE_GEMMRQ_PASS_0_tiling_closure_args;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+
+  // PULP NN GEMM
+  int8_t *ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A =
+      DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A;
+  int8_t *ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B =
+      DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B;
+  int8_t *ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out =
+      DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out;
+  for (int i = 0; i < 1; i++) {
+    for (int j = 0; j < 1; j++) {
+// LMACAN: In some edge cases sporadic errors happen if this loop is not added.
+// We believe this is due to missing bubbles in the pipeline that break operator forwarding.
+// Breaking test:
+//   `python testRunner_tiled_siracusa.py -t=Tests/Transformer --defaultMemLevel=L3 --doublebuffer --l1=30000`
+#pragma unroll 1
+      for (int k = 0; k < 3; k++) {
+        asm volatile("nop" ::);
+      }
+      pulp_nn_linear_i8_i8_i8(
+          ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A, NULL,
+          ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out,
+          ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B,
+          DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul, DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C, 1, 16, 256,
+          *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O, 1, 1);
+      ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A += 256;
+      ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out +=
+          *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+    }
+    ref_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out_DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B +=
+        256 * *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+  }
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out;
+} _MERGE_GEMMRQ_PASS_0_cluster_fork_args_t;
+
+static void _MERGE_GEMMRQ_PASS_0_cluster_fork(void *_MERGE_GEMMRQ_PASS_0_cluster_fork_args) {
+  // CLOSURE ARG CAST
+  _MERGE_GEMMRQ_PASS_0_cluster_fork_args_t *args = (_MERGE_GEMMRQ_PASS_0_cluster_fork_args_t *)_MERGE_GEMMRQ_PASS_0_cluster_fork_args;
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul;
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out = args->DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_GEMMRQ_PASS_0_tiling_closure_args_t DeeployNetwork__MERGE_GEMMRQ_PASS_0_tiling_closure_args = (_MERGE_GEMMRQ_PASS_0_tiling_closure_args_t){
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O,
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A,
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B,
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul,
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C,
+      .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out};
+
+  // _MERGE_GEMMRQ_PASS_0_tiling_closure CLOSURE CALL
+  _MERGE_GEMMRQ_PASS_0_tiling_closure(&DeeployNetwork__MERGE_GEMMRQ_PASS_0_tiling_closure_args);
+
+  pi_cl_team_barrier();
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_output_0;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul;
+  int8_t *DeeployNetwork_onnx__Gemm_25;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr;
+} _MERGE_GEMMRQ_PASS_0_closure_args_t;
+
+static void _MERGE_GEMMRQ_PASS_0_closure(void *_MERGE_GEMMRQ_PASS_0_closure_args) {
+  // CLOSURE ARG CAST
+  _MERGE_GEMMRQ_PASS_0_closure_args_t *args = (_MERGE_GEMMRQ_PASS_0_closure_args_t *)_MERGE_GEMMRQ_PASS_0_closure_args;
+  int8_t *DeeployNetwork_output_0 = args->DeeployNetwork_output_0;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul;
+  int8_t *DeeployNetwork_onnx__Gemm_25 = args->DeeployNetwork_onnx__Gemm_25;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  uint16_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = (uint16_t *)DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_O;
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1560);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 0);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1536);
+  int32_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C = (int32_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1824);
+  int8_t *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L1 + 1816);
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out =
+      (DMA_copy){.ext = DeeployNetwork_output_0,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 6,
+                 .mchan_cmd = 1310726,
+                 .dir = 0,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul =
+      (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul,
+                 .loc = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul,
+                 .hwc_to_chw = 0,
+                 .stride_2d = 0,
+                 .number_of_2d_copies = 1,
+                 .stride_1d = 0,
+                 .number_of_1d_copies = 1,
+                 .length_1d_copy = 24,
+                 .mchan_cmd = 1441816,
+                 .dir = 1,
+                 .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C = (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias,
+                                                                                      .loc = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C,
+                                                                                      .hwc_to_chw = 0,
+                                                                                      .stride_2d = 0,
+                                                                                      .number_of_2d_copies = 1,
+                                                                                      .stride_1d = 0,
+                                                                                      .number_of_1d_copies = 1,
+                                                                                      .length_1d_copy = 24,
+                                                                                      .mchan_cmd = 1441816,
+                                                                                      .dir = 1,
+                                                                                      .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B = (DMA_copy){.ext = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight,
+                                                                                      .loc = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B,
+                                                                                      .hwc_to_chw = 0,
+                                                                                      .stride_2d = 0,
+                                                                                      .number_of_2d_copies = 1,
+                                                                                      .stride_1d = 0,
+                                                                                      .number_of_1d_copies = 1,
+                                                                                      .length_1d_copy = 1536,
+                                                                                      .mchan_cmd = 1443328,
+                                                                                      .dir = 1,
+                                                                                      .tid = 0};
+  DMA_copy DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A = (DMA_copy){.ext = DeeployNetwork_onnx__Gemm_25,
+                                                                                      .loc = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A,
+                                                                                      .hwc_to_chw = 0,
+                                                                                      .stride_2d = 0,
+                                                                                      .number_of_2d_copies = 1,
+                                                                                      .stride_1d = 0,
+                                                                                      .number_of_1d_copies = 1,
+                                                                                      .length_1d_copy = 256,
+                                                                                      .mchan_cmd = 1442048,
+                                                                                      .dir = 1,
+                                                                                      .tid = 0};
+
+  int32_t dma_channel = dory_dma_allocate();
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.tid = dma_channel;
+
+  DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.tid = dma_channel;
+
+  // TILING LOOP
+  for (int TILING_I = DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_numTiles[*DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr];
+       TILING_I < DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_numTiles[(*DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr) + 1];
+       TILING_I++) {
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.ext = ((char *)DeeployNetwork_onnx__Gemm_25) + (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.length_1d_copy = (256);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A.mchan_cmd = (1442048);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight) + (1536 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.length_1d_copy = (1536 - 512 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B.mchan_cmd = (1443328 - 512 * (TILING_I));
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias) + (24 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.length_1d_copy = (24 - 8 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C.mchan_cmd = (1441816 - 8 * (TILING_I));
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.ext =
+        ((char *)DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul) + (24 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.length_1d_copy = (24 - 8 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul.mchan_cmd = (1441816 - 8 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A from DeeployNetwork_onnx__Gemm_25
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C);
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul from DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul);
+
+    // UPDATE VARIABLE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O
+    *DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = (6 - 2 * (TILING_I));
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_B);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_C);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_mul);
+
+    _MERGE_GEMMRQ_PASS_0_cluster_fork_args_t DeeployNetwork__MERGE_GEMMRQ_PASS_0_cluster_fork_args = (_MERGE_GEMMRQ_PASS_0_cluster_fork_args_t){
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_O,
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_A,
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_B,
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_mul,
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_C,
+        .DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out = DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out};
+
+    pi_cl_team_fork(NUM_CORES, (void *)_MERGE_GEMMRQ_PASS_0_cluster_fork, &DeeployNetwork__MERGE_GEMMRQ_PASS_0_cluster_fork_args);
+
+    // UPDATE DMA STRUCT DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.ext = ((char *)DeeployNetwork_output_0) + (6 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.length_1d_copy = (6 - 2 * (TILING_I));
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.number_of_1d_copies = (1);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.number_of_2d_copies = (1);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.stride_1d = (0);
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.stride_2d = (0);
+
+    DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out.mchan_cmd = (1310726 - 2 * (TILING_I));
+
+    // IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out from DeeployNetwork_output_0
+    dory_dma_memcpy_mindims_async(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out);
+
+    // BLOCKING IMPORT TILE DeeployNetwork_TILING_REPLACED__MERGE_GEMMRQ_PASS_0_L1_ref_data_out
+    dory_dma_barrier(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_data_out);
+
+    // CLOSE TILING LOOP
+  }
+  *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr += 1;
+
+  dory_dma_free(&DeeployNetwork_TILING_REPLACED_L1__DMA__MERGE_GEMMRQ_PASS_0_A);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+typedef struct {
+  int8_t *DeeployNetwork_output_0;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul;
+  int8_t *DeeployNetwork_onnx__Gemm_25;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr;
+} _MERGE_GEMMRQ_PASS_0_closure_L3_args_t;
+
+static void _MERGE_GEMMRQ_PASS_0_closure_L3(void *_MERGE_GEMMRQ_PASS_0_closure_L3_args) {
+  // CLOSURE ARG CAST
+  _MERGE_GEMMRQ_PASS_0_closure_L3_args_t *args = (_MERGE_GEMMRQ_PASS_0_closure_L3_args_t *)_MERGE_GEMMRQ_PASS_0_closure_L3_args;
+  int8_t *DeeployNetwork_output_0 = args->DeeployNetwork_output_0;
+  int8_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias;
+  int32_t *DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul = args->DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul;
+  int8_t *DeeployNetwork_onnx__Gemm_25 = args->DeeployNetwork_onnx__Gemm_25;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = args->DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr;
+
+  // CLOSURE FUNCTION CALL
+  _MERGE_GEMMRQ_PASS_0_closure_args_t DeeployNetwork__MERGE_GEMMRQ_PASS_0_closure_args = (_MERGE_GEMMRQ_PASS_0_closure_args_t){
+      .DeeployNetwork_output_0 = DeeployNetwork_output_0,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul,
+      .DeeployNetwork_onnx__Gemm_25 = DeeployNetwork_onnx__Gemm_25,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr};
+
+  // _MERGE_GEMMRQ_PASS_0_closure CLOSURE CALL
+  _MERGE_GEMMRQ_PASS_0_closure(&DeeployNetwork__MERGE_GEMMRQ_PASS_0_closure_args);
+
+  // CLOSURE ARG WRITEBACK
+}
+
+void RunNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads) {
+  uint8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_1;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out;
+  int8_t *DeeployNetwork_input_8;
+  int8_t *DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out;
+  int8_t *DeeployNetwork_onnx__Flatten_24;
+  int8_t *DeeployNetwork_onnx__Gemm_25;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_0_buffer;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_1_buffer;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_2_buffer;
+  void *DeeployNetwork__MERGE_CONVRQ_PASS_3_buffer;
+
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr =
+      &bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = &bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr =
+      &bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = &bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = &bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr =
+      &bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = &bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr =
+      &bu_DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr;
+  uint8_t bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = 0;
+  uint8_t *DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = &bu_DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr;
+  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = (uint8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 1024);
+
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args_t){.DeeployNetwork_input_0 = DeeployNetwork_input_0,
+                                                                .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In =
+                                                                    DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+                                                                .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr =
+                                                                    DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3 CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_closure_L3_args);
+  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 512);
+
+  _MERGE_CONVRQ_PASS_0_closure_L3_args_t DeeployNetwork__MERGE_CONVRQ_PASS_0_closure_L3_args = (_MERGE_CONVRQ_PASS_0_closure_L3_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_0_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_0_add,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeIn_In,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_0_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_0_closure_L3 CLOSURE CALL
+  _MERGE_CONVRQ_PASS_0_closure_L3(&DeeployNetwork__MERGE_CONVRQ_PASS_0_closure_L3_args);
+
+  DeeployNetwork_input_1 = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 0);
+
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args =
+      (_NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out =
+                                                                     DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_Out,
+                                                                 .DeeployNetwork_input_1 = DeeployNetwork_input_1,
+                                                                 .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr =
+                                                                     DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3 CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_0_TransposeOut_closure_L3_args);
+
+  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 512);
+
+  _MERGE_CONVRQ_PASS_1_closure_L3_args_t DeeployNetwork__MERGE_CONVRQ_PASS_1_closure_L3_args = (_MERGE_CONVRQ_PASS_1_closure_L3_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_1_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_1_add,
+      .DeeployNetwork_input_1 = DeeployNetwork_input_1,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_1_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_1_closure_L3 CLOSURE CALL
+  _MERGE_CONVRQ_PASS_1_closure_L3(&DeeployNetwork__MERGE_CONVRQ_PASS_1_closure_L3_args);
+
+  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 1024);
+
+  _MERGE_CONVRQ_PASS_2_closure_L3_args_t DeeployNetwork__MERGE_CONVRQ_PASS_2_closure_L3_args = (_MERGE_CONVRQ_PASS_2_closure_L3_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_2_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_2_add,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_1_TransposeOut_Out,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_2_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_2_closure_L3 CLOSURE CALL
+  _MERGE_CONVRQ_PASS_2_closure_L3(&DeeployNetwork__MERGE_CONVRQ_PASS_2_closure_L3_args);
+
+  DeeployNetwork_input_8 = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 2048);
+
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args =
+      (_NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out =
+                                                                     DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_Out,
+                                                                 .DeeployNetwork_input_8 = DeeployNetwork_input_8,
+                                                                 .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr =
+                                                                     DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3 CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_2_TransposeOut_closure_L3_args);
+
+  DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 256);
+
+  _MERGE_CONVRQ_PASS_3_closure_L3_args_t DeeployNetwork__MERGE_CONVRQ_PASS_3_closure_L3_args = (_MERGE_CONVRQ_PASS_3_closure_L3_args_t){
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_CONV2D_PASS_3_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_mul,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_BN2D_SIGNED_ACT_PASS_3_add,
+      .DeeployNetwork_input_8 = DeeployNetwork_input_8,
+      .DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out = DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_CONVRQ_PASS_3_tileIdxPtr};
+
+  // _MERGE_CONVRQ_PASS_3_closure_L3 CLOSURE CALL
+  _MERGE_CONVRQ_PASS_3_closure_L3(&DeeployNetwork__MERGE_CONVRQ_PASS_3_closure_L3_args);
+
+  DeeployNetwork_onnx__Flatten_24 = (int8_t *)((char *)DeeployNetwork_MEMORYARENA_L2 + 0);
+
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args_t DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args =
+      (_NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args_t){.DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out =
+                                                                     DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_Out,
+                                                                 .DeeployNetwork_onnx__Flatten_24 = DeeployNetwork_onnx__Flatten_24,
+                                                                 .DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr =
+                                                                     DeeployNetwork_TILING_REPLACED_L1__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_tileIdxPtr};
+
+  // _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3 CLOSURE CALL
+  _NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3(&DeeployNetwork__NCHW_TO_NHWC_CONV_PASS_3_TransposeOut_closure_L3_args);
+
+  // Reshape (Name: Flatten_8, Op: Flatten)
+  SINGLE_CORE DeeployNetwork_onnx__Gemm_25 = DeeployNetwork_onnx__Flatten_24;
+
+  _MERGE_GEMMRQ_PASS_0_closure_L3_args_t DeeployNetwork__MERGE_GEMMRQ_PASS_0_closure_L3_args = (_MERGE_GEMMRQ_PASS_0_closure_L3_args_t){
+      .DeeployNetwork_output_0 = DeeployNetwork_output_0,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_weight,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_PACT_LIN_PASS_0_bias,
+      .DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul = DeeployNetwork_net__QL_REPLACED__INTEGERIZE_SIGNED_ACT_PASS_0_mul,
+      .DeeployNetwork_onnx__Gemm_25 = DeeployNetwork_onnx__Gemm_25,
+      .DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr = DeeployNetwork_TILING_REPLACED_L1__MERGE_GEMMRQ_PASS_0_tileIdxPtr};
+
+  // _MERGE_GEMMRQ_PASS_0_closure_L3 CLOSURE CALL
+  _MERGE_GEMMRQ_PASS_0_closure_L3(&DeeployNetwork__MERGE_GEMMRQ_PASS_0_closure_L3_args);
+}
+
+void InitNetwork(__attribute__((unused)) uint32_t core_id, __attribute__((unused)) uint32_t numThreads) {
+
+  DeeployNetwork_input_0 = (uint8_t *)pi_l2_malloc(sizeof(uint8_t) * 192);
+
+  DeeployNetwork_output_0 = (int8_t *)pi_l2_malloc(sizeof(int8_t) * 10);
+
+  DeeployNetwork_MEMORYARENA_L2 = (int8_t *)pi_l2_malloc(sizeof(int8_t) * 3072);
+
+  DeeployNetwork_MEMORYARENA_L1 = (int8_t *)pmsis_l1_malloc(sizeof(int8_t) * 1992);
+
+  DeeployNetwork_inputs[0] = (void *)DeeployNetwork_input_0;
+  DeeployNetwork_outputs[0] = (void *)DeeployNetwork_output_0;
+}
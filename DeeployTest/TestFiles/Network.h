@@ -0,0 +1,31 @@
+
+#ifndef __DEEPLOY_HEADER_
+#define __DEEPLOY_HEADER_
+#include "DeeployBasicMath.h"
+#include "bsp/ram.h"
+#include "dory_dma.h"
+#include "dory_mem.h"
+#include "pmsis.h"
+#include "pulp_nn_kernels.h"
+#include "stdint.h"
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+void RunNetwork(uint32_t core_id, uint32_t numThreads);
+void InitNetwork(uint32_t core_id, uint32_t numThread);
+
+extern uint8_t *DeeployNetwork_input_0;
+static const uint32_t DeeployNetwork_input_0_len = 192;
+extern int8_t *DeeployNetwork_output_0;
+static const uint32_t DeeployNetwork_output_0_len = 10;
+extern int8_t *DeeployNetwork_MEMORYARENA_L2;
+static const uint32_t DeeployNetwork_MEMORYARENA_L2_len = 3072;
+extern int8_t *DeeployNetwork_MEMORYARENA_L1;
+static const uint32_t DeeployNetwork_MEMORYARENA_L1_len = 1992;
+static const uint32_t DeeployNetwork_num_inputs = 1;
+static const uint32_t DeeployNetwork_num_outputs = 1;
+extern void *DeeployNetwork_inputs[1];
+extern void *DeeployNetwork_outputs[1];
+static const uint32_t DeeployNetwork_inputs_bytes[1] = {192};
+static const uint32_t DeeployNetwork_outputs_bytes[1] = {10};
+#endif
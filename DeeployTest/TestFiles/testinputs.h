@@ -0,0 +1,9 @@
+uint8_t testInputVector0[] = {214, 46,  148, 66,  58,  23,  93,  145, 58,  70,  182, 212, 215, 216, 195, 72,  218, 233, 226, 184, 58,  64,  115, 221,
+                              219, 198, 218, 133, 201, 126, 234, 196, 174, 33,  230, 26,  196, 130, 128, 229, 178, 245, 92,  160, 142, 130, 109, 102,
+                              72,  51,  70,  111, 133, 1,   30,  129, 179, 22,  110, 138, 161, 230, 136, 9,   237, 111, 117, 49,  53,  88,  231, 186,
+                              53,  44,  60,  58,  32,  138, 211, 157, 26,  154, 124, 111, 247, 99,  188, 26,  219, 122, 205, 78,  134, 142, 107, 174,
+                              107, 79,  231, 170, 137, 207, 245, 166, 239, 45,  34,  201, 171, 141, 6,   204, 121, 79,  73,  169, 252, 70,  238, 163,
+                              133, 90,  30,  172, 90,  160, 4,   52,  61,  210, 247, 215, 196, 4,   174, 29,  177, 75,  49,  179, 30,  200, 73,  110,
+                              67,  212, 77,  205, 75,  42,  137, 8,   57,  86,  64,  210, 165, 49,  165, 27,  196, 10,  149, 216, 13,  239, 35,  151,
+                              53,  85,  76,  126, 11,  74,  153, 239, 238, 239, 239, 146, 229, 247, 36,  37,  128, 253, 29,  143, 51,  140, 88,  32};
+void *testInputVector[1] = {testInputVector0};
@@ -0,0 +1,2 @@
+int8_t testOutputVector0[] = {-18, 23, -20, -14, -2, 8, 18, -1, -8, 24, 0, 0};
+void *testOutputVector[1] = {testOutputVector0};
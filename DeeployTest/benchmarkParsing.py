@@ -0,0 +1,108 @@
+# ----------------------------------------------------------------------
+#
+# File: benchmarkParsing.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import copy
+import os
+import time
+
+import numpy as np
+import onnx
+import onnx_graphsurgeon as gs
+from testUtils.platformMapping import mapDeployer, mapPlatform
+from testUtils.typeMapping import inferInputType
+
+from Deeploy.DeeployTypes import NetworkContext, NetworkDeployer
+
+
+def _setupDeployer(testDir: str, platformName: str, deeployStateDir: str) -> NetworkDeployer:
+    onnx_graph = onnx.load_model(f'{testDir}/network.onnx')
+    graph = gs.import_onnx(onnx_graph)
+
+    inputs = np.load(f'{testDir}/inputs.npz')
+    test_inputs = [inputs[x].reshape(-1).astype(np.float64) for x in inputs.files]
+
+    platform, signProp = mapPlatform(platformName)
+
+    inputTypes = {}
+    inputOffsets = {}
+    for index, num in enumerate(test_inputs):
+        # Skip empty inputs, they are removed by the frontend
+        if np.prod(num.shape) == 0:
+            continue
+        _type, offset = inferInputType(num, signProp)[0]
+        inputTypes[f"input_{index}"] = _type
+        inputOffsets[f"input_{index}"] = offset
+
+    return mapDeployer(platform, graph, inputTypes, deeployStateDir = deeployStateDir, inputOffsets = inputOffsets)
+
+
+def _timeFrontEnd(testDir: str, platformName: str, deeployStateDir: str, iterations: int):
+    times = []
+    for _ in range(iterations):
+        deployer = _setupDeployer(testDir, platformName, deeployStateDir)
+        start = time.perf_counter()
+        deployer.frontEnd()
+        times.append(time.perf_counter() - start)
+    return min(times), deployer.ctxt
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description = "Compare parsing time of context snapshots against deep copies for backtracking.")
+    parser.add_argument('-t',
+                        metavar = 'testdir',
+                        dest = 'dir',
+                        type = str,
+                        default = './Tests/microLlama/microLlama128',
+                        help = 'Set the regression test\n')
+    parser.add_argument('-p',
+                        metavar = 'platform',
+                        dest = 'platform',
+                        type = str,
+                        default = "Siracusa",
+                        help = 'Choose the target Platform\n')
+    parser.add_argument('-n',
+                        metavar = 'iterations',
+                        dest = 'iterations',
+                        type = int,
+                        default = 1,
+                        help = 'Number of timed runs per configuration, the fastest one is reported\n')
+    args = parser.parse_args()
+
+    _DEEPLOYSTATEDIR = os.path.join("./TEST_PARSING_BENCHMARK_DeeployState", args.platform, args.dir)
+
+    snapshot = NetworkContext.snapshot
+
+    NetworkContext.snapshot = lambda self: copy.deepcopy(self)
+    deepcopyTime, deepcopyCtxt = _timeFrontEnd(args.dir, args.platform, _DEEPLOYSTATEDIR, args.iterations)
+
+    NetworkContext.snapshot = snapshot
+    snapshotTime, snapshotCtxt = _timeFrontEnd(args.dir, args.platform, _DEEPLOYSTATEDIR, args.iterations)
+
+    assert deepcopyCtxt == snapshotCtxt, "Contexts differ between deepcopy and snapshot, test failed!"
+
+    print(f"{args.dir}: deepcopy {deepcopyTime:.3f}s, snapshot {snapshotTime:.3f}s, "
+          f"speedup {deepcopyTime / snapshotTime:.2f}x")
+    print("Parsing benchmark passed!")
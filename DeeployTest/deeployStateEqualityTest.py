@@ -127,4 +127,8 @@ if __name__ == '__main__':
     alteredCtxt2.globalObjects[bufferName].name = "meme"
     assert not ctxt_post_binding_imported == alteredCtxt2, "Contexts are not supposed to be equal but are, test failed!"
 
+    # Test if the exported graph and context can be restored into the deployer
+    deployer.importDeeployState(_DEEPLOYSTATEDIR, _backendPostBindingFilename)
+    assert ctxt_post_binding_imported == deployer.ctxt, "Contexts are supposed to be equal but are not, test failed!"
+
     print("Contexts equality test passed!")
@@ -26,6 +26,7 @@
 # limitations under the License.
 
 import os
+from contextlib import nullcontext
 
 import numpy as np
 import onnx
@@ -37,8 +38,12 @@ from testUtils.platformMapping import mapDeployer, mapPlatform
 from testUtils.testRunner import TestGeneratorArgumentParser
 from testUtils.typeMapping import inferInputType
 
+from Deeploy.CommonExtensions.NetworkDeployers.ConstantSharingDeployer import ConstantSharingDeployerWrapper
+from Deeploy.CommonExtensions.NetworkDeployers.InPlaceAliasingDeployer import InPlaceAliasingDeployerWrapper
+from Deeploy.CommonExtensions.NetworkDeployers.LayerProfilingDeployer import LayerProfilingDeployerWrapper
 from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.DebugPasses import EmulateCMSISRequantPass
-from Deeploy.DeeployTypes import _NoVerbosity
+from Deeploy.CompilerProfiling import CompilerProfiler
+from Deeploy.DeeployTypes import DeeployStateExportLevel, _NoVerbosity
 from Deeploy.Targets.CortexM.Platform import CMSISPlatform
 
 _TEXT_ALIGN = 30
@@ -54,6 +59,37 @@ if __name__ == '__main__':
     parser.add_argument('--overwriteRecentState',
                         action = 'store_true',
                         help = 'Copy the recent deeply state to the ./deeployStates folder\n')
+    parser.add_argument('--incbin',
+                        dest = 'incbin',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Dump constants as binary files and include them with .incbin\n')
+    parser.add_argument('--weightsBlob',
+                        choices = ['incbin', 'mmap'],
+                        default = None,
+                        help = 'Pack all constants into weights.bin and load it with .incbin or mmap\n')
+    parser.add_argument('--inPlaceAliasing',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Let element-wise operators overwrite inputs without later users\n')
+    parser.add_argument('--shareConstants',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Deploy constants with identical values only once\n')
+    parser.add_argument('--multithreaded',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Split Generic kernels among the threads passed to RunNetwork\n')
+    parser.add_argument('--batchSize',
+                        metavar = '<size>',
+                        dest = 'batchSize',
+                        type = int,
+                        default = 1,
+                        help = 'Number of samples per inference, the test vectors are repeated for every sample\n')
+    parser.add_argument('--profileLayers',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Accumulate the cycles of every layer with getCycles\n')
 
     args = parser.parse_args()
 
@@ -85,7 +121,10 @@ if __name__ == '__main__':
             test_inputs = [test_inputs[0]]
             test_outputs = [test_outputs[-2]]
 
-    platform, signProp = mapPlatform(args.platform)
+    test_inputs = [np.tile(values, args.batchSize) for values in test_inputs]
+    test_outputs = [np.tile(values, args.batchSize) for values in test_outputs]
+
+    platform, signProp = mapPlatform(args.platform, multithreaded = args.multithreaded)
 
     for index, num in enumerate(test_inputs):
         # WIESP: Do not infer types and offset of empty arrays
@@ -98,14 +137,28 @@ if __name__ == '__main__':
     _DEEPLOYSTATEDIR = os.path.join(args.dumpdir, "deeployStates")
 
     deployer = mapDeployer(platform, graph, inputTypes, deeployStateDir = _DEEPLOYSTATEDIR, inputOffsets = inputOffsets)
+    deployer.deeployStateExportLevel = DeeployStateExportLevel[args.deeployStateExport.upper()]
+    deployer.batchSize = args.batchSize
 
     if not isinstance(
             platform, CMSISPlatform
     ) and not "simpleCNN" in args.dir and not "testRQMatMul" in args.dir and not "testRQGEMM" in args.dir:
         deployer.loweringOptimizer.passes.insert(0, EmulateCMSISRequantPass())
 
+    if args.shareConstants:
+        deployer = ConstantSharingDeployerWrapper(deployer)
+
+    if args.inPlaceAliasing:
+        deployer = InPlaceAliasingDeployerWrapper(deployer)
+
+    if args.profileLayers:
+        deployer = LayerProfilingDeployerWrapper(deployer)
+
+    compilerProfiler = CompilerProfiler() if args.profileCompiler is not None else None
+
     # Parse graph and infer output levels and signedness
-    _ = deployer.generateFunction(verbose = _NoVerbosity)
+    with compilerProfiler or nullcontext():
+        _ = deployer.generateFunction(verbose = _NoVerbosity)
 
     if args.overwriteRecentState:
         os.makedirs(f'./deeployStates/', exist_ok = True)
@@ -130,7 +183,13 @@ if __name__ == '__main__':
     f.write(testNetworkHeaderStr)
     f.close()
 
-    testNetworkImplementationStr = generateTestNetworkImplementation(deployer, platform, verbose = args.verbose)
+    testNetworkImplementationStr = generateTestNetworkImplementation(
+        deployer,
+        platform,
+        verbose = args.verbose,
+        binaryConstantDir = os.path.join(args.dumpdir, "constants") if args.incbin else None,
+        weightsBlob = os.path.join(args.dumpdir, "weights.bin") if args.weightsBlob is not None else None,
+        weightsBlobLoading = args.weightsBlob if args.weightsBlob is not None else "incbin")
     f = open(f'{args.dumpdir}/Network.c', "w")
     f.write(testNetworkImplementationStr)
     f.close()
@@ -149,3 +208,12 @@ if __name__ == '__main__':
         print()
         print(f"{'Number of Ops:' :<{_TEXT_ALIGN}} {num_ops}")
         print(f"{'Model Parameters: ' :<{_TEXT_ALIGN}} {deployer.getParameterSize()}")
+        if args.shareConstants:
+            constantSharingPass = deployer.constantSharingPass
+            print(f"{'Shared Constants (Count / Bytes):' :<{_TEXT_ALIGN}} "
+                  f"{len(constantSharingPass.sharedConstants)} / {constantSharingPass.savedBytes}")
+
+    if compilerProfiler is not None:
+        compilerProfiler.exportChromeTrace(args.profileCompiler)
+        print()
+        print(compilerProfiler.summary())
@@ -26,6 +26,8 @@
 import os
 import random
 from collections import OrderedDict
+from contextlib import nullcontext
+from functools import partial
 from typing import List, Union
 
 import numpy as np
@@ -36,20 +38,29 @@ from ortools.constraint_solver.pywrapcp import IntVar
 from testUtils.codeGenerate import generateL3HexDump, generateTestInputsHeader, generateTestNetworkHeader, \
     generateTestNetworkImplementation, generateTestOutputsHeader
 from testUtils.graphDebug import generateDebugConfig
-from testUtils.platformMapping import mapDeployer, mapPlatform, setupMemoryPlatform
+from testUtils.platformMapping import mapDeployer, mapPlatform, mapTilingCostModel, setupMemoryPlatform
 from testUtils.testRunner import TestGeneratorArgumentParser
 from testUtils.typeMapping import inferInputType
 
-from Deeploy.DeeployTypes import CodeGenVerbosity, ConstantBuffer, NetworkContext, NetworkDeployer, ONNXLayer, \
-    SubGraph, TransientBuffer
+from Deeploy.CommonExtensions.NetworkDeployers.ConstantSharingDeployer import ConstantSharingDeployerWrapper
+from Deeploy.CommonExtensions.NetworkDeployers.InPlaceAliasingDeployer import InPlaceAliasingDeployerWrapper
+from Deeploy.CompilerProfiling import CompilerProfiler
+from Deeploy.DeeployTypes import CodeGenVerbosity, ConstantBuffer, DeeployStateExportLevel, NetworkContext, \
+    NetworkDeployer, ONNXLayer, SubGraph, TransientBuffer
 from Deeploy.EngineExtension.NetworkDeployers.EngineColoringDeployer import EngineColoringDeployerWrapper
 from Deeploy.MemoryLevelExtension.MemoryLevels import MemoryHierarchy, MemoryLevel
 from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import MemoryDeployerWrapper
 from Deeploy.MemoryLevelExtension.OptimizationPasses.MemoryLevelAnnotationPasses import AnnotateDefaultMemoryLevel, \
     AnnotateIOMemoryLevel, AnnotateNeurekaWeightMemoryLevel
-from Deeploy.TilingExtension.MemoryScheduler import MemoryScheduler
+from Deeploy.Targets.PULPOpen.Platform import PULPClusterEngine, PULPReductionTilingMapping
+from Deeploy.TilingExtension.CPSATTilerModel import CPSATTilerModel
+from Deeploy.TilingExtension.LayerFusion import LayerFusion
+from Deeploy.TilingExtension.MemoryAwareScheduler import MemoryAwareScheduler
+from Deeploy.TilingExtension.MemoryScheduler import GreedyMemoryScheduler, MemoryScheduler
 from Deeploy.TilingExtension.TilerExtension import Tiler, TilerDeployerWrapper
 from Deeploy.TilingExtension.TilerModel import TilerModel
+from Deeploy.TilingExtension.TilingCodegen import tileTableStatistics
+from Deeploy.TilingExtension.TilingSolutionCache import TilingSolutionCache
 
 _TEXT_ALIGN = 30
 
@@ -145,6 +156,11 @@ class RandomizedSBTiler(DBTiler):
         return coefficient
 
 
+class GreedySBTiler(SBTiler):
+
+    memorySchedulerClass = GreedyMemoryScheduler
+
+
 # Mock of the Global Scheduler's inteface
 # Returns a list of list of nodes instead of simply a list
 # Inner list represent the patter over which we tile
@@ -194,6 +210,10 @@ def setupDeployer(graph: gs.Graph,
         platform.engines[0].enable3x3 = True
     if args.enableStrides:
         platform.engines[0].enableStrides = True
+    if args.reductionTiling:
+        for engine in platform.engines:
+            if isinstance(engine, PULPClusterEngine):
+                engine.Mapping = PULPReductionTilingMapping
 
     for index, num in enumerate(test_inputs):
         # WIESP: Do not infer types and offset of empty arrays
@@ -208,7 +228,7 @@ def setupDeployer(graph: gs.Graph,
                            inputTypes,
                            deeployStateDir = _DEEPLOYSTATEDIR,
                            inputOffsets = inputOffsets,
-                           scheduler = _mockScheduler)
+                           scheduler = MemoryAwareScheduler() if args.memoryAwareScheduler else _mockScheduler)
 
     # Make the deployer engine-color-aware
     if args.platform == "Siracusa_w_neureka":
@@ -231,14 +251,40 @@ def setupDeployer(graph: gs.Graph,
     # Make the deployer memory-level aware
     deployer = MemoryDeployerWrapper(deployer, memoryLevelAnnotationPasses)
 
+    # Share duplicated constants after the memory levels are annotated, but before tiling
+    if args.shareConstants:
+        deployer = ConstantSharingDeployerWrapper(deployer)
+
+    # Alias element-wise outputs after the memory levels are annotated, but before tiling
+    if args.inPlaceAliasing:
+        deployer = InPlaceAliasingDeployerWrapper(deployer)
+
     # Make the deployer tiler aware
     if args.doublebuffer:
         deployer = TilerDeployerWrapper(deployer, DBOnlyL3Tiler)
     elif args.randomizedMemoryScheduler:
         deployer = TilerDeployerWrapper(deployer, RandomizedSBTiler)
+    elif args.greedyMemoryScheduler:
+        deployer = TilerDeployerWrapper(deployer, GreedySBTiler)
     else:
         deployer = TilerDeployerWrapper(deployer, SBTiler)
 
+    if args.tilingCache is not None:
+        deployer.tiler.solutionCache = TilingSolutionCache(args.tilingCache, fixSolutions = args.fixTilingSolutions)
+
+    deployer.tiler.numWorkers = args.tilingWorkers
+
+    if args.latencyObjective:
+        deployer.tiler.costModel = mapTilingCostModel(args.platform)
+    if args.layerFusion:
+        deployer.tiler.layerFusion = LayerFusion()
+    if args.cpsat:
+        deployer.tiler.tilerModelFactory = partial(CPSATTilerModel,
+                                                   numSearchWorkers = args.solverWorkers,
+                                                   deterministic = not args.parallelSolver)
+    deployer.deeployStateExportLevel = DeeployStateExportLevel[args.deeployStateExport.upper()]
+    deployer.batchSize = args.batchSize
+
     deployer.frontEnd()
     deployer.midEnd()
 
@@ -286,7 +332,22 @@ if __name__ == '__main__':
                         default = False,
                         help = 'Adds EXPERIMENTAL support for strided convolutions on N-EUREKA\n')
     parser.add_argument('--randomizedMemoryScheduler', action = "store_true")
+    parser.add_argument('--greedyMemoryScheduler', action = "store_true")
+    parser.add_argument('--latencyObjective',
+                        action = "store_true",
+                        help = 'Minimize the estimated latency instead of maximizing the tile sizes\n')
+    parser.add_argument('--reductionTiling', action = "store_true")
+    parser.add_argument('--layerFusion', action = "store_true")
+    parser.add_argument('--memoryAwareScheduler', action = "store_true")
     parser.add_argument('--doublebuffer', action = 'store_true')
+    parser.add_argument('--inPlaceAliasing', action = 'store_true')
+    parser.add_argument('--shareConstants', action = 'store_true')
+    parser.add_argument('--batchSize',
+                        metavar = '<size>',
+                        dest = 'batchSize',
+                        type = int,
+                        default = 1,
+                        help = 'Number of samples per inference, the test vectors are repeated for every sample\n')
     parser.add_argument('--l1', metavar = 'l1', dest = 'l1', type = int, default = 64000, help = 'Set L1 size\n')
     parser.add_argument('--shouldFail', action = 'store_true')
     parser.add_argument('--profileTiling',
@@ -297,6 +358,31 @@ if __name__ == '__main__':
     parser.add_argument('--overwriteRecentState',
                         action = 'store_true',
                         help = 'Copy the recent deeply state to the ./deeployStates folder\n')
+    parser.add_argument('--tilingCache',
+                        metavar = 'tilingCache',
+                        dest = 'tilingCache',
+                        type = str,
+                        default = None,
+                        help = 'Directory of the persistent tiling solution cache\n')
+    parser.add_argument('--fixTilingSolutions',
+                        action = 'store_true',
+                        help = 'Reuse the cached tiling solutions as they are and only solve patterns without one\n')
+    parser.add_argument('--tilingWorkers',
+                        metavar = 'tilingWorkers',
+                        dest = 'tilingWorkers',
+                        type = int,
+                        default = None,
+                        help = 'Solve every pattern separately with the given number of worker processes\n')
+    parser.add_argument('--cpsat', action = "store_true", help = 'Solve the tiling models with CP-SAT\n')
+    parser.add_argument('--solverWorkers',
+                        metavar = 'solverWorkers',
+                        dest = 'solverWorkers',
+                        type = int,
+                        default = 8,
+                        help = 'Number of parallel CP-SAT search workers\n')
+    parser.add_argument('--parallelSolver',
+                        action = 'store_true',
+                        help = 'Solve with parallel CP-SAT search workers instead of a deterministic fixed search\n')
 
     parser.set_defaults(shouldFail = False)
     args = parser.parse_args()
@@ -333,6 +419,9 @@ if __name__ == '__main__':
             test_inputs = [test_inputs[0]]
             test_outputs = [test_outputs[-2]]
 
+    test_inputs = [np.tile(values, args.batchSize) for values in test_inputs]
+    test_outputs = [np.tile(values, args.batchSize) for values in test_outputs]
+
     # Instantiate Classes Requried for Memory Level Annotation Extension
     L3 = MemoryLevel(name = "L3", neighbourNames = ["L2"], size = 64000000)
     L2 = MemoryLevel(name = "L2", neighbourNames = ["L3", "L1"], size = 512000)
@@ -345,12 +434,17 @@ if __name__ == '__main__':
     memoryHierarchy = MemoryHierarchy(memoryLevels)
     memoryHierarchy.setDefaultMemoryLevel(args.defaultMemLevel)
 
-    deployer = setupDeployer(graph,
-                             memoryHierarchy,
-                             defaultTargetMemoryLevel = L1,
-                             defaultIoMemoryLevel = memoryHierarchy.memoryLevels[args.defaultMemLevel],
-                             verbose = verbosityCfg,
-                             overwriteRecentState = args.overwriteRecentState)
+    compilerProfiler = CompilerProfiler() if args.profileCompiler is not None else None
+
+    tileTableStatistics.reset()
+
+    with compilerProfiler or nullcontext():
+        deployer = setupDeployer(graph,
+                                 memoryHierarchy,
+                                 defaultTargetMemoryLevel = L1,
+                                 defaultIoMemoryLevel = memoryHierarchy.memoryLevels[args.defaultMemLevel],
+                                 verbose = verbosityCfg,
+                                 overwriteRecentState = args.overwriteRecentState)
 
     platform = deployer.Platform
     signProp = False
@@ -372,7 +466,8 @@ if __name__ == '__main__':
         print("Tiler test ended, failed as expected!")
     else:
 
-        _ = deployer.generateFunction(verbosityCfg)
+        with compilerProfiler or nullcontext():
+            _ = deployer.generateFunction(verbosityCfg)
 
         # Create input and output vectors
         os.makedirs(f'{args.dumpdir}', exist_ok = True)
@@ -417,5 +512,45 @@ if __name__ == '__main__':
             for level in deployer.worstCaseBufferSize.keys():
                 print(f"{'  ' + str(level) + ':' :<{_TEXT_ALIGN}} {deployer.worstCaseBufferSize[level]}")
             print(f"{'Model Parameters: ' :<{_TEXT_ALIGN}} {deployer.getParameterSize()}")
+            if args.shareConstants:
+                constantSharingPass = deployer.constantSharingPass
+                print(f"{'Shared Constants (Count / Bytes):' :<{_TEXT_ALIGN}} "
+                      f"{len(constantSharingPass.sharedConstants)} / {constantSharingPass.savedBytes}")
+            if args.tilingCache is not None:
+                solutionCache = deployer.tiler.solutionCache
+                print(f"{'Tiling Cache Hits: ' :<{_TEXT_ALIGN}} {solutionCache.hits}")
+                print(f"{'Tiling Cache Misses: ' :<{_TEXT_ALIGN}} {solutionCache.misses}")
+            solveStatistics = [statistics for statistics in deployer.tiler.solveStatistics if statistics is not None]
+            if solveStatistics != []:
+                print(f"{'Tiler Solve Time: ' :<{_TEXT_ALIGN}} "
+                      f"{sum(statistics.wallTime for statistics in solveStatistics):.3f}s")
+                print(f"{'Tiler Conflicts: ' :<{_TEXT_ALIGN}} "
+                      f"{sum(statistics.conflicts for statistics in solveStatistics)}")
+                for idx, statistics in enumerate(solveStatistics):
+                    if statistics.objectiveBound is None:
+                        continue
+                    print(f"{'  Model ' + str(idx) + ' Objective / Bound:' :<{_TEXT_ALIGN}} "
+                          f"{statistics.objectiveValue} / {statistics.objectiveBound} ({statistics.status})")
+            print('Tile Tables (Count / Bytes):')
+            print(f"{'  Emitted:' :<{_TEXT_ALIGN}} "
+                  f"{tileTableStatistics.emittedTables} / {tileTableStatistics.emittedBytes}")
+            print(f"{'  Compressed:' :<{_TEXT_ALIGN}} "
+                  f"{tileTableStatistics.compressedTables} / {tileTableStatistics.compressedBytes}")
+            print(f"{'  Shared:' :<{_TEXT_ALIGN}} "
+                  f"{tileTableStatistics.sharedTables} / {tileTableStatistics.sharedBytes}")
+            print('Arena Size / Lower Bound:')
+            for name, scheduler in (("Tiles", deployer.tiler.innerMemoryScheduler),
+                                    ("Home", deployer.tiler.outerMemoryScheduler)):
+                for level, (arenaSize, lowerBound) in scheduler.fragmentationReport().items():
+                    if lowerBound == 0:
+                        continue
+                    fragmentation = 100 * (arenaSize - lowerBound) / lowerBound
+                    print(f"{'  ' + name + ' ' + str(level) + ':' :<{_TEXT_ALIGN}} "
+                          f"{arenaSize} / {lowerBound} ({fragmentation:.1f}% fragmentation)")
 
         print("Tiler test ended, no memory violations!")
+
+    if compilerProfiler is not None:
+        compilerProfiler.exportChromeTrace(args.profileCompiler)
+        print()
+        print(compilerProfiler.summary())
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------------------
+#
+# File: testReferenceInterpreter.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+
+import numpy as np
+import onnx
+import onnx_graphsurgeon as gs
+from testUtils.platformMapping import mapDeployer, mapPlatform
+from testUtils.referenceInterpreter import PULPReferenceKernels, ReferenceInterpreter
+from testUtils.testRunner import TestGeneratorArgumentParser
+from testUtils.typeMapping import inferInputType
+
+from Deeploy.CommonExtensions.OptimizationPasses.TopologyOptimizationPasses.DebugPasses import EmulateCMSISRequantPass
+from Deeploy.Targets.CortexM.Platform import CMSISPlatform
+from Deeploy.Targets.PULPOpen.Platform import PULPPlatform
+
+_TEXT_ALIGN = 30
+
+if __name__ == '__main__':
+
+    parser = TestGeneratorArgumentParser(
+        description = "Run the lowered graph of a test with the NumPy reference interpreter and check its outputs.")
+    parser.add_argument('--dumpActivations',
+                        action = 'store_true',
+                        default = False,
+                        help = 'Write all reference tensors to activations.npz in the dump directory\n')
+
+    args = parser.parse_args()
+
+    graph = gs.import_onnx(onnx.load_model(f'{args.dir}/network.onnx'))
+    inputs = np.load(f'{args.dir}/inputs.npz')
+    outputs = np.load(f'{args.dir}/outputs.npz')
+
+    test_inputs = [inputs[x].reshape(-1).astype(np.float64) for x in inputs.files]
+    test_outputs = [outputs[x].astype(np.float64) for x in outputs.files]
+
+    platform, signProp = mapPlatform(args.platform)
+
+    inputTypes = {}
+    inputOffsets = {}
+    for index, num in enumerate(test_inputs):
+        if np.prod(num.shape) == 0:
+            continue
+        _type, offset = inferInputType(num, signProp)[0]
+        inputTypes[f"input_{index}"] = _type
+        inputOffsets[f"input_{index}"] = offset
+
+    deployer = mapDeployer(platform,
+                           graph,
+                           inputTypes,
+                           deeployStateDir = os.path.join(args.dumpdir, "deeployStates"),
+                           inputOffsets = inputOffsets)
+
+    if not isinstance(
+            platform, CMSISPlatform
+    ) and not "simpleCNN" in args.dir and not "testRQMatMul" in args.dir and not "testRQGEMM" in args.dir:
+        deployer.loweringOptimizer.passes.insert(0, EmulateCMSISRequantPass())
+
+    deployer.frontEnd()
+
+    kernels = PULPReferenceKernels if isinstance(platform, PULPPlatform) else None
+    interpreter = ReferenceInterpreter(deployer, kernels)
+    tensors = interpreter.run(test_inputs)
+
+    errors = 0
+    for index, (golden, result) in enumerate(zip(test_outputs, interpreter.outputs(tensors))):
+        mismatches = int(np.sum(golden.reshape(-1).astype(result.dtype) != result.reshape(-1)))
+        errors += mismatches
+        print(f"{f'Output {index} mismatches:' :<{_TEXT_ALIGN}} {mismatches} of {result.size}")
+        if mismatches and args.verbose:
+            print(f"Expected {golden.reshape(-1)[:16]}\nGot      {result.reshape(-1)[:16]}")
+
+    if os.path.isfile(f'{args.dir}/activations.npz'):
+        activations = np.load(f'{args.dir}/activations.npz')
+        matches = interpreter.matchActivations(tensors, activations)
+        print(f"{'Matched activations:' :<{_TEXT_ALIGN}} "
+              f"{sum(name is not None for name in matches.values())} of {len(matches)}")
+        if args.verbose:
+            for goldenName, name in matches.items():
+                print(f"{'':<{_TEXT_ALIGN}} {goldenName} -> {name}")
+
+    if args.dumpActivations:
+        os.makedirs(args.dumpdir, exist_ok = True)
+        np.savez(os.path.join(args.dumpdir, "activations.npz"), **tensors)
+
+    if errors:
+        print(f"Reference interpreter does not match the golden outputs of {args.dir}!")
+        sys.exit(1)
+
+    print(f"Reference interpreter matches the golden outputs of {args.dir}!")
@@ -29,7 +29,7 @@ import re
 import onnx
 import onnx_graphsurgeon as gs
 
-from Deeploy.CommonExtensions.OptimizationPasses.Matchers import Match, NonBranchingMatcher
+from Deeploy.CommonExtensions.OptimizationPasses.Matchers import Match, NonBranchingMatcher, OpTypeIndex
 from Deeploy.CommonExtensions.OptimizationPasses.PassClasses import ReplaceSequentialPatternPass, contextagnostic
 from Deeploy.DeeployTypes import TopologyOptimizer
 
@@ -51,7 +51,7 @@ def _rename_conv_to_test_conv(graph: gs.Graph, match: Match, name: str):
 @contextagnostic
 class ConvTestPass(ReplaceSequentialPatternPass):
 
-    def __init__(self):
+    def __init__(self, batched: bool = True):
         pattern = gs.Graph()
         _input = gs.Variable(name = 'input_1')
         output = pattern.layer(inputs = [_input], outputs = ['conv_out'], op = test_regex, name = 'conv1')
@@ -59,7 +59,11 @@ class ConvTestPass(ReplaceSequentialPatternPass):
         pattern.inputs.append(_input)
 
         name = "_CONV_TEST_PASS"
-        super().__init__(pattern, _rename_conv_to_test_conv, name, NonBranchingMatcher(regex_op = True))
+        super().__init__(pattern,
+                         _rename_conv_to_test_conv,
+                         name,
+                         NonBranchingMatcher(regex_op = True),
+                         batched = batched)
 
 
 if __name__ == "__main__":
@@ -83,4 +87,15 @@ if __name__ == "__main__":
 
     assert match_count == test_op_name_count, "Didn't match all the operations."
 
+    # The op type index has to follow the rewrites
+    indexed_nodes = OpTypeIndex.fromGraph(optimized_graph).nodes(test_op_name)
+    assert indexed_nodes == [node for node in optimized_graph.nodes if node.op == test_op_name], \
+        "Op type index is out of sync with the graph."
+
+    # Rewriting the matches one by one has to give the same graph
+    unbatched_graph = TopologyOptimizer([ConvTestPass(batched = False)]).optimize(gs.import_onnx(model))
+    unbatched_nodes = [(node.name, node.op) for node in unbatched_graph.nodes]
+    batched_nodes = [(node.name, node.op) for node in optimized_graph.nodes]
+    assert unbatched_nodes == batched_nodes, "Batched and unbatched rewrites differ."
+
     print("Test passed")
@@ -30,8 +30,44 @@ if __name__ == "__main__":
     parser = TestRunnerArgumentParser(
         tiling_arguments = False,
         description = "Deeploy Code Generation Utility for the Generic Platform (Host Machine, no Tiling).")
+    parser.add_argument('-n',
+                        metavar = 'num_threads',
+                        dest = 'num_threads',
+                        type = int,
+                        default = 1,
+                        help = 'Number of host threads\n')
+    parser.add_argument('--benchmark',
+                        metavar = 'iterations',
+                        dest = 'benchmark',
+                        type = int,
+                        default = 0,
+                        help = 'Time the given number of inferences and profile every layer\n')
+    parser.add_argument('--warmup',
+                        metavar = 'iterations',
+                        dest = 'warmup',
+                        type = int,
+                        default = 10,
+                        help = 'Number of untimed inferences before the benchmark\n')
+    parser.add_argument('--benchmarkReport',
+                        metavar = '<file>',
+                        dest = 'benchmarkReport',
+                        type = str,
+                        default = None,
+                        help = 'Append the benchmark results as a JSON line to the given file\n')
     args = parser.parse_args()
 
-    testRunner = TestRunner(platform = "Generic", simulator = "host", tiling = False, argument_parser = parser)
+    gen_args = "--multithreaded" if args.num_threads > 1 else ""
+    if args.benchmark > 0:
+        gen_args += " --profileLayers"
+
+    testRunner = TestRunner(platform = "Generic",
+                            simulator = "host",
+                            tiling = False,
+                            argument_parser = parser,
+                            gen_args = gen_args,
+                            benchmark_report = args.benchmarkReport)
+
+    testRunner.cmake_args += f" -D num_threads={args.num_threads}"
+    testRunner.cmake_args += f" -D benchmark_iterations={args.benchmark} -D benchmark_warmup={args.warmup}"
 
     testRunner.run()
@@ -0,0 +1,41 @@
+# ----------------------------------------------------------------------
+#
+# File: testRunner_regression.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from testUtils.regressionRunner import RegressionRunner, RegressionRunnerArgumentParser
+
+if __name__ == "__main__":
+
+    parser = RegressionRunnerArgumentParser(
+        description = "Deeploy Regression Test Runner, runs many tests on many platforms in parallel.")
+    args = parser.parse_args()
+
+    regressionRunner = RegressionRunner(args)
+    regressionRunner.run()
+
+    regressionRunner.printSummary()
+    regressionRunner.writeReport(args.report, args.csv)
+
+    if any(result.status != "passed" for result in regressionRunner.results):
+        sys.exit(1)
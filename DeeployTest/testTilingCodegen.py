@@ -0,0 +1,108 @@
+# ----------------------------------------------------------------------
+#
+# File: testTilingCodegen.py
+#
+# Last edited: 18.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from Deeploy.AbstractDataTypes import PointerClass
+from Deeploy.CommonExtensions.DataTypes import int32_t
+from Deeploy.DeeployTypes import VariableBuffer
+from Deeploy.TilingExtension.MemoryConstraints import MemoryConstraint
+from Deeploy.TilingExtension.TilingCodegen import HyperRectangle, MemoryTransfer, TilingSchedule, \
+    VariableReplacementScheme, calculateRectangleArrayOffsets, calculateRectangleOffset, computeHyperRectangleArray, \
+    computeHyperRectangleList, minimizeRectangleArrayDims, minimizeRectangleDims, minimizeVariableReplacement
+
+# Pairs of buffer and tile shapes
+testShapes = [
+    ((1, 32, 32, 16), (1, 5, 32, 16)),
+    ((1, 32, 32, 16), (1, 7, 6, 16)),
+    ((4, 9, 13), (3, 2, 13)),
+    ((64, 48), (16, 48)),
+    ((64, 48), (64, 48)),
+    ((17,), (4,)),
+]
+
+
+def _memoryTransfer(largeShape, smallShape) -> MemoryTransfer:
+    source = MemoryConstraint("L2", int(np.prod(largeShape)))
+    source.shape = largeShape
+    destination = MemoryConstraint("L1", int(np.prod(smallShape)))
+    destination.shape = smallShape
+    return MemoryTransfer(source, destination)
+
+
+if __name__ == "__main__":
+
+    for largeShape, smallShape in testShapes:
+        buffer = VariableBuffer("buffer", largeShape)
+        buffer._type = PointerClass(int32_t)
+
+        rectangles = computeHyperRectangleArray(_memoryTransfer(largeShape, smallShape))
+
+        # Every element has to be transferred exactly once
+        coverage = np.zeros(largeShape, dtype = np.int64)
+        for rect in rectangles:
+            coverage[tuple(slice(offset, offset + dim) for offset, dim in zip(rect.offset, rect.dims))] += 1
+        assert np.all(coverage == 1), f"Tiles of {smallShape} do not cover {largeShape} exactly once"
+
+        assert computeHyperRectangleList(_memoryTransfer(largeShape, smallShape)) == rectangles.toList(), \
+            "List and array tile enumerations differ"
+
+        offsets = calculateRectangleArrayOffsets(rectangles, buffer)
+        expectedOffsets = np.ravel_multi_index(rectangles.offsets.T, largeShape) * 4
+        assert np.array_equal(offsets, expectedOffsets), f"Wrong tile offsets for {smallShape} in {largeShape}"
+
+        minimalRects, baselineRects = minimizeRectangleArrayDims(rectangles, buffer)
+        for idx, rect in enumerate(rectangles):
+            assert (minimalRects[idx], baselineRects[idx]) == minimizeRectangleDims(rect, buffer), \
+                f"Minimizing {rect} alone and in an array differ"
+            assert np.prod(minimalRects[idx].dims) == np.prod(rect.dims), f"Minimizing {rect} changed its size"
+            assert calculateRectangleOffset(rect, buffer) == offsets[idx], f"Offset of {rect} differs"
+
+    # The per-step view has to reproduce the original load schedule
+    inputLoadSchedule = [{"A": HyperRectangle((idx, 0), (1, 8)), "B": HyperRectangle((0,), (8,))} for idx in range(4)]
+    outputLoadSchedule = [{"C": HyperRectangle((idx, 0), (1, 8))} for idx in range(4)]
+    schedule = TilingSchedule({"A": [0], "B": [64]}, {"C": [128]}, inputLoadSchedule, outputLoadSchedule)
+
+    assert list(schedule.inputLoadSchedule) == inputLoadSchedule, "Input load schedule view differs"
+    assert schedule.outputLoadSchedule[-1] == outputLoadSchedule[-1], "Output load schedule view differs"
+
+    flatSchedule = schedule + schedule
+    assert list(flatSchedule.inputLoadSchedule) == inputLoadSchedule * 2, "Concatenated load schedule differs"
+
+    # Output tiles accumulated over several steps are only written back after the last of them
+    assert np.all(schedule.outputWriteBackMask()), "Distinct output tiles have to be written back"
+    reductionSchedule = TilingSchedule({"A": [0]}, {"C": [128]}, inputLoadSchedule,
+                                       [step for step in outputLoadSchedule[:2] for _ in range(2)])
+    assert reductionSchedule.outputWriteBackMask().tolist() == [False, True, False, True], \
+        "Repeated output tiles have to be written back once"
+
+    perTileReplacements = {"size": [8, 8, 8, 8], "offset": [0, 8, 16, 24]}
+    replacements = VariableReplacementScheme(perTileReplacements, {
+        "size": PointerClass(int32_t),
+        "offset": PointerClass(int32_t)
+    })
+    minimalReplacements, operatorRepresentation = minimizeVariableReplacement(replacements + replacements, {})
+    assert operatorRepresentation == {"size": 8}, "Constant replacements have to be folded"
+    assert list(minimalReplacements.perTileReplacements["offset"]) == [0, 8, 16, 24] * 2, "Replacements differ"
+
+    print("Tiling codegen test passed!")
@@ -29,7 +29,9 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
-from Deeploy.DeeployTypes import ConstantBuffer, DeploymentPlatform, NetworkDeployer, VariableBuffer
+from Deeploy.AbstractDataTypes import IntegerImmediate
+from Deeploy.CommonExtensions.NetworkDeployers.LayerProfilingDeployer import LayerProfilingDeployerWrapper
+from Deeploy.DeeployTypes import ConstantBuffer, DeploymentPlatform, NetworkDeployer, VariableBuffer, formatArrayValues
 from Deeploy.Targets.MemPool.Platform import MemPoolPlatform
 
 _TEXT_ALIGN = 30
@@ -51,6 +53,24 @@ def _shapeBroadcast(ctxt, value, name):
     return broadcastNum
 
 
+def _testVectorString(values: np.ndarray, data_type) -> str:
+    data_width = data_type.referencedType.typeWidth
+
+    # WIESEP: Arrays have to be 4 byte alinged (at lest in banshee)
+    bytes = len(values) * (data_width // 8)
+    if bytes % 4 != 0:
+        bytes = 4 * int((bytes / 4 + 1))
+        padding = (bytes * 8) // data_width - len(values)
+        values = np.pad(values, (0, padding), 'constant')
+
+    # Integer vectors are stored as float64, emit them as integer literals
+    if issubclass(data_type.referencedType, IntegerImmediate):
+        assert np.all(np.abs(values - np.round(values)) < 0.001), "Integer test vector has non-integer values!"
+        values = np.round(values).astype(np.int64)
+
+    return formatArrayValues(values)
+
+
 def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List, inputTypes: Dict, inputOffsets: Dict) -> str:
     retStr = ""
     inputNames = [deployer.ctxt.lookup(buf.name) for buf in deployer.graph.inputs]
@@ -70,21 +90,10 @@ def generateTestInputsHeader(deployer: NetworkDeployer, test_inputs: List, input
         broadcastNum = _shapeBroadcast(deployer.ctxt, num, f"input_{index}")
 
         data_type = inputTypes[f"input_{index}"]
-        data_width = inputTypes[f"input_{index}"].referencedType.typeWidth
 
         retStr += f"{data_type.referencedType.typeName} testInputVector{index}[] ="
         retStr += "{"
-        list_str = (", ").join([str(x) for x in broadcastNum])
-
-        # WIESEP: Arrays have to be 4 byte alinged (at lest in banshee)
-        bytes = len(broadcastNum) * (data_width // 8)
-        if bytes % 4 != 0:
-            bytes = 4 * int((bytes / 4 + 1))
-            padding = (bytes * 8) // data_width - len(broadcastNum)
-            list_str += ", "
-            list_str += (", ").join([str(0) for x in range(padding)])
-
-        retStr += list_str
+        retStr += _testVectorString(broadcastNum, data_type)
         retStr += "};\n"
 
     retStr += f"void* testInputVector[{len(inputTypes)}] = " + "{"
@@ -124,21 +133,9 @@ def generateTestOutputsHeader(deployer: NetworkDeployer,
                 ((1 - output_signed[f"output_{index}"]) * (output_n_levels[f"output_{index}"] / 2)))
 
         data_type = output_data_type[f"output_{index}"]
-        data_width = data_type.referencedType.typeWidth
         retStr += f"{data_type.referencedType.typeName} testOutputVector{index}[] ="
         retStr += "{"
-
-        # WIESEP: Arrays have to be 4 byte alinged (at lest in banshee)
-        list_str = (", ").join([str(x) for x in num])
-
-        bytes = len(num) * (data_width // 8)
-        if bytes % 4 != 0:
-            bytes = 4 * int((bytes / 4 + 1))
-            padding = (bytes * 8) // data_width - len(num)
-            list_str += ", "
-            list_str += (", ").join([str(0) for x in range(padding)])
-
-        retStr += list_str
+        retStr += _testVectorString(num, data_type)
         retStr += "};\n"
 
     retStr += f"void* testOutputVector[{len(test_outputs)}] = " + "{"
@@ -176,6 +173,8 @@ def generateTestNetworkHeader(deployer: NetworkDeployer, platform: DeploymentPla
     """
 
     retStr += deployer.generateIOBufferInitializationCode()
+    if isinstance(deployer, LayerProfilingDeployerWrapper):
+        retStr += deployer.generateLayerProfilingDeclarations()
     retStr += """
     #endif
     """
@@ -185,7 +184,10 @@ def generateTestNetworkHeader(deployer: NetworkDeployer, platform: DeploymentPla
 
 def generateTestNetworkImplementation(deployer: NetworkDeployer,
                                       platform: DeploymentPlatform,
-                                      verbose: Optional[bool] = None) -> str:
+                                      verbose: Optional[bool] = None,
+                                      binaryConstantDir: Optional[str] = None,
+                                      weightsBlob: Optional[str] = None,
+                                      weightsBlobLoading: str = "incbin") -> str:
 
     if verbose is None:
         verbose = False
@@ -202,7 +204,9 @@ def generateTestNetworkImplementation(deployer: NetworkDeployer,
 
     """
 
-    retStr += deployer.generateBufferInitializationCode()
+    retStr += deployer.generateBufferInitializationCode(binaryConstantDir,
+                                                        weightsBlob = weightsBlob,
+                                                        weightsBlobLoading = weightsBlobLoading)
     retStr += deployer.generateGlobalDefinitionCode()
 
     # WIESEP: Mempool assigns section attributes to intermediate buffers to allow .
@@ -33,7 +33,7 @@ from Deeploy.MemoryLevelExtension.NetworkDeployers.MemoryLevelDeployer import Me
 from Deeploy.Targets.CortexM.Deployer import CMSISDeployer
 from Deeploy.Targets.CortexM.Platform import CMSISOptimizer, CMSISPlatform
 from Deeploy.Targets.Generic.Deployer import GenericDeployer
-from Deeploy.Targets.Generic.Platform import GenericOptimizer, GenericPlatform
+from Deeploy.Targets.Generic.Platform import GenericEngine, GenericOptimizer, GenericParallelMapping, GenericPlatform
 from Deeploy.Targets.MemPool.Deployer import MemPoolDeployer
 from Deeploy.Targets.MemPool.Platform import MemPoolOptimizer, MemPoolPlatform
 from Deeploy.Targets.Neureka.Deployer import NeurekaDeployer
@@ -41,6 +41,8 @@ from Deeploy.Targets.Neureka.Platform import MemoryNeurekaPlatform, MemoryNeurek
     NeurekaPlatform
 from Deeploy.Targets.PULPOpen.Deployer import PULPDeployer
 from Deeploy.Targets.PULPOpen.Platform import MemoryPULPPlatform, MemoryPULPPlatformWrapper, PULPOptimizer, PULPPlatform
+from Deeploy.Targets.PULPOpen.TilingCostModel import SiracusaTilingCostModel
+from Deeploy.TilingExtension.TilingCostModel import TilingCostModel
 
 _SIGNPROP_PLATFORMS = ["Apollo3", "Apollo4", "QEMU-ARM", "Generic", "MemPool"]
 _NONSIGNPROP_PLATFORMS = ["Siracusa", "Siracusa_w_neureka", "PULPOpen"]
@@ -51,7 +53,7 @@ def defaultScheduler(graph: gs.Graph):
     return graph.nodes
 
 
-def mapPlatform(platformName: str) -> Tuple[DeploymentPlatform, bool]:
+def mapPlatform(platformName: str, multithreaded: bool = False) -> Tuple[DeploymentPlatform, bool]:
 
     assert platformName in _PLATFORMS,\
         "Platform's signprop preference is unknown! Add it in platformMapping.py."
@@ -67,6 +69,9 @@ def mapPlatform(platformName: str) -> Tuple[DeploymentPlatform, bool]:
     elif platformName == "MemPool":
         Platform = MemPoolPlatform()
 
+    elif platformName == "Generic" and multithreaded:
+        Platform = GenericPlatform(engines = [GenericEngine("Generic", Mapping = GenericParallelMapping)])
+
     elif platformName == "Generic":
         Platform = GenericPlatform()
 
@@ -79,9 +84,20 @@ def mapPlatform(platformName: str) -> Tuple[DeploymentPlatform, bool]:
     else:
         raise RuntimeError(f"Deployment platform {platformName} is not implemented")
 
+    if multithreaded and platformName != "Generic":
+        raise RuntimeError(f"Multi-threaded kernels are only implemented for the Generic platform, not {platformName}")
+
     return Platform, signProp
 
 
+def mapTilingCostModel(platformName: str) -> TilingCostModel:
+
+    if platformName == "Siracusa" or platformName == "PULPOpen":
+        return SiracusaTilingCostModel
+
+    raise RuntimeError(f"No tiling cost model is calibrated for the {platformName} platform")
+
+
 def setupMemoryPlatform(platform: DeploymentPlatform, memoryHierarchy: MemoryHierarchy,
                         defaultTargetMemoryLevel: MemoryLevel) -> Union[MemoryPlatform, MemoryPlatformWrapper]:
     if isinstance(platform, PULPPlatform):
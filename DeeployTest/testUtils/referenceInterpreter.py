@@ -0,0 +1,769 @@
+# ----------------------------------------------------------------------
+#
+# File: referenceInterpreter.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Host-side NumPy reference for lowered and parsed Deeploy graphs.
+
+All tensors are handled in their true integer domain, i.e. the domain of the golden ``inputs.npz``, ``outputs.npz`` and
+``activations.npz`` files. Kernels reproduce the integer arithmetic of the target kernels (truncating divisions, 32 bit
+intermediates, rounding shifts, clipping), while the interpreter takes care of the storage of every result in the type
+and offset that type checking assigned to its buffer.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from Deeploy.DeeployTypes import ConstantBuffer, NetworkContext, NetworkDeployer, OperatorRepresentation, VariableBuffer
+
+ReferenceKernel = Callable[[Dict[str, np.ndarray], OperatorRepresentation, int], np.ndarray]
+
+
+def bufferOffset(buffer: VariableBuffer) -> int:
+    """Offset between the true and the stored value of a buffer
+
+    Unsigned values are stored with an offset of nLevels / 2 in signed types, just like the kernel templates assume.
+    """
+    if not (hasattr(buffer, "_signed") and hasattr(buffer, "nLevels")) or buffer._signed:
+        return 0
+    if buffer._type.referencedType.typeMin >= 0:
+        return 0
+    return int(buffer.nLevels // 2)
+
+
+def wrap(values: np.ndarray, typeWidth: int, signed: bool = True) -> np.ndarray:
+    """Wrap integer values around like a cast to a C integer type of the given width"""
+    values = np.asarray(values, dtype = np.int64)
+    if typeWidth >= 64:
+        return values
+    values = values & ((1 << typeWidth) - 1)
+    if signed:
+        values = np.where(values >= (1 << (typeWidth - 1)), values - (1 << typeWidth), values)
+    return values
+
+
+def cDiv(nom: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    """Integer division truncating towards zero like C"""
+    nom = np.asarray(nom, dtype = np.int64)
+    denom = np.asarray(denom, dtype = np.int64)
+    quotient = np.abs(nom) // np.abs(denom)
+    return np.where((nom < 0) != (denom < 0), -quotient, quotient)
+
+
+def isqrt(values: np.ndarray) -> np.ndarray:
+    """Integer floor square root of non-negative values"""
+    values = np.maximum(np.asarray(values, dtype = np.int64), 0)
+    root = np.floor(np.sqrt(values.astype(np.float64))).astype(np.int64)
+    root = np.where(root * root > values, root - 1, root)
+    return np.where((root + 1) * (root + 1) <= values, root + 1, root)
+
+
+def requantShift(values: np.ndarray, mul: np.ndarray, add: np.ndarray, log2D: int, rounding: bool = True) -> np.ndarray:
+    """``((values * mul + add) + 2**(log2D - 1)) >> log2D`` with 32 bit intermediates
+
+    Without ``rounding``, the rounding term is assumed to be folded into ``add`` already.
+    """
+    intermediate = wrap(values * mul + add, 32)
+    if log2D == 0 or not rounding:
+        return intermediate >> log2D
+    return wrap(intermediate + (1 << (log2D - 1)), 32) >> log2D
+
+
+def clipStored(values: np.ndarray, outputOffset: int, minValue: int, maxValue: int) -> np.ndarray:
+    """Clip values to the range a kernel clips their stored representation to"""
+    return np.clip(values, minValue + outputOffset, maxValue + outputOffset)
+
+
+def _channelBroadcast(values: np.ndarray, channels: int, channelsFirst: bool) -> np.ndarray:
+    values = np.asarray(values, dtype = np.int64).reshape(-1)
+    if values.size == 1:
+        return values.reshape(1, 1, 1)
+    # Kernels only read the first parameter of every channel, even if type inference broadcast the buffer
+    assert values.size % channels == 0, f"Expected {channels} channel parameters, got {values.size}!"
+    values = values[:channels]
+    if channelsFirst:
+        return values.reshape(1, channels, 1)
+    return values.reshape(1, channels)
+
+
+def _toChannelsFirst(data: np.ndarray, channelsFirst: bool) -> np.ndarray:
+    if channelsFirst:
+        return data
+    return np.moveaxis(data, -1, 1)
+
+
+def _fromChannelsFirst(data: np.ndarray, channelsFirst: bool) -> np.ndarray:
+    if channelsFirst:
+        return data
+    return np.moveaxis(data, 1, -1)
+
+
+def _slidingWindows(data: np.ndarray, kernelShape: Sequence[int], strides: Sequence[int],
+                    dilations: Sequence[int]) -> np.ndarray:
+    # Returns a [N, C, *outputShape, *kernelShape] view of the channels first data
+    spatialDims = len(kernelShape)
+    extent = [(k - 1) * d + 1 for k, d in zip(kernelShape, dilations)]
+    windows = np.lib.stride_tricks.sliding_window_view(data, extent, axis = tuple(range(2, 2 + spatialDims)))
+    selection = (slice(None), slice(None))
+    selection += tuple(slice(None, None, s) for s in strides)
+    selection += tuple(slice(None, None, d) for d in dilations)
+    return windows[selection]
+
+
+def _pads(operatorRepresentation: OperatorRepresentation, spatialDims: int) -> List[int]:
+    pads = [int(pad) for pad in operatorRepresentation.get('pads', [0] * 2 * spatialDims)]
+    return pads if len(pads) == 2 * spatialDims else [0] * 2 * spatialDims
+
+
+def _conv(data: np.ndarray,
+          weight: np.ndarray,
+          operatorRepresentation: OperatorRepresentation,
+          inputChannelsFirst: Optional[bool] = None) -> np.ndarray:
+    channelsFirst = operatorRepresentation.get('channels_first', True)
+    if inputChannelsFirst is None:
+        inputChannelsFirst = channelsFirst
+    group = int(operatorRepresentation.get('group', 1))
+    spatialDims = data.ndim - 2
+
+    data = _toChannelsFirst(data, inputChannelsFirst)
+    if not channelsFirst:
+        # Lowering stores dense weights as [O, *K, I] and depthwise weights as [1, *K, O] or [O, *K, 1]
+        if group > 1 and weight.shape[0] == 1:
+            weight = np.moveaxis(weight, (-1, 0), (0, 1))
+        else:
+            weight = np.moveaxis(weight, -1, 1)
+
+    kernelShape = weight.shape[2:]
+    strides = operatorRepresentation.get('strides', [1] * spatialDims)
+    dilations = operatorRepresentation.get('dilations', [1] * spatialDims)
+    pads = _pads(operatorRepresentation, spatialDims)
+    if any(pads):
+        data = np.pad(data, [(0, 0), (0, 0)] + [(pads[idx], pads[idx + spatialDims]) for idx in range(spatialDims)])
+
+    windows = _slidingWindows(data, kernelShape, strides, dilations)
+    batch, channels = windows.shape[:2]
+    outputShape = windows.shape[2:2 + spatialDims]
+
+    windows = windows.reshape(batch, group, channels // group, *outputShape, -1)
+    weight = weight.reshape(group, weight.shape[0] // group, weight.shape[1], -1)
+    output = np.einsum("ngc...k,gock->ngo...", windows, weight)
+    output = output.reshape(batch, -1, *outputShape)
+
+    return _fromChannelsFirst(output, channelsFirst)
+
+
+def _convKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                outputOffset: int) -> np.ndarray:
+    output = _conv(inputs['data_in'], inputs['weight'], operatorRepresentation)
+    if 'bias' in inputs:
+        bias = inputs['bias'].reshape(-1)
+        if operatorRepresentation.get('channels_first', True):
+            bias = bias.reshape(-1, *([1] * (output.ndim - 2)))
+        output = output + bias
+    return output
+
+
+def _requantizedConvKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                           outputOffset: int) -> np.ndarray:
+    output = _conv(inputs['data_in'], inputs['weight'], operatorRepresentation)
+    return _requantize(output, inputs['mul'], inputs['add'], operatorRepresentation, outputOffset)
+
+
+def _requantize(values: np.ndarray,
+                mul: np.ndarray,
+                add: np.ndarray,
+                operatorRepresentation: OperatorRepresentation,
+                outputOffset: int,
+                rounding: bool = True) -> np.ndarray:
+    channelsFirst = operatorRepresentation.get('channels_first', True)
+    shape = values.shape
+    channels = shape[1] if (channelsFirst and values.ndim > 2) else shape[-1]
+    if channelsFirst and values.ndim > 2:
+        flat = values.reshape(shape[0], channels, -1)
+    else:
+        flat = values.reshape(-1, channels)
+
+    mul = _channelBroadcast(mul, channels, channelsFirst and values.ndim > 2)
+    add = _channelBroadcast(add, channels, channelsFirst and values.ndim > 2)
+    if mul.ndim > flat.ndim:
+        mul, add = mul.reshape(-1), add.reshape(-1)
+
+    output = requantShift(flat, mul, add, int(operatorRepresentation['log2D']), rounding)
+    return _clipRequantized(output, operatorRepresentation, outputOffset).reshape(shape)
+
+
+def _clipRequantized(values: np.ndarray, operatorRepresentation: OperatorRepresentation,
+                     outputOffset: int) -> np.ndarray:
+    # Platforms without sign propagation store unsigned outputs directly and clip them to [0, n_levels - 1]
+    nLevels = int(operatorRepresentation['n_levels'])
+    if outputOffset == 0 and not operatorRepresentation.get('signed', True):
+        return np.clip(values, 0, nLevels - 1)
+    return clipStored(values, outputOffset, -(nLevels // 2), nLevels // 2 - 1)
+
+
+def _requantShiftKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                        outputOffset: int) -> np.ndarray:
+    data, mul, add = inputs['data_in'], inputs['mul'], inputs['add']
+    channelsFirst = operatorRepresentation.get('channels_first', True)
+    channels = int(operatorRepresentation['channels'])
+
+    if channelsFirst:
+        flat = data.reshape(-1, channels, int(operatorRepresentation['channel_width']))
+    else:
+        flat = data.reshape(-1, channels)
+
+    mul = _channelBroadcast(mul, channels, channelsFirst)
+    add = _channelBroadcast(add, channels, channelsFirst)
+    if mul.ndim > flat.ndim:
+        mul, add = mul.reshape(-1), add.reshape(-1)
+
+    output = requantShift(flat, mul, add, int(operatorRepresentation['log2D']))
+    return _clipRequantized(output, operatorRepresentation, outputOffset).reshape(data.shape)
+
+
+def _gemm(A: np.ndarray, B: np.ndarray, operatorRepresentation: OperatorRepresentation) -> np.ndarray:
+    if operatorRepresentation.get('transA', 0):
+        A = np.swapaxes(A, -1, -2)
+    if operatorRepresentation.get('transB', 0):
+        B = np.swapaxes(B, -1, -2)
+    return np.matmul(A, B)
+
+
+def _gemmKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                outputOffset: int) -> np.ndarray:
+    output = int(operatorRepresentation.get('alpha', 1)) * _gemm(inputs['A'], inputs['B'], operatorRepresentation)
+    if 'C' in inputs:
+        output = output + int(operatorRepresentation.get('beta', 1)) * inputs['C']
+    return output
+
+
+def _matMulKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                  outputOffset: int) -> np.ndarray:
+    return np.matmul(inputs['A'], inputs['B'])
+
+
+def _rqGemmKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                  outputOffset: int) -> np.ndarray:
+    A, B, C, mul, add = (inputs[key] for key in ('A', 'B', 'C', 'mul', 'add'))
+    output = wrap(
+        int(operatorRepresentation.get('alpha', 1)) * _gemm(A, B, operatorRepresentation) +
+        int(operatorRepresentation.get('beta', 1)) * C, 32)
+    return _gemmRequantize(output, mul, add, operatorRepresentation, outputOffset)
+
+
+def _rqMatMulKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                    outputOffset: int) -> np.ndarray:
+    A, B, mul, add = (inputs[key] for key in ('A', 'B', 'mul', 'add'))
+    return _gemmRequantize(wrap(np.matmul(A, B), 32), mul, add, operatorRepresentation, outputOffset)
+
+
+def _gemmRequantize(values: np.ndarray, mul: np.ndarray, add: np.ndarray,
+                    operatorRepresentation: OperatorRepresentation, outputOffset: int) -> np.ndarray:
+    # Per row or per tensor parameters broadcast against the [..., M, O] output
+    mul = np.asarray(mul, dtype = np.int64)
+    add = np.asarray(add, dtype = np.int64)
+    if mul.ndim > values.ndim:
+        mul = mul.reshape(mul.shape[-values.ndim:])
+        add = add.reshape(add.shape[-values.ndim:])
+
+    output = requantShift(values, mul, add, int(operatorRepresentation['log2D']))
+    return _clipRequantized(output, operatorRepresentation, outputOffset)
+
+
+def _addKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+               outputOffset: int) -> np.ndarray:
+    return inputs['data_in_1'] + inputs['data_in_2']
+
+
+def _requantizedAddKernel(inputs: Dict[str, np.ndarray],
+                          operatorRepresentation: OperatorRepresentation,
+                          outputOffset: int,
+                          rounding: bool = True) -> np.ndarray:
+
+    def _rqs(values, prefix):
+        return requantShift(values, int(operatorRepresentation[f'{prefix}_mul']),
+                            int(operatorRepresentation[f'{prefix}_add']),
+                            int(operatorRepresentation[f'{prefix}_log2D']), rounding)
+
+    output = _rqs(_rqs(inputs['data_in_1'], 'rqs1') + _rqs(inputs['data_in_2'], 'rqs2'), 'rqsOut')
+    nLevels = int(operatorRepresentation.get('rqsOut_n_levels', 256))
+    if operatorRepresentation.get('rqsOut_signed', True):
+        return np.clip(output, -(nLevels // 2), nLevels // 2 - 1)
+    return np.clip(output, 0, nLevels - 1)
+
+
+def _mulKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+               outputOffset: int) -> np.ndarray:
+    return inputs['A'] * inputs['B']
+
+
+def _divide(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation) -> np.ndarray:
+    nom, denom = np.broadcast_arrays(inputs['A'], inputs['B'])
+    Delta = int(operatorRepresentation['Delta'])
+    eps = int(operatorRepresentation['eps'])
+    eta = int(operatorRepresentation['eta'])
+
+    nom = int(wrap(Delta * eta, 32)) * nom
+    denom = eta * denom + eps
+    sgnNom = np.where(nom >= 0, 1, -1)
+    return wrap(cDiv(nom + sgnNom * (denom >> 1), denom), 32)
+
+
+def _integerDivKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                      outputOffset: int) -> np.ndarray:
+    return _divide(inputs, operatorRepresentation)
+
+
+def _rqIntegerDivKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                        outputOffset: int) -> np.ndarray:
+    output = _divide(inputs, operatorRepresentation)
+    mul, add, shift = (int(np.asarray(value).reshape(-1)[0])
+                       for value in (inputs['requant_mul'], inputs['requant_add'], inputs['requant_div']))
+    return np.clip(requantShift(output, mul, add, shift), -128, 127)
+
+
+def _gelu(data: np.ndarray, b: int, one: int) -> np.ndarray:
+    sign = np.sign(data)
+    q = np.minimum(sign * data, -b)
+    L = wrap(sign * (-((q + b) * (q + b)) + one), 32)
+    return wrap(data * ((one + L) >> 1), 32)
+
+
+def _iGELUKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                 outputOffset: int) -> np.ndarray:
+    return _gelu(inputs['data_in'], int(operatorRepresentation['b']), int(operatorRepresentation['one']))
+
+
+def _rqiGELUKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                   outputOffset: int) -> np.ndarray:
+    output = _gelu(inputs['data_in'], int(operatorRepresentation['b']), int(operatorRepresentation['one']))
+    mul, add, shift = (
+        int(np.asarray(value).reshape(-1)[0]) for value in (inputs['mul'], inputs['add'], inputs['shift']))
+    return clipStored(requantShift(output, mul, add, shift), outputOffset, -128, 127)
+
+
+def _hardswish(data: np.ndarray, operatorRepresentation: OperatorRepresentation) -> np.ndarray:
+    temp = np.clip(data + int(operatorRepresentation['three']), 0, int(operatorRepresentation['six']))
+    return wrap(data * wrap(temp * int(operatorRepresentation['one_over_six']), 32), 32)
+
+
+def _iHardswishKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                      outputOffset: int) -> np.ndarray:
+    return _hardswish(inputs['data_in'], operatorRepresentation)
+
+
+def _rqiHardswishKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                        outputOffset: int) -> np.ndarray:
+    output = requantShift(_hardswish(inputs['data_in'], operatorRepresentation), int(operatorRepresentation['mul']),
+                          int(operatorRepresentation['add']), int(operatorRepresentation['shift']))
+    return clipStored(output, outputOffset, -128, 127)
+
+
+def _rows(data: np.ndarray, operatorRepresentation: OperatorRepresentation) -> np.ndarray:
+    return data.reshape(-1, int(operatorRepresentation['lastDimLength']))
+
+
+def _iLayerNormKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                      outputOffset: int) -> np.ndarray:
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    weight = inputs['weight'].reshape(-1)
+    bias = inputs['bias'].reshape(-1)
+    length = data.shape[-1]
+
+    mean = cDiv(np.sum(data, axis = -1, keepdims = True), length)
+    centered = wrap(data - mean, 16)
+    variance = cDiv(wrap(np.sum(centered * centered, axis = -1, keepdims = True), 32), length) + 1
+    std = isqrt(variance)
+
+    output = (cDiv((data - mean) * weight, std) + bias) >> int(operatorRepresentation['log2D'])
+    return output.reshape(inputs['data_in'].shape)
+
+
+def _iRMSNormKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                    outputOffset: int) -> np.ndarray:
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    weight = inputs['weight'].reshape(-1)
+    length = data.shape[-1]
+
+    squared = wrap(data, 16)
+    variance = cDiv(wrap(np.sum(squared * squared, axis = -1, keepdims = True), 32), length) + 1
+    std = isqrt(variance)
+
+    output = cDiv(wrap(data * weight, 32), std) >> int(operatorRepresentation['log2D'])
+    return np.clip(output, -128, 127).reshape(inputs['data_in'].shape)
+
+
+def _softmax(data: np.ndarray, coeffA: int, coeffB: int, coeffC: int, log2: int, nLevels: int,
+             signedShift: bool) -> np.ndarray:
+    # Returns the unsigned [0, nLevels - 1] integer softmax of every row
+    xTilde = wrap(data - np.max(data, axis = -1, keepdims = True), 16)
+    z = np.clip(wrap(-cDiv(xTilde, log2), 8, signed = signedShift), 0, 31)
+    p = wrap(xTilde + z * log2, 16)
+    y = wrap(wrap(coeffA * ((p + coeffB) * (p + coeffB)), 32) + coeffC, 64, signed = False)
+    y = wrap(y >> z, 32, signed = False)
+    ySum = wrap(np.sum(y, axis = -1, keepdims = True), 32, signed = False)
+    return wrap(y * (nLevels - 1), 32, signed = False) // ySum
+
+
+def _iSoftmaxKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                    outputOffset: int) -> np.ndarray:
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    nLevels = int(operatorRepresentation['n_levels'])
+    output = _softmax(data, int(operatorRepresentation['coeffA']), int(operatorRepresentation['coeffB']),
+                      int(operatorRepresentation['coeffC']), int(operatorRepresentation['log2']), nLevels, True)
+    return (output - nLevels // 2 + outputOffset).reshape(inputs['data_in'].shape)
+
+
+def _itaMaxKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                  outputOffset: int) -> np.ndarray:
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    nLevels = int(operatorRepresentation['n_levels'])
+
+    shift = (np.max(data, axis = -1, keepdims = True) - data + 16) >> 5
+    expSum = np.sum(256 >> shift, axis = -1, keepdims = True)
+    expSumInverse = ((nLevels - 1) * 256) // expSum
+
+    output = (expSumInverse >> shift) - nLevels // 2
+    return (output + outputOffset).reshape(inputs['data_in'].shape)
+
+
+def _itaPartialMaxKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                         outputOffset: int) -> np.ndarray:
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    groupWidth = int(operatorRepresentation['group_width'])
+    nLevels = int(operatorRepresentation['n_levels'])
+
+    # The row maximum is discovered group by group, rescaling the partial sum whenever it grows
+    expPartialSum = np.zeros((data.shape[0], 1), dtype = np.int64)
+    globalMax = np.full((data.shape[0], 1), np.min(data) - 1, dtype = np.int64)
+    for start in range(0, data.shape[-1] - groupWidth + 1, groupWidth):
+        group = data[:, start:start + groupWidth]
+        currentMax = np.max(group, axis = -1, keepdims = True)
+        shiftSum = np.where(currentMax > globalMax, (currentMax - globalMax + 16) >> 5, 0)
+        globalMax = np.maximum(globalMax, currentMax)
+        expSum = np.sum(256 >> ((globalMax - group + 16) >> 5), axis = -1, keepdims = True)
+        expPartialSum = (expPartialSum >> shiftSum) + expSum
+
+    expPartialSumInverse = ((nLevels // 2 - 1) * 256) // expPartialSum
+    output = (expPartialSumInverse >> ((globalMax - data + 16) >> 5)) - nLevels // 2
+    return (output + outputOffset).reshape(inputs['data_in'].shape)
+
+
+def _maxPoolKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                   outputOffset: int) -> np.ndarray:
+    channelsFirst = operatorRepresentation.get('channels_first', True)
+    kernelShape = operatorRepresentation['kernel_shape']
+    spatialDims = len(kernelShape)
+
+    data = _toChannelsFirst(inputs['data_in'], channelsFirst)
+    pads = _pads(operatorRepresentation, spatialDims)
+    if any(pads):
+        data = np.pad(data, [(0, 0), (0, 0)] + [(pads[idx], pads[idx + spatialDims]) for idx in range(spatialDims)],
+                      constant_values = np.iinfo(np.int64).min)
+
+    windows = _slidingWindows(data, kernelShape, operatorRepresentation.get('strides', [1] * spatialDims),
+                              operatorRepresentation.get('dilations', [1] * spatialDims))
+    output = np.max(windows, axis = tuple(range(-spatialDims, 0)))
+    return _fromChannelsFirst(output, channelsFirst)
+
+
+def _padKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+               outputOffset: int) -> np.ndarray:
+    data = inputs['data_in']
+    pads = [int(pad) for pad in operatorRepresentation['pads']]
+    if not operatorRepresentation.get('channels_first', True):
+        # Channels last pads keep the ONNX [N, C, *spatial] order
+        order = [0, *range(2, data.ndim), 1]
+        pads = [pads[idx] for idx in order] + [pads[idx + data.ndim] for idx in order]
+    padWidth = [(pads[idx], pads[idx + data.ndim]) for idx in range(data.ndim)]
+    return np.pad(data, padWidth, constant_values = operatorRepresentation.get('value', 0))
+
+
+def _reduceAxes(data: np.ndarray, operatorRepresentation: OperatorRepresentation) -> tuple:
+    return tuple(int(axis) % data.ndim for axis in operatorRepresentation['axes'])
+
+
+def _reduceMeanKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                      outputOffset: int) -> np.ndarray:
+    data = inputs['data_in']
+    axes = _reduceAxes(data, operatorRepresentation)
+    keepdims = bool(operatorRepresentation.get('keepdims', 0))
+    reduceLength = int(np.prod([data.shape[axis] for axis in axes]))
+
+    accumulator = wrap(np.sum(data, axis = axes, keepdims = keepdims), 32)
+    if not keepdims and reduceLength > 1 and (reduceLength & (reduceLength - 1)) == 0:
+        shift = reduceLength.bit_length() - 1
+        return (accumulator + (1 << (shift - 1))) >> shift
+
+    sgn = np.where(accumulator >= 0, 1, -1)
+    return cDiv(accumulator + sgn * (reduceLength >> 1), reduceLength)
+
+
+def _reduceSumKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                     outputOffset: int) -> np.ndarray:
+    data = inputs['data_in']
+    return np.sum(data,
+                  axis = _reduceAxes(data, operatorRepresentation),
+                  keepdims = bool(operatorRepresentation.get('keepdims', 0)))
+
+
+def _gatherKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                  outputOffset: int) -> np.ndarray:
+    return np.take(inputs['data_in'], inputs['indices'].astype(np.int64), axis = int(operatorRepresentation['axis']))
+
+
+def _sliceKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                 outputOffset: int) -> np.ndarray:
+    data = inputs['data_in']
+    starts = inputs['starts'].reshape(-1).astype(np.int64)
+    ends = inputs['ends'].reshape(-1).astype(np.int64)
+    axes = inputs['axes'].reshape(-1).astype(np.int64) if 'axes' in inputs else np.arange(len(starts))
+    steps = inputs['steps'].reshape(-1).astype(np.int64) if 'steps' in inputs else np.ones(len(starts),
+                                                                                           dtype = np.int64)
+
+    selection = [slice(None)] * data.ndim
+    for start, end, axis, step in zip(starts, ends, axes, steps):
+        selection[int(axis)] = slice(int(start), int(end), int(step))
+    return data[tuple(selection)]
+
+
+def _transposeKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                     outputOffset: int) -> np.ndarray:
+    return np.transpose(inputs['data_in'], operatorRepresentation['perm'])
+
+
+def _concatKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                  outputOffset: int) -> np.ndarray:
+    return np.concatenate([inputs[f'data_in_{idx + 1}'] for idx in range(len(inputs))],
+                          axis = int(operatorRepresentation['axis']))
+
+
+def _identityKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                    outputOffset: int) -> np.ndarray:
+    return inputs['data_in']
+
+
+def _pulpRequantizedConvKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                               outputOffset: int) -> np.ndarray:
+    # Depthwise kernels read channels first inputs even in channels last graphs
+    inputChannelsFirst = operatorRepresentation.get('channels_first', True) or \
+        int(operatorRepresentation.get('group', 1)) > 1
+    output = wrap(_conv(inputs['data_in'], inputs['weight'], operatorRepresentation, inputChannelsFirst), 32)
+    return _requantize(output, inputs['mul'], inputs['add'], operatorRepresentation, outputOffset, rounding = False)
+
+
+def _pulpRequantizedGemmKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                               outputOffset: int) -> np.ndarray:
+    # The requantization merge folds bias, add and rounding into C
+    output = wrap(_gemm(inputs['A'], inputs['B'], operatorRepresentation), 32)
+    channels = output.shape[-1]
+    mul = _channelBroadcast(inputs['mul'], channels, False).reshape(-1)
+    add = _channelBroadcast(inputs['C'], channels, False).reshape(-1)
+    output = requantShift(output, mul, add, int(operatorRepresentation['log2D']), rounding = False)
+    return _clipRequantized(output, operatorRepresentation, outputOffset)
+
+
+def _pulpRequantizedAddKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                              outputOffset: int) -> np.ndarray:
+    # The requantization merge folds the rounding of all three requantizations into their add
+    return _requantizedAddKernel(inputs, operatorRepresentation, outputOffset, rounding = False)
+
+
+def _pulpiSoftmaxKernel(inputs: Dict[str, np.ndarray], operatorRepresentation: OperatorRepresentation,
+                        outputOffset: int) -> np.ndarray:
+    # Unsigned 8 bit softmax without coeffA
+    data = _rows(inputs['data_in'], operatorRepresentation)
+    output = _softmax(data, 1, int(operatorRepresentation['coeffB']), int(operatorRepresentation['coeffC']),
+                      int(operatorRepresentation['log2']), 256, False)
+    return (output + outputOffset).reshape(inputs['data_in'].shape)
+
+
+ReferenceKernels: Dict[str, ReferenceKernel] = {
+    'Add': _addKernel,
+    'Concat': _concatKernel,
+    'Conv': _convKernel,
+    'DebugPrint': _identityKernel,
+    'Div': _integerDivKernel,
+    'Flatten': _identityKernel,
+    'Gather': _gatherKernel,
+    'Gemm': _gemmKernel,
+    'iGELU': _iGELUKernel,
+    'iHardswish': _iHardswishKernel,
+    'iLayerNorm': _iLayerNormKernel,
+    'IntegerDiv': _integerDivKernel,
+    'IntegerMean': _reduceMeanKernel,
+    'iRMSNorm': _iRMSNormKernel,
+    'iSoftmax': _iSoftmaxKernel,
+    'ITAMax': _itaMaxKernel,
+    'ITAPartialMax': _itaPartialMaxKernel,
+    'MatMul': _matMulKernel,
+    'MatMulInteger': _matMulKernel,
+    'MaxPool': _maxPoolKernel,
+    'Mul': _mulKernel,
+    'Pad': _padKernel,
+    'ReduceMean': _reduceMeanKernel,
+    'ReduceSum': _reduceSumKernel,
+    'RequantizedAdd': _requantizedAddKernel,
+    'RequantizedConv': _requantizedConvKernel,
+    'RequantizediGELU': _rqiGELUKernel,
+    'RequantizediHardswish': _rqiHardswishKernel,
+    'RequantShift': _requantShiftKernel,
+    'Reshape': _identityKernel,
+    'RQGemm': _rqGemmKernel,
+    'RQIntegerDiv': _rqIntegerDivKernel,
+    'RQMatMul': _rqMatMulKernel,
+    'Slice': _sliceKernel,
+    'Transpose': _transposeKernel,
+    'Unsqueeze': _identityKernel,
+}
+
+PULPReferenceKernels: Dict[str, ReferenceKernel] = {
+    'iSoftmax': _pulpiSoftmaxKernel,
+    'RequantizedAdd': _pulpRequantizedAddKernel,
+    'RequantizedConv': _pulpRequantizedConvKernel,
+    'RequantizedGemm': _pulpRequantizedGemmKernel,
+}
+
+
+class ReferenceInterpreter():
+    """Executes a parsed deployer's lowered graph with NumPy reference kernels
+
+    Parameters
+    ----------
+    deployer : NetworkDeployer
+        Deployer after ``frontEnd()``, i.e. with a lowered, parsed and type checked graph.
+    kernels : Optional[Dict[str, ReferenceKernel]]
+        Reference kernels by node operator, extending or overriding ``ReferenceKernels``.
+
+    """
+
+    def __init__(self, deployer: NetworkDeployer, kernels: Optional[Dict[str, ReferenceKernel]] = None):
+        assert deployer.parsed, "The reference interpreter needs a parsed deployer, run frontEnd() first!"
+        self.deployer = deployer
+        self.kernels = {**ReferenceKernels, **(kernels if kernels is not None else {})}
+
+    @property
+    def ctxt(self) -> NetworkContext:
+        return self.deployer.ctxt
+
+    def _store(self, name: str, values: np.ndarray) -> np.ndarray:
+        buffer = self.ctxt.lookup(name)
+        values = np.asarray(values)
+        assert values.size == np.prod(buffer.shape), \
+            f"Reference result for {name} has {values.size} elements, its buffer {tuple(buffer.shape)}!"
+        values = values.reshape(buffer.shape)
+
+        referencedType = buffer._type.referencedType
+        if not hasattr(referencedType, "typeMin"):
+            return values.astype(np.float32)
+
+        offset = bufferOffset(buffer)
+        stored = wrap(np.rint(values).astype(np.int64) - offset, referencedType.typeWidth, referencedType.typeMin < 0)
+        return stored + offset
+
+    def _load(self, name: str, tensors: Dict[str, np.ndarray]) -> np.ndarray:
+        if name in tensors:
+            return tensors[name]
+
+        buffer = self.ctxt.lookup(name)
+        if not isinstance(buffer, ConstantBuffer):
+            raise RuntimeError(f"Tensor {name} is used before it is computed!")
+
+        values = np.asarray(buffer.values)
+        if not hasattr(buffer._type.referencedType, "typeMin"):
+            return values
+        return values.astype(np.int64)
+
+    def run(self, inputs: List[np.ndarray]) -> Dict[str, np.ndarray]:
+        """Run the graph on the test inputs
+
+        Parameters
+        ----------
+        inputs : List[np.ndarray]
+            True values of the network inputs in the order of ``inputs.npz``.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            True values of all intermediate and output tensors, keyed by tensor name.
+
+        """
+        tensors: Dict[str, np.ndarray] = {}
+
+        for index, values in enumerate(inputs):
+            name = f"input_{index}"
+            if np.prod(values.shape) == 0 or not self.ctxt.is_global(name):
+                continue
+            shape = self.ctxt.lookup(name).shape
+            repeat = int(np.prod(shape) // np.prod(values.shape))
+            tensors[name] = self._store(name, np.tile(values.reshape(-1), repeat))
+
+        for layer in self.deployer.layerBinding.values():
+            node = layer.node
+            operatorRepresentation = layer.mapper.parser.operatorRepresentation
+
+            if node.op not in self.kernels:
+                raise RuntimeError(f"No reference kernel for {node.op} node {node.name}!")
+
+            # Kernels address their inputs by the keys the parser assigned to them
+            inputNames = [tensor.name for tensor in node.inputs]
+            nodeInputs = {
+                key: self._load(name, tensors)
+                for key, name in operatorRepresentation.items()
+                if key not in ('nodeName', 'nodeOp') and isinstance(name, str) and name in inputNames
+            }
+            assert len(node.outputs) == 1, f"Reference kernels produce a single output, {node.name} has more!"
+
+            outputName = node.outputs[0].name
+            outputOffset = bufferOffset(self.ctxt.lookup(outputName))
+            result = self.kernels[node.op](nodeInputs, operatorRepresentation, outputOffset)
+            tensors[outputName] = self._store(outputName, result)
+
+        return tensors
+
+    def outputs(self, tensors: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        """Select the network outputs from the result of ``run``"""
+        return [tensors[f"output_{index}"] for index in range(len(self.deployer.graph.outputs))]
+
+    def matchActivations(self, tensors: Dict[str, np.ndarray],
+                         goldens: Union[Dict[str, np.ndarray], np.lib.npyio.NpzFile]) -> Dict[str, Optional[str]]:
+        """Find the computed tensor that reproduces every golden activation
+
+        Golden activations are usually exported by the training framework and keyed by module rather than by tensor
+        name, so a tensor of the same name is preferred, but any tensor with identical values is accepted.
+
+        Returns
+        -------
+        Dict[str, Optional[str]]
+            Name of the matching tensor for every golden activation, or None if no tensor matches.
+
+        """
+
+        def _equal(golden: np.ndarray, name: str) -> bool:
+            values = tensors[name]
+            return golden.size == values.size and np.array_equal(golden.reshape(-1), values.reshape(-1))
+
+        matches = {}
+        for goldenName in goldens.keys():
+            golden = np.asarray(goldens[goldenName])
+            candidates = ([goldenName] if goldenName in tensors else []) + list(tensors.keys())
+            matches[goldenName] = next((name for name in candidates if _equal(golden, name)), None)
+        return matches
@@ -0,0 +1,432 @@
+# ----------------------------------------------------------------------
+#
+# File: regressionRunner.py
+#
+# Last edited: 19.10.2026
+#
+# Copyright (C) 2026, ETH Zurich and University of Bologna.
+#
+# ----------------------------------------------------------------------
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the License); you may
+# not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an AS IS BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import csv
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from testUtils.testRunner import _ArgumentDefaultMetavarTypeFormatter, cmake_str, escapeAnsi, getPaths, prBlue, \
+    prGreen, prRed
+
+_HASHFILE = ".regressionHash"
+
+
+@dataclass
+class RegressionConfiguration():
+    """Platform configuration of a regression sweep, mirroring one of the testRunner_*.py scripts"""
+    platform: str  #: str: Platform name of the generation script and of CMake
+    simulator: Literal['gvsoc', 'banshee', 'qemu', 'host', 'none']
+    tiling: bool  #: bool: Generate tests with testMVP.py instead of generateNetwork.py
+    genArgs: str = ""  #: str: Additional arguments of the generation script
+    cmakeArgs: str = ""  #: str: Additional CMake arguments
+
+
+regressionConfigurations: Dict[str, RegressionConfiguration] = {
+    "generic":
+        RegressionConfiguration("Generic", "host", False),
+    "cortexm":
+        RegressionConfiguration("QEMU-ARM", "qemu", False),
+    "mempool":
+        RegressionConfiguration("MemPool", "banshee", False, cmakeArgs = "-D num_threads=16"),
+    "siracusa":
+        RegressionConfiguration("Siracusa", "gvsoc", False, cmakeArgs = "-D NUM_CORES=1"),
+    "tiled_siracusa":
+        RegressionConfiguration("Siracusa", "gvsoc", True, cmakeArgs = "-D NUM_CORES=1"),
+    "tiled_siracusa_w_neureka":
+        RegressionConfiguration("Siracusa_w_neureka", "gvsoc", True, cmakeArgs = "-D NUM_CORES=1"),
+}
+
+
+@dataclass
+class RegressionResult():
+    """Outcome of a single test of a regression sweep"""
+    test: str
+    configuration: str
+    platform: str
+    target: str  #: str: Name of the test's executable in the shared build tree
+    status: Literal['passed', 'failed', 'error', 'pending'] = 'pending'
+    stage: Optional[str] = None  #: Optional[str]: Stage which failed
+    regenerated: bool = False  #: bool: False if the generated sources were up to date
+    errors: Optional[int] = None
+    outputs: Optional[int] = None
+    cycles: Optional[int] = None
+    generationTime: float = 0.
+    buildTime: float = 0.  #: float: Time of the build shared by all tests of the build tree
+    simulationTime: float = 0.
+    log: str = ""  #: str: Log file of the last executed stage
+    message: str = ""
+
+
+def hashFiles(paths: Iterable[str], hasher: Optional["hashlib._Hash"] = None) -> str:
+    """Content hash of files and of all files within directories, independent of modification times"""
+    hasher = hasher if hasher is not None else hashlib.sha256()
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, fileNames in os.walk(path):
+                dirs[:] = [directory for directory in dirs if directory != "__pycache__"]
+                files += [os.path.join(root, fileName) for fileName in fileNames if not fileName.endswith(".pyc")]
+        elif os.path.isfile(path):
+            files.append(path)
+
+    for fileName in sorted(files):
+        hasher.update(os.path.relpath(fileName).encode())
+        with open(fileName, "rb") as fileHandle:
+            hasher.update(fileHandle.read())
+
+    return hasher.hexdigest()
+
+
+def parseSimulationOutput(output: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Extract the number of errors, tested outputs and cycles from the output of a test binary"""
+    errors = re.findall(r"Errors:\s*(\d+)\s*out of\s*(\d+)", output)
+    # Multi-core platforms report the runtime of every core, the slowest one counts
+    cycles = [int(value) for value in re.findall(r"Runtime:\s*(\d+)\s*cycles", output)]
+
+    numErrors, numOutputs = (int(errors[-1][0]), int(errors[-1][1])) if errors else (None, None)
+    return numErrors, numOutputs, max(cycles) if cycles else None
+
+
+class RegressionRunnerArgumentParser(argparse.ArgumentParser):
+
+    def __init__(self, description = None):
+
+        formatter = _ArgumentDefaultMetavarTypeFormatter
+
+        if description is None:
+            super().__init__(description = "Deeploy Regression Test Runner.", formatter_class = formatter)
+        else:
+            super().__init__(description = description, formatter_class = formatter)
+
+        self.add_argument('-t',
+                          metavar = '<dir>',
+                          dest = 'dirs',
+                          type = str,
+                          nargs = '+',
+                          required = True,
+                          help = 'Set the regression tests\n')
+        self.add_argument('-p',
+                          metavar = '<configuration>',
+                          dest = 'configurations',
+                          type = str,
+                          nargs = '+',
+                          choices = list(regressionConfigurations.keys()),
+                          required = True,
+                          help = 'Choose the platform configurations\n')
+        self.add_argument('-j',
+                          metavar = '<jobs>',
+                          dest = 'jobs',
+                          type = int,
+                          default = os.cpu_count(),
+                          help = 'Number of tests generated and simulated in parallel\n')
+        self.add_argument('-v', action = 'count', dest = 'verbose', default = 0, help = 'Increase verbosity level\n')
+        self.add_argument('-D',
+                          dest = 'cmake',
+                          action = 'extend',
+                          nargs = "*",
+                          type = cmake_str,
+                          help = "Create or update a cmake cache entry\n")
+        self.add_argument('--genArgs',
+                          metavar = '<args>',
+                          dest = 'genArgs',
+                          type = str,
+                          default = "",
+                          help = 'Additional arguments of all generation scripts\n')
+        self.add_argument('--force',
+                          dest = 'force',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Regenerate tests even if their sources are unchanged\n')
+        self.add_argument('--skipsim',
+                          dest = 'skipsim',
+                          action = 'store_true',
+                          default = False,
+                          help = 'Skip network simulation\n')
+        self.add_argument('--toolchain',
+                          metavar = '<LLVM|GCC>',
+                          dest = 'toolchain',
+                          type = str,
+                          default = "LLVM",
+                          help = 'Pick compiler toolchain\n')
+        self.add_argument('--toolchain_install_dir',
+                          metavar = '<dir>',
+                          dest = 'toolchain_install_dir',
+                          type = str,
+                          default = os.environ.get('LLVM_INSTALL_DIR'),
+                          help = 'Pick compiler install dir\n')
+        self.add_argument('--report',
+                          metavar = '<file>',
+                          dest = 'report',
+                          type = str,
+                          default = "regressionReport.json",
+                          help = 'Write the results to the given JSON file\n')
+        self.add_argument('--csv',
+                          metavar = '<file>',
+                          dest = 'csv',
+                          type = str,
+                          default = None,
+                          help = 'Additionally write the results to the given CSV file\n')
+
+
+class RegressionRunner():
+    """Runs many tests on many platform configurations in parallel
+
+    Tests are generated and simulated in up to `jobs` parallel
+    subprocesses. All tests of a platform with the same CMake arguments
+    share a single build tree, which is configured and built once for
+    all of them. Tests are only regenerated if the hash of their ONNX
+    graph, inputs, outputs, generation arguments or the Deeploy sources
+    changed since their last successful generation.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self._args = args
+        self._cmake = os.environ.get("CMAKE", "cmake")
+        self._dir_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+        self._dir_toolchain = os.path.normpath(args.toolchain_install_dir) if args.toolchain_install_dir else ""
+
+        # Generated code depends on the compiler and the generation scripts
+        self._sourceHash = hashFiles([
+            os.path.join(self._dir_root, "..", "Deeploy"),
+            os.path.join(self._dir_root, "testUtils"),
+            os.path.join(self._dir_root, "testMVP.py"),
+            os.path.join(self._dir_root, "generateNetwork.py")
+        ])
+
+        self.results: List[RegressionResult] = []
+        self._generatedDirs: Dict[int, str] = {}
+        self._printLock = threading.Lock()
+
+        for configurationName in args.configurations:
+            configuration = regressionConfigurations[configurationName]
+            for testDir in args.dirs:
+                dirGen, dirTest, _ = getPaths(testDir, f"TEST_{configuration.platform.upper()}/{configurationName}")
+                target = re.sub(r"\W", "_", f"{configurationName}_{os.path.normpath(dirTest)}")
+                result = RegressionResult(dirTest, configurationName, configuration.platform, target)
+                self._generatedDirs[id(result)] = dirGen
+                self.results.append(result)
+
+    def _log(self, message: str):
+        if self._args.verbose >= 1:
+            with self._printLock:
+                prBlue(f"[RegressionRunner] {message}")
+
+    def _execute(self, command: str, logFile: str) -> Tuple[int, str]:
+        if self._args.verbose >= 2:
+            self._log(command)
+
+        process = subprocess.run(command,
+                                 shell = True,
+                                 cwd = self._dir_root,
+                                 stdout = subprocess.PIPE,
+                                 stderr = subprocess.STDOUT,
+                                 encoding = 'utf-8',
+                                 errors = 'replace')
+
+        os.makedirs(os.path.dirname(logFile), exist_ok = True)
+        with open(logFile, "w", encoding = 'utf-8') as fileHandle:
+            fileHandle.write(f"{command}\n\n{escapeAnsi(process.stdout)}")
+
+        return process.returncode, process.stdout
+
+    def _generationCommand(self, result: RegressionResult) -> str:
+        configuration = regressionConfigurations[result.configuration]
+        script = "testMVP.py" if configuration.tiling else "generateNetwork.py"
+        return (f"python {script} -d {self._generatedDirs[id(result)]} -t {result.test} -p {configuration.platform} "
+                f"{configuration.genArgs} {self._args.genArgs}").strip()
+
+    def _generate(self, result: RegressionResult):
+        dirGen = self._generatedDirs[id(result)]
+        command = self._generationCommand(result)
+
+        hasher = hashlib.sha256(f"{self._sourceHash}{command}".encode())
+        testHash = hashFiles([
+            os.path.join(self._dir_root, result.test, fileName)
+            for fileName in ("network.onnx", "inputs.npz", "outputs.npz")
+        ], hasher)
+
+        hashFile = os.path.join(dirGen, _HASHFILE)
+        if not self._args.force and os.path.isfile(hashFile) and os.path.isfile(os.path.join(dirGen, "Network.c")):
+            with open(hashFile, "r") as fileHandle:
+                if fileHandle.read() == testHash:
+                    self._log(f"Skipping generation of {result.test} on {result.configuration}, sources are unchanged")
+                    return
+
+        # Invalidate the previous generation in case this one fails
+        if os.path.isfile(hashFile):
+            os.remove(hashFile)
+
+        result.log = os.path.join(dirGen, "generate.log")
+        result.regenerated = True
+
+        start = time.perf_counter()
+        returnCode, _ = self._execute(command, result.log)
+        result.generationTime = time.perf_counter() - start
+
+        if returnCode != 0:
+            result.status, result.stage = "error", "generate"
+            result.message = f"Generation failed with exit code {returnCode}"
+            return
+
+        with open(hashFile, "w") as fileHandle:
+            fileHandle.write(testHash)
+
+    def _buildDir(self, configuration: RegressionConfiguration) -> str:
+        cmakeArgs = f"{self._args.toolchain} {configuration.cmakeArgs} {' '.join(self._args.cmake or [])}"
+        return os.path.join(f"TEST_{configuration.platform.upper()}",
+                            "build_" + hashlib.sha256(cmakeArgs.encode()).hexdigest()[:8])
+
+    def _build(self, buildDir: str, results: List[RegressionResult]):
+        configuration = regressionConfigurations[results[0].configuration]
+
+        testNames = ";".join(result.target for result in results)
+        generatedSources = ";".join(os.path.abspath(self._generatedDirs[id(result)]) for result in results)
+        banshee = "ON" if configuration.simulator == 'banshee' else "OFF"
+        cmakeArgs = " ".join(self._args.cmake or [])
+
+        command = (f"{self._cmake} -D TOOLCHAIN={self._args.toolchain} -D TOOLCHAIN_INSTALL_DIR={self._dir_toolchain} "
+                   f"-D platform={configuration.platform} -D TESTNAMES={shlex.quote(testNames)} "
+                   f"-D GENERATED_SOURCES={shlex.quote(generatedSources)} -D banshee_simulation={banshee} "
+                   f"{configuration.cmakeArgs} {cmakeArgs} -B {buildDir} ..")
+
+        start = time.perf_counter()
+        logFile = os.path.join(buildDir, "configure.log")
+        returnCode, _ = self._execute(command, logFile)
+        if returnCode != 0:
+            for result in results:
+                result.status, result.stage, result.log = "error", "configure", logFile
+                result.message = f"Configuring the CMake project failed with exit code {returnCode}"
+            return
+
+        targets = " ".join(result.target for result in results)
+        logFile = os.path.join(buildDir, "build.log")
+        returnCode, _ = self._execute(f"{self._cmake} --build {buildDir} -j {self._args.jobs} --target {targets}",
+                                      logFile)
+
+        # Only build the tests one by one to pinpoint the failing ones
+        if returnCode != 0:
+            for result in results:
+                logFile = os.path.join(self._generatedDirs[id(result)], "build.log")
+                returnCode, _ = self._execute(
+                    f"{self._cmake} --build {buildDir} -j {self._args.jobs} --target {result.target}", logFile)
+                if returnCode != 0:
+                    result.status, result.stage, result.log = "error", "build", logFile
+                    result.message = f"Building failed with exit code {returnCode}"
+
+        buildTime = time.perf_counter() - start
+        for result in results:
+            result.buildTime = buildTime
+
+    def _simulate(self, buildDir: str, result: RegressionResult):
+        configuration = regressionConfigurations[result.configuration]
+
+        if configuration.simulator == 'host':
+            command = os.path.join(buildDir, "bin", result.target)
+        else:
+            command = f"{self._cmake} --build {buildDir} --target {configuration.simulator}_{result.target}"
+
+        result.log = os.path.join(self._generatedDirs[id(result)], "simulate.log")
+
+        start = time.perf_counter()
+        returnCode, output = self._execute(command, result.log)
+        result.simulationTime = time.perf_counter() - start
+
+        result.errors, result.outputs, result.cycles = parseSimulationOutput(output)
+
+        if result.errors is None:
+            result.status, result.stage = "error", "simulate"
+            result.message = f"Simulation did not report any errors, exit code {returnCode}"
+        elif result.errors != 0:
+            result.status, result.stage = "failed", "simulate"
+            result.message = f"Found {result.errors} errors in {result.outputs} outputs"
+        else:
+            result.status = "passed"
+
+    def run(self) -> List[RegressionResult]:
+        # Build trees are shared by all tests of a platform with the same CMake arguments
+        buildGroups: Dict[str, List[RegressionResult]] = OrderedDict()
+        for result in self.results:
+            buildDir = self._buildDir(regressionConfigurations[result.configuration])
+            buildGroups.setdefault(buildDir, []).append(result)
+
+        with ThreadPoolExecutor(max_workers = self._args.jobs) as pool:
+            # Generation scripts and simulators run in subprocesses, the threads only wait for them
+            list(pool.map(self._generate, self.results))
+
+            for buildDir, results in buildGroups.items():
+                generatedResults = [result for result in results if result.status == "pending"]
+                if generatedResults != []:
+                    self._log(f"Building {len(generatedResults)} tests in {buildDir}")
+                    self._build(buildDir, generatedResults)
+
+            simulations = [(buildDir, result)
+                           for buildDir, results in buildGroups.items()
+                           for result in results
+                           if result.status == "pending"]
+
+            if self._args.skipsim:
+                for _, result in simulations:
+                    result.status = "passed"
+            else:
+                list(pool.map(lambda simulation: self._simulate(*simulation), simulations))
+
+        return self.results
+
+    def printSummary(self):
+        for result in self.results:
+            description = f"{result.test} on {result.configuration}"
+            if result.status == "passed":
+                cycles = f", {result.cycles} cycles" if result.cycles is not None else ""
+                prGreen(f"✅ {description}{cycles}")
+            else:
+                prRed(f"❌ {description}: {result.message} (see {result.log})")
+
+        numPassed = len([result for result in self.results if result.status == "passed"])
+        print(f"{numPassed} of {len(self.results)} tests passed")
+
+    def writeReport(self, jsonFile: Optional[str], csvFile: Optional[str] = None):
+        rows = [dataclasses.asdict(result) for result in self.results]
+
+        if jsonFile is not None:
+            with open(jsonFile, "w") as fileHandle:
+                json.dump({"sourceHash": self._sourceHash, "results": rows}, fileHandle, indent = 2)
+
+        if csvFile is not None:
+            with open(csvFile, "w", newline = "") as fileHandle:
+                writer = csv.DictWriter(fileHandle,
+                                        fieldnames = [field.name for field in dataclasses.fields(RegressionResult)])
+                writer.writeheader()
+                writer.writerows(rows)
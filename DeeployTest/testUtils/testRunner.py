@@ -25,10 +25,12 @@
 
 import argparse
 import codecs
+import json
 import os
 import re
 import subprocess
-from typing import Literal, Tuple
+import time
+from typing import Dict, Literal, Optional, Tuple
 
 
 # Source: https://stackoverflow.com/a/38662876
@@ -75,6 +77,22 @@ def getPaths(path_test: str, gendir_name: str) -> Tuple[str, str]:
     return dir_gen, dir_test, test_name
 
 
+def parseBenchmarkOutput(output: str) -> Optional[Dict]:
+    """Extract the JSON results of the benchmark mode from the output of a test binary"""
+    benchmarks = re.findall(r"^Benchmark:\s*(\{.*\})\s*$", output, re.MULTILINE)
+    return json.loads(benchmarks[-1]) if benchmarks else None
+
+
+def gitRevision() -> Optional[str]:
+    """Commit of the Deeploy checkout, None outside of a git repository"""
+    process = subprocess.run(["git", "rev-parse", "HEAD"],
+                             cwd = os.path.dirname(os.path.realpath(__file__)),
+                             stdout = subprocess.PIPE,
+                             stderr = subprocess.DEVNULL,
+                             encoding = 'utf-8')
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
 def cmake_str(arg_str):
     return "-D" + codecs.decode(str(arg_str), 'unicode_escape')
 
@@ -115,6 +133,19 @@ class TestGeneratorArgumentParser(argparse.ArgumentParser):
                           default = './TestFiles',
                           help = 'Set the output dump folder\n')
         self.add_argument('-v', action = 'count', dest = 'verbose', default = 0, help = 'Increase verbosity level\n')
+        self.add_argument('--deeployStateExport',
+                          metavar = '<level>',
+                          dest = 'deeployStateExport',
+                          type = str,
+                          choices = ['none', 'final', 'all'],
+                          default = 'all',
+                          help = 'Choose which intermediate deeployStates to export\n')
+        self.add_argument('--profileCompiler',
+                          metavar = '<file>',
+                          dest = 'profileCompiler',
+                          type = str,
+                          default = None,
+                          help = 'Profile the code generation and export a Chrome trace to the given file\n')
 
         self.args = None
 
@@ -179,6 +210,31 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
         self.add_argument('--overwriteRecentState',
                           action = 'store_true',
                           help = 'Copy the recent state to the ./deeployStates folder\n')
+        self.add_argument('--deeployStateExport',
+                          metavar = '<level>',
+                          dest = 'deeployStateExport',
+                          type = str,
+                          choices = ['none', 'final', 'all'],
+                          default = 'all',
+                          help = 'Choose which intermediate deeployStates to export\n')
+        self.add_argument('--profileCompiler',
+                          metavar = '<file>',
+                          dest = 'profileCompiler',
+                          type = str,
+                          default = None,
+                          help = 'Profile the code generation and export a Chrome trace to the given file\n')
+        self.add_argument('--inPlaceAliasing',
+                          action = 'store_true',
+                          help = 'Let element-wise operators overwrite inputs without later users\n')
+        self.add_argument('--shareConstants',
+                          action = 'store_true',
+                          help = 'Deploy constants with identical values only once\n')
+        self.add_argument('--batchSize',
+                          metavar = '<size>',
+                          dest = 'batchSize',
+                          type = int,
+                          default = 1,
+                          help = 'Number of samples per inference\n')
 
         if self.tiling_arguments:
             self.add_argument('--defaultMemLevel',
@@ -198,12 +254,59 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
             self.add_argument('--randomizedMemoryScheduler',
                               action = "store_true",
                               help = 'Enable randomized memory scheduler\n')
+            self.add_argument('--greedyMemoryScheduler',
+                              action = "store_true",
+                              help = 'Enable best-fit memory scheduler\n')
+            self.add_argument('--latencyObjective',
+                              action = "store_true",
+                              help = 'Minimize the estimated latency instead of maximizing the tile sizes\n')
+            self.add_argument('--reductionTiling',
+                              action = "store_true",
+                              help = 'Allow tiling the reduction dimension of GEMMs\n')
+            self.add_argument('--layerFusion',
+                              action = "store_true",
+                              help = 'Fuse chains of layers into depth-first tiled patterns\n')
+            self.add_argument('--memoryAwareScheduler',
+                              action = "store_true",
+                              help = 'Order layers to minimize the peak size of live intermediate tensors\n')
             self.add_argument('--profileTiling',
                               metavar = '<level>',
                               dest = 'profileTiling',
                               type = str,
                               default = None,
                               help = 'Profile tiling for a given memory level (eg. "L2")\n')
+            self.add_argument('--tilingCache',
+                              metavar = '<dir>',
+                              dest = 'tilingCache',
+                              type = str,
+                              default = None,
+                              help = 'Directory of the persistent tiling solution cache\n')
+            self.add_argument(
+                '--fixTilingSolutions',
+                action = "store_true",
+                help = 'Reuse the cached tiling solutions as they are and only solve patterns without one\n')
+            self.add_argument('--tilingWorkers',
+                              metavar = '<workers>',
+                              dest = 'tilingWorkers',
+                              type = int,
+                              default = None,
+                              help = 'Solve every pattern separately with the given number of worker processes\n')
+            self.add_argument('--cpsat', action = "store_true", help = 'Solve the tiling models with CP-SAT\n')
+            self.add_argument('--solverWorkers',
+                              metavar = '<workers>',
+                              dest = 'solverWorkers',
+                              type = int,
+                              default = None,
+                              help = 'Number of parallel CP-SAT search workers\n')
+            self.add_argument('--parallelSolver',
+                              action = "store_true",
+                              help = 'Solve with parallel CP-SAT search workers instead of a deterministic fixed search\n')
+        else:
+            self.add_argument('--weightsBlob',
+                              dest = 'weightsBlob',
+                              choices = ['incbin', 'mmap'],
+                              default = None,
+                              help = 'Pack all constants into one binary file and load it with .incbin or mmap\n')
 
         self.args = None
 
@@ -222,6 +325,16 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
             command += " --overwriteRecentState"
         if self.args.debug:
             command += " --debug"
+        if self.args.deeployStateExport != 'all':
+            command += f" --deeployStateExport {self.args.deeployStateExport}"
+        if self.args.profileCompiler is not None:
+            command += f" --profileCompiler {os.path.abspath(self.args.profileCompiler)}"
+        if self.args.inPlaceAliasing:
+            command += " --inPlaceAliasing"
+        if self.args.shareConstants:
+            command += " --shareConstants"
+        if self.args.batchSize != 1:
+            command += f" --batchSize {self.args.batchSize}"
 
         if self.tiling_arguments:
             if self.args.defaultMemLevel:
@@ -232,8 +345,32 @@ class TestRunnerArgumentParser(argparse.ArgumentParser):
                 command += f" --l1={self.args.l1}"
             if self.args.randomizedMemoryScheduler:
                 command += " --randomizedMemoryScheduler"
+            if self.args.greedyMemoryScheduler:
+                command += " --greedyMemoryScheduler"
+            if self.args.latencyObjective:
+                command += " --latencyObjective"
+            if self.args.reductionTiling:
+                command += " --reductionTiling"
+            if self.args.layerFusion:
+                command += " --layerFusion"
+            if self.args.memoryAwareScheduler:
+                command += " --memoryAwareScheduler"
             if self.args.profileTiling is not None:
                 command += f" --profileTiling {self.args.profileTiling}"
+            if self.args.tilingCache is not None:
+                command += f" --tilingCache {os.path.abspath(self.args.tilingCache)}"
+            if self.args.fixTilingSolutions:
+                command += " --fixTilingSolutions"
+            if self.args.tilingWorkers is not None:
+                command += f" --tilingWorkers {self.args.tilingWorkers}"
+            if self.args.cpsat:
+                command += " --cpsat"
+            if self.args.solverWorkers is not None:
+                command += f" --solverWorkers {self.args.solverWorkers}"
+            if self.args.parallelSolver:
+                command += " --parallelSolver"
+        elif self.args.weightsBlob is not None:
+            command += f" --weightsBlob {self.args.weightsBlob}"
 
         return command
 
@@ -253,7 +390,8 @@ class TestRunner():
                  tiling: bool,
                  argument_parser: TestRunnerArgumentParser,
                  gen_args: str = "",
-                 cmake_args: str = ""):
+                 cmake_args: str = "",
+                 benchmark_report: Optional[str] = None):
 
         if simulator not in ['gvsoc', 'banshee', 'qemu', 'vsim', 'vsim.gui', 'host', 'none']:
             raise ValueError(
@@ -272,6 +410,8 @@ class TestRunner():
 
         self.cmake_args = cmake_args
         self.gen_args = gen_args
+        self.benchmark_report = benchmark_report
+        self.benchmark: Optional[Dict] = None
 
         self._dir_gen_root = f'TEST_{platform.upper()}'
         self._dir_toolchain = os.path.normpath(self._args.toolchain_install_dir)
@@ -393,3 +533,32 @@ class TestRunner():
             raise RuntimeError(f"Found an error in {self._dir_test}")
         else:
             prGreen(f"✅ No errors found in in {self._dir_test}")
+
+        results = parseBenchmarkOutput(result)
+        if results is not None:
+            self.collect_benchmark(results)
+
+    def collect_benchmark(self, results: Dict):
+        self.benchmark = {
+            "test": self._dir_test,
+            "platform": self._platform,
+            "commit": gitRevision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            **results
+        }
+
+        benchmarkFile = os.path.join(self._dir_gen, "benchmark.json")
+        with open(benchmarkFile, "w") as fileHandle:
+            json.dump(self.benchmark, fileHandle, indent = 2)
+
+        # One line per run, so that consecutive runs build up a history across commits
+        if self.benchmark_report is not None:
+            with open(self.benchmark_report, "a") as fileHandle:
+                fileHandle.write(json.dumps(self.benchmark) + "\n")
+
+        latency = {key: value / 1e6 for key, value in results["latency_ns"].items()}
+        prBlue(f"[TestRunner] Latency p50 / p90 / p99: {latency['p50']:.3f} / {latency['p90']:.3f} / "
+               f"{latency['p99']:.3f} ms, {results['inferences_per_second']:.1f} inferences/s")
+        for layer in results["layers"]:
+            prBlue(f"[TestRunner]   {layer['name']:<40} {layer['mean_ns'] / 1e3:10.1f} us")
+        prBlue(f"[TestRunner] Benchmark results written to {benchmarkFile}")
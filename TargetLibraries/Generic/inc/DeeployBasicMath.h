@@ -44,6 +44,26 @@
 #define SINGLE_CORE
 #endif
 
+// Define default fork-join wrapper for sections split among numThreads threads
+#ifndef BEGIN_PARALLEL
+#ifdef _OPENMP
+#include <omp.h>
+#define BEGIN_PARALLEL                                                         \
+  _Pragma("omp parallel num_threads(numThreads)") {                            \
+    uint32_t const thread_id = (uint32_t)omp_get_thread_num();                 \
+    uint32_t const thread_count = (uint32_t)omp_get_num_threads();
+#else
+#define BEGIN_PARALLEL                                                         \
+  {                                                                            \
+    uint32_t const thread_id = 0;                                              \
+    uint32_t const thread_count = 1;
+#endif
+#endif
+
+#ifndef END_PARALLEL
+#define END_PARALLEL }
+#endif
+
 #include <ctype.h>
 #include <inttypes.h>
 #include <stdbool.h>
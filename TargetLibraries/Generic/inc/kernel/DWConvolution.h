@@ -59,4 +59,20 @@ void DWConv2d_s8_s8_s32_NCHW(int8_t const *__restrict__ pSrcA, uint32_t C,
                              int32_t *__restrict__ pDstC, int32_t input_offset,
                              int32_t output_offset);
 
+/*
+ * 2D Convolution  ----------------------------------
+ * kernel      = DWConv2d_parallel_s8_s8_s32_NCHW
+ * layout      = NCHW
+ * data type   = 8-bit integer
+ * kernel size = generic
+ * parallel    = channels are split among numThreads cores
+ * unrolling   = no
+ * simd        = no
+ */
+void DWConv2d_parallel_s8_s8_s32_NCHW(
+    int8_t const *__restrict__ pSrcA, uint32_t C, uint32_t H, uint32_t W,
+    int8_t const *__restrict__ pSrcB, uint32_t P, uint32_t Q, uint32_t SP,
+    uint32_t SQ, int32_t *__restrict__ pDstC, int32_t input_offset,
+    int32_t output_offset, uint32_t core_id, uint32_t numThreads);
+
 #endif //__DEEPLOY_BASIC_MATH_DWCONVOLUTION_KERNEL_HEADER_
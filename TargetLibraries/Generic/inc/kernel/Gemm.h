@@ -63,4 +63,19 @@ void Gemm_s8_s8_s32_s32(int8_t const *__restrict__ pSrcA,
                         int32_t transB, int32_t A_offset, int32_t B_offset,
                         int32_t C_offset, int32_t Y_offset);
 
+/*
+ * Matrix multiplication ----------------------------------
+ * kernel     = Gemm_parallel_s8_s8_s32_s32
+ * data type  = 8-bit integer
+ * parallel   = rows of Y are split among numThreads cores
+ * unrolling  = no
+ * cleanup    = yes
+ */
+void Gemm_parallel_s8_s8_s32_s32(
+    int8_t const *__restrict__ pSrcA, int8_t const *__restrict__ pSrcB,
+    int32_t const *__restrict__ pSrcC, int32_t *__restrict__ pDstY, uint32_t M,
+    uint32_t N, uint32_t P, int32_t alpha, int32_t beta, int32_t transA,
+    int32_t transB, int32_t A_offset, int32_t B_offset, int32_t C_offset,
+    int32_t Y_offset, uint32_t core_id, uint32_t numThreads);
+
 #endif //__DEEPLOY_BASIC_MATH_GEMM_KERNEL_HEADER_
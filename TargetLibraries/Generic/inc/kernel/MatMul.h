@@ -62,4 +62,18 @@ void MatMul_s8_s8_s32(int8_t const *__restrict__ pSrcA,
                       uint32_t P, int32_t A_offset, int32_t B_offset,
                       int32_t C_offset);
 
+/*
+ * Matrix multiplication ----------------------------------
+ * kernel     = MatMul_parallel_s8_s8_s32
+ * data type  = 8-bit integer
+ * parallel   = rows of C are split among numThreads cores
+ * cleanup    = yes
+ */
+void MatMul_parallel_s8_s8_s32(int8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pDstC, uint32_t M,
+                               uint32_t N, uint32_t P, int32_t A_offset,
+                               int32_t B_offset, int32_t C_offset,
+                               uint32_t core_id, uint32_t numThreads);
+
 #endif //__DEEPLOY_BASIC_MATH_MATMUL_KERNEL_HEADER_
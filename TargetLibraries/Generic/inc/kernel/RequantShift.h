@@ -132,4 +132,112 @@ void RequantShift_s32_s8_NCHW(int32_t *data_in, int32_t size, int32_t *mul,
                               int32_t output_offset, int8_t output_min,
                               int8_t output_max, bool rounding);
 
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s8_s8_NHWC
+ * layout           = NHWC
+ * input data type  = 8-bit integer
+ * output data type = 8-bit integer
+ * parallel         = pixels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s8_s8_NHWC(int8_t *data_in, int32_t size,
+                                      int32_t *mul, int32_t *add,
+                                      int8_t *data_out, int32_t log2D,
+                                      int32_t channels, int32_t input_offset,
+                                      int32_t output_offset, int8_t output_min,
+                                      int8_t output_max, bool rounding,
+                                      uint32_t core_id, uint32_t numThreads);
+
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s16_s8_NHWC
+ * layout           = NHWC
+ * input data type  = 16-bit integer
+ * output data type = 8-bit integer
+ * parallel         = pixels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s16_s8_NHWC(int16_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t channels, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads);
+
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s32_s8_NHWC
+ * layout           = NHWC
+ * input data type  = 32-bit integer
+ * output data type = 8-bit integer
+ * parallel         = pixels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s32_s8_NHWC(int32_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t channels, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads);
+
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s8_s8_NCHW
+ * layout           = NCHW
+ * input data type  = 8-bit integer
+ * output data type = 8-bit integer
+ * parallel         = channels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s8_s8_NCHW(int8_t *data_in, int32_t size,
+                                      int32_t *mul, int32_t *add,
+                                      int8_t *data_out, int32_t log2D,
+                                      int32_t HW, int32_t input_offset,
+                                      int32_t output_offset, int8_t output_min,
+                                      int8_t output_max, bool rounding,
+                                      uint32_t core_id, uint32_t numThreads);
+
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s16_s8_NCHW
+ * layout           = NCHW
+ * input data type  = 16-bit integer
+ * output data type = 8-bit integer
+ * parallel         = channels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s16_s8_NCHW(int16_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t HW, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads);
+
+/*
+ * Re-quantization and Shift  ----------------------------------
+ * kernel           = RequantShift_parallel_s32_s8_NCHW
+ * layout           = NCHW
+ * input data type  = 32-bit integer
+ * output data type = 8-bit integer
+ * parallel         = channels are split among numThreads cores
+ * unrolling        = no
+ * simd             = no
+ */
+void RequantShift_parallel_s32_s8_NCHW(int32_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t HW, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads);
+
 #endif //__DEEPLOY_BASIC_MATH_REQUANTSHIFT_KERNEL_HEADER_
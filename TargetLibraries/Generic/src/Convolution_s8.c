@@ -73,3 +73,25 @@ void Conv2d_s8_s8_s32_NCHW(int8_t const *__restrict__ pSrcA, uint32_t C,
     }
   }
 }
+
+void Conv2d_parallel_s8_s8_s32_NCHW(
+    int8_t const *__restrict__ pSrcA, uint32_t C, uint32_t H, uint32_t W,
+    int8_t const *__restrict__ pSrcB, uint32_t F, uint32_t P, uint32_t Q,
+    uint32_t SP, uint32_t SQ, int32_t *__restrict__ pDstC, int32_t input_offset,
+    int32_t output_offset, uint32_t core_id, uint32_t numThreads) {
+
+  uint32_t H_out = (H - P) / SP + 1;
+  uint32_t W_out = (W - Q) / SQ + 1;
+
+  // Parallelize by assigning each core a block of output channels
+  uint32_t const chunk = (F + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, F);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, F);
+
+  if (chunk_start < chunk_stop) {
+    Conv2d_s8_s8_s32_NCHW(pSrcA, C, H, W, pSrcB + chunk_start * C * P * Q,
+                          chunk_stop - chunk_start, P, Q, SP, SQ,
+                          pDstC + chunk_start * H_out * W_out, input_offset,
+                          output_offset);
+  }
+}
@@ -70,3 +70,25 @@ void DWConv2d_s8_s8_s32_NCHW(int8_t const *__restrict__ pSrcA, uint32_t C,
     }
   }
 }
+
+void DWConv2d_parallel_s8_s8_s32_NCHW(
+    int8_t const *__restrict__ pSrcA, uint32_t C, uint32_t H, uint32_t W,
+    int8_t const *__restrict__ pSrcB, uint32_t P, uint32_t Q, uint32_t SP,
+    uint32_t SQ, int32_t *__restrict__ pDstC, int32_t input_offset,
+    int32_t output_offset, uint32_t core_id, uint32_t numThreads) {
+
+  uint32_t H_out = (H - P) / SP + 1;
+  uint32_t W_out = (W - Q) / SQ + 1;
+
+  // Parallelize by assigning each core a block of channels
+  uint32_t const chunk = (C + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, C);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, C);
+
+  if (chunk_start < chunk_stop) {
+    DWConv2d_s8_s8_s32_NCHW(
+        pSrcA + chunk_start * H * W, chunk_stop - chunk_start, H, W,
+        pSrcB + chunk_start * P * Q, P, Q, SP, SQ,
+        pDstC + chunk_start * H_out * W_out, input_offset, output_offset);
+  }
+}
@@ -90,3 +90,34 @@ void Gemm_s8_s8_s32_s32(int8_t const *__restrict__ pSrcA,
     }
   }
 }
+
+void Gemm_parallel_s8_s8_s32_s32(
+    int8_t const *__restrict__ pSrcA, int8_t const *__restrict__ pSrcB,
+    int32_t const *__restrict__ pSrcC, int32_t *__restrict__ pDstY, uint32_t M,
+    uint32_t N, uint32_t P, int32_t alpha, int32_t beta, int32_t transA,
+    int32_t transB, int32_t A_offset, int32_t B_offset, int32_t C_offset,
+    int32_t Y_offset, uint32_t core_id, uint32_t numThreads) {
+
+  // Strides of the (possibly transposed) inputs along their logical axes
+  uint32_t const A_stride_m = transA ? 1 : N;
+  uint32_t const A_stride_n = transA ? M : 1;
+  uint32_t const B_stride_n = transB ? 1 : P;
+  uint32_t const B_stride_p = transB ? N : 1;
+
+  // Parallelize by assigning each core a block of rows of Y
+  uint32_t const chunk = (M + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, M);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, M);
+
+  for (uint32_t m = chunk_start; m < chunk_stop; ++m) {
+    for (uint32_t p = 0; p < P; p++) {
+      int32_t sum = 0;
+      for (uint32_t n = 0; n < N; n++) {
+        sum += (int32_t)(pSrcA[m * A_stride_m + n * A_stride_n] + A_offset) *
+               (pSrcB[n * B_stride_n + p * B_stride_p] + B_offset);
+      }
+      pDstY[m * P + p] =
+          alpha * sum + beta * (pSrcC[m * P + p] + C_offset) + Y_offset;
+    }
+  }
+}
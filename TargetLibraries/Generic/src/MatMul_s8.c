@@ -127,3 +127,21 @@ void MatMul_s8_s8_s32(int8_t const *__restrict__ pSrcA,
     }
   }
 }
+
+void MatMul_parallel_s8_s8_s32(int8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pDstC, uint32_t M,
+                               uint32_t N, uint32_t P, int32_t A_offset,
+                               int32_t B_offset, int32_t C_offset,
+                               uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of rows of C
+  uint32_t const chunk = (M + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, M);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, M);
+
+  if (chunk_start < chunk_stop) {
+    MatMul_s8_s8_s32(pSrcA + chunk_start * N, pSrcB, pDstC + chunk_start * P,
+                     chunk_stop - chunk_start, N, P, A_offset, B_offset,
+                     C_offset);
+  }
+}
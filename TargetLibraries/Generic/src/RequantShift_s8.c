@@ -153,3 +153,141 @@ void RequantShift_s32_s8_NCHW(int32_t *data_in, int32_t size, int32_t *mul,
     data_out[i] = out;
   }
 }
+
+void RequantShift_parallel_s8_s8_NHWC(int8_t *data_in, int32_t size,
+                                      int32_t *mul, int32_t *add,
+                                      int8_t *data_out, int32_t log2D,
+                                      int32_t channels, int32_t input_offset,
+                                      int32_t output_offset, int8_t output_min,
+                                      int8_t output_max, bool rounding,
+                                      uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of pixels
+  uint32_t const width = (uint32_t)channels;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s8_s8_NHWC(data_in + chunk_start * width,
+                            (int32_t)((chunk_stop - chunk_start) * width), mul,
+                            add, data_out + chunk_start * width, log2D,
+                            channels, input_offset, output_offset, output_min,
+                            output_max, rounding);
+  }
+}
+
+void RequantShift_parallel_s16_s8_NHWC(int16_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t channels, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of pixels
+  uint32_t const width = (uint32_t)channels;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s16_s8_NHWC(data_in + chunk_start * width,
+                             (int32_t)((chunk_stop - chunk_start) * width), mul,
+                             add, data_out + chunk_start * width, log2D,
+                             channels, input_offset, output_offset, output_min,
+                             output_max, rounding);
+  }
+}
+
+void RequantShift_parallel_s32_s8_NHWC(int32_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t channels, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of pixels
+  uint32_t const width = (uint32_t)channels;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s32_s8_NHWC(data_in + chunk_start * width,
+                             (int32_t)((chunk_stop - chunk_start) * width), mul,
+                             add, data_out + chunk_start * width, log2D,
+                             channels, input_offset, output_offset, output_min,
+                             output_max, rounding);
+  }
+}
+
+void RequantShift_parallel_s8_s8_NCHW(int8_t *data_in, int32_t size,
+                                      int32_t *mul, int32_t *add,
+                                      int8_t *data_out, int32_t log2D,
+                                      int32_t HW, int32_t input_offset,
+                                      int32_t output_offset, int8_t output_min,
+                                      int8_t output_max, bool rounding,
+                                      uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of channels
+  uint32_t const width = (uint32_t)HW;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s8_s8_NCHW(
+        data_in + chunk_start * width,
+        (int32_t)((chunk_stop - chunk_start) * width), mul + chunk_start,
+        add + chunk_start, data_out + chunk_start * width, log2D, HW,
+        input_offset, output_offset, output_min, output_max, rounding);
+  }
+}
+
+void RequantShift_parallel_s16_s8_NCHW(int16_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t HW, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of channels
+  uint32_t const width = (uint32_t)HW;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s16_s8_NCHW(
+        data_in + chunk_start * width,
+        (int32_t)((chunk_stop - chunk_start) * width), mul + chunk_start,
+        add + chunk_start, data_out + chunk_start * width, log2D, HW,
+        input_offset, output_offset, output_min, output_max, rounding);
+  }
+}
+
+void RequantShift_parallel_s32_s8_NCHW(int32_t *data_in, int32_t size,
+                                       int32_t *mul, int32_t *add,
+                                       int8_t *data_out, int32_t log2D,
+                                       int32_t HW, int32_t input_offset,
+                                       int32_t output_offset, int8_t output_min,
+                                       int8_t output_max, bool rounding,
+                                       uint32_t core_id, uint32_t numThreads) {
+  // Parallelize by assigning each core a block of channels
+  uint32_t const width = (uint32_t)HW;
+  uint32_t const rows = (uint32_t)size / width;
+  uint32_t const chunk = (rows + numThreads - 1) / numThreads;
+  uint32_t const chunk_start = MIN(chunk * core_id, rows);
+  uint32_t const chunk_stop = MIN(chunk_start + chunk, rows);
+
+  if (chunk_start < chunk_stop) {
+    RequantShift_s32_s8_NCHW(
+        data_in + chunk_start * width,
+        (int32_t)((chunk_stop - chunk_start) * width), mul + chunk_start,
+        add + chunk_start, data_out + chunk_start * width, log2D, HW,
+        input_offset, output_offset, output_min, output_max, rounding);
+  }
+}
@@ -40,6 +40,7 @@
 
 #include "pmsis.h"
 
+#include "kernel/GemmAccumulate.h"
 #include "kernel/RQiHardswish.h"
 #include "kernel/RequantShift.h"
 #include "kernel/UniformRequantShift.h"
@@ -0,0 +1,60 @@
+/* =====================================================================
+ * Title:        GemmAccumulate.h
+ * Description:
+ *
+ * $Date:        18.10.2026
+ *
+ * ===================================================================== */
+/*
+ * Copyright (C) 2026 ETH Zurich and University of Bologna.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the License); you may
+ * not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an AS IS BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "DeeployPULPMath.h"
+
+/*
+ * Partial GEMM over one chunk of the reduction dimension
+ *
+ * pAcc[m][o] (+)= sum_n pSrcA[m][n] * pSrcB[o][n]
+ *
+ * If accumulate is zero, the accumulator is overwritten, otherwise the
+ * partial sums are added to it. The output neurons are split among
+ * the cores of the cluster.
+ */
+void Gemm_Accumulate_i8_i8_i32(int8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pAcc, uint32_t M,
+                               uint32_t N, uint32_t O, uint32_t accumulate);
+
+void Gemm_Accumulate_u8_i8_i32(uint8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pAcc, uint32_t M,
+                               uint32_t N, uint32_t O, uint32_t accumulate);
+
+/*
+ * Requantization of the accumulated partial sums
+ *
+ * pDst[m][o] = clip((pAcc[m][o] * mul[o] + add[o]) >> log2D)
+ */
+void Gemm_Requant_i32_i8(int32_t const *__restrict__ pAcc,
+                         int8_t *__restrict__ pDst, int32_t const *mul,
+                         int32_t const *add, int32_t log2D, uint32_t M,
+                         uint32_t O);
+
+void Gemm_Requant_i32_u8(int32_t const *__restrict__ pAcc,
+                         uint8_t *__restrict__ pDst, int32_t const *mul,
+                         int32_t const *add, int32_t log2D, uint32_t M,
+                         uint32_t O);
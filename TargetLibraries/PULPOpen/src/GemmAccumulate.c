@@ -0,0 +1,123 @@
+/* =====================================================================
+ * Title:        GemmAccumulate.c
+ * Description:
+ *
+ * $Date:        18.10.2026
+ *
+ * ===================================================================== */
+/*
+ * Copyright (C) 2026 ETH Zurich and University of Bologna.
+ *
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the License); you may
+ * not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an AS IS BASIS, WITHOUT
+ * WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "DeeployPULPMath.h"
+#include "pmsis.h"
+
+void Gemm_Accumulate_i8_i8_i32(int8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pAcc, uint32_t M,
+                               uint32_t N, uint32_t O, uint32_t accumulate) {
+
+  int8_t core_id = pi_core_id();
+  int8_t log2Core = log2(NUM_CORES);
+  uint32_t chunk = (O >> log2Core) + ((O & (NUM_CORES - 1)) != 0);
+  uint32_t chunk_start = MIN(chunk * core_id, O);
+  uint32_t chunk_stop = MIN(chunk_start + chunk, O);
+
+  for (uint32_t m = 0; m < M; m++) {
+    int8_t const *pA = pSrcA + m * N;
+    for (uint32_t o = chunk_start; o < chunk_stop; o++) {
+      int8_t const *pB = pSrcB + o * N;
+      int32_t sum = accumulate ? pAcc[m * O + o] : 0;
+#pragma unroll 4
+      for (uint32_t n = 0; n < N; n++) {
+        sum += (int32_t)pA[n] * (int32_t)pB[n];
+      }
+      pAcc[m * O + o] = sum;
+    }
+  }
+
+  pi_cl_team_barrier(0);
+}
+
+void Gemm_Accumulate_u8_i8_i32(uint8_t const *__restrict__ pSrcA,
+                               int8_t const *__restrict__ pSrcB,
+                               int32_t *__restrict__ pAcc, uint32_t M,
+                               uint32_t N, uint32_t O, uint32_t accumulate) {
+
+  int8_t core_id = pi_core_id();
+  int8_t log2Core = log2(NUM_CORES);
+  uint32_t chunk = (O >> log2Core) + ((O & (NUM_CORES - 1)) != 0);
+  uint32_t chunk_start = MIN(chunk * core_id, O);
+  uint32_t chunk_stop = MIN(chunk_start + chunk, O);
+
+  for (uint32_t m = 0; m < M; m++) {
+    uint8_t const *pA = pSrcA + m * N;
+    for (uint32_t o = chunk_start; o < chunk_stop; o++) {
+      int8_t const *pB = pSrcB + o * N;
+      int32_t sum = accumulate ? pAcc[m * O + o] : 0;
+#pragma unroll 4
+      for (uint32_t n = 0; n < N; n++) {
+        sum += (int32_t)pA[n] * (int32_t)pB[n];
+      }
+      pAcc[m * O + o] = sum;
+    }
+  }
+
+  pi_cl_team_barrier(0);
+}
+
+void Gemm_Requant_i32_i8(int32_t const *__restrict__ pAcc,
+                         int8_t *__restrict__ pDst, int32_t const *mul,
+                         int32_t const *add, int32_t log2D, uint32_t M,
+                         uint32_t O) {
+
+  int8_t core_id = pi_core_id();
+  int8_t log2Core = log2(NUM_CORES);
+  uint32_t chunk = (O >> log2Core) + ((O & (NUM_CORES - 1)) != 0);
+  uint32_t chunk_start = MIN(chunk * core_id, O);
+  uint32_t chunk_stop = MIN(chunk_start + chunk, O);
+
+  for (uint32_t m = 0; m < M; m++) {
+    for (uint32_t o = chunk_start; o < chunk_stop; o++) {
+      int32_t intermediate = (pAcc[m * O + o] * mul[o] + add[o]) >> log2D;
+      pDst[m * O + o] = (int8_t)CLAMP(intermediate, -128, 127);
+    }
+  }
+
+  pi_cl_team_barrier(0);
+}
+
+void Gemm_Requant_i32_u8(int32_t const *__restrict__ pAcc,
+                         uint8_t *__restrict__ pDst, int32_t const *mul,
+                         int32_t const *add, int32_t log2D, uint32_t M,
+                         uint32_t O) {
+
+  int8_t core_id = pi_core_id();
+  int8_t log2Core = log2(NUM_CORES);
+  uint32_t chunk = (O >> log2Core) + ((O & (NUM_CORES - 1)) != 0);
+  uint32_t chunk_start = MIN(chunk * core_id, O);
+  uint32_t chunk_stop = MIN(chunk_start + chunk, O);
+
+  for (uint32_t m = 0; m < M; m++) {
+    for (uint32_t o = chunk_start; o < chunk_stop; o++) {
+      int32_t intermediate = (pAcc[m * O + o] * mul[o] + add[o]) >> log2D;
+      pDst[m * O + o] = (uint8_t)CLAMP(intermediate, 0, 255);
+    }
+  }
+
+  pi_cl_team_barrier(0);
+}
@@ -1,3 +1,9 @@
+set(benchmark_iterations 0 CACHE STRING "Number of timed inferences of the host benchmark, 0 runs the network once")
+set(benchmark_warmup 10 CACHE STRING "Number of untimed inferences before the host benchmark")
+
 add_compile_definitions(
     DEEPLOY_GENERIC_PLATFORM
+    NUM_THREADS=${num_threads}
+    BENCHMARK_ITERATIONS=${benchmark_iterations}
+    BENCHMARK_WARMUP=${benchmark_warmup}
 )